@@ -16,12 +16,20 @@ class BuildExt(build_ext):
                     "/std:c++20",
                     "/GL",
                     "/fp:fast",
-                    "/arch:AVX2",
                 ]
                 ext.extra_link_args = ["/LTCG"]
             else:
-                # GCC/Clang flags (Linux/macOS)
-                ext.extra_compile_args = ["-O3", "-Wall", "-std=c++20", "-flto"]
+                # GCC/Clang flags (Linux/macOS). Math calls may skip errno and
+                # assume no FP traps; full -ffast-math is avoided because NaN,
+                # infinity and exact rounding must keep IEEE semantics.
+                ext.extra_compile_args = [
+                    "-O3",
+                    "-Wall",
+                    "-std=c++20",
+                    "-flto",
+                    "-fno-math-errno",
+                    "-fno-trapping-math",
+                ]
                 ext.extra_link_args = ["-flto"]
         super().build_extensions()
 
@@ -31,13 +39,17 @@ module = Extension(
     sources=[
         "src/vldt_module.cpp",
         "src/data_model.cpp",
+        "src/fast_defaults.cpp",
         "src/init_globals.cpp",
+        "src/conversion/date_fast.cpp",
         "src/conversion/dict_utils.cpp",
         "src/conversion/json_utils.cpp",
         "src/conversion/rapidjson_to_pyobject.cpp",
+        "src/conversion/uuid_fast.cpp",
         "src/schema/schema.cpp",
         "src/schema/deserializer.cpp",
         "src/validation/validation.cpp",
+        "src/validation/validation_builtins.cpp",
         "src/validation/validation_containers.cpp",
         "src/validation/validation_primitives.cpp",
         "src/validation/validation_validators.cpp",
@@ -0,0 +1,90 @@
+#include "date_fast.hpp"
+
+#include <Python.h>
+#include <datetime.h>
+
+static const Py_ssize_t FIXED_DATETIME_LEN = 19;
+
+/**
+ * @brief Reads a run of ASCII digits as a decimal number.
+ *
+ * @param s The buffer.
+ * @param n The number of digits to read.
+ * @param out The parsed value.
+ * @return true if all characters were digits.
+ */
+static inline bool read_digits(const char *s, int n, int *out) {
+  int value = 0;
+  for (int i = 0; i < n; i++) {
+    unsigned digit = static_cast<unsigned char>(s[i]) - '0';
+    if (digit > 9) {
+      return false;
+    }
+    value = value * 10 + static_cast<int>(digit);
+  }
+  *out = value;
+  return true;
+}
+
+/**
+ * @brief Parses a fixed-width datetime string.
+ *
+ * Accepts "YYYY-MM-DD HH:MM:SS" and "YYYY/MM/DD HH:MM:SS", with 'T' or a
+ * space between the date and the time.
+ *
+ * @param s The UTF-8 buffer.
+ * @param len The buffer length.
+ * @return PyObject* A new datetime, or nullptr with ValueError set.
+ */
+PyObject *parse_fixed_datetime(const char *s, Py_ssize_t len) {
+  int year, month, day, hour, minute, second;
+  if (len != FIXED_DATETIME_LEN || (s[4] != '-' && s[4] != '/') ||
+      s[7] != s[4] || (s[10] != ' ' && s[10] != 'T') || s[13] != ':' ||
+      s[16] != ':' || !read_digits(s, 4, &year) ||
+      !read_digits(s + 5, 2, &month) || !read_digits(s + 8, 2, &day) ||
+      !read_digits(s + 11, 2, &hour) || !read_digits(s + 14, 2, &minute) ||
+      !read_digits(s + 17, 2, &second)) {
+    PyObject *text = PyUnicode_DecodeUTF8(s, len, "replace");
+    if (text) {
+      PyErr_Format(PyExc_ValueError,
+                   "Invalid datetime string %R, expected "
+                   "'YYYY-MM-DD HH:MM:SS' (or 'YYYY/MM/DD', with 'T' or a "
+                   "space before the time)",
+                   text);
+      Py_DECREF(text);
+    }
+    return nullptr;
+  }
+  return PyDateTime_FromDateAndTime(year, month, day, hour, minute, second, 0);
+}
+
+/**
+ * @brief Python entry point for parse_fixed_datetime.
+ *
+ * @param module The extension module.
+ * @param arg The string to parse.
+ * @return PyObject* A new datetime, or nullptr on error.
+ */
+PyObject *date_fast_parse_datetime(PyObject *module, PyObject *arg) {
+  if (!PyUnicode_Check(arg)) {
+    PyErr_Format(PyExc_TypeError, "Expected str, got %s",
+                 Py_TYPE(arg)->tp_name);
+    return nullptr;
+  }
+  Py_ssize_t len = 0;
+  const char *s = PyUnicode_AsUTF8AndSize(arg, &len);
+  if (!s) {
+    return nullptr;
+  }
+  return parse_fixed_datetime(s, len);
+}
+
+/**
+ * @brief Imports the datetime C API.
+ *
+ * @return int 0 on success, -1 on failure.
+ */
+int init_date_fast_globals(void) {
+  PyDateTime_IMPORT;
+  return PyDateTimeAPI ? 0 : -1;
+}
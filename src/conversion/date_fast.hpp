@@ -0,0 +1,32 @@
+#pragma once
+
+#include <Python.h>
+
+/**
+ * @brief Parses a fixed-width "YYYY-MM-DD HH:MM:SS" string into a datetime.
+ *
+ * The date separator may be '-' or '/' (used consistently) and the date and
+ * time may be separated by 'T' or a space.
+ *
+ * @param s The UTF-8 buffer.
+ * @param len The buffer length.
+ * @return PyObject* A new datetime on success, or nullptr with ValueError set.
+ */
+PyObject *parse_fixed_datetime(const char *s, Py_ssize_t len);
+
+/**
+ * @brief Python entry point for parse_fixed_datetime
+ * (vldt.parse_datetime_fast).
+ *
+ * @param module The extension module.
+ * @param arg The string to parse.
+ * @return PyObject* A new datetime on success, or nullptr on error.
+ */
+PyObject *date_fast_parse_datetime(PyObject *module, PyObject *arg);
+
+/**
+ * @brief Imports the datetime C API used by the fast parsers.
+ *
+ * @return int 0 on success, -1 on failure.
+ */
+int init_date_fast_globals(void);
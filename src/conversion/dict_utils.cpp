@@ -1,12 +1,13 @@
 #include "dict_utils.hpp"
 #include "data_model.hpp"
+#include "init_globals.hpp"
 #include "schema/schema.hpp"
 #include <Python.h>
 #include <stdlib.h>
 #include <string>
+#include <vector>
 
 extern PyObject *schema_key;
-extern PyObject *get_schema_cached(PyObject *cls);
 
 /**
  * @brief Convert a PyObject to its dictionary representation.
@@ -22,6 +23,8 @@ extern PyObject *get_schema_cached(PyObject *cls);
  */
 PyObject *convert_to_dict(PyObject *value, PyObject *dict_serializer);
 
+static PyObject *convert_datamodel(PyObject *value, PyObject *out = nullptr);
+
 /**
  * @brief Checks if a PyObject is of a basic immutable type.
  *
@@ -44,14 +47,14 @@ static inline int is_basic_immutable(PyObject *value) {
  * not Py_NotImplemented, a new reference to the converted object is returned.
  *
  * @param value The PyObject to convert.
- * @param dict_serializer A dictionary containing conversion functions.
+ * @param dict_serializer A non-empty dictionary of conversion functions, or
+ * Py_None (the schema freezes empty mappings to Py_None).
  * @return New reference to the converted PyObject, or nullptr if no conversion
  * is performed.
  */
 static PyObject *apply_dict_serializer(PyObject *value,
                                        PyObject *dict_serializer) {
-  if (dict_serializer && PyDict_Check(dict_serializer) &&
-      PyDict_Size(dict_serializer) > 0) {
+  if (dict_serializer != Py_None) {
     PyObject *type_obj = (PyObject *)Py_TYPE(value);
     PyObject *conv_func = PyDict_GetItem(dict_serializer, type_obj);
     if (conv_func && PyCallable_Check(conv_func)) {
@@ -100,7 +103,7 @@ static PyObject *convert_list(PyObject *list_obj, PyObject *dict_serializer) {
  * @return New dictionary with converted values, or nullptr on error.
  */
 static PyObject *convert_dict(PyObject *dict_obj, PyObject *dict_serializer) {
-  PyObject *new_dict = PyDict_New();
+  PyObject *new_dict = new_presized_dict(PyDict_GET_SIZE(dict_obj));
   if (!new_dict) {
     return nullptr;
   }
@@ -191,61 +194,472 @@ static PyObject *convert_set(PyObject *set_obj, PyObject *dict_serializer) {
 }
 
 /**
- * @brief Converts a DataModel instance to a dictionary.
+ * @brief Converts an item of a list or dict field of plain items.
+ *
+ * @param item The item.
+ * @param dump The field's dispatch entry (DUMP_LIST_PLAIN or DUMP_DICT_PLAIN).
+ * @param dict_serializer The schema's dict_serializer.
+ * @return New reference to the converted item, or nullptr on error.
+ */
+static inline PyObject *convert_dumped_item(PyObject *item,
+                                            const FieldDump &dump,
+                                            PyObject *dict_serializer) {
+  if (!Py_IS_TYPE(item, dump.item_type)) {
+    return convert_to_dict(item, dict_serializer);
+  }
+  return Py_NewRef(item);
+}
+
+/**
+ * @brief Converts a field value whose type matches its dispatch entry.
  *
- * Retrieves the cached schema for the model and iterates over its fields to
- * build a dictionary representation using the schema's dict_serializer for
- * nested conversions.
+ * The caller has checked that value has exactly dump.type, so the kind
+ * selected at schema compile time applies without further type tests. The
+ * kinds holding models are walked by convert_datamodel itself.
  *
- * @param value The DataModel instance to convert.
- * @return New dictionary representing the DataModel, or nullptr on error.
+ * @param value The field value.
+ * @param dump The field's dispatch entry (a kind without models).
+ * @param dict_serializer The schema's dict_serializer.
+ * @return New reference to the converted value, or nullptr on error.
  */
-static PyObject *convert_datamodel(PyObject *value) {
-  PyTypeObject *type_ptr = Py_TYPE(value);
-  PyObject *capsule = get_schema_cached((PyObject *)type_ptr);
-  if (!capsule) {
-    return nullptr;
+static PyObject *convert_dumped_field(PyObject *value, const FieldDump &dump,
+                                      PyObject *dict_serializer) {
+  switch (dump.kind) {
+  case DUMP_PLAIN:
+    return Py_NewRef(value);
+  case DUMP_SERIALIZER: {
+    PyObject *converted = PyObject_CallOneArg(dump.serializer, value);
+    if (converted == Py_NotImplemented) {
+      Py_DECREF(converted);
+      return convert_to_dict(value, Py_None);
+    }
+    return converted;
+  }
+  case DUMP_LIST_PLAIN: {
+    Py_ssize_t size = PyList_GET_SIZE(value);
+    PyObject *new_list = PyList_New(size);
+    if (!new_list) {
+      return nullptr;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+      PyObject *item =
+          convert_dumped_item(PyList_GET_ITEM(value, i), dump, dict_serializer);
+      if (!item) {
+        Py_DECREF(new_list);
+        return nullptr;
+      }
+      PyList_SET_ITEM(new_list, i, item);
+    }
+    return new_list;
+  }
+  case DUMP_DICT_PLAIN: {
+    PyObject *new_dict = new_presized_dict(PyDict_GET_SIZE(value));
+    if (!new_dict) {
+      return nullptr;
+    }
+    PyObject *k, *v;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(value, &pos, &k, &v)) {
+      PyObject *item = convert_dumped_item(v, dump, dict_serializer);
+      if (!item || PyDict_SetItem(new_dict, k, item) != 0) {
+        Py_XDECREF(item);
+        Py_DECREF(new_dict);
+        return nullptr;
+      }
+      Py_DECREF(item);
+    }
+    return new_dict;
   }
-  SchemaCache *schema =
-      (SchemaCache *)PyCapsule_GetPointer(capsule, "vldt.SchemaCache");
-  Py_DECREF(capsule);
-  if (!schema) {
+  default:
+    return convert_to_dict(value, dict_serializer);
+  }
+}
+
+/**
+ * @brief Returns the dictionary a model's fields are converted into.
+ *
+ * Without out this is a copy of the kwargs template. A caller-supplied out
+ * that already holds exactly the field keys, in order and as the interned
+ * names (as left by a previous to_dict(out=...)), is reused as it is: each
+ * store then only replaces a value, with no allocation or resize. Any other
+ * out is cleared and refilled from the template first.
+ *
+ * @param schema The model's compiled schema.
+ * @param out Dictionary to reuse, or nullptr.
+ * @return New reference to the result dictionary, or nullptr on error.
+ */
+static PyObject *new_model_result(SchemaCache *schema, PyObject *out) {
+  if (!out) {
+    return PyDict_Copy(schema->kwargs_template);
+  }
+  if (PyDict_GET_SIZE(out) == schema->num_fields) {
+    Py_ssize_t pos = 0;
+    Py_ssize_t i = 0;
+    PyObject *key;
+    PyObject *ignored;
+    while (PyDict_Next(out, &pos, &key, &ignored) &&
+           key == schema->table.keys[i]) {
+      i++;
+    }
+    if (i == schema->num_fields) {
+      return Py_NewRef(out);
+    }
+  }
+  PyDict_Clear(out);
+  if (PyDict_Update(out, schema->kwargs_template) != 0) {
     return nullptr;
   }
-  PyObject *dict_serializer = schema->dict_serializer;
-  PyObject *result_dict = PyDict_New();
+  return Py_NewRef(out);
+}
+
+/**
+ * @brief Converts a leaf DataModel instance to a dictionary.
+ *
+ * Every field of a leaf model is a plain int, str, float or bool, so values
+ * of exactly the declared type are stored as is; anything else (e.g. a bool
+ * in an int field) goes through the generic conversion.
+ *
+ * @param schema The model's compiled schema (is_leaf must be set).
+ * @param values The instance's field values.
+ * @param out Dictionary to fill instead of a new one, or nullptr.
+ * @return New dictionary representing the DataModel, or nullptr on error.
+ */
+static PyObject *convert_leaf_datamodel(SchemaCache *schema, PyObject **values,
+                                        PyObject *out = nullptr) {
+  PyObject *result_dict = new_model_result(schema, out);
   if (!result_dict) {
     return nullptr;
   }
-  DataModelObject *bm = (DataModelObject *)value;
+  const FieldTable &table = schema->table;
   for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
-    FieldSchema *fs = &schema->fields[i];
-    std::string field_key(fs->field_name_c);
-    auto it = bm->instance_data->fields.find(field_key);
-    if (it == bm->instance_data->fields.end()) {
+    PyObject *field_value = values[i];
+    if (!field_value) {
+      if (PyDict_DelItem(result_dict, table.keys[i]) != 0) {
+        Py_DECREF(result_dict);
+        return nullptr;
+      }
       continue;
     }
-    PyObject *field_value = it->second;
-    PyObject *conv_value = convert_to_dict(field_value, dict_serializer);
+    PyObject *conv_value =
+        Py_IS_TYPE(field_value, table.dumps[i].type)
+            ? Py_NewRef(field_value)
+            : convert_to_dict(field_value, schema->dict_serializer);
     if (!conv_value) {
       Py_DECREF(result_dict);
       return nullptr;
     }
-    if (PyDict_SetItem(result_dict, fs->field_name, conv_value) != 0) {
-      Py_DECREF(conv_value);
+    int rc = PyDict_SetItem(result_dict, table.keys[i], conv_value);
+    Py_DECREF(conv_value);
+    if (rc != 0) {
       Py_DECREF(result_dict);
       return nullptr;
     }
-    Py_DECREF(conv_value);
   }
   return result_dict;
 }
 
+/**
+ * @brief What a DumpFrame is converting.
+ */
+enum DumpFrameKind : uint8_t {
+  FRAME_MODEL = 0, // fields of a non-leaf model
+  FRAME_LIST = 1,  // items of a List of models
+  FRAME_DICT = 2   // values of a Dict with model values
+};
+
+/**
+ * @brief One pending conversion of convert_datamodel's explicit stack.
+ *
+ * source is the model, list or dict being converted (borrowed from its
+ * parent, which outlives the frame) and result the dict or list being
+ * filled, owned by the frame. pos is the next field index, list index or
+ * PyDict_Next position. slot (field or list index) and key (dict key,
+ * borrowed from source) say where the result of the frame pushed on top of
+ * this one is stored.
+ */
+struct DumpFrame {
+  uint8_t kind;
+  PyObject *source;
+  PyObject *result;
+  PyTypeObject *item_type;
+  PyObject *dict_serializer;
+  Py_ssize_t pos;
+  Py_ssize_t slot;
+  PyObject *key;
+};
+
+/**
+ * @brief Stack of DumpFrames; the first frames live inline so shallow
+ * models convert without a heap allocation.
+ */
+class DumpStack {
+public:
+  ~DumpStack() {
+    while (depth_ > 0) {
+      Py_XDECREF(top().result);
+      pop();
+    }
+  }
+
+  bool empty() const { return depth_ == 0; }
+
+  DumpFrame &top() {
+    return depth_ <= kInline ? inline_[depth_ - 1] : overflow_.back();
+  }
+
+  /**
+   * @brief Pushes a frame that owns result.
+   */
+  void push(uint8_t kind, PyObject *source, PyObject *result,
+            PyTypeObject *item_type, PyObject *dict_serializer) {
+    DumpFrame frame{kind, source, result, item_type, dict_serializer,
+                    0,    -1,     nullptr};
+    if (depth_ < kInline) {
+      inline_[depth_] = frame;
+    } else {
+      overflow_.push_back(frame);
+    }
+    depth_++;
+  }
+
+  /**
+   * @brief Removes the top frame without touching its references.
+   */
+  void pop() {
+    if (depth_ > kInline) {
+      overflow_.pop_back();
+    }
+    depth_--;
+  }
+
+private:
+  static constexpr size_t kInline = 16;
+  DumpFrame inline_[kInline];
+  std::vector<DumpFrame> overflow_;
+  size_t depth_ = 0;
+};
+
+/**
+ * @brief Stores a converted value where a frame expects it.
+ *
+ * @param frame The frame receiving the value.
+ * @param key The dict key for model and dict frames.
+ * @param value New reference to the value; stolen.
+ * @return 0 on success, -1 on error.
+ */
+static inline int store_dumped(DumpFrame &frame, PyObject *key,
+                               PyObject *value) {
+  if (frame.kind == FRAME_LIST) {
+    PyList_SET_ITEM(frame.result, frame.slot, value);
+    return 0;
+  }
+  int rc = PyDict_SetItem(frame.result, key, value);
+  Py_DECREF(value);
+  return rc;
+}
+
+/**
+ * @brief Returns the dict key under which a frame stores its pending value.
+ */
+static inline PyObject *pending_key(DumpFrame &frame) {
+  if (frame.kind != FRAME_MODEL) {
+    return frame.key;
+  }
+  InstanceData *data = ((DataModelObject *)frame.source)->instance_data;
+  return data->schema->table.keys[frame.slot];
+}
+
+/**
+ * @brief Converts a model reached from convert_datamodel's walk.
+ *
+ * Leaf models are converted right away; other models get a frame.
+ *
+ * @param stack The stack of the walk.
+ * @param value The model instance.
+ * @param out Dictionary to fill instead of a new one, or nullptr.
+ * @return New dictionary for a leaf model; nullptr when a frame was pushed
+ * (no exception set) or on error (exception set).
+ */
+static PyObject *begin_model(DumpStack &stack, PyObject *value,
+                             PyObject *out = nullptr) {
+  InstanceData *data = ((DataModelObject *)value)->instance_data;
+  SchemaCache *schema = data->schema;
+  if (schema->is_leaf) {
+    return convert_leaf_datamodel(schema, data->values, out);
+  }
+  PyObject *result = new_model_result(schema, out);
+  if (result) {
+    stack.push(FRAME_MODEL, value, result, nullptr, schema->dict_serializer);
+  }
+  return nullptr;
+}
+
+/**
+ * @brief Converts the remaining fields of the model frame on top.
+ *
+ * Nested non-leaf models and containers of models get a frame of their own,
+ * which ends the step; every other field is converted according to the
+ * dispatch kind chosen at schema compile time when the value has exactly
+ * the declared type, and through the generic dispatch otherwise.
+ *
+ * @param stack The stack of the walk; its top frame is a model frame.
+ * @return 1 when a frame was pushed, 0 when the model is done, -1 on error.
+ */
+static int step_model(DumpStack &stack) {
+  DumpFrame &frame = stack.top();
+  InstanceData *data = ((DataModelObject *)frame.source)->instance_data;
+  SchemaCache *schema = data->schema;
+  const FieldTable &table = schema->table;
+  PyObject *dict_serializer = frame.dict_serializer;
+  while (frame.pos < schema->num_fields) {
+    Py_ssize_t i = frame.pos++;
+    PyObject *field_value = data->values[i];
+    if (!field_value) {
+      if (PyDict_DelItem(frame.result, table.keys[i]) != 0) {
+        return -1;
+      }
+      continue;
+    }
+    const FieldDump &dump = table.dumps[i];
+    PyObject *conv_value;
+    if (dump.kind == DUMP_GENERIC || !Py_IS_TYPE(field_value, dump.type)) {
+      conv_value = convert_to_dict(field_value, dict_serializer);
+    } else if (dump.kind == DUMP_MODEL) {
+      frame.slot = i;
+      conv_value = begin_model(stack, field_value);
+      if (!conv_value) {
+        return PyErr_Occurred() ? -1 : 1;
+      }
+    } else if (dump.kind == DUMP_LIST_MODEL) {
+      PyObject *result = PyList_New(PyList_GET_SIZE(field_value));
+      if (!result) {
+        return -1;
+      }
+      frame.slot = i;
+      stack.push(FRAME_LIST, field_value, result, dump.item_type,
+                 dict_serializer);
+      return 1;
+    } else if (dump.kind == DUMP_DICT_MODEL) {
+      PyObject *result = new_presized_dict(PyDict_GET_SIZE(field_value));
+      if (!result) {
+        return -1;
+      }
+      frame.slot = i;
+      stack.push(FRAME_DICT, field_value, result, dump.item_type,
+                 dict_serializer);
+      return 1;
+    } else {
+      conv_value = convert_dumped_field(field_value, dump, dict_serializer);
+    }
+    if (!conv_value) {
+      return -1;
+    }
+    int rc = PyDict_SetItem(frame.result, table.keys[i], conv_value);
+    Py_DECREF(conv_value);
+    if (rc != 0) {
+      return -1;
+    }
+  }
+  return 0;
+}
+
+/**
+ * @brief Converts the remaining items of the list or dict frame on top.
+ *
+ * Items that are non-leaf models of exactly the declared item type get a
+ * frame of their own, which ends the step; leaf models are converted in
+ * place and other items take the generic conversion.
+ *
+ * @param stack The stack of the walk; its top frame is a list or dict frame.
+ * @return 1 when a frame was pushed, 0 when the container is done, -1 on
+ * error.
+ */
+static int step_container(DumpStack &stack) {
+  DumpFrame &frame = stack.top();
+  bool is_list = frame.kind == FRAME_LIST;
+  for (;;) {
+    PyObject *item;
+    if (is_list) {
+      if (frame.pos >= PyList_GET_SIZE(frame.result) ||
+          frame.pos >= PyList_GET_SIZE(frame.source)) {
+        return 0;
+      }
+      frame.slot = frame.pos++;
+      item = PyList_GET_ITEM(frame.source, frame.slot);
+    } else if (!PyDict_Next(frame.source, &frame.pos, &frame.key, &item)) {
+      return 0;
+    }
+    PyObject *conv_item;
+    if (Py_IS_TYPE(item, frame.item_type)) {
+      conv_item = begin_model(stack, item);
+      if (!conv_item) {
+        return PyErr_Occurred() ? -1 : 1;
+      }
+    } else {
+      conv_item = convert_to_dict(item, frame.dict_serializer);
+      if (!conv_item) {
+        return -1;
+      }
+    }
+    if (store_dumped(frame, frame.key, conv_item) != 0) {
+      return -1;
+    }
+  }
+}
+
+/**
+ * @brief Converts a DataModel instance to a dictionary.
+ *
+ * Each model's result starts as a copy of its schema's kwargs template, so
+ * it is already sized and keyed with the interned field names and each store
+ * only replaces a value. Leaf models take a shorter loop. Nested models and
+ * lists and dicts of models declared as such are walked with an explicit
+ * stack instead of recursion, so deeply nested data does not grow the C
+ * stack.
+ *
+ * @param value The DataModel instance to convert.
+ * @param out Dictionary to fill with the top-level fields instead of a new
+ * one, or nullptr. Nested models always get new dictionaries.
+ * @return New dictionary representing the DataModel, or nullptr on error.
+ */
+static PyObject *convert_datamodel(PyObject *value, PyObject *out) {
+  InstanceData *data = ((DataModelObject *)value)->instance_data;
+  if (data->schema->is_leaf) {
+    return convert_leaf_datamodel(data->schema, data->values, out);
+  }
+  DumpStack stack;
+  if (!begin_model(stack, value, out) && PyErr_Occurred()) {
+    return nullptr;
+  }
+  for (;;) {
+    DumpFrame &frame = stack.top();
+    int rc =
+        frame.kind == FRAME_MODEL ? step_model(stack) : step_container(stack);
+    if (rc < 0) {
+      return nullptr;
+    }
+    if (rc > 0) {
+      continue;
+    }
+    PyObject *result = stack.top().result;
+    stack.pop();
+    if (stack.empty()) {
+      return result;
+    }
+    DumpFrame &parent = stack.top();
+    if (store_dumped(parent, pending_key(parent), result) != 0) {
+      return nullptr;
+    }
+  }
+}
+
 /**
  * @brief Converts a PyObject to its dictionary representation.
  *
  * Attempts to convert using a custom dict_serializer first. If not applicable,
- * conversion is dispatched based on the type of the PyObject.
+ * the type is read once and compared by identity against the builtin leaf
+ * and container types, so the common cases skip the subclass checks. Models
+ * and subclasses of the builtin types are handled after that.
  *
  * @param value The PyObject to convert.
  * @param dict_serializer A dictionary mapping types to custom conversion
@@ -258,13 +672,29 @@ PyObject *convert_to_dict(PyObject *value, PyObject *dict_serializer) {
       return encoded;
     }
   }
-  if (is_basic_immutable(value)) {
-    Py_INCREF(value);
-    return value;
+  PyTypeObject *type = Py_TYPE(value);
+  if (type == &PyUnicode_Type || type == &PyLong_Type ||
+      type == &PyFloat_Type || type == &PyBool_Type || value == Py_None) {
+    return Py_NewRef(value);
+  }
+  if (type == &PyList_Type) {
+    return convert_list(value, dict_serializer);
+  }
+  if (type == &PyDict_Type) {
+    return convert_dict(value, dict_serializer);
+  }
+  if (type == &PyTuple_Type) {
+    return convert_tuple(value, dict_serializer);
   }
-  if (PyObject_IsInstance(value, (PyObject *)&DataModelType) == 1) {
+  if (type == &PySet_Type) {
+    return convert_set(value, dict_serializer);
+  }
+  if (PyType_IsSubtype(type, &DataModelType)) {
     return convert_datamodel(value);
   }
+  if (is_basic_immutable(value)) {
+    return Py_NewRef(value);
+  }
   if (PyList_Check(value)) {
     return convert_list(value, dict_serializer);
   }
@@ -277,15 +707,16 @@ PyObject *convert_to_dict(PyObject *value, PyObject *dict_serializer) {
   if (PySet_Check(value)) {
     return convert_set(value, dict_serializer);
   }
-  Py_INCREF(value);
-  return value;
+  return Py_NewRef(value);
 }
 
 /**
  * @brief Create a DataModel instance from a dictionary.
  *
  * Parses the input arguments to extract a dictionary and constructs a new
- * instance by calling the model class.
+ * instance. Classes that keep the default __new__, __init__ and metaclass
+ * __call__ are built by calling DataModel_new and DataModel_init directly,
+ * skipping the generic type call; other classes are called normally.
  *
  * @param cls The model class.
  * @param args Tuple containing the input dictionary.
@@ -296,25 +727,111 @@ PyObject *dict_utils_from_dict(PyObject *cls, PyObject *args) {
   if (!PyArg_ParseTuple(args, "O!", &PyDict_Type, &input_dict)) {
     return nullptr;
   }
-  PyObject *empty_tuple = PyTuple_New(0);
-  if (!empty_tuple) {
-    return nullptr;
+  if (!DataModel_can_init_from_native(cls)) {
+    return PyObject_Call(cls, empty_tuple, input_dict);
+  }
+  PyTypeObject *type = reinterpret_cast<PyTypeObject *>(cls);
+  PyObject *instance = type->tp_new(type, empty_tuple, input_dict);
+  if (instance && DataModel_init(instance, empty_tuple, input_dict) != 0) {
+    Py_CLEAR(instance);
   }
-  PyObject *instance = PyObject_Call(cls, empty_tuple, input_dict);
-  Py_DECREF(empty_tuple);
   return instance;
 }
 
 /**
- * @brief Convert a DataModel instance to a dictionary.
+ * @brief Create a list of DataModel instances from dictionaries.
+ *
+ * The construction path is chosen once for the class, then every dictionary
+ * is bound the same way from_dict binds one, and the instances are stored
+ * into a list sized up front.
+ *
+ * @param cls The model class.
+ * @param items A list, tuple or other iterable of dictionaries.
+ * @return A new list of instances, or nullptr on failure.
+ */
+PyObject *dict_utils_from_dicts(PyObject *cls, PyObject *items) {
+  PyObject *seq = PySequence_Fast(items, "from_dicts() expects an iterable");
+  if (!seq) {
+    return nullptr;
+  }
+  Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+  PyObject *result = PyList_New(size);
+  if (!result) {
+    Py_DECREF(seq);
+    return nullptr;
+  }
+  bool native = DataModel_can_init_from_native(cls);
+  PyTypeObject *type = reinterpret_cast<PyTypeObject *>(cls);
+  for (Py_ssize_t i = 0; i < size; i++) {
+    PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+    if (!PyDict_Check(item)) {
+      PyErr_Format(PyExc_TypeError,
+                   "from_dicts() item %zd must be a dict, not %.200s", i,
+                   Py_TYPE(item)->tp_name);
+      Py_DECREF(result);
+      Py_DECREF(seq);
+      return nullptr;
+    }
+    PyObject *instance;
+    if (native) {
+      instance = type->tp_new(type, empty_tuple, item);
+      if (instance && DataModel_init(instance, empty_tuple, item) != 0) {
+        Py_CLEAR(instance);
+      }
+    } else {
+      instance = PyObject_Call(cls, empty_tuple, item);
+    }
+    if (!instance) {
+      Py_DECREF(result);
+      Py_DECREF(seq);
+      return nullptr;
+    }
+    PyList_SET_ITEM(result, i, instance);
+  }
+  Py_DECREF(seq);
+  return result;
+}
+
+/**
+ * @brief Convert a DataModel instance to a dictionary: to_dict(*, out=None).
  *
  * Delegates the conversion to convert_datamodel, which constructs a dictionary
- * representation of the DataModel instance.
+ * representation of the DataModel instance. When out is given, the top-level
+ * fields are written into it and it is returned; passing the same dict on
+ * every call lets repeated conversions reuse it.
  *
  * @param self The DataModel instance.
- * @param Py_UNUSED(ignored) Unused parameter.
+ * @param args The argument values (at most the out keyword).
+ * @param nargs Number of positional arguments (none accepted).
+ * @param kwnames Keyword argument names.
  * @return New dictionary representing the DataModel instance.
  */
-PyObject *dict_utils_to_dict(PyObject *self, PyObject *Py_UNUSED(ignored)) {
-  return convert_datamodel(self);
+PyObject *dict_utils_to_dict(PyObject *self, PyObject *const *args,
+                             Py_ssize_t nargs, PyObject *kwnames) {
+  if (!kwnames) {
+    if (nargs != 0) {
+      PyErr_Format(PyExc_TypeError,
+                   "to_dict() takes no positional arguments (%zd given)",
+                   nargs);
+      return nullptr;
+    }
+    return convert_datamodel(self);
+  }
+  if (nargs != 0 || PyTuple_GET_SIZE(kwnames) != 1 ||
+      PyUnicode_CompareWithASCIIString(PyTuple_GET_ITEM(kwnames, 0), "out") !=
+          0) {
+    PyErr_SetString(PyExc_TypeError,
+                    "to_dict() takes only the keyword argument 'out'");
+    return nullptr;
+  }
+  PyObject *out = args[0];
+  if (out == Py_None) {
+    return convert_datamodel(self);
+  }
+  if (!PyDict_CheckExact(out)) {
+    PyErr_Format(PyExc_TypeError, "to_dict() out must be a dict, not %.200s",
+                 Py_TYPE(out)->tp_name);
+    return nullptr;
+  }
+  return convert_datamodel(self, out);
 }
@@ -6,12 +6,17 @@
  * @brief Convert a DataModel instance to a dictionary.
  *
  * This function converts a DataModel instance into a dictionary representation.
+ * An optional keyword-only out dict receives the top-level fields instead of
+ * a new dictionary.
  *
  * @param self The DataModel instance.
- * @param unused Unused parameter.
+ * @param args The argument values (at most the out keyword).
+ * @param nargs Number of positional arguments (none accepted).
+ * @param kwnames Keyword argument names.
  * @return PyObject* The resulting dictionary, or nullptr on error.
  */
-PyObject *dict_utils_to_dict(PyObject *self, PyObject *unused);
+PyObject *dict_utils_to_dict(PyObject *self, PyObject *const *args,
+                             Py_ssize_t nargs, PyObject *kwnames);
 
 /**
  * @brief Create a DataModel instance from a dictionary.
@@ -23,3 +28,15 @@ PyObject *dict_utils_to_dict(PyObject *self, PyObject *unused);
  * @return PyObject* The new DataModel instance, or nullptr on error.
  */
 PyObject *dict_utils_from_dict(PyObject *cls, PyObject *args);
+
+/**
+ * @brief Create a list of DataModel instances from dictionaries.
+ *
+ * Equivalent to [cls.from_dict(d) for d in items] without the per-item
+ * method call.
+ *
+ * @param cls The class object to instantiate.
+ * @param items An iterable of dictionaries.
+ * @return PyObject* The new list of instances, or nullptr on error.
+ */
+PyObject *dict_utils_from_dicts(PyObject *cls, PyObject *items);
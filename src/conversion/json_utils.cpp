@@ -2,6 +2,7 @@
 #include "conversion/rapidjson_to_pyobject.hpp"
 #include "data_model.hpp"
 #include "init_globals.hpp"
+#include "rapidjson_config.hpp"
 #include "schema/schema.hpp"
 #include <Python.h>
 #include <atomic>
@@ -20,29 +21,71 @@ static bool
 write_json_value(PyObject *value, PyObject *json_serializer,
                  rapidjson::Writer<rapidjson::StringBuffer> &writer);
 
-// Global declarations.
-extern PyObject *schema_key;
-extern PyObject *get_schema_cached(PyObject *cls);
-
 /**
- * @brief Retrieve the cached schema from the type dictionary.
+ * @brief Write a Python int as a JSON number.
+ *
+ * Values in the 64-bit ranges are written natively; larger ones are written
+ * from their decimal representation so they are not truncated.
  */
-static PyObject *get_cached_schema(PyTypeObject *type_ptr) {
-  PyObject *type_dict = type_ptr->tp_dict;
-  PyObject *capsule = nullptr;
-  if (type_dict && PyDict_Check(type_dict)) {
-    capsule = PyDict_GetItem(type_dict, schema_key);
-    if (capsule) {
-      Py_INCREF(capsule);
+static bool write_json_int(PyObject *value,
+                           rapidjson::Writer<rapidjson::StringBuffer> &writer) {
+  int overflow = 0;
+  long long long_val = PyLong_AsLongLongAndOverflow(value, &overflow);
+  if (!overflow) {
+    if (long_val == -1 && PyErr_Occurred()) {
+      return false;
+    }
+    writer.Int64(long_val);
+    return true;
+  }
+  if (overflow > 0) {
+    unsigned long long ulong_val = PyLong_AsUnsignedLongLong(value);
+    if (!PyErr_Occurred()) {
+      writer.Uint64(ulong_val);
+      return true;
     }
+    PyErr_Clear();
   }
-  if (!capsule) {
-    capsule = get_schema_cached(reinterpret_cast<PyObject *>(type_ptr));
-    if (capsule && type_dict && PyDict_Check(type_dict)) {
-      PyDict_SetItem(type_dict, schema_key, capsule);
+  PyObject *digits = PyLong_Type.tp_repr(value);
+  if (!digits) {
+    return false;
+  }
+  Py_ssize_t len = 0;
+  const char *s = PyUnicode_AsUTF8AndSize(digits, &len);
+  bool ok =
+      s && writer.RawValue(s, static_cast<size_t>(len), rapidjson::kNumberType);
+  Py_DECREF(digits);
+  return ok;
+}
+
+/**
+ * @brief Write a value of exactly str, int, float or bool as JSON.
+ *
+ * Used for plain fields without a json_serializer entry for their type, so
+ * leaf values skip the container and serializer checks.
+ */
+static bool
+write_json_plain(PyObject *value,
+                 rapidjson::Writer<rapidjson::StringBuffer> &writer) {
+  PyTypeObject *type = Py_TYPE(value);
+  if (type == &PyUnicode_Type) {
+    Py_ssize_t len = 0;
+    const char *s = PyUnicode_AsUTF8AndSize(value, &len);
+    if (!s) {
+      return false;
     }
+    writer.String(s, static_cast<rapidjson::SizeType>(len));
+    return true;
+  }
+  if (type == &PyLong_Type) {
+    return write_json_int(value, writer);
   }
-  return capsule;
+  if (type == &PyFloat_Type) {
+    writer.Double(PyFloat_AS_DOUBLE(value));
+    return true;
+  }
+  writer.Bool(value == Py_True);
+  return true;
 }
 
 /**
@@ -54,9 +97,44 @@ static bool
 write_json_value(PyObject *value, PyObject *json_serializer,
                  rapidjson::Writer<rapidjson::StringBuffer> &writer) {
   if (PyObject_TypeCheck(value, &DataModelType)) {
-    auto bm = reinterpret_cast<DataModelObject *>(value);
+    InstanceData *data =
+        reinterpret_cast<DataModelObject *>(value)->instance_data;
+    SchemaCache *schema = data->schema;
+    const FieldTable &table = schema->table;
+    // The compiled entries assume the model's own json_serializer; a nested
+    // model written with its root's mapping takes the generic path.
+    bool compiled = json_serializer == schema->json_serializer;
     writer.StartObject();
-    for (auto &pair : bm->instance_data->fields) {
+    for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+      PyObject *field_value = data->values[i];
+      if (!field_value) {
+        continue;
+      }
+      const FieldSchema *fs = &schema->fields[i];
+      writer.Key(fs->field_name_c,
+                 static_cast<rapidjson::SizeType>(fs->field_name_len));
+      const FieldJsonDump &dump = table.json_dumps[i];
+      if (compiled && Py_IS_TYPE(field_value, dump.type)) {
+        if (!dump.serializer) {
+          if (!write_json_plain(field_value, writer)) {
+            return false;
+          }
+          continue;
+        }
+        PyObject *converted = PyObject_CallOneArg(dump.serializer, field_value);
+        if (!converted) {
+          return false;
+        }
+        bool success = write_json_value(converted, json_serializer, writer);
+        Py_DECREF(converted);
+        if (!success) {
+          return false;
+        }
+      } else if (!write_json_value(field_value, json_serializer, writer)) {
+        return false;
+      }
+    }
+    for (auto &pair : data->extras) {
       const std::string &field_name = pair.first;
       PyObject *field_value = pair.second;
       writer.Key(field_name.c_str(),
@@ -84,18 +162,19 @@ write_json_value(PyObject *value, PyObject *json_serializer,
     PyObject *val = nullptr;
     Py_ssize_t pos = 0;
     while (PyDict_Next(value, &pos, &key, &val)) {
-      const char *key_str = nullptr;
-      if (PyUnicode_Check(key)) {
-        key_str = PyUnicode_AsUTF8(key);
-      } else {
-        PyObject *key_repr = PyObject_Str(key);
-        if (!key_repr) {
-          return false;
-        }
-        key_str = PyUnicode_AsUTF8(key_repr);
-        Py_DECREF(key_repr);
+      PyObject *key_str_obj =
+          PyUnicode_Check(key) ? Py_NewRef(key) : PyObject_Str(key);
+      if (!key_str_obj) {
+        return false;
       }
-      writer.Key(key_str);
+      Py_ssize_t key_len = 0;
+      const char *key_str = PyUnicode_AsUTF8AndSize(key_str_obj, &key_len);
+      if (!key_str) {
+        Py_DECREF(key_str_obj);
+        return false;
+      }
+      writer.Key(key_str, static_cast<rapidjson::SizeType>(key_len));
+      Py_DECREF(key_str_obj);
       if (!write_json_value(val, json_serializer, writer)) {
         return false;
       }
@@ -103,7 +182,7 @@ write_json_value(PyObject *value, PyObject *json_serializer,
     writer.EndObject();
     return true;
   } else {
-    if (json_serializer && PyDict_Check(json_serializer)) {
+    if (json_serializer != Py_None) {
       PyObject *type_obj = reinterpret_cast<PyObject *>(Py_TYPE(value));
       PyObject *conv_func = PyDict_GetItem(json_serializer, type_obj);
       if (conv_func && PyCallable_Check(conv_func)) {
@@ -120,16 +199,18 @@ write_json_value(PyObject *value, PyObject *json_serializer,
       writer.Bool(value == Py_True);
       return true;
     } else if (PyLong_Check(value)) {
-      long long_val = PyLong_AsLongLong(value);
-      writer.Int64(long_val);
-      return true;
+      return write_json_int(value, writer);
     } else if (PyFloat_Check(value)) {
       double d = PyFloat_AsDouble(value);
       writer.Double(d);
       return true;
     } else if (PyUnicode_Check(value)) {
-      const char *s = PyUnicode_AsUTF8(value);
-      writer.String(s);
+      Py_ssize_t len = 0;
+      const char *s = PyUnicode_AsUTF8AndSize(value, &len);
+      if (!s) {
+        return false;
+      }
+      writer.String(s, static_cast<rapidjson::SizeType>(len));
       return true;
     } else if (value == Py_None) {
       writer.Null();
@@ -148,64 +229,381 @@ write_json_value(PyObject *value, PyObject *json_serializer,
 }
 
 /**
- * @brief Create a DataModel instance from a JSON string.
+ * @brief Build the keyword arguments dict for a JSON object.
+ *
+ * Starts from a copy of the schema's kwargs template, so the dict is sized for
+ * the fields up front and field keys are the interned field names, then drops
+ * the fields that are absent from the object.
+ *
+ * @param schema Compiled schema of the target class.
+ * @param object The JSON object.
+ * @return New dict reference, or nullptr on error.
+ */
+static PyObject *kwargs_from_object(SchemaCache *schema,
+                                    const rapidjson::Value &object) {
+  PyObject *kwargs = PyDict_Copy(schema->kwargs_template);
+  if (!kwargs) {
+    return nullptr;
+  }
+  std::vector<char> seen(schema->num_fields, 0);
+  for (auto itr = object.MemberBegin(); itr != object.MemberEnd(); ++itr) {
+    PyObject *key = json_key_to_pyobject(itr->name.GetString(),
+                                         itr->name.GetStringLength());
+    if (!key) {
+      Py_DECREF(kwargs);
+      return nullptr;
+    }
+    PyObject *index = PyDict_GetItemWithError(schema->field_index, key);
+    if (index) {
+      Py_ssize_t slot = PyLong_AsSsize_t(index);
+      seen[slot] = 1;
+      Py_SETREF(key, Py_NewRef(schema->table.keys[slot]));
+    } else if (PyErr_Occurred()) {
+      Py_DECREF(key);
+      Py_DECREF(kwargs);
+      return nullptr;
+    }
+    PyObject *value = rapidjson_to_pyobject(itr->value);
+    if (!value || PyDict_SetItem(kwargs, key, value) < 0) {
+      Py_XDECREF(value);
+      Py_DECREF(key);
+      Py_DECREF(kwargs);
+      return nullptr;
+    }
+    Py_DECREF(value);
+    Py_DECREF(key);
+  }
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    if (!seen[i] && PyDict_DelItem(kwargs, schema->table.keys[i]) < 0) {
+      Py_DECREF(kwargs);
+      return nullptr;
+    }
+  }
+  return kwargs;
+}
+
+/**
+ * @brief Per-call decoding state for one model class.
+ *
+ * Resolved once per from_json / from_json_many call so the schema lookup and
+ * the construction-path check are not repeated for every decoded document.
+ */
+struct JsonDecoder {
+  PyObject *cls;
+  SchemaCache *schema;
+  bool native;
+};
+
+/**
+ * @brief Resolve the decoder of a model class.
+ *
+ * @param cls Python type.
+ * @param decoder Receives the resolved state.
+ * @return true on success, false with an exception set.
+ */
+static bool resolve_decoder(PyObject *cls, JsonDecoder *decoder) {
+  if (!empty_tuple) {
+    return false;
+  }
+  decoder->cls = cls;
+  decoder->native = DataModel_can_init_from_native(cls);
+  decoder->schema = get_schema(cls);
+  return decoder->schema != nullptr;
+}
+
+/**
+ * @brief Build a model instance from a parsed JSON object.
+ *
+ * Binds the fields directly from the parsed document. Classes that customize
+ * construction fall back to converting the document into a dictionary and
+ * calling the class with it as keyword arguments.
+ *
+ * @param decoder The resolved decoder of the model class.
+ * @param native The parsed JSON object.
+ * @return New DataModel instance or nullptr on error.
+ */
+static PyObject *instance_from_document(const JsonDecoder &decoder,
+                                        const rapidjson::Value &native) {
+  if (decoder.native) {
+    PyTypeObject *type = reinterpret_cast<PyTypeObject *>(decoder.cls);
+    PyObject *instance = type->tp_new(type, empty_tuple, nullptr);
+    if (!instance) {
+      return nullptr;
+    }
+    if (DataModel_init_from_native_schema(instance, decoder.schema, native) !=
+        0) {
+      Py_DECREF(instance);
+      return nullptr;
+    }
+    return instance;
+  }
+
+  if (!native.IsObject()) {
+    PyErr_SetString(PyExc_TypeError, "Converted JSON is not a dictionary");
+    return nullptr;
+  }
+  PyObject *dict_obj = kwargs_from_object(decoder.schema, native);
+  if (!dict_obj) {
+    return nullptr;
+  }
+
+  PyObject *instance = PyObject_Call(decoder.cls, empty_tuple, dict_obj);
+  Py_DECREF(dict_obj);
+
+  return instance;
+}
+
+/** Size of the per-thread buffer backing parsed documents. */
+static constexpr size_t kParsePoolBufferSize = 32 * 1024;
+
+static thread_local char parse_pool_buffer[kParsePoolBufferSize];
+static thread_local rapidjson::MemoryPoolAllocator<>
+    parse_pool(parse_pool_buffer, sizeof(parse_pool_buffer));
+static thread_local bool parse_pool_in_use = false;
+
+/**
+ * @brief Document allocating from a per-thread memory pool.
  *
- * Parses the JSON string into a Python dictionary and then calls the class's
- * constructor directly using the dictionary as keyword arguments.
+ * The pool's first chunk is a thread-local buffer, so small documents are
+ * parsed without touching the heap, and the pool is cleared (not destroyed)
+ * when the document goes away. A document created while the pool is taken
+ * (e.g. from_json called from a validator during another parse) falls back to
+ * its own allocator.
+ */
+class PooledDocument : public rapidjson::Document {
+public:
+  PooledDocument() : rapidjson::Document(acquire_pool()) {}
+  ~PooledDocument() {
+    // Values never free into a MemoryPoolAllocator, so the pool can be
+    // cleared before the base destructor runs.
+    if (&GetAllocator() == &parse_pool) {
+      parse_pool.Clear();
+      parse_pool_in_use = false;
+    }
+  }
+  PooledDocument(const PooledDocument &) = delete;
+  PooledDocument &operator=(const PooledDocument &) = delete;
+
+private:
+  static rapidjson::MemoryPoolAllocator<> *acquire_pool() {
+    if (parse_pool_in_use) {
+      return nullptr;
+    }
+    parse_pool_in_use = true;
+    return &parse_pool;
+  }
+};
+
+/** Output buffers that grew past this size are released after use. */
+static constexpr size_t kOutputBufferKeepSize = 1024 * 1024;
+
+static thread_local rapidjson::StringBuffer output_buffer;
+static thread_local bool output_buffer_in_use = false;
+
+/**
+ * @brief String buffer reusing a per-thread buffer across to_json calls.
+ *
+ * The shared buffer keeps its capacity between calls, so serializing many
+ * models does not regrow it from scratch each time. A to_json call made while
+ * the buffer is taken (e.g. from a json_serializer) uses a buffer of its own.
+ */
+class PooledStringBuffer {
+public:
+  PooledStringBuffer() : owns_shared_(!output_buffer_in_use) {
+    if (owns_shared_) {
+      output_buffer_in_use = true;
+      output_buffer.Clear();
+    }
+  }
+  ~PooledStringBuffer() {
+    if (owns_shared_) {
+      if (output_buffer.GetSize() > kOutputBufferKeepSize) {
+        output_buffer.Clear();
+        output_buffer.ShrinkToFit();
+      }
+      output_buffer_in_use = false;
+    }
+  }
+  PooledStringBuffer(const PooledStringBuffer &) = delete;
+  PooledStringBuffer &operator=(const PooledStringBuffer &) = delete;
+
+  rapidjson::StringBuffer &buffer() {
+    return owns_shared_ ? output_buffer : local_;
+  }
+
+private:
+  bool owns_shared_;
+  rapidjson::StringBuffer local_;
+};
+
+/**
+ * @brief Set a ValueError describing a rapidjson parse failure.
+ *
+ * @param doc The document that failed to parse.
+ * @param base_offset Offset of the document within the whole input.
+ */
+static void set_parse_error(const rapidjson::Document &doc,
+                            size_t base_offset) {
+  PyErr_Format(PyExc_ValueError, "rapidjson parse error: %s (at offset %u)",
+               rapidjson::GetParseError_En(doc.GetParseError()),
+               static_cast<unsigned>(base_offset + doc.GetErrorOffset()));
+}
+
+/**
+ * @brief Get the UTF-8 buffer of a JSON argument (str, bytes or bytearray).
+ *
+ * @param obj The Python argument.
+ * @param len Receives the buffer length.
+ * @return const char* The buffer, or nullptr with TypeError set.
+ */
+static const char *get_json_buffer(PyObject *obj, Py_ssize_t *len) {
+  if (PyUnicode_Check(obj)) {
+    return PyUnicode_AsUTF8AndSize(obj, len);
+  }
+  if (PyBytes_Check(obj)) {
+    *len = PyBytes_GET_SIZE(obj);
+    return PyBytes_AS_STRING(obj);
+  }
+  if (PyByteArray_Check(obj)) {
+    *len = PyByteArray_GET_SIZE(obj);
+    return PyByteArray_AS_STRING(obj);
+  }
+  PyErr_SetString(PyExc_TypeError,
+                  "Argument must be a str, bytes or bytearray object");
+  return nullptr;
+}
+
+/**
+ * @brief Create a DataModel instance from a JSON string.
  *
  * @param cls Python type.
- * @param json_str JSON string.
+ * @param json_str UTF-8 JSON text.
+ * @param json_length Length of json_str in bytes.
  * @return New DataModel instance or nullptr on error.
  */
-static PyObject *json_utils_from_json_impl(PyObject *cls,
-                                           const char *json_str) {
-  if (!json_str || json_str[0] == '\0') {
+static PyObject *json_utils_from_json_impl(PyObject *cls, const char *json_str,
+                                           Py_ssize_t json_length) {
+  if (!json_str || json_length == 0) {
     PyErr_SetString(PyExc_ValueError, "Empty JSON string");
     return nullptr;
   }
-  size_t json_length = std::strlen(json_str);
+  JsonDecoder decoder;
+  if (!resolve_decoder(cls, &decoder)) {
+    return nullptr;
+  }
   std::vector<char> buffer(json_str, json_str + json_length + 1);
 
-  rapidjson::Document doc;
+  PooledDocument doc;
   doc.ParseInsitu(buffer.data());
   if (doc.HasParseError()) {
-    PyErr_Format(PyExc_ValueError, "rapidjson parse error: %s (at offset %u)",
-                 rapidjson::GetParseError_En(doc.GetParseError()),
-                 static_cast<unsigned>(doc.GetErrorOffset()));
+    set_parse_error(doc, 0);
     return nullptr;
   }
   if (!doc.IsObject()) {
     PyErr_SetString(PyExc_TypeError, "JSON root must be an object");
     return nullptr;
   }
+  return instance_from_document(decoder, doc);
+}
 
-  PyObject *dict_obj = rapidjson_to_pyobject(doc);
-  if (!dict_obj) {
+/**
+ * @brief Append model instances for every object of a JSON array.
+ *
+ * @param decoder The resolved decoder of the model class.
+ * @param array The parsed JSON array.
+ * @return New list of instances, or nullptr on error.
+ */
+static PyObject *instances_from_array(const JsonDecoder &decoder,
+                                      const rapidjson::Value &array) {
+  rapidjson::SizeType size = array.Size();
+  PyObject *result = PyList_New(size);
+  if (!result) {
     return nullptr;
   }
-  if (!PyDict_Check(dict_obj)) {
-    Py_DECREF(dict_obj);
-    PyErr_SetString(PyExc_TypeError, "Converted JSON is not a dictionary");
-    return nullptr;
+  for (rapidjson::SizeType i = 0; i < size; i++) {
+    const rapidjson::Value &item = array[i];
+    if (!item.IsObject()) {
+      Py_DECREF(result);
+      PyErr_Format(PyExc_TypeError, "JSON array item %u must be an object",
+                   static_cast<unsigned>(i));
+      return nullptr;
+    }
+    PyObject *instance = instance_from_document(decoder, item);
+    if (!instance) {
+      Py_DECREF(result);
+      return nullptr;
+    }
+    PyList_SET_ITEM(result, i, instance);
   }
+  return result;
+}
 
-  if (!empty_tuple) {
-    Py_DECREF(dict_obj);
+/**
+ * @brief Append model instances for every object of a newline-delimited
+ * JSON stream.
+ *
+ * Documents are parsed one after another from the same buffer; whitespace
+ * (including the newlines) between them is skipped.
+ *
+ * @param decoder The resolved decoder of the model class.
+ * @param buffer Mutable, NUL-terminated copy of the input.
+ * @return New list of instances, or nullptr on error.
+ */
+static PyObject *instances_from_stream(const JsonDecoder &decoder,
+                                       std::vector<char> &buffer) {
+  PyObject *result = PyList_New(0);
+  if (!result) {
     return nullptr;
   }
-  PyObject *instance = PyObject_Call(cls, empty_tuple, dict_obj);
-  Py_DECREF(empty_tuple);
-  Py_DECREF(dict_obj);
-
-  return instance;
+  char *base = buffer.data();
+  size_t pos = 0;
+  while (true) {
+    while (base[pos] == ' ' || base[pos] == '\n' || base[pos] == '\r' ||
+           base[pos] == '\t') {
+      pos++;
+    }
+    if (base[pos] == '\0') {
+      break;
+    }
+    rapidjson::InsituStringStream stream(base + pos);
+    PooledDocument doc;
+    doc.ParseStream<rapidjson::kParseInsituFlag |
+                    rapidjson::kParseStopWhenDoneFlag>(stream);
+    if (doc.HasParseError()) {
+      set_parse_error(doc, pos);
+      Py_DECREF(result);
+      return nullptr;
+    }
+    if (!doc.IsObject()) {
+      PyErr_Format(PyExc_TypeError,
+                   "JSON document at offset %u must be an object",
+                   static_cast<unsigned>(pos));
+      Py_DECREF(result);
+      return nullptr;
+    }
+    PyObject *instance = instance_from_document(decoder, doc);
+    if (!instance) {
+      Py_DECREF(result);
+      return nullptr;
+    }
+    int rc = PyList_Append(result, instance);
+    Py_DECREF(instance);
+    if (rc != 0) {
+      Py_DECREF(result);
+      return nullptr;
+    }
+    pos += stream.Tell();
+  }
+  return result;
 }
 
 extern "C" {
 
 /**
- * @brief Create a DataModel instance from a JSON string.
+ * @brief Create a DataModel instance from a JSON document.
  *
- * Expects exactly one argument (a JSON string).
+ * Expects exactly one argument (str, bytes or bytearray). Byte input is
+ * parsed as UTF-8 without being decoded into a str first.
  */
 PyObject *json_utils_from_json(PyObject *cls, PyObject *const *args,
                                Py_ssize_t nargs) {
@@ -214,42 +612,77 @@ PyObject *json_utils_from_json(PyObject *cls, PyObject *const *args,
                     "Expected exactly one argument (a JSON string)");
     return nullptr;
   }
-  PyObject *json_obj = args[0];
-  if (!PyUnicode_Check(json_obj)) {
-    PyErr_SetString(PyExc_TypeError, "Argument must be a Unicode string");
+  Py_ssize_t json_length = 0;
+  const char *json_str = get_json_buffer(args[0], &json_length);
+  if (!json_str) {
     return nullptr;
   }
-  const char *json_str = PyUnicode_AsUTF8(json_obj);
-  return json_utils_from_json_impl(cls, json_str);
+  return json_utils_from_json_impl(cls, json_str, json_length);
 }
 
 /**
- * @brief Convert a DataModel instance to a JSON string.
+ * @brief Create a list of DataModel instances from a JSON array or from
+ * newline-delimited JSON objects.
  *
- * Applies a custom json_serializer and returns a Unicode string.
+ * Expects exactly one argument (str, bytes or bytearray).
  */
-PyObject *json_utils_to_json(PyObject *self, PyObject *Py_UNUSED(ignored)) {
-  PyTypeObject *type_ptr = Py_TYPE(self);
-  PyObject *capsule = get_cached_schema(type_ptr);
-  if (!capsule) {
+PyObject *json_utils_from_json_many(PyObject *cls, PyObject *const *args,
+                                    Py_ssize_t nargs) {
+  if (nargs != 1) {
+    PyErr_SetString(PyExc_TypeError,
+                    "Expected exactly one argument (a JSON string)");
+    return nullptr;
+  }
+  Py_ssize_t json_length = 0;
+  const char *json_str = get_json_buffer(args[0], &json_length);
+  if (!json_str) {
     return nullptr;
   }
-  SchemaCache *schema = reinterpret_cast<SchemaCache *>(
-      PyCapsule_GetPointer(capsule, "vldt.SchemaCache"));
-  Py_DECREF(capsule);
-  if (!schema) {
+  JsonDecoder decoder;
+  if (!resolve_decoder(cls, &decoder)) {
     return nullptr;
   }
+  std::vector<char> buffer(json_str, json_str + json_length);
+  buffer.push_back('\0');
 
+  const char *first = buffer.data();
+  while (*first == ' ' || *first == '\n' || *first == '\r' || *first == '\t') {
+    first++;
+  }
+  if (*first != '[') {
+    return instances_from_stream(decoder, buffer);
+  }
+
+  PooledDocument doc;
+  doc.ParseInsitu(buffer.data());
+  if (doc.HasParseError()) {
+    set_parse_error(doc, 0);
+    return nullptr;
+  }
+  return instances_from_array(decoder, doc);
+}
+
+/**
+ * @brief Convert a DataModel instance to a JSON string.
+ *
+ * Applies a custom json_serializer and returns a Unicode string. The schema
+ * comes from the instance data, so no class lookup is needed per call.
+ */
+PyObject *json_utils_to_json(PyObject *self, PyObject *Py_UNUSED(ignored)) {
+  SchemaCache *schema =
+      reinterpret_cast<DataModelObject *>(self)->instance_data->schema;
   PyObject *json_serializer = schema->json_serializer;
-  rapidjson::StringBuffer sb;
-  rapidjson::Writer<rapidjson::StringBuffer> writer(sb);
+  PooledStringBuffer sb;
+  rapidjson::Writer<rapidjson::StringBuffer> writer(sb.buffer());
 
   if (!write_json_value(self, json_serializer, writer)) {
-    PyErr_SetString(PyExc_RuntimeError, "Error converting object to JSON");
+    if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_RuntimeError, "Error converting object to JSON");
+    }
     return nullptr;
   }
-  return PyUnicode_FromString(sb.GetString());
+  return PyUnicode_FromStringAndSize(
+      sb.buffer().GetString(), static_cast<Py_ssize_t>(sb.buffer().GetSize()));
 }
 
 } // extern "C"
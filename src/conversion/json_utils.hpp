@@ -21,6 +21,21 @@ extern "C" {
 PyObject *json_utils_from_json(PyObject *cls, PyObject *const *args,
                                Py_ssize_t nargs);
 
+/**
+ * @brief Create a list of DataModel instances from a batch of JSON documents.
+ *
+ * Accepts either a JSON array of objects or newline-delimited JSON (one
+ * object per line) as str, bytes or bytearray. All documents are parsed and
+ * bound in a single call.
+ *
+ * @param cls The Python type object for the DataModel.
+ * @param args Pointer to an array of Python objects (arguments).
+ * @param nargs Number of arguments provided.
+ * @return A new list of DataModel instances on success, or NULL on error.
+ */
+PyObject *json_utils_from_json_many(PyObject *cls, PyObject *const *args,
+                                    Py_ssize_t nargs);
+
 /**
  * @brief Convert a DataModel instance to a JSON string.
  *
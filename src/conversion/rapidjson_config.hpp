@@ -0,0 +1,19 @@
+#pragma once
+
+/**
+ * @brief RapidJSON configuration shared by every file that includes it.
+ *
+ * Enables RapidJSON's SIMD whitespace skipping and string scanning using only
+ * the baseline instruction set of the target: SSE2 on x86-64 and NEON on
+ * ARM64. Both are guaranteed by the architecture, so the extension keeps
+ * running on every CPU of the target without a runtime check. Must be
+ * included before any RapidJSON header so all translation units agree.
+ */
+#if !defined(RAPIDJSON_SSE2) && !defined(RAPIDJSON_SSE42) &&                   \
+    !defined(RAPIDJSON_NEON)
+#if defined(__x86_64__) || defined(_M_X64) || defined(__SSE2__)
+#define RAPIDJSON_SSE2
+#elif defined(__aarch64__) || defined(_M_ARM64) || defined(__ARM_NEON)
+#define RAPIDJSON_NEON
+#endif
+#endif
@@ -3,9 +3,79 @@
 #endif
 
 #include "rapidjson_to_pyobject.hpp"
+#include "init_globals.hpp"
+#include "rapidjson_config.hpp"
 #include <Python.h>
+#include <cstdint>
+#include <cstring>
 #include <rapidjson/document.h>
 
+/**
+ * @brief One entry of the JSON object key cache.
+ */
+struct KeyCacheEntry {
+  uint64_t hash;
+  PyObject *key;
+};
+
+static constexpr size_t kKeyCacheSize = 1024;
+static constexpr size_t kKeyCacheMaxLength = 64;
+static KeyCacheEntry key_cache[kKeyCacheSize];
+
+/**
+ * @brief Hashes the bytes of a JSON key (FNV-1a).
+ */
+static inline uint64_t key_bytes_hash(const char *data, size_t len) {
+  uint64_t hash = 0xcbf29ce484222325ULL;
+  for (size_t i = 0; i < len; i++) {
+    hash = (hash ^ static_cast<unsigned char>(data[i])) * 0x100000001b3ULL;
+  }
+  return hash;
+}
+
+void json_key_cache_seed(PyObject *key) {
+  if (!PyUnicode_CheckExact(key) || !PyUnicode_IS_ASCII(key)) {
+    return;
+  }
+  size_t len = static_cast<size_t>(PyUnicode_GET_LENGTH(key));
+  if (len > kKeyCacheMaxLength || PyObject_Hash(key) == -1) {
+    PyErr_Clear();
+    return;
+  }
+  const char *data = static_cast<const char *>(PyUnicode_DATA(key));
+  uint64_t hash = key_bytes_hash(data, len);
+  KeyCacheEntry &entry = key_cache[hash & (kKeyCacheSize - 1)];
+  Py_XSETREF(entry.key, Py_NewRef(key));
+  entry.hash = hash;
+}
+
+PyObject *json_key_to_pyobject(const char *data, size_t len) {
+  if (len > kKeyCacheMaxLength) {
+    return PyUnicode_FromStringAndSize(data, static_cast<Py_ssize_t>(len));
+  }
+  for (size_t i = 0; i < len; i++) {
+    if (static_cast<unsigned char>(data[i]) >= 0x80) {
+      return PyUnicode_FromStringAndSize(data, static_cast<Py_ssize_t>(len));
+    }
+  }
+  uint64_t hash = key_bytes_hash(data, len);
+  KeyCacheEntry &entry = key_cache[hash & (kKeyCacheSize - 1)];
+  if (entry.key && entry.hash == hash &&
+      PyUnicode_GET_LENGTH(entry.key) == static_cast<Py_ssize_t>(len) &&
+      memcmp(PyUnicode_DATA(entry.key), data, len) == 0) {
+    return Py_NewRef(entry.key);
+  }
+  PyObject *key =
+      PyUnicode_FromStringAndSize(data, static_cast<Py_ssize_t>(len));
+  if (!key || PyObject_Hash(key) == -1) {
+    Py_XDECREF(key);
+    return nullptr;
+  }
+  Py_XSETREF(entry.key, Py_NewRef(key));
+  entry.hash = hash;
+  return key;
+}
+
 /**
  * @brief Converts a rapidjson::Value to a corresponding PyObject.
  *
@@ -56,13 +126,13 @@ PyObject *rapidjson_to_pyobject(const rapidjson::Value &value) {
       return list_obj;
     }
     if (value.IsObject()) {
-      PyObject *dict_obj = PyDict_New();
+      PyObject *dict_obj = new_presized_dict(value.MemberCount());
       if (!dict_obj) {
         return nullptr;
       }
       for (auto itr = value.MemberBegin(); itr != value.MemberEnd(); ++itr) {
-        PyObject *key_obj = PyUnicode_FromStringAndSize(
-            itr->name.GetString(), itr->name.GetStringLength());
+        PyObject *key_obj = json_key_to_pyobject(itr->name.GetString(),
+                                                 itr->name.GetStringLength());
         if (!key_obj) {
           Py_DECREF(dict_obj);
           return nullptr;
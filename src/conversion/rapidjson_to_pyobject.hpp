@@ -1,6 +1,8 @@
 #pragma once
 
+#include "rapidjson_config.hpp"
 #include <Python.h>
+#include <cstddef>
 #include <rapidjson/document.h>
 
 /**
@@ -10,3 +12,29 @@
  * @return PyObject* A new reference on success, or nullptr on failure.
  */
 PyObject *rapidjson_to_pyobject(const rapidjson::Value &value);
+
+/**
+ * @brief Converts the UTF-8 name of a JSON object member to a str.
+ *
+ * Short ASCII keys go through a small cache keyed by their bytes, so the
+ * keys repeated across objects and documents (field names above all) reuse
+ * one str object with its hash already computed instead of allocating and
+ * hashing a new string for every member. Dict lookups with such keys can
+ * then match by identity.
+ *
+ * @param data The key bytes.
+ * @param len The key length in bytes.
+ * @return PyObject* A new reference on success, or nullptr on failure.
+ */
+PyObject *json_key_to_pyobject(const char *data, size_t len);
+
+/**
+ * @brief Puts a str into the JSON key cache.
+ *
+ * Schema compilation seeds the cache with the interned field names and
+ * aliases, so JSON keys naming a field decode to the very object the field
+ * table holds.
+ *
+ * @param key The key to cache; anything but a short ASCII str is ignored.
+ */
+void json_key_cache_seed(PyObject *key);
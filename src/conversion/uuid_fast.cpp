@@ -0,0 +1,156 @@
+#include "uuid_fast.hpp"
+#include "init_globals.hpp"
+
+#include <Python.h>
+#include <array>
+#include <cstdint>
+
+static PyObject *UUIDType = nullptr;
+static PyObject *SafeUUIDUnknown = nullptr;
+static PyObject *int_str = nullptr;
+static PyObject *is_safe_str = nullptr;
+
+/**
+ * @brief Lookup table mapping ASCII bytes to hex nibble values (0xFF = bad).
+ */
+static constexpr std::array<uint8_t, 256> make_hex_table() {
+  std::array<uint8_t, 256> table{};
+  for (auto &entry : table) {
+    entry = 0xFF;
+  }
+  for (int i = 0; i < 10; i++) {
+    table['0' + i] = static_cast<uint8_t>(i);
+  }
+  for (int i = 0; i < 6; i++) {
+    table['a' + i] = static_cast<uint8_t>(10 + i);
+    table['A' + i] = static_cast<uint8_t>(10 + i);
+  }
+  return table;
+}
+
+static constexpr std::array<uint8_t, 256> hex_table = make_hex_table();
+
+/**
+ * @brief Copies the 32 hex digits of a UUID string into a contiguous buffer.
+ *
+ * @param s The UTF-8 buffer.
+ * @param len The buffer length (32 or 36).
+ * @param hex Output buffer of 33 bytes, NUL-terminated on success.
+ * @return true if the input is a well-formed UUID string.
+ */
+static bool collect_uuid_hex(const char *s, Py_ssize_t len, char *hex) {
+  if (len == 36) {
+    if (s[8] != '-' || s[13] != '-' || s[18] != '-' || s[23] != '-') {
+      return false;
+    }
+    static const int group_start[] = {0, 9, 14, 19, 24};
+    static const int group_len[] = {8, 4, 4, 4, 12};
+    int pos = 0;
+    for (int g = 0; g < 5; g++) {
+      for (int i = 0; i < group_len[g]; i++) {
+        hex[pos++] = s[group_start[g] + i];
+      }
+    }
+  } else if (len == 32) {
+    for (int i = 0; i < 32; i++) {
+      hex[i] = s[i];
+    }
+  } else {
+    return false;
+  }
+  uint8_t bad = 0;
+  for (int i = 0; i < 32; i++) {
+    bad |= hex_table[static_cast<unsigned char>(hex[i])];
+  }
+  hex[32] = '\0';
+  return (bad & 0xF0) == 0;
+}
+
+/**
+ * @brief Builds a UUID instance without going through UUID.__init__.
+ *
+ * @param hex 32 validated hex digits, NUL-terminated.
+ * @return PyObject* A new UUID, or nullptr on error.
+ */
+static PyObject *build_uuid(const char *hex) {
+  PyObject *int_value = PyLong_FromString(hex, nullptr, 16);
+  if (!int_value) {
+    return nullptr;
+  }
+  PyTypeObject *type = reinterpret_cast<PyTypeObject *>(UUIDType);
+  PyObject *uuid = PyBaseObject_Type.tp_new(type, empty_tuple, nullptr);
+  if (!uuid) {
+    Py_DECREF(int_value);
+    return nullptr;
+  }
+  if (PyObject_GenericSetAttr(uuid, int_str, int_value) < 0 ||
+      PyObject_GenericSetAttr(uuid, is_safe_str, SafeUUIDUnknown) < 0) {
+    Py_DECREF(int_value);
+    Py_DECREF(uuid);
+    return nullptr;
+  }
+  Py_DECREF(int_value);
+  return uuid;
+}
+
+/**
+ * @brief Builds a uuid.UUID from a string.
+ *
+ * @param value The string to parse.
+ * @return PyObject* A new UUID, or nullptr with an exception set.
+ */
+PyObject *parse_uuid_from_str(PyObject *value) {
+  Py_ssize_t len = 0;
+  const char *s = PyUnicode_AsUTF8AndSize(value, &len);
+  if (!s) {
+    return nullptr;
+  }
+  char hex[33];
+  if (collect_uuid_hex(s, len, hex)) {
+    return build_uuid(hex);
+  }
+  return PyObject_CallOneArg(UUIDType, value);
+}
+
+/**
+ * @brief Python entry point for parse_uuid_from_str.
+ *
+ * @param module The extension module.
+ * @param arg The string to parse.
+ * @return PyObject* A new UUID, or nullptr on error.
+ */
+PyObject *uuid_fast_parse_uuid(PyObject *module, PyObject *arg) {
+  if (!PyUnicode_Check(arg)) {
+    PyErr_Format(PyExc_TypeError, "Expected str, got %s",
+                 Py_TYPE(arg)->tp_name);
+    return nullptr;
+  }
+  return parse_uuid_from_str(arg);
+}
+
+/**
+ * @brief Imports uuid.UUID and uuid.SafeUUID.unknown.
+ *
+ * @return int 0 on success, -1 on failure.
+ */
+int init_uuid_fast_globals(void) {
+  PyObject *uuid_module = PyImport_ImportModule("uuid");
+  if (!uuid_module) {
+    return -1;
+  }
+  UUIDType = PyObject_GetAttrString(uuid_module, "UUID");
+  PyObject *safe_uuid = PyObject_GetAttrString(uuid_module, "SafeUUID");
+  Py_DECREF(uuid_module);
+  if (!UUIDType || !safe_uuid || !PyType_Check(UUIDType)) {
+    Py_XDECREF(safe_uuid);
+    return -1;
+  }
+  SafeUUIDUnknown = PyObject_GetAttrString(safe_uuid, "unknown");
+  Py_DECREF(safe_uuid);
+  int_str = PyUnicode_InternFromString("int");
+  is_safe_str = PyUnicode_InternFromString("is_safe");
+  if (!SafeUUIDUnknown || !int_str || !is_safe_str) {
+    return -1;
+  }
+  return 0;
+}
@@ -0,0 +1,30 @@
+#pragma once
+
+#include <Python.h>
+
+/**
+ * @brief Builds a uuid.UUID from its canonical string form.
+ *
+ * Accepts the 36-character hyphenated form and the 32-character bare hex
+ * form. Any other shape is passed to the uuid.UUID constructor.
+ *
+ * @param value The string to parse.
+ * @return PyObject* A new UUID on success, or nullptr with an exception set.
+ */
+PyObject *parse_uuid_from_str(PyObject *value);
+
+/**
+ * @brief Python entry point for parse_uuid_from_str (vldt.parse_uuid_fast).
+ *
+ * @param module The extension module.
+ * @param arg The string to parse.
+ * @return PyObject* A new UUID on success, or nullptr on error.
+ */
+PyObject *uuid_fast_parse_uuid(PyObject *module, PyObject *arg);
+
+/**
+ * @brief Imports uuid.UUID and uuid.SafeUUID used by the fast parser.
+ *
+ * @return int 0 on success, -1 on failure.
+ */
+int init_uuid_fast_globals(void);
@@ -1,5 +1,8 @@
 #include <Python.h>
+#include <algorithm>
 #include <functional>
+#include <memory>
+#include <new>
 #include <stdlib.h>
 #include <string.h>
 #include <string>
@@ -22,6 +25,10 @@ static PyObject *field_suffix = nullptr;
 PyObject *FieldType = nullptr;
 static PyObject *default_str = nullptr;
 static PyObject *default_factory_str = nullptr;
+static PyObject *copy_deepcopy = nullptr;
+static PyObject *deepcopy_str = nullptr;
+static PyObject *model_deepcopy = nullptr;
+static PyObject *to_dict_str = nullptr;
 
 /**
  * @brief Initialize globals for DataModel.
@@ -50,6 +57,19 @@ int init_data_model_globals(void) {
   default_str = PyUnicode_InternFromString("default");
   default_factory_str = PyUnicode_InternFromString("default_factory");
 
+  PyObject *copy_module = PyImport_ImportModule("copy");
+  if (!copy_module) {
+    return -1;
+  }
+  copy_deepcopy = PyObject_GetAttrString(copy_module, "deepcopy");
+  Py_DECREF(copy_module);
+  if (!copy_deepcopy) {
+    return -1;
+  }
+  deepcopy_str = PyUnicode_InternFromString("__deepcopy__");
+  model_deepcopy = _PyType_Lookup(&DataModelType, deepcopy_str);
+  to_dict_str = PyUnicode_InternFromString("to_dict");
+
   return 0;
 }
 
@@ -70,6 +90,102 @@ static int is_class_var(PyObject *expected_type) {
   return 0;
 }
 
+/**
+ * @brief Allocate the native storage for an instance of the given class.
+ *
+ * The storage holds a reference to the schema capsule until it is released.
+ *
+ * @param type The model class.
+ * @return InstanceData* New instance data, or nullptr with an exception set.
+ */
+static InstanceData *alloc_instance_data(PyTypeObject *type) {
+  SchemaCache *schema = get_schema((PyObject *)type);
+  if (!schema) {
+    return nullptr;
+  }
+  if (schema->num_free_instances > 0) {
+    Py_INCREF(schema->capsule);
+    return schema->free_instances[--schema->num_free_instances];
+  }
+  InstanceData *data = new (std::nothrow) InstanceData();
+  if (!data) {
+    PyErr_NoMemory();
+    return nullptr;
+  }
+  data->schema = schema;
+  data->values = new (std::nothrow) PyObject *[schema->num_fields]();
+  if (!data->values) {
+    delete data;
+    PyErr_NoMemory();
+    return nullptr;
+  }
+  Py_INCREF(schema->capsule);
+  return data;
+}
+
+/**
+ * @brief Release the native storage of an instance.
+ *
+ * The references held by the storage are dropped; the storage itself goes to
+ * the schema's freelist when there is room, and is deleted otherwise. The
+ * reference to the schema capsule is dropped last, since it may free the
+ * schema.
+ *
+ * @param data The instance data.
+ */
+static void free_instance_data(InstanceData *data) {
+  if (!data) {
+    return;
+  }
+  SchemaCache *schema = data->schema;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    Py_CLEAR(data->values[i]);
+  }
+  for (auto &pair : data->extras) {
+    Py_XDECREF(pair.second);
+  }
+  data->extras.clear();
+  data->dict_initialized = false;
+  if (schema->num_free_instances < VLDT_INSTANCE_FREELIST_SIZE) {
+    schema->free_instances[schema->num_free_instances++] = data;
+  } else {
+    delete[] data->values;
+    delete data;
+  }
+  Py_DECREF(schema->capsule);
+}
+
+/**
+ * @brief Find the slot of a declared field by name.
+ *
+ * Field keys are interned, so an interned name (as attribute names in code
+ * are) names a field exactly when it is one of the keys: small schemas
+ * answer with pointer compares, misses included, and only other names go
+ * through the field index dict.
+ *
+ * @param schema The compiled schema.
+ * @param name The attribute name.
+ * @return Py_ssize_t The field index, or -1 if name is not a field.
+ */
+static inline Py_ssize_t field_slot(SchemaCache *schema, PyObject *name) {
+  Py_ssize_t n = schema->num_fields;
+  if (n <= VLDT_FIELD_SCAN_LIMIT && PyUnicode_CheckExact(name) &&
+      PyUnicode_CHECK_INTERNED(name)) {
+    PyObject **keys = schema->table.keys;
+    for (Py_ssize_t i = 0; i < n; i++) {
+      if (keys[i] == name) {
+        return i;
+      }
+    }
+    return -1;
+  }
+  PyObject *index = PyDict_GetItem(schema->field_index, name);
+  if (!index) {
+    return -1;
+  }
+  return PyLong_AsSsize_t(index);
+}
+
 /**
  * @brief DataModel.__new__ implementation.
  *
@@ -79,10 +195,16 @@ static int is_class_var(PyObject *expected_type) {
  * @return PyObject* New instance.
  */
 PyObject *DataModel_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
+  InstanceData *data = alloc_instance_data(type);
+  if (!data) {
+    return nullptr;
+  }
   DataModelObject *self = (DataModelObject *)type->tp_alloc(type, 0);
-  if (self) {
-    self->instance_data = new InstanceData();
+  if (!self) {
+    free_instance_data(data);
+    return nullptr;
   }
+  self->instance_data = data;
   return (PyObject *)self;
 }
 
@@ -93,10 +215,7 @@ PyObject *DataModel_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
  */
 void DataModel_dealloc(PyObject *self) {
   DataModelObject *bm_self = (DataModelObject *)self;
-  for (auto &pair : bm_self->instance_data->fields) {
-    Py_XDECREF(pair.second);
-  }
-  delete bm_self->instance_data;
+  free_instance_data(bm_self->instance_data);
   Py_TYPE(self)->tp_free(self);
 }
 
@@ -111,286 +230,1453 @@ PyObject *DataModel_getattro(PyObject *self, PyObject *name) {
   DataModelObject *bm_self = (DataModelObject *)self;
   InstanceData *data = bm_self->instance_data;
 
-  const char *attr_name = PyUnicode_AsUTF8(name);
-  auto it = data->fields.find(attr_name);
-  if (it != data->fields.end()) {
-    Py_INCREF(it->second);
-    return it->second;
+  Py_ssize_t slot = field_slot(data->schema, name);
+  if (slot >= 0 && data->values[slot]) {
+    Py_INCREF(data->values[slot]);
+    return data->values[slot];
+  }
+  if (!data->extras.empty()) {
+    const char *attr_name = PyUnicode_AsUTF8(name);
+    if (!attr_name) {
+      return nullptr;
+    }
+    auto it = data->extras.find(attr_name);
+    if (it != data->extras.end()) {
+      Py_INCREF(it->second);
+      return it->second;
+    }
   }
   return PyObject_GenericGetAttr(self, name);
 }
 
 /**
- * @brief DataModel.__init__ implementation.
+ * @brief Resolve the value of a field that was not provided by the caller.
  *
- * This merged implementation:
- *   - Allocates the instance data.
- *   - Retrieves and validates the schema.
- *   - Runs BEFORE validators.
- *   - Iterates over each field to extract values directly from kwds (checking
- *     aliases first), falling back to default_factory, default_value, or None
- * as needed.
- *   - Validates and converts each field value.
- *   - Runs AFTER validators.
+ * Falls back to default_factory, default_value, or None (for optional
+ * fields). Records an error in the collector when no value can be produced.
  *
- * @param self Python object.
- * @param args Positional arguments (none allowed).
- * @param kwds Keyword arguments.
- * @return int 0 on success, -1 on failure.
+ * @param fs The field schema.
+ * @param flags The field's FieldFlags bits from the field table.
+ * @param collector The error collector.
+ * @return PyObject* New reference to the value, or nullptr if missing.
  */
-int DataModel_init(PyObject *self, PyObject *args, PyObject *kwds) {
-  DataModelObject *bm_self = (DataModelObject *)self;
-
-  PyObject *cls = (PyObject *)Py_TYPE(self);
-  PyObject *capsule = get_schema_cached(cls);
-  if (!capsule) {
-    PyErr_SetString(PyExc_TypeError, "Could not compile model schema");
-    return -1;
-  }
-  SchemaCache *schema =
-      (SchemaCache *)PyCapsule_GetPointer(capsule, "vldt.SchemaCache");
-  Py_DECREF(capsule);
-  if (!schema) {
-    PyErr_SetString(PyExc_TypeError, "Schema capsule is invalid");
-    return -1;
+static PyObject *resolve_missing_field(FieldSchema *fs, uint8_t flags,
+                                       ErrorCollector &collector) {
+  const char *field_path = fs->field_name_c;
+  if (flags & FIELD_HAS_FACTORY) {
+    PyObject *value = PyObject_CallNoArgs(fs->default_factory);
+    if (!value) {
+      collector.add_error(
+          field_path, "Missing required field and default factory call failed");
+    }
+    return value;
   }
-
-  if (run_model_before_validators(schema, cls, &kwds) != 0) {
-    return -1;
+  if (flags & FIELD_HAS_DEFAULT) {
+    Py_INCREF(fs->default_value);
+    return fs->default_value;
   }
-  if (run_field_before_validators(schema, cls, &kwds) != 0) {
-    return -1;
+  if (flags & FIELD_OPTIONAL) {
+    Py_RETURN_NONE;
   }
+  collector.add_error(field_path, "Missing required field");
+  return nullptr;
+}
 
-  InstanceData *data = bm_self->instance_data;
-  ErrorCollector collector;
-  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
-    FieldSchema *fs = &schema->fields[i];
-    const char *field_path = fs->field_name_c;
-    PyObject *value = nullptr;
+/**
+ * @brief Store an already validated field value in the instance data.
+ *
+ * @param data The instance data.
+ * @param slot The field index.
+ * @param value The field value (reference is stolen).
+ */
+static inline void set_field_value(InstanceData *data, Py_ssize_t slot,
+                                   PyObject *value) {
+  PyObject *old = data->values[slot];
+  data->values[slot] = value;
+  Py_XDECREF(old);
+}
 
-    if (kwds && PyDict_Check(kwds)) {
-      if (fs->alias && PyList_Check(fs->alias)) {
-        Py_ssize_t n_alias = PyList_Size(fs->alias);
-        for (Py_ssize_t j = 0; j < n_alias; j++) {
-          PyObject *alias_key = PyList_GetItem(fs->alias, j);
-          value = PyDict_GetItem(kwds, alias_key);
-          if (value) {
-            Py_INCREF(value);
-            break;
-          }
-        }
-      }
-      if (!value) {
-        value = PyDict_GetItem(kwds, fs->field_name);
-        if (value) {
-          Py_INCREF(value);
-        }
-      }
+/**
+ * @brief Copy a list whose sampled items already have the item type.
+ *
+ * The first item, or sample evenly spaced items including the first and
+ * the last, must have exactly the item type; the other items are not
+ * checked.
+ *
+ * @param value The provided value.
+ * @param item_type The exact item type.
+ * @param sample The number of items to check.
+ * @return PyObject* New reference to the copy, or nullptr when the value has
+ * to go through the validator (or on error).
+ */
+static PyObject *sampled_row_copy(PyObject *value, PyTypeObject *item_type,
+                                  Py_ssize_t sample) {
+  if (!PyList_CheckExact(value)) {
+    return nullptr;
+  }
+  Py_ssize_t size = PyList_GET_SIZE(value);
+  if (sample > size) {
+    sample = size;
+  }
+  for (Py_ssize_t i = 0; i < sample; i++) {
+    Py_ssize_t index = sample > 1 ? i * (size - 1) / (sample - 1) : 0;
+    if (!Py_IS_TYPE(PyList_GET_ITEM(value, index), item_type)) {
+      return nullptr;
     }
+  }
+  return PyList_GetSlice(value, 0, size);
+}
 
-    if (!value) {
-      if (fs->default_factory != Py_None &&
-          PyCallable_Check(fs->default_factory)) {
-        value = PyObject_CallFunctionObjArgs(fs->default_factory, nullptr);
-        if (!value) {
-          collector.add_error(
-              field_path,
-              "Missing required field and default factory call failed");
-          continue;
-        }
-      } else if (fs->default_value != VLDTUndefined) {
-        value = fs->default_value;
-        Py_INCREF(value);
-      } else if (fs->type_schema->is_optional) {
-        Py_INCREF(Py_None);
-        value = Py_None;
-      } else {
-        collector.add_error(field_path, "Missing required field");
-        continue;
-      }
+/**
+ * @brief Copy a field's list using sampled item checks.
+ *
+ * Used for fields with a list_sample (Config.fast_list). A list of a
+ * primitive type is copied when its sampled items have the item type. A
+ * list of such lists is copied row by row, each row sampled the same way;
+ * if any row does not pass, the whole value goes through the validator.
+ *
+ * @param fs The field schema (its list_sample must be set).
+ * @param value The provided value.
+ * @return PyObject* New reference to the copy, or nullptr when the value has
+ * to go through the validator (or on error).
+ */
+static PyObject *sampled_list_copy(FieldSchema *fs, PyObject *value) {
+  TypeSchema *item_ts = fs->type_schema->args[0];
+  if (item_ts->container_kind != CK_LIST) {
+    return sampled_row_copy(value, (PyTypeObject *)item_ts->expected_type,
+                            fs->list_sample);
+  }
+  if (!PyList_CheckExact(value)) {
+    return nullptr;
+  }
+  PyTypeObject *item_type = (PyTypeObject *)item_ts->args[0]->expected_type;
+  Py_ssize_t size = PyList_GET_SIZE(value);
+  PyObject *rows = PyList_New(size);
+  if (!rows) {
+    PyErr_Clear();
+    return nullptr;
+  }
+  for (Py_ssize_t i = 0; i < size; i++) {
+    PyObject *row =
+        sampled_row_copy(PyList_GET_ITEM(value, i), item_type, fs->list_sample);
+    if (!row) {
+      PyErr_Clear();
+      Py_DECREF(rows);
+      return nullptr;
     }
+    PyList_SET_ITEM(rows, i, row);
+  }
+  return rows;
+}
 
-    PyObject *new_value = validate_and_convert(
-        value, fs->type_schema, &collector, field_path, schema->deserializers);
-    if (!new_value) {
-      auto &fields = data->fields;
-      if (fields.find(field_path) != fields.end()) {
-        Py_XDECREF(fields[field_path]);
-      }
-      Py_INCREF(value);
-      fields[field_path] = value;
-      continue;
-    } else {
-      Py_DECREF(value);
-      value = new_value;
-      auto &fields = data->fields;
-      if (fields.find(field_path) != fields.end()) {
-        Py_XDECREF(fields[field_path]);
-      }
-      fields[field_path] = value;
-    }
+/**
+ * @brief Validate a field value and store it in the instance data.
+ *
+ * Steals the reference to value. If validation fails the raw value is stored
+ * and the error is recorded in the collector.
+ *
+ * @param data The instance data.
+ * @param slot The field index.
+ * @param fs The field schema.
+ * @param value The field value (reference is stolen).
+ * @param collector The error collector.
+ * @param deserializers The registered deserializers.
+ */
+static void store_field(InstanceData *data, Py_ssize_t slot, FieldSchema *fs,
+                        PyObject *value, ErrorCollector &collector,
+                        Deserializers *deserializers) {
+  TypeSchema *ts = fs->type_schema;
+  if (Py_IS_TYPE(value, ts->exact_type)) {
+    set_field_value(data, slot, value);
+    return;
+  }
+  PyObject *new_value =
+      fs->list_sample ? sampled_list_copy(fs, value) : nullptr;
+  if (!new_value) {
+    new_value =
+        ts->validator(value, ts, &collector, fs->field_name_c, deserializers);
+  }
+  if (new_value) {
+    Py_DECREF(value);
+    value = new_value;
   }
+  set_field_value(data, slot, value);
+}
+
+/**
+ * @brief Resolve a field that was not provided and store it in the instance
+ * data.
+ *
+ * Fields marked FIELD_MISSING_READY store the resolved value as it is; the
+ * others validate it like a provided value.
+ *
+ * @param data The instance data.
+ * @param slot The field index.
+ * @param fs The field schema.
+ * @param flags The field's FieldFlags bits from the field table.
+ * @param collector The error collector.
+ * @param deserializers The registered deserializers.
+ */
+static void store_missing_field(InstanceData *data, Py_ssize_t slot,
+                                FieldSchema *fs, uint8_t flags,
+                                ErrorCollector &collector,
+                                Deserializers *deserializers) {
+  PyObject *value = resolve_missing_field(fs, flags, collector);
+  if (!value) {
+    return;
+  }
+  if (flags & FIELD_MISSING_READY) {
+    set_field_value(data, slot, value);
+    return;
+  }
+  store_field(data, slot, fs, value, collector, deserializers);
+}
 
+/**
+ * @brief Raise collected errors and run AFTER validators.
+ *
+ * @param schema The compiled schema.
+ * @param cls The model class.
+ * @param self The model instance.
+ * @param collector The error collector.
+ * @return int 0 on success, -1 on failure.
+ */
+static int finish_init(SchemaCache *schema, PyObject *cls, PyObject *self,
+                       ErrorCollector &collector) {
   if (collector.has_errors()) {
     std::string err_json = collector.to_json();
     PyErr_SetString(PyExc_TypeError, err_json.c_str());
     return -1;
   }
-
-  if (run_field_after_validators(schema, cls, self) != 0) {
-    return -1;
+  if (!(schema->validator_flags & VALIDATORS_AFTER)) {
+    return 0;
   }
-  if (run_model_after_validators(schema, cls, self) != 0) {
+  if (run_field_after_validators(schema, cls, self) != 0 ||
+      run_model_after_validators(schema, cls, self) != 0 ||
+      run_async_after_validators(schema, cls, self) != 0) {
     return -1;
   }
   return 0;
 }
 
 /**
- * @brief DataModel.__setattro__ implementation.
+ * @brief Look up a field by its interned name in a kwargs dictionary.
  *
- * @param self Python object.
- * @param name Attribute name.
- * @param value Attribute value.
- * @return int 0 on success, -1 on failure.
+ * Uses the hash cached in the field table where the interpreter exposes a
+ * known-hash lookup.
+ *
+ * @param kwds The kwargs dictionary.
+ * @param key The interned field name.
+ * @param hash The cached hash of the field name (-1 if unknown).
+ * @return PyObject* Borrowed reference to the value, or nullptr if absent.
  */
-int DataModel_setattro(PyObject *self, PyObject *name, PyObject *value) {
-  DataModelObject *bm_self = (DataModelObject *)self;
-  InstanceData *data = bm_self->instance_data;
+static inline PyObject *lookup_field(PyObject *kwds, PyObject *key,
+                                     Py_hash_t hash) {
+  PyObject *value;
+#if PY_VERSION_HEX < 0x030D0000
+  if (hash != -1) {
+    value = _PyDict_GetItem_KnownHash(kwds, key, hash);
+  } else {
+    value = PyDict_GetItemWithError(kwds, key);
+  }
+#else
+  value = PyDict_GetItemWithError(kwds, key);
+#endif
+  if (!value && PyErr_Occurred()) {
+    PyErr_Clear();
+  }
+  return value;
+}
 
-  // Retrieve the cached schema for the model
-  PyObject *capsule = get_schema_cached((PyObject *)Py_TYPE(self));
-  if (!capsule) {
-    PyErr_SetString(PyExc_TypeError, "Could not retrieve model schema");
-    return -1;
+/**
+ * @brief Take the next kwargs entry if it is the given field.
+ *
+ * Keyword arguments usually arrive in field declaration order (from_dict on
+ * to_dict output, keyword calls, parsed JSON), so walking the dict alongside
+ * the fields finds each value without a hash probe. Keys are compared by
+ * identity first, then by cached hash and contents.
+ *
+ * @param kwds The kwargs dictionary.
+ * @param pos The walk position in kwds (advanced by one entry).
+ * @param key The interned field name.
+ * @param hash The cached hash of the field name.
+ * @return PyObject* Borrowed reference to the value, or nullptr if the next
+ * entry is not the field.
+ */
+static inline PyObject *next_field_in_order(PyObject *kwds, Py_ssize_t *pos,
+                                            PyObject *key, Py_hash_t hash) {
+  PyObject *k, *v;
+  if (!PyDict_Next(kwds, pos, &k, &v)) {
+    return nullptr;
   }
-  SchemaCache *schema =
-      (SchemaCache *)PyCapsule_GetPointer(capsule, "vldt.SchemaCache");
-  Py_DECREF(capsule);
-
-  // Use the instance annotations cached in the schema.
-  // (Ensure that schema->instance_annotations was set during schema
-  // compilation.)
-  PyObject *annotations = schema->instance_annotations;
-  Py_INCREF(annotations);
-
-  if (annotations && PyDict_Contains(annotations, name)) {
-    PyObject *expected_type = PyDict_GetItemWithError(annotations, name);
-    if (expected_type) {
-      if (is_class_var(expected_type)) {
-        PyErr_SetString(PyExc_AttributeError, "Cannot set ClassVar attribute");
-        Py_DECREF(annotations);
+  if (k == key) {
+    return v;
+  }
+  if (PyUnicode_CheckExact(k) && PyObject_Hash(k) == hash &&
+      PyUnicode_Compare(k, key) == 0) {
+    return v;
+  }
+  return nullptr;
+}
+
+/**
+ * @brief Look up the first alias of a field present in a kwargs dictionary.
+ *
+ * @param kwds The kwargs dictionary.
+ * @param fs The field schema.
+ * @return PyObject* Borrowed reference to the value, or nullptr if absent.
+ */
+static PyObject *lookup_alias(PyObject *kwds, FieldSchema *fs) {
+  Py_ssize_t n_alias = PyTuple_GET_SIZE(fs->alias);
+  for (Py_ssize_t j = 0; j < n_alias; j++) {
+    PyObject *value = PyDict_GetItem(kwds, PyTuple_GET_ITEM(fs->alias, j));
+    if (value) {
+      return value;
+    }
+  }
+  return nullptr;
+}
+
+/**
+ * @brief Match the keys of a kwargs dictionary to fields in a single pass.
+ *
+ * Used for models with aliases: each key is looked up once in the schema's
+ * key map instead of probing every alias of every field. When several keys
+ * name the same field, the one ranked first (aliases in declaration order,
+ * then the canonical name) wins.
+ *
+ * @param schema The compiled schema (its key_map must be set).
+ * @param kwds The kwargs dictionary.
+ * @param matched Output array of borrowed values indexed by field slot,
+ * zero-filled by the caller (left nullptr where no key matched).
+ * @param ranks Scratch array of num_fields ranks.
+ * @return int 0 on success, -1 on error.
+ */
+static int match_keyed_fields(SchemaCache *schema, PyObject *kwds,
+                              PyObject **matched, Py_ssize_t *ranks) {
+  const Py_ssize_t rank_mask = (1 << VLDT_KEY_RANK_BITS) - 1;
+  PyObject *key, *value;
+  Py_ssize_t pos = 0;
+  while (PyDict_Next(kwds, &pos, &key, &value)) {
+    PyObject *entry = PyDict_GetItemWithError(schema->key_map, key);
+    if (!entry) {
+      if (PyErr_Occurred()) {
         return -1;
-      } else {
-        // Compile a TypeSchema from the expected type
-        TypeSchema *ts = compile_type_schema(expected_type);
-        if (!ts) {
-          Py_DECREF(annotations);
-          return -1;
-        }
-        const char *attr_name = PyUnicode_AsUTF8(name);
-        ErrorCollector collector;
-        PyObject *converted = validate_and_convert(
-            value, ts, &collector, attr_name, schema->deserializers);
-        free_type_schema(ts);
-        if (!converted) {
-          if (collector.has_errors()) {
-            std::string err_json = collector.to_json();
-            PyErr_SetString(PyExc_TypeError, err_json.c_str());
-          } else {
-            PyErr_Format(PyExc_TypeError, "Invalid value for attribute %R",
-                         name);
-          }
-          Py_DECREF(annotations);
-          return -1;
-        }
-        // Use the converted value for assignment
-        value = converted;
       }
+      continue;
     }
-    // Update the instance data with the new value
-    const char *attr_name = PyUnicode_AsUTF8(name);
-    auto &fields = data->fields;
-    if (fields.find(attr_name) != fields.end()) {
-      Py_XDECREF(fields[attr_name]);
+    Py_ssize_t packed = PyLong_AsSsize_t(entry);
+    Py_ssize_t slot = packed >> VLDT_KEY_RANK_BITS;
+    Py_ssize_t rank = packed & rank_mask;
+    if (!matched[slot] || rank <= ranks[slot]) {
+      matched[slot] = value;
+      ranks[slot] = rank;
     }
-    fields[attr_name] = value;
-    Py_DECREF(annotations);
-    return 0;
-  } else {
-    // If the attribute is not defined in the annotations, assign it directly
-    const char *attr_name = PyUnicode_AsUTF8(name);
-    auto &fields = data->fields;
-    if (fields.find(attr_name) != fields.end()) {
-      Py_XDECREF(fields[attr_name]);
+  }
+  return 0;
+}
+
+/**
+ * @brief Bind the fields of an instance from a keyword arguments dictionary.
+ *
+ * Iterates over each field to extract values directly from kwds (checking
+ * aliases first, in one pass over kwds when the model has aliases), falling
+ * back to default_factory, default_value, or None as needed, validates and
+ * converts each value, and runs AFTER validators.
+ *
+ * @param self The model instance.
+ * @param schema The compiled schema of the instance's class.
+ * @param kwds Keyword arguments (may be nullptr).
+ * @return int 0 on success, -1 on failure.
+ */
+static int init_fields_from_kwds(PyObject *self, SchemaCache *schema,
+                                 PyObject *kwds) {
+  PyObject *cls = (PyObject *)Py_TYPE(self);
+  InstanceData *data = ((DataModelObject *)self)->instance_data;
+  const FieldTable &table = schema->table;
+  bool has_kwds = kwds && PyDict_Check(kwds);
+  // Small models match aliases into stack buffers; larger ones allocate.
+  PyObject *small_matched[VLDT_FIELD_SCAN_LIMIT];
+  Py_ssize_t small_ranks[VLDT_FIELD_SCAN_LIMIT];
+  std::unique_ptr<PyObject *[]> heap_matched;
+  std::unique_ptr<Py_ssize_t[]> heap_ranks;
+  PyObject **matched = nullptr;
+  if (has_kwds && schema->key_map) {
+    Py_ssize_t n = schema->num_fields;
+    Py_ssize_t *ranks = small_ranks;
+    matched = small_matched;
+    if (n > VLDT_FIELD_SCAN_LIMIT) {
+      heap_matched.reset(new (std::nothrow) PyObject *[n]);
+      heap_ranks.reset(new (std::nothrow) Py_ssize_t[n]);
+      if (!heap_matched || !heap_ranks) {
+        PyErr_NoMemory();
+        return -1;
+      }
+      matched = heap_matched.get();
+      ranks = heap_ranks.get();
+    }
+    std::fill_n(matched, n, nullptr);
+    if (match_keyed_fields(schema, kwds, matched, ranks) != 0) {
+      return -1;
+    }
+  }
+  ErrorCollector collector;
+  bool in_order = has_kwds && !matched;
+  Py_ssize_t walk_pos = 0;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    PyObject *value = nullptr;
+    if (matched) {
+      value = matched[i];
+    } else if (has_kwds) {
+      if (table.flags[i] & FIELD_HAS_ALIAS) {
+        in_order = false;
+        value = lookup_alias(kwds, &schema->fields[i]);
+      } else if (in_order) {
+        value = next_field_in_order(kwds, &walk_pos, table.keys[i],
+                                    table.hashes[i]);
+        in_order = value != nullptr;
+      }
+      if (!value) {
+        value = lookup_field(kwds, table.keys[i], table.hashes[i]);
+      }
+    }
+
+    FieldSchema *fs = &schema->fields[i];
+    if (!value) {
+      store_missing_field(data, i, fs, table.flags[i], collector,
+                          schema->deserializers);
+      continue;
     }
     Py_INCREF(value);
-    fields[attr_name] = value;
-    Py_DECREF(annotations);
-    return 0;
+    store_field(data, i, fs, value, collector, schema->deserializers);
   }
+
+  return finish_init(schema, cls, self, collector);
 }
 
 /**
- * @brief DataModel.__deepcopy__ implementation.
+ * @brief Run the BEFORE validators on a private dictionary, then bind the
+ * fields from it.
+ *
+ * The validators rewrite the dictionary in place, so it must not be one the
+ * caller still owns (e.g. the argument of from_dict or a nested model's
+ * input).
+ *
+ * @param self The model instance.
+ * @param schema The compiled schema (with BEFORE validators).
+ * @param kwds A dictionary owned by this initialization.
+ * @return int 0 on success, -1 on failure.
+ */
+static int init_with_before_validators(PyObject *self, SchemaCache *schema,
+                                       PyObject *kwds) {
+  PyObject *cls = (PyObject *)Py_TYPE(self);
+  if (run_async_before_validators(schema, cls, &kwds) != 0 ||
+      run_model_before_validators(schema, cls, &kwds) != 0 ||
+      run_field_before_validators(schema, cls, &kwds) != 0) {
+    return -1;
+  }
+  return init_fields_from_kwds(self, schema, kwds);
+}
+
+/**
+ * @brief DataModel.__init__ implementation.
+ *
+ * Reuses the schema resolved by tp_new for the instance storage (looking it
+ * up only for instances allocated elsewhere) and binds the fields from kwds.
+ * Models with BEFORE validators copy kwds once and run the whole validator
+ * pipeline on that copy, so the caller's dictionary is never modified.
  *
  * @param self Python object.
- * @param args Arguments.
- * @return PyObject* Deep copied object.
+ * @param args Positional arguments (none allowed).
+ * @param kwds Keyword arguments.
+ * @return int 0 on success, -1 on failure.
  */
-static PyObject *DataModel_deepcopy(PyObject *self, PyObject *args) {
-  PyObject *memo;
-  if (!PyArg_ParseTuple(args, "O", &memo)) {
-    return nullptr;
+int DataModel_init(PyObject *self, PyObject *args, PyObject *kwds) {
+  // tp_new already resolved the schema the instance storage was sized for.
+  InstanceData *data = ((DataModelObject *)self)->instance_data;
+  SchemaCache *schema =
+      data ? data->schema : get_schema((PyObject *)Py_TYPE(self));
+  if (!schema) {
+    return -1;
   }
+  if (!(schema->validator_flags & VALIDATORS_BEFORE)) {
+    return init_fields_from_kwds(self, schema, kwds);
+  }
+  PyObject *own_kwds = kwds ? PyDict_Copy(kwds) : PyDict_New();
+  if (!own_kwds) {
+    return -1;
+  }
+  int result = init_with_before_validators(self, schema, own_kwds);
+  Py_DECREF(own_kwds);
+  return result;
+}
 
-  PyTypeObject *type = Py_TYPE(self);
-  PyObject *new_obj = type->tp_alloc(type, 0);
-  if (!new_obj) {
+/**
+ * @brief Look up a member of a JSON object by name.
+ *
+ * @param native The JSON object.
+ * @param key The member name.
+ * @return const rapidjson::Value* The member value, or nullptr if absent.
+ */
+static const rapidjson::Value *
+find_native_member(const rapidjson::Value &native, PyObject *key) {
+  Py_ssize_t key_len = 0;
+  const char *key_str = PyUnicode_AsUTF8AndSize(key, &key_len);
+  if (!key_str) {
+    PyErr_Clear();
     return nullptr;
   }
+  // Scan from the end: like json.loads, the last of repeated keys wins.
+  for (auto it = native.MemberEnd(); it != native.MemberBegin();) {
+    --it;
+    if (it->name.GetStringLength() ==
+            static_cast<rapidjson::SizeType>(key_len) &&
+        memcmp(it->name.GetString(), key_str, key_len) == 0) {
+      return &it->value;
+    }
+  }
+  return nullptr;
+}
 
-  DataModelObject *src = (DataModelObject *)self;
-  DataModelObject *dst = (DataModelObject *)new_obj;
-  dst->instance_data = new InstanceData();
-
-  for (const auto &pair : src->instance_data->fields) {
-    PyObject *copied_field = nullptr;
-    PyObject *deepcopy_func =
-        PyObject_GetAttrString(pair.second, "__deepcopy__");
-    if (deepcopy_func == nullptr) {
-      if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Clear();
-        Py_INCREF(pair.second);
-        copied_field = pair.second;
-      } else {
-        Py_DECREF(new_obj);
+/**
+ * @brief Match the members of a JSON object to fields in a single pass.
+ *
+ * The JSON counterpart of match_keyed_fields: each member name is looked up
+ * once in the schema's native key map, and the key ranked first wins when
+ * several members name the same field. Among members with the same rank
+ * (a repeated key), the last one wins, as with json.loads.
+ *
+ * @param schema The compiled schema (its native_key_map must be set).
+ * @param native The JSON object.
+ * @return Array of member values indexed by field slot (nullptr where no
+ * member matched), or nullptr with MemoryError set.
+ */
+static std::unique_ptr<const rapidjson::Value *[]>
+match_native_members(SchemaCache *schema, const rapidjson::Value &native) {
+  Py_ssize_t n = schema->num_fields;
+  std::unique_ptr<const rapidjson::Value *[]> matched(
+      new (std::nothrow) const rapidjson::Value *[n]());
+  std::unique_ptr<Py_ssize_t[]> ranks(new (std::nothrow) Py_ssize_t[n]);
+  if (!matched || !ranks) {
+    PyErr_NoMemory();
+    return nullptr;
+  }
+  const NativeKeyMap &key_map = *schema->native_key_map;
+  const Py_ssize_t rank_mask = (1 << VLDT_KEY_RANK_BITS) - 1;
+  for (auto it = native.MemberBegin(); it != native.MemberEnd(); ++it) {
+    auto entry = key_map.find(
+        std::string_view(it->name.GetString(), it->name.GetStringLength()));
+    if (entry == key_map.end()) {
+      continue;
+    }
+    Py_ssize_t slot = entry->second >> VLDT_KEY_RANK_BITS;
+    Py_ssize_t rank = entry->second & rank_mask;
+    if (!matched[slot] || rank <= ranks[slot]) {
+      matched[slot] = &it->value;
+      ranks[slot] = rank;
+    }
+  }
+  return matched;
+}
+
+/**
+ * @brief Take the next JSON object member if it is the given field.
+ *
+ * rapidjson looks members up by a linear scan, so walking the members in
+ * order alongside the fields avoids rescanning the object for each field
+ * when the document lists them in declaration order.
+ *
+ * @param native The JSON object.
+ * @param walk The walk position (advanced by one member on a match).
+ * @param key The field name.
+ * @return const rapidjson::Value* The member value, or nullptr if the next
+ * member is not the field.
+ */
+static const rapidjson::Value *
+next_member_in_order(const rapidjson::Value &native,
+                     rapidjson::Value::ConstMemberIterator &walk,
+                     PyObject *key) {
+  if (walk == native.MemberEnd()) {
+    return nullptr;
+  }
+  Py_ssize_t key_len = 0;
+  const char *key_str = PyUnicode_AsUTF8AndSize(key, &key_len);
+  if (!key_str) {
+    PyErr_Clear();
+    return nullptr;
+  }
+  const rapidjson::Value &name = walk->name;
+  if (name.GetStringLength() != static_cast<rapidjson::SizeType>(key_len) ||
+      memcmp(name.GetString(), key_str, key_len) != 0) {
+    return nullptr;
+  }
+  return &(walk++)->value;
+}
+
+/**
+ * @brief Match the members of a JSON object to fields by name.
+ *
+ * Used when the schema has no native key map. Fields are taken from the
+ * members in declaration order while the document follows it; the others
+ * (and aliased fields) are looked up by name. If members are left after the
+ * in-order walk, a later one may repeat a field already taken, so those
+ * fields are looked up again to let the last repeated key win.
+ *
+ * @param schema The compiled schema.
+ * @param native The JSON object.
+ * @return Array of member values indexed by field slot (nullptr where no
+ * member matched), or nullptr with MemoryError set.
+ */
+static std::unique_ptr<const rapidjson::Value *[]>
+match_native_members_by_name(SchemaCache *schema,
+                             const rapidjson::Value &native) {
+  Py_ssize_t n = schema->num_fields;
+  std::unique_ptr<const rapidjson::Value *[]> matched(
+      new (std::nothrow) const rapidjson::Value *[n]());
+  if (!matched) {
+    PyErr_NoMemory();
+    return nullptr;
+  }
+  const FieldTable &table = schema->table;
+  auto walk = native.MemberBegin();
+  bool in_order = true;
+  Py_ssize_t taken_in_order = 0;
+  for (Py_ssize_t i = 0; i < n; i++) {
+    FieldSchema *fs = &schema->fields[i];
+    const rapidjson::Value *member = nullptr;
+    if (table.flags[i] & FIELD_HAS_ALIAS) {
+      in_order = false;
+      Py_ssize_t n_alias = PyTuple_GET_SIZE(fs->alias);
+      for (Py_ssize_t j = 0; j < n_alias && !member; j++) {
+        PyObject *alias_key = PyTuple_GET_ITEM(fs->alias, j);
+        if (PyUnicode_Check(alias_key)) {
+          member = find_native_member(native, alias_key);
+        }
+      }
+    } else if (in_order) {
+      member = next_member_in_order(native, walk, fs->field_name);
+      in_order = member != nullptr;
+      taken_in_order += in_order;
+    }
+    if (!member) {
+      member = find_native_member(native, fs->field_name);
+    }
+    matched[i] = member;
+  }
+  if (walk != native.MemberEnd()) {
+    for (Py_ssize_t i = 0; i < taken_in_order; i++) {
+      matched[i] = find_native_member(native, schema->fields[i].field_name);
+    }
+  }
+  return matched;
+}
+
+/**
+ * @brief Release the instance storages pooled by a schema.
+ *
+ * @param schema The compiled schema.
+ */
+void DataModel_clear_instance_freelist(SchemaCache *schema) {
+  while (schema->num_free_instances > 0) {
+    InstanceData *data = schema->free_instances[--schema->num_free_instances];
+    delete[] data->values;
+    delete data;
+  }
+}
+
+/**
+ * @brief Check whether a class can be built straight from a native JSON DOM.
+ *
+ * @param cls Python type.
+ * @return true if DataModel_init_from_native can be used.
+ */
+bool DataModel_can_init_from_native(PyObject *cls) {
+  if (!PyType_Check(cls)) {
+    return false;
+  }
+  PyTypeObject *type = reinterpret_cast<PyTypeObject *>(cls);
+  return type->tp_init == DataModel_init && type->tp_new == DataModel_new &&
+         Py_TYPE(cls)->tp_call == PyType_Type.tp_call;
+}
+
+/**
+ * @brief Check whether a dict certainly lacks a required field of a model.
+ *
+ * @param cls The model class.
+ * @param dict The candidate keyword arguments.
+ * @return true if constructing cls from dict must fail for a missing field.
+ */
+bool DataModel_dict_lacks_required(PyObject *cls, PyObject *dict) {
+  if (!DataModel_can_init_from_native(cls)) {
+    return false;
+  }
+  SchemaCache *schema = get_schema(cls);
+  if (!schema) {
+    PyErr_Clear();
+    return false;
+  }
+  if (schema->validator_flags & VALIDATORS_BEFORE) {
+    return false;
+  }
+  const FieldTable &table = schema->table;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    uint8_t flags = table.flags[i];
+    if (flags & (FIELD_HAS_DEFAULT | FIELD_HAS_FACTORY | FIELD_OPTIONAL)) {
+      continue;
+    }
+    if (lookup_field(dict, table.keys[i], table.hashes[i])) {
+      continue;
+    }
+    if ((flags & FIELD_HAS_ALIAS) && lookup_alias(dict, &schema->fields[i])) {
+      continue;
+    }
+    return true;
+  }
+  return false;
+}
+
+/**
+ * @brief Build a nested DataModel directly from a JSON object.
+ *
+ * Nested validation errors are attached to the parent collector under
+ * error_path, matching the kwargs path.
+ *
+ * @param type The model class; DataModel_can_init_from_native must hold.
+ * @param native The JSON object holding the nested model.
+ * @param collector The parent error collector.
+ * @param error_path The path of the nested model in error messages.
+ * @return PyObject* New reference to the nested model, or nullptr on error.
+ */
+static PyObject *init_nested_from_native(PyTypeObject *type,
+                                         const rapidjson::Value &native,
+                                         ErrorCollector &collector,
+                                         const char *error_path) {
+  PyObject *instance = type->tp_new(type, empty_tuple, nullptr);
+  if (instance && DataModel_init_from_native(instance, native) == 0) {
+    return instance;
+  }
+  Py_XDECREF(instance);
+  PyObject *exc_type = nullptr, *exc_value = nullptr, *exc_tb = nullptr;
+  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+  PyObject *exc_str = exc_value ? PyObject_Str(exc_value) : nullptr;
+  const char *nested_json =
+      exc_str ? PyUnicode_AsUTF8(exc_str) : "Unknown error";
+  collector.add_suberror(error_path, nested_json ? nested_json : "");
+  Py_XDECREF(exc_str);
+  Py_XDECREF(exc_type);
+  Py_XDECREF(exc_value);
+  Py_XDECREF(exc_tb);
+  PyErr_Clear();
+  return nullptr;
+}
+
+/**
+ * @brief Returns the model class a field can build straight from a JSON
+ * object: the field's own model type, or X of an Optional[X] field.
+ *
+ * @param ts The field's type schema.
+ * @return The model class, or nullptr when the field takes the generic path.
+ */
+static PyTypeObject *native_model_type(TypeSchema *ts) {
+  if (ts->container_kind == CK_UNION && ts->is_optional && ts->num_args == 2) {
+    ts = ts->args[ts->args[0]->expected_type == (PyObject *)Py_TYPE(Py_None)];
+  }
+  if (!ts->is_data_model ||
+      !DataModel_can_init_from_native(ts->expected_type)) {
+    return nullptr;
+  }
+  return reinterpret_cast<PyTypeObject *>(ts->expected_type);
+}
+
+/**
+ * @brief Build a List[Model] field directly from a JSON array.
+ *
+ * Object items become model instances without an intermediate dict; any
+ * other item is converted and validated like the kwargs path does. As in
+ * validate_list, the first invalid item ends the list.
+ *
+ * @param fs The field schema.
+ * @param type The item model class.
+ * @param native The JSON array.
+ * @param collector The parent error collector.
+ * @param deserializers The registered deserializers.
+ * @return PyObject* New reference to the list, or nullptr on error.
+ */
+static PyObject *init_model_list_from_native(FieldSchema *fs,
+                                             PyTypeObject *type,
+                                             const rapidjson::Value &native,
+                                             ErrorCollector &collector,
+                                             Deserializers *deserializers) {
+  PyObject *list = PyList_New(native.Size());
+  if (!list) {
+    return nullptr;
+  }
+  TypeSchema *item_ts = fs->type_schema->args[0];
+  std::string path = std::string(fs->field_name_c) + ".";
+  size_t base_len = path.size();
+  Py_ssize_t i = 0;
+  for (const rapidjson::Value &item : native.GetArray()) {
+    path.resize(base_len);
+    path += std::to_string(i);
+    PyObject *value;
+    if (item.IsObject()) {
+      value = init_nested_from_native(type, item, collector, path.c_str());
+    } else {
+      PyObject *raw = rapidjson_to_pyobject(item);
+      if (!raw) {
+        Py_DECREF(list);
         return nullptr;
       }
+      value = validate_and_convert(raw, item_ts, &collector, path.c_str(),
+                                   deserializers);
+      Py_DECREF(raw);
+    }
+    if (!value) {
+      Py_DECREF(list);
+      return nullptr;
+    }
+    PyList_SET_ITEM(list, i++, value);
+  }
+  return list;
+}
+
+/**
+ * @brief Initialize a DataModel instance from a native JSON object.
+ *
+ * Walks the compiled schema and pulls each field (checking aliases first)
+ * straight out of the JSON DOM, following the members in order while they
+ * match the fields, or matching all members in one pass for models with
+ * aliases, so unknown keys are never converted into Python objects and no
+ * intermediate kwargs dict is built. Models with BEFORE validators
+ * need the full input dict, so they take the kwargs path.
+ *
+ * @param self The model instance.
+ * @param native The rapidjson DOM element representing the JSON object.
+ * @return int 0 on success, -1 on failure.
+ */
+int DataModel_init_from_native(PyObject *self, const rapidjson::Value &native) {
+  SchemaCache *schema = get_schema((PyObject *)Py_TYPE(self));
+  if (!schema) {
+    return -1;
+  }
+  return DataModel_init_from_native_schema(self, schema, native);
+}
+
+/**
+ * @brief Initialize a DataModel instance from a native JSON object using an
+ * already resolved schema.
+ *
+ * Lets callers decoding many documents of the same class look the schema up
+ * once instead of once per instance.
+ *
+ * @param self The model instance.
+ * @param schema The compiled schema of the instance's class.
+ * @param native The rapidjson DOM element representing the JSON object.
+ * @return int 0 on success, -1 on failure.
+ */
+int DataModel_init_from_native_schema(PyObject *self, SchemaCache *schema,
+                                      const rapidjson::Value &native) {
+  if (!native.IsObject()) {
+    PyErr_SetString(PyExc_TypeError, "JSON root must be an object");
+    return -1;
+  }
+
+  PyObject *cls = (PyObject *)Py_TYPE(self);
+  if (schema->validator_flags & VALIDATORS_BEFORE) {
+    PyObject *kwds = rapidjson_to_pyobject(native);
+    if (!kwds) {
+      return -1;
+    }
+    int result = init_with_before_validators(self, schema, kwds);
+    Py_DECREF(kwds);
+    return result;
+  }
+
+  InstanceData *data = ((DataModelObject *)self)->instance_data;
+  const FieldTable &table = schema->table;
+  std::unique_ptr<const rapidjson::Value *[]> matched =
+      schema->native_key_map ? match_native_members(schema, native)
+                             : match_native_members_by_name(schema, native);
+  if (!matched) {
+    return -1;
+  }
+  ErrorCollector collector;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    FieldSchema *fs = &schema->fields[i];
+    const rapidjson::Value *member = matched[i];
+
+    PyObject *value = nullptr;
+    TypeSchema *ts = fs->type_schema;
+    PyTypeObject *model_type = nullptr;
+    if (member && member->IsObject() && (model_type = native_model_type(ts))) {
+      if (ts->is_data_model) {
+        value = init_nested_from_native(model_type, *member, collector,
+                                        fs->field_name_c);
+      } else {
+        // Optional[X]: report a failure the way the union validator does.
+        ErrorCollector union_collector;
+        value = init_nested_from_native(model_type, *member, union_collector,
+                                        fs->field_name_c);
+        if (!value) {
+          collector.add_error(
+              fs->field_name_c,
+              "Value did not match any candidate in Union: got dict");
+        }
+      }
+      if (value) {
+        set_field_value(data, i, value);
+      }
+      continue;
+    }
+    if (member && member->IsArray() && ts->container_kind == CK_LIST &&
+        ts->num_args == 1 && (model_type = native_model_type(ts->args[0])) &&
+        ts->args[0]->is_data_model) {
+      value = init_model_list_from_native(fs, model_type, *member, collector,
+                                          schema->deserializers);
+      if (value) {
+        set_field_value(data, i, value);
+      } else if (PyErr_Occurred()) {
+        return -1;
+      }
+      continue;
+    }
+    if (member) {
+      value = rapidjson_to_pyobject(*member);
+      if (!value) {
+        return -1;
+      }
     } else {
-      copied_field = PyObject_CallFunctionObjArgs(deepcopy_func, memo, nullptr);
-      Py_DECREF(deepcopy_func);
-      if (copied_field == nullptr) {
-        Py_DECREF(new_obj);
+      store_missing_field(data, i, fs, table.flags[i], collector,
+                          schema->deserializers);
+      continue;
+    }
+    store_field(data, i, fs, value, collector, schema->deserializers);
+  }
+
+  return finish_init(schema, cls, self, collector);
+}
+
+/**
+ * @brief Stores an attribute that is not a declared field.
+ *
+ * @param data The instance storage.
+ * @param name Attribute name.
+ * @param value New reference to the value; stolen.
+ * @return int 0 on success, -1 on failure.
+ */
+static int set_extra(InstanceData *data, PyObject *name, PyObject *value) {
+  const char *attr_name = PyUnicode_AsUTF8(name);
+  if (!attr_name) {
+    Py_DECREF(value);
+    return -1;
+  }
+  PyObject *&slot = data->extras[attr_name];
+  PyObject *old = slot;
+  slot = value;
+  Py_XDECREF(old);
+  return 0;
+}
+
+/**
+ * @brief Validates a value for a declared field and stores it.
+ *
+ * The field's compiled TypeSchema is used; a value whose type is exactly
+ * the plain type of the field is stored without calling the validator.
+ *
+ * @param self The model instance.
+ * @param slot The field's slot.
+ * @param value The value (borrowed).
+ * @return int 0 on success, -1 on failure.
+ */
+int DataModel_set_field(PyObject *self, Py_ssize_t slot, PyObject *value) {
+  InstanceData *data = ((DataModelObject *)self)->instance_data;
+  SchemaCache *schema = data->schema;
+  TypeSchema *ts = schema->table.types[slot];
+  if (Py_IS_TYPE(value, ts->exact_type)) {
+    Py_INCREF(value);
+    set_field_value(data, slot, value);
+    return 0;
+  }
+  ErrorCollector collector;
+  FieldSchema *fs = &schema->fields[slot];
+  PyObject *converted =
+      fs->list_sample ? sampled_list_copy(fs, value) : nullptr;
+  if (!converted) {
+    converted = validate_and_convert(value, ts, &collector, fs->field_name_c,
+                                     schema->deserializers);
+  }
+  if (!converted) {
+    if (collector.has_errors()) {
+      std::string err_json = collector.to_json();
+      PyErr_SetString(PyExc_TypeError, err_json.c_str());
+    } else if (!PyErr_Occurred()) {
+      PyErr_Format(PyExc_TypeError, "Invalid value for attribute %R",
+                   fs->field_name);
+    }
+    return -1;
+  }
+  set_field_value(data, slot, converted);
+  return 0;
+}
+
+/**
+ * @brief DataModel.__setattro__ implementation.
+ *
+ * Declared fields are validated with DataModel_set_field. Attributes
+ * declared in __slots__ of a subclass are stored in their slot; other
+ * attributes are kept as extras.
+ *
+ * @param self Python object.
+ * @param name Attribute name.
+ * @param value Attribute value.
+ * @return int 0 on success, -1 on failure.
+ */
+int DataModel_setattro(PyObject *self, PyObject *name, PyObject *value) {
+  DataModelObject *bm_self = (DataModelObject *)self;
+  InstanceData *data = bm_self->instance_data;
+  SchemaCache *schema = data->schema;
+
+  Py_ssize_t slot = field_slot(schema, name);
+  if (slot < 0) {
+    PyObject *descr = _PyType_Lookup(Py_TYPE(self), name);
+    if (descr && Py_IS_TYPE(descr, &PyMemberDescr_Type)) {
+      return Py_TYPE(descr)->tp_descr_set(descr, self, value);
+    }
+  }
+  if (!value) {
+    PyErr_Format(PyExc_AttributeError, "Cannot delete attribute %R", name);
+    return -1;
+  }
+  if (slot >= 0) {
+    return DataModel_set_field(self, slot, value);
+  }
+
+  PyObject *expected_type =
+      PyDict_GetItemWithError(schema->instance_annotations, name);
+  if (expected_type && is_class_var(expected_type)) {
+    PyErr_SetString(PyExc_AttributeError, "Cannot set ClassVar attribute");
+    return -1;
+  }
+  if (PyErr_Occurred()) {
+    return -1;
+  }
+  Py_INCREF(value);
+  return set_extra(data, name, value);
+}
+
+static PyObject *deepcopy_model(PyObject *self, PyObject *memo);
+
+/**
+ * @brief Records a copy in the deepcopy memo under the original's id().
+ *
+ * @param value The original object.
+ * @param copied The copy of value.
+ * @param memo The deepcopy memo dictionary.
+ * @return int 0 on success, -1 on error.
+ */
+static int memoize_copy(PyObject *value, PyObject *copied, PyObject *memo) {
+  PyObject *key = PyLong_FromVoidPtr(value);
+  if (!key) {
+    return -1;
+  }
+  int res = PyDict_SetItem(memo, key, copied);
+  Py_DECREF(key);
+  return res;
+}
+
+/**
+ * @brief Returns true for the immutable scalars deepcopy shares as they are.
+ */
+static inline bool is_shared_scalar(PyObject *value) {
+  return value == Py_None || PyUnicode_CheckExact(value) ||
+         PyLong_CheckExact(value) || PyFloat_CheckExact(value) ||
+         PyBool_Check(value) || PyBytes_CheckExact(value);
+}
+
+/**
+ * @brief Returns true if every value of a dict is a shared scalar and every
+ * key is an exact str, so a plain dict copy is already a deep copy.
+ */
+static bool dict_is_flat(PyObject *dict) {
+  PyObject *item_key, *item_value;
+  Py_ssize_t pos = 0;
+  while (PyDict_Next(dict, &pos, &item_key, &item_value)) {
+    if (!PyUnicode_CheckExact(item_key) || !is_shared_scalar(item_value)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * @brief Copy a single attribute value for __deepcopy__.
+ *
+ * Immutable scalars are shared. Lists, dicts and models are copied here,
+ * recording each copy in the memo so shared and cyclic references keep
+ * their shape; tuples and sets go through copy.deepcopy. Any other value is
+ * copied with its own __deepcopy__ when it has one and shared otherwise.
+ * Lists and dicts holding only scalars (the usual List[int] or
+ * Dict[str, float] field) are copied in one step instead of per item.
+ *
+ * @param value The attribute value.
+ * @param memo The deepcopy memo dictionary.
+ * @return PyObject* New reference to the copy, or nullptr on error.
+ */
+static PyObject *deepcopy_value(PyObject *value, PyObject *memo) {
+  if (is_shared_scalar(value)) {
+    Py_INCREF(value);
+    return value;
+  }
+
+  PyObject *key = PyLong_FromVoidPtr(value);
+  if (!key) {
+    return nullptr;
+  }
+  PyObject *memoized = PyDict_GetItemWithError(memo, key);
+  Py_DECREF(key);
+  if (memoized) {
+    Py_INCREF(memoized);
+    return memoized;
+  }
+  if (PyErr_Occurred()) {
+    return nullptr;
+  }
+
+  if (PyList_CheckExact(value)) {
+    Py_ssize_t size = PyList_GET_SIZE(value);
+    Py_ssize_t scalars = 0;
+    while (scalars < size &&
+           is_shared_scalar(PyList_GET_ITEM(value, scalars))) {
+      scalars++;
+    }
+    if (scalars == size) {
+      PyObject *copied = PyList_GetSlice(value, 0, size);
+      if (copied && memoize_copy(value, copied, memo) < 0) {
+        Py_CLEAR(copied);
+      }
+      return copied;
+    }
+    PyObject *copied = PyList_New(size);
+    if (!copied) {
+      return nullptr;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+      Py_INCREF(Py_None);
+      PyList_SET_ITEM(copied, i, Py_None);
+    }
+    if (memoize_copy(value, copied, memo) < 0) {
+      Py_DECREF(copied);
+      return nullptr;
+    }
+    for (Py_ssize_t i = 0; i < size && i < PyList_GET_SIZE(value); i++) {
+      PyObject *item = deepcopy_value(PyList_GET_ITEM(value, i), memo);
+      if (!item) {
+        Py_DECREF(copied);
         return nullptr;
       }
+      PyList_SetItem(copied, i, item);
     }
-    dst->instance_data->fields[pair.first] = copied_field;
+    return copied;
+  }
+  if (PyDict_CheckExact(value)) {
+    if (dict_is_flat(value)) {
+      PyObject *copied = PyDict_Copy(value);
+      if (copied && memoize_copy(value, copied, memo) < 0) {
+        Py_CLEAR(copied);
+      }
+      return copied;
+    }
+    PyObject *copied = new_presized_dict(PyDict_GET_SIZE(value));
+    if (!copied) {
+      return nullptr;
+    }
+    if (memoize_copy(value, copied, memo) < 0) {
+      Py_DECREF(copied);
+      return nullptr;
+    }
+    PyObject *item_key, *item_value;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(value, &pos, &item_key, &item_value)) {
+      PyObject *copied_key = deepcopy_value(item_key, memo);
+      if (!copied_key) {
+        Py_DECREF(copied);
+        return nullptr;
+      }
+      PyObject *copied_value = deepcopy_value(item_value, memo);
+      if (!copied_value) {
+        Py_DECREF(copied_key);
+        Py_DECREF(copied);
+        return nullptr;
+      }
+      int res = PyDict_SetItem(copied, copied_key, copied_value);
+      Py_DECREF(copied_key);
+      Py_DECREF(copied_value);
+      if (res < 0) {
+        Py_DECREF(copied);
+        return nullptr;
+      }
+    }
+    return copied;
+  }
+  if (PyTuple_Check(value) || PyAnySet_Check(value)) {
+    return PyObject_CallFunctionObjArgs(copy_deepcopy, value, memo, nullptr);
+  }
+
+  PyObject *copied;
+  if (PyObject_TypeCheck(value, &DataModelType) &&
+      _PyType_Lookup(Py_TYPE(value), deepcopy_str) == model_deepcopy) {
+    copied = deepcopy_model(value, memo);
+  } else {
+    PyObject *deepcopy_func = PyObject_GetAttr(value, deepcopy_str);
+    if (deepcopy_func == nullptr) {
+      if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+        Py_INCREF(value);
+        return value;
+      }
+      return nullptr;
+    }
+    copied = PyObject_CallOneArg(deepcopy_func, memo);
+    Py_DECREF(deepcopy_func);
+  }
+  if (copied && memoize_copy(value, copied, memo) < 0) {
+    Py_DECREF(copied);
+    return nullptr;
+  }
+  return copied;
+}
+
+/**
+ * @brief Deep copies the __slots__ values of a model into its copy.
+ *
+ * Walks the member descriptors that the model's Python classes declare in
+ * __slots__ (for example AsyncDataModel's pending keyword arguments); slots
+ * that are not set are skipped.
+ *
+ * @param self The model instance.
+ * @param new_obj The copy being built.
+ * @param memo The deepcopy memo dictionary.
+ * @return int 0 on success, -1 on error.
+ */
+static int deepcopy_slots(PyObject *self, PyObject *new_obj, PyObject *memo) {
+  PyObject *mro = Py_TYPE(self)->tp_mro;
+  for (Py_ssize_t i = 0; mro && i < PyTuple_GET_SIZE(mro); i++) {
+    PyTypeObject *base = (PyTypeObject *)PyTuple_GET_ITEM(mro, i);
+    if (!(base->tp_flags & Py_TPFLAGS_HEAPTYPE) || !base->tp_dict) {
+      continue;
+    }
+    PyObject *name, *descr;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(base->tp_dict, &pos, &name, &descr)) {
+      if (!Py_IS_TYPE(descr, &PyMemberDescr_Type)) {
+        continue;
+      }
+      PyObject *value = PyMemberDescr_Type.tp_descr_get(
+          descr, self, (PyObject *)Py_TYPE(self));
+      if (!value) {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+          return -1;
+        }
+        PyErr_Clear();
+        continue;
+      }
+      PyObject *copied = deepcopy_value(value, memo);
+      Py_DECREF(value);
+      if (!copied) {
+        return -1;
+      }
+      int res = PyMemberDescr_Type.tp_descr_set(descr, new_obj, copied);
+      Py_DECREF(copied);
+      if (res < 0) {
+        return -1;
+      }
+    }
+  }
+  return 0;
+}
+
+/**
+ * @brief Copies a model instance, deep copying its fields, extras and
+ * __slots__ values.
+ *
+ * @param self The model instance.
+ * @param memo The deepcopy memo dictionary.
+ * @return PyObject* New reference to the copy, or nullptr on error.
+ */
+static PyObject *deepcopy_model(PyObject *self, PyObject *memo) {
+  PyTypeObject *type = Py_TYPE(self);
+  InstanceData *dst_data = alloc_instance_data(type);
+  if (!dst_data) {
+    return nullptr;
+  }
+  PyObject *new_obj = type->tp_alloc(type, 0);
+  if (!new_obj) {
+    free_instance_data(dst_data);
+    return nullptr;
+  }
+
+  DataModelObject *src = (DataModelObject *)self;
+  DataModelObject *dst = (DataModelObject *)new_obj;
+  dst->instance_data = dst_data;
+
+  InstanceData *src_data = src->instance_data;
+  for (Py_ssize_t i = 0; i < src_data->schema->num_fields; i++) {
+    if (!src_data->values[i]) {
+      continue;
+    }
+    PyObject *copied_field = deepcopy_value(src_data->values[i], memo);
+    if (!copied_field) {
+      Py_DECREF(new_obj);
+      return nullptr;
+    }
+    dst_data->values[i] = copied_field;
+  }
+  for (const auto &pair : src_data->extras) {
+    PyObject *copied_field = deepcopy_value(pair.second, memo);
+    if (!copied_field) {
+      Py_DECREF(new_obj);
+      return nullptr;
+    }
+    dst_data->extras[pair.first] = copied_field;
+  }
+  if (deepcopy_slots(self, new_obj, memo) < 0) {
+    Py_DECREF(new_obj);
+    return nullptr;
   }
   return new_obj;
 }
 
+/**
+ * @brief DataModel.__deepcopy__ implementation.
+ *
+ * Takes the memo as its single positional argument (METH_O), so each call
+ * from copy.deepcopy skips building and parsing an argument tuple.
+ *
+ * @param self Python object.
+ * @param memo The deepcopy memo dictionary.
+ * @return PyObject* Deep copied object.
+ */
+static PyObject *DataModel_deepcopy(PyObject *self, PyObject *memo) {
+  if (!PyDict_Check(memo)) {
+    PyErr_Format(PyExc_TypeError,
+                 "__deepcopy__() argument must be dict, not %.200s",
+                 Py_TYPE(memo)->tp_name);
+    return nullptr;
+  }
+  return deepcopy_model(self, memo);
+}
+
+/**
+ * @brief Compares the field values of two instances of the same model.
+ *
+ * @return int 1 if all fields are equal, 0 if not, -1 on error.
+ */
+static int fields_equal(InstanceData *a, InstanceData *b) {
+  for (Py_ssize_t i = 0; i < a->schema->num_fields; i++) {
+    PyObject *left = a->values[i];
+    PyObject *right = b->values[i];
+    if (left == right) {
+      continue;
+    }
+    if (!left || !right) {
+      return 0;
+    }
+    int res = PyObject_RichCompareBool(left, right, Py_EQ);
+    if (res <= 0) {
+      return res;
+    }
+  }
+  return 1;
+}
+
+/**
+ * @brief Compares a model with another object's to_dict() output.
+ *
+ * @param self The model instance.
+ * @param other_to_dict The bound to_dict method of the other object.
+ * @return int 1 if equal, 0 if not, -1 on error.
+ */
+static int to_dict_equal(PyObject *self, PyObject *other_to_dict) {
+  PyObject *right = PyObject_CallNoArgs(other_to_dict);
+  if (!right) {
+    return -1;
+  }
+  PyObject *left = PyObject_CallMethodNoArgs(self, to_dict_str);
+  if (!left) {
+    Py_DECREF(right);
+    return -1;
+  }
+  int res = PyObject_RichCompareBool(left, right, Py_EQ);
+  Py_DECREF(left);
+  Py_DECREF(right);
+  return res;
+}
+
+/**
+ * @brief DataModel rich comparison (== and !=).
+ *
+ * Instances of the same model class compare their field values slot by
+ * slot, stopping at the first difference, without building the two
+ * to_dict() results. A model with a dict_serializer compares its to_dict()
+ * output instead, so equality still follows the serialized values. Any
+ * other object is equal when it has a to_dict() returning the same
+ * dictionary; objects without to_dict() get NotImplemented, so their own
+ * __eq__ decides. Attributes that are not fields are not compared. As in
+ * the to_dict() comparison, a field holding the same object on both sides
+ * (a NaN included) is equal.
+ *
+ * @param self The model instance.
+ * @param other The object compared with.
+ * @param op The comparison operator.
+ * @return PyObject* Py_True, Py_False or Py_NotImplemented.
+ */
+static PyObject *DataModel_richcompare(PyObject *self, PyObject *other,
+                                       int op) {
+  if (op != Py_EQ && op != Py_NE) {
+    Py_RETURN_NOTIMPLEMENTED;
+  }
+  int equal;
+  InstanceData *self_data = ((DataModelObject *)self)->instance_data;
+  if (Py_IS_TYPE(other, Py_TYPE(self)) && self_data && self_data->schema &&
+      self_data->schema->dict_serializer == Py_None &&
+      ((DataModelObject *)other)->instance_data &&
+      ((DataModelObject *)other)->instance_data->schema == self_data->schema) {
+    equal = fields_equal(self_data, ((DataModelObject *)other)->instance_data);
+  } else {
+    PyObject *other_to_dict = PyObject_GetAttr(other, to_dict_str);
+    if (!other_to_dict) {
+      if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        return nullptr;
+      }
+      PyErr_Clear();
+      Py_RETURN_NOTIMPLEMENTED;
+    }
+    equal = to_dict_equal(self, other_to_dict);
+    Py_DECREF(other_to_dict);
+  }
+  if (equal < 0) {
+    return nullptr;
+  }
+  return PyBool_FromLong(op == Py_EQ ? equal : !equal);
+}
+
 static PyMethodDef DataModel_methods[] = {
     {"from_dict", (PyCFunction)dict_utils_from_dict, METH_CLASS | METH_VARARGS,
      "Create an instance from a dictionary."},
-    {"to_dict", (PyCFunction)dict_utils_to_dict, METH_NOARGS,
-     "Convert the model instance to a dictionary."},
+    {"from_dicts", (PyCFunction)dict_utils_from_dicts, METH_CLASS | METH_O,
+     "Create a list of instances from an iterable of dictionaries."},
+    {"to_dict", (PyCFunction)(void (*)(void))dict_utils_to_dict,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Convert the model instance to a dictionary, filling out when given."},
     {"from_json", (PyCFunction)json_utils_from_json, METH_CLASS | METH_FASTCALL,
-     "Create an instance from a JSON string."},
+     "Create an instance from a JSON str, bytes or bytearray."},
+    {"from_json_many", (PyCFunction)json_utils_from_json_many,
+     METH_CLASS | METH_FASTCALL,
+     "Create a list of instances from a JSON array or newline-delimited "
+     "JSON."},
     {"to_json", (PyCFunction)json_utils_to_json, METH_NOARGS,
      "Convert the model instance to a JSON string."},
-    {"__deepcopy__", (PyCFunction)DataModel_deepcopy, METH_VARARGS,
+    {"__deepcopy__", (PyCFunction)DataModel_deepcopy, METH_O,
      "Deep copy the model instance."},
     {nullptr, nullptr, 0, nullptr}};
 
@@ -409,7 +1695,7 @@ PyTypeObject DataModelType = {
     .tp_as_number = nullptr,
     .tp_as_sequence = nullptr,
     .tp_as_mapping = nullptr,
-    .tp_hash = nullptr,
+    .tp_hash = PyObject_HashNotImplemented,
     .tp_call = nullptr,
     .tp_str = nullptr,
     .tp_getattro = DataModel_getattro,
@@ -419,7 +1705,7 @@ PyTypeObject DataModelType = {
     .tp_doc = "DataModel objects",
     .tp_traverse = nullptr,
     .tp_clear = nullptr,
-    .tp_richcompare = nullptr,
+    .tp_richcompare = DataModel_richcompare,
     .tp_weaklistoffset = 0,
     .tp_iter = nullptr,
     .tp_iternext = nullptr,
@@ -5,6 +5,7 @@
 #include <unordered_map>
 
 #ifdef __cplusplus
+#include "conversion/rapidjson_config.hpp"
 #include <rapidjson/document.h>
 #endif
 
@@ -46,6 +47,16 @@ int DataModel_init(PyObject *self, PyObject *args, PyObject *kwds);
  */
 int DataModel_setattro(PyObject *self, PyObject *name, PyObject *value);
 
+/**
+ * @brief Validates a value for a declared field and stores it in its slot.
+ *
+ * @param self The model instance.
+ * @param slot The field's slot in the instance value array.
+ * @param value The value to set (borrowed).
+ * @return 0 on success, -1 on failure.
+ */
+int DataModel_set_field(PyObject *self, Py_ssize_t slot, PyObject *value);
+
 /**
  * @brief DataModel.__getattro__ implementation.
  *
@@ -103,20 +114,72 @@ extern PyObject *schema_key;
  */
 int DataModel_init_from_native(PyObject *self, const rapidjson::Value &native);
 
+/**
+ * @brief Initialize a DataModel instance from a native JSON object using an
+ * already resolved schema.
+ *
+ * @param self The model instance.
+ * @param schema The compiled schema of the instance's class.
+ * @param native The rapidjson DOM element representing the JSON object.
+ * @return 0 on success, -1 on failure.
+ */
+int DataModel_init_from_native_schema(PyObject *self,
+                                      struct SchemaCache *schema,
+                                      const rapidjson::Value &native);
+
+/**
+ * @brief Check whether a class can be built straight from a native JSON DOM.
+ *
+ * The native path bypasses type.__call__, so it is only taken when the class
+ * does not override __new__, __init__ or the metaclass __call__.
+ *
+ * @param cls Python type.
+ * @return true if DataModel_init_from_native can be used.
+ */
+bool DataModel_can_init_from_native(PyObject *cls);
+
+/**
+ * @brief Check whether a dict certainly lacks a required field of a model.
+ *
+ * Used to rule out union candidates without building (and failing) an
+ * instance. Only models built by the default constructor without BEFORE
+ * validators are ruled out, since those could fill in missing keys.
+ *
+ * @param cls The model class.
+ * @param dict The candidate keyword arguments.
+ * @return true if constructing cls from dict must fail for a missing field.
+ */
+bool DataModel_dict_lacks_required(PyObject *cls, PyObject *dict);
+
+/**
+ * @brief Release the instance storages pooled by a schema.
+ *
+ * Called when the schema itself is freed.
+ *
+ * @param schema The compiled schema.
+ */
+void DataModel_clear_instance_freelist(struct SchemaCache *schema);
+
 #ifdef __cplusplus
 } // end extern "C"
 #endif
 
 #ifdef __cplusplus
+struct SchemaCache;
+
 /**
  * @brief Internal data structure for storing instance attributes.
  *
- * Holds the fields of a DataModel instance in a C++ unordered_map
- * for faster access, avoiding the overhead of Python’s __dict__.
+ * Field values live in a flat array with one slot per schema field, indexed
+ * like SchemaCache::fields, so reads and writes of declared fields are a
+ * single pointer access instead of a hash lookup. Attributes that are not
+ * declared fields are kept in a separate map.
  */
 struct InstanceData {
+  SchemaCache *schema; // Kept alive through a reference to its capsule.
+  PyObject **values;   // Field values (nullptr when unset).
   std::unordered_map<std::string, PyObject *>
-      fields;            // Field name to value mapping.
+      extras;            // Non-field attribute name to value mapping.
   bool dict_initialized; // Tracks whether __dict__ has been populated.
 };
 
@@ -4,6 +4,7 @@
 #include "rapidjson/error/en.h"
 #include "rapidjson/prettywriter.h"
 #include "rapidjson/stringbuffer.h"
+#include <cstring>
 #include <memory>
 #include <string>
 
@@ -35,17 +36,38 @@ public:
                   static_cast<rapidjson::SizeType>(message.size()),
                   doc_->GetAllocator());
 
-    if (doc_->HasMember(key)) {
-      rapidjson::Value &existing = (*doc_)[key];
-      if (!existing.IsArray()) {
-        rapidjson::Value arr(rapidjson::kArrayType);
-        arr.PushBack(existing, doc_->GetAllocator());
-        existing = arr;
-      }
-      existing.PushBack(msg, doc_->GetAllocator());
-    } else {
-      doc_->AddMember(key, msg, doc_->GetAllocator());
-    }
+    append(key, msg);
+  }
+
+  /**
+   * @brief Add an error message made of a constant prefix and a detail.
+   *
+   * The message is assembled once, directly in the document allocator, so a
+   * failure such as "Expected type int, got " + type name does not build
+   * intermediate std::string objects.
+   *
+   * @param field The field associated with the error.
+   * @param prefix The constant start of the message.
+   * @param detail The part of the message that varies per failure.
+   */
+  void add_error(const char *field, const char *prefix, const char *detail) {
+    lazy_init();
+    auto &allocator = doc_->GetAllocator();
+
+    rapidjson::Value key;
+    key.SetString(field, static_cast<rapidjson::SizeType>(std::strlen(field)),
+                  allocator);
+
+    size_t prefix_len = std::strlen(prefix);
+    size_t detail_len = std::strlen(detail);
+    char *buffer =
+        static_cast<char *>(allocator.Malloc(prefix_len + detail_len + 1));
+    std::memcpy(buffer, prefix, prefix_len);
+    std::memcpy(buffer + prefix_len, detail, detail_len + 1);
+
+    rapidjson::Value msg(rapidjson::StringRef(
+        buffer, static_cast<rapidjson::SizeType>(prefix_len + detail_len)));
+    append(key, msg);
   }
 
   /**
@@ -118,6 +140,26 @@ public:
   }
 
 private:
+  /**
+   * @brief Store a message under a key, turning repeated keys into arrays.
+   *
+   * @param key The error key, allocated in the document.
+   * @param msg The error message, allocated in the document.
+   */
+  void append(rapidjson::Value &key, rapidjson::Value &msg) {
+    if (doc_->HasMember(key)) {
+      rapidjson::Value &existing = (*doc_)[key];
+      if (!existing.IsArray()) {
+        rapidjson::Value arr(rapidjson::kArrayType);
+        arr.PushBack(existing, doc_->GetAllocator());
+        existing = arr;
+      }
+      existing.PushBack(msg, doc_->GetAllocator());
+    } else {
+      doc_->AddMember(key, msg, doc_->GetAllocator());
+    }
+  }
+
   /**
    * @brief Lazily initialize the JSON document.
    */
@@ -0,0 +1,167 @@
+#include "fast_defaults.hpp"
+#include <Python.h>
+#include <cstddef>
+#include <cstdint>
+#include <random>
+
+typedef struct {
+  PyObject_HEAD uint64_t state;
+  long long lo;
+  long long hi;
+  uint64_t span;
+  uint64_t threshold;
+  vectorcallfunc vectorcall;
+} RandIntFactoryObject;
+
+/**
+ * @brief Advances a SplitMix64 generator and returns its next output.
+ *
+ * @param state The generator state, updated in place.
+ * @return uint64_t The next 64 random bits.
+ */
+static inline uint64_t splitmix64_next(uint64_t *state) {
+  uint64_t z = (*state += 0x9E3779B97F4A7C15ULL);
+  z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+  z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+  return z ^ (z >> 31);
+}
+
+/**
+ * @brief Draws an integer uniformly from the factory's [lo, hi] range.
+ *
+ * Outputs below the rejection threshold are discarded so that the modulo
+ * does not favour the low end of ranges that do not divide 2**64.
+ *
+ * @param self The factory.
+ * @return long long A value in [lo, hi].
+ */
+static long long randint_next(RandIntFactoryObject *self) {
+  uint64_t bits = splitmix64_next(&self->state);
+  if (self->span == 0) {
+    return (long long)((uint64_t)self->lo + bits);
+  }
+  while (bits < self->threshold) {
+    bits = splitmix64_next(&self->state);
+  }
+  return (long long)((uint64_t)self->lo + bits % self->span);
+}
+
+/**
+ * @brief Vectorcall entry point: factory().
+ */
+static PyObject *RandIntFactory_vectorcall(PyObject *callable,
+                                           PyObject *const *args, size_t nargsf,
+                                           PyObject *kwnames) {
+  if (PyVectorcall_NARGS(nargsf) != 0 ||
+      (kwnames && PyTuple_GET_SIZE(kwnames) != 0)) {
+    PyErr_SetString(PyExc_TypeError, "RandIntFactory takes no arguments");
+    return nullptr;
+  }
+  return PyLong_FromLongLong(randint_next((RandIntFactoryObject *)callable));
+}
+
+/**
+ * @brief Creates a factory: RandIntFactory(lo, hi, seed=None).
+ *
+ * Both bounds are inclusive and must fit in a signed 64-bit integer. Without
+ * a seed the generator is seeded from std::random_device.
+ */
+static PyObject *RandIntFactory_new(PyTypeObject *type, PyObject *args,
+                                    PyObject *kwds) {
+  static const char *kwlist[] = {"lo", "hi", "seed", nullptr};
+  long long lo = 0;
+  long long hi = 0;
+  PyObject *seed = Py_None;
+  if (!PyArg_ParseTupleAndKeywords(args, kwds, "LL|O:RandIntFactory",
+                                   (char **)kwlist, &lo, &hi, &seed)) {
+    return nullptr;
+  }
+  if (hi < lo) {
+    PyErr_Format(PyExc_ValueError, "empty range for randint (%lld, %lld)", lo,
+                 hi);
+    return nullptr;
+  }
+  uint64_t state;
+  if (seed == Py_None) {
+    std::random_device device;
+    state = ((uint64_t)device() << 32) ^ (uint64_t)device();
+  } else {
+    if (!PyLong_Check(seed)) {
+      PyErr_SetString(PyExc_TypeError, "seed must be an int or None");
+      return nullptr;
+    }
+    state = (uint64_t)PyLong_AsUnsignedLongLongMask(seed);
+    if (state == (uint64_t)-1 && PyErr_Occurred()) {
+      return nullptr;
+    }
+  }
+  RandIntFactoryObject *self = (RandIntFactoryObject *)type->tp_alloc(type, 0);
+  if (!self) {
+    return nullptr;
+  }
+  self->state = state;
+  self->lo = lo;
+  self->hi = hi;
+  // A span of 0 stands for the full 2**64 range, where every output is used.
+  self->span = (uint64_t)hi - (uint64_t)lo + 1;
+  self->threshold = self->span ? (0 - self->span) % self->span : 0;
+  self->vectorcall = RandIntFactory_vectorcall;
+  return (PyObject *)self;
+}
+
+static PyObject *RandIntFactory_repr(RandIntFactoryObject *self) {
+  return PyUnicode_FromFormat("RandIntFactory(%lld, %lld)", self->lo, self->hi);
+}
+
+PyTypeObject RandIntFactoryType = {
+    .ob_base = {.ob_base = {.ob_refcnt = 1, .ob_type = &PyType_Type},
+                .ob_size = 0},
+    .tp_name = "vldt._vldt.RandIntFactory",
+    .tp_basicsize = sizeof(RandIntFactoryObject),
+    .tp_itemsize = 0,
+    .tp_dealloc = nullptr,
+    .tp_vectorcall_offset = offsetof(RandIntFactoryObject, vectorcall),
+    .tp_getattr = nullptr,
+    .tp_setattr = nullptr,
+    .tp_as_async = nullptr,
+    .tp_repr = (reprfunc)RandIntFactory_repr,
+    .tp_as_number = nullptr,
+    .tp_as_sequence = nullptr,
+    .tp_as_mapping = nullptr,
+    .tp_hash = nullptr,
+    .tp_call = PyVectorcall_Call,
+    .tp_str = nullptr,
+    .tp_getattro = nullptr,
+    .tp_setattro = nullptr,
+    .tp_as_buffer = nullptr,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_doc = "Default factory returning random integers in [lo, hi]",
+    .tp_traverse = nullptr,
+    .tp_clear = nullptr,
+    .tp_richcompare = nullptr,
+    .tp_weaklistoffset = 0,
+    .tp_iter = nullptr,
+    .tp_iternext = nullptr,
+    .tp_methods = nullptr,
+    .tp_members = nullptr,
+    .tp_getset = nullptr,
+    .tp_base = nullptr,
+    .tp_dict = nullptr,
+    .tp_descr_get = nullptr,
+    .tp_descr_set = nullptr,
+    .tp_dictoffset = 0,
+    .tp_init = nullptr,
+    .tp_alloc = nullptr,
+    .tp_new = RandIntFactory_new,
+    .tp_free = nullptr,
+    .tp_is_gc = nullptr,
+    .tp_bases = nullptr,
+    .tp_mro = nullptr,
+    .tp_cache = nullptr,
+    .tp_subclasses = nullptr,
+    .tp_weaklist = nullptr,
+    .tp_del = nullptr,
+    .tp_version_tag = 0,
+    .tp_finalize = nullptr};
+
+int init_fast_defaults(void) { return PyType_Ready(&RandIntFactoryType); }
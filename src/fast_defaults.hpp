@@ -0,0 +1,21 @@
+#pragma once
+
+#include <Python.h>
+
+/**
+ * @brief Type object for vldt._vldt.RandIntFactory.
+ *
+ * A RandIntFactory is a zero-argument callable returning a random integer
+ * in an inclusive [lo, hi] range, like random.randint(lo, hi). It keeps its
+ * own SplitMix64 state, so each call is a few integer operations in C
+ * instead of a trip through random.Random. It is meant for
+ * Field(default_factory=...), not for anything security sensitive.
+ */
+extern PyTypeObject RandIntFactoryType;
+
+/**
+ * @brief Readies the RandIntFactory type.
+ *
+ * @return int 0 on success, -1 on failure.
+ */
+int init_fast_defaults(void);
@@ -33,6 +33,48 @@ extern PyObject *NoneType;
  */
 extern PyObject *VLDTUndefined;
 
+/**
+ * @brief Create a dict sized up front for the given number of items.
+ *
+ * Uses _PyDict_NewPresized where the interpreter exports it, so filling the
+ * dict never resizes its table; other versions get a plain dict.
+ *
+ * @param size Expected number of items.
+ * @return New dict reference, or nullptr on error.
+ */
+static inline PyObject *new_presized_dict(Py_ssize_t size) {
+#if PY_VERSION_HEX < 0x030D0000
+  return _PyDict_NewPresized(size);
+#else
+  (void)size;
+  return PyDict_New();
+#endif
+}
+
+/**
+ * @brief isinstance() for a compiled field type.
+ *
+ * A value of exactly the expected type is accepted with a pointer compare,
+ * as PyObject_IsInstance itself does first. Otherwise, classes whose
+ * metaclass is exactly type cannot customize isinstance, so
+ * their check is a direct walk of the value type's MRO instead of a lookup
+ * and call of type.__instancecheck__. Other classes (ABCs, enums, models)
+ * go through PyObject_IsInstance.
+ *
+ * @param value The value to check.
+ * @param type The expected type.
+ * @return 1 if value is an instance of type, 0 if not, -1 on error.
+ */
+static inline int is_instance_of(PyObject *value, PyObject *type) {
+  if ((PyObject *)Py_TYPE(value) == type) {
+    return 1;
+  }
+  if (Py_IS_TYPE(type, &PyType_Type)) {
+    return PyType_IsSubtype(Py_TYPE(value), (PyTypeObject *)type);
+  }
+  return PyObject_IsInstance(value, type);
+}
+
 /**
  * @brief Functions to initialize individual globals.
  */
@@ -1,19 +1,54 @@
 #include "deserializer.hpp"
 
+/**
+ * @brief Check whether an object is a dict or a read-only view of one.
+ * @param obj The object to check.
+ * @return true for dicts and types.MappingProxyType instances.
+ */
+bool is_deserializer_mapping(PyObject *obj) {
+  return PyDict_Check(obj) || PyObject_TypeCheck(obj, &PyDictProxy_Type);
+}
+
+/**
+ * @brief Return a mapping of deserializers as a dict.
+ * @param mapping A dict or a mappingproxy.
+ * @return New reference to a dict, or nullptr with an exception set.
+ */
+static PyObject *deserializer_mapping_as_dict(PyObject *mapping) {
+  if (PyDict_Check(mapping)) {
+    return Py_NewRef(mapping);
+  }
+  PyObject *dict = PyDict_New();
+  if (dict && PyDict_Merge(dict, mapping, 1) != 0) {
+    Py_CLEAR(dict);
+  }
+  return dict;
+}
+
 /**
  * @brief Create a Deserializers structure from a Python dict.
- * @param deserializer_dict A Python dictionary containing deserializer
+ *
+ * The outer mapping and the per-type mappings may also be mappingproxy
+ * views, as in the read-only GLOBAL_DESERIALIZER.
+ *
+ * @param deserializer_mapping A Python dictionary containing deserializer
  * functions.
  * @return Deserializers* Pointer to the created Deserializers structure.
  */
-Deserializers *create_deserializers(PyObject *deserializer_dict) {
-  if (!deserializer_dict || !PyDict_Check(deserializer_dict)) {
+Deserializers *create_deserializers(PyObject *deserializer_mapping) {
+  if (!deserializer_mapping || !is_deserializer_mapping(deserializer_mapping)) {
     PyErr_SetString(PyExc_TypeError, "deserializer_dict must be a dict");
     return nullptr;
   }
+  PyObject *deserializer_dict =
+      deserializer_mapping_as_dict(deserializer_mapping);
+  if (!deserializer_dict) {
+    return nullptr;
+  }
 
   Deserializers *deserializers = new Deserializers();
   if (!deserializers) {
+    Py_DECREF(deserializer_dict);
     PyErr_NoMemory();
     return nullptr;
   }
@@ -21,19 +56,28 @@ Deserializers *create_deserializers(PyObject *deserializer_dict) {
   PyObject *outer_key, *outer_value;
   Py_ssize_t pos = 0;
   while (PyDict_Next(deserializer_dict, &pos, &outer_key, &outer_value)) {
-    if (!PyDict_Check(outer_value)) {
+    if (!is_deserializer_mapping(outer_value)) {
       PyErr_SetString(PyExc_TypeError,
                       "Each value in deserializer_dict must be a dict");
       free_deserializers(deserializers);
+      Py_DECREF(deserializer_dict);
+      return nullptr;
+    }
+    PyObject *sources = deserializer_mapping_as_dict(outer_value);
+    if (!sources) {
+      free_deserializers(deserializers);
+      Py_DECREF(deserializer_dict);
       return nullptr;
     }
     PyObject *inner_key, *inner_value;
     Py_ssize_t inner_pos = 0;
-    while (PyDict_Next(outer_value, &inner_pos, &inner_key, &inner_value)) {
+    while (PyDict_Next(sources, &inner_pos, &inner_key, &inner_value)) {
       if (!PyCallable_Check(inner_value)) {
         PyErr_SetString(PyExc_TypeError,
                         "Deserializer function must be callable");
+        Py_DECREF(sources);
         free_deserializers(deserializers);
+        Py_DECREF(deserializer_dict);
         return nullptr;
       }
       Py_INCREF(outer_key);
@@ -42,7 +86,9 @@ Deserializers *create_deserializers(PyObject *deserializer_dict) {
       DeserializerKey dk = {outer_key, inner_key};
       deserializers->map.insert({dk, inner_value});
     }
+    Py_DECREF(sources);
   }
+  Py_DECREF(deserializer_dict);
   return deserializers;
 }
 
@@ -51,22 +97,18 @@ Deserializers *create_deserializers(PyObject *deserializer_dict) {
  * @param deserializers Pointer to the Deserializers structure.
  * @param deserialize_to The target type.
  * @param deserialize_from The source type.
- * @return PyObject* The cached deserializer function or Py_None.
+ * @return PyObject* Borrowed reference to the deserializer function, or
+ * nullptr if none is registered.
  */
 PyObject *get_deserializer(Deserializers *deserializers,
                            PyObject *deserialize_to,
                            PyObject *deserialize_from) {
   if (!deserializers) {
-    PyErr_SetString(PyExc_RuntimeError, "Deserializers structure is null");
     return nullptr;
   }
   DeserializerKey dk = {deserialize_to, deserialize_from};
   auto it = deserializers->map.find(dk);
-  if (it != deserializers->map.end()) {
-    Py_INCREF(it->second);
-    return it->second;
-  }
-  Py_RETURN_NONE;
+  return it != deserializers->map.end() ? it->second : nullptr;
 }
 
 /**
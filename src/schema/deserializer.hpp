@@ -62,14 +62,21 @@ extern "C" {
 Deserializers *create_deserializers(PyObject *deserializer_dict);
 
 /**
- * @brief Retrieve the cached deserializer function for the given types.
+ * @brief Check whether an object can be passed to create_deserializers.
  *
- * If no function is found, returns Py_None.
+ * @param obj The object to check.
+ * @return true for dicts and types.MappingProxyType instances.
+ */
+bool is_deserializer_mapping(PyObject *obj);
+
+/**
+ * @brief Retrieve the cached deserializer function for the given types.
  *
  * @param deserializers Pointer to the Deserializers structure.
  * @param deserialize_to The target type.
  * @param deserialize_from The source type.
- * @return PyObject* The cached deserializer function or Py_None.
+ * @return PyObject* Borrowed reference to the deserializer function, or
+ * nullptr if none is registered.
  */
 PyObject *get_deserializer(Deserializers *deserializers,
                            PyObject *deserialize_to,
@@ -3,10 +3,14 @@
 #include <cstring>
 #include <memory>
 
+#include "conversion/rapidjson_to_pyobject.hpp"
 #include "data_model.hpp"
 #include "init_globals.hpp"
 #include "schema/deserializer.hpp"
 #include "schema/schema.hpp"
+#include "validation/validation.hpp"
+#include "validation/validation_containers.hpp"
+#include "validation/validation_validators.hpp"
 
 extern PyObject *UnionType;
 extern PyObject *ClassVarType;
@@ -16,6 +20,7 @@ extern PyObject *SetType;
 namespace {
 PyObject *cached_type_schema_key = nullptr;
 PyObject *unified_schema_key = nullptr;
+PyObject *generic_type_schemas = nullptr;
 
 /**
  * @brief No-op capsule destructor.
@@ -93,6 +98,192 @@ void try_cache_type_schema(PyObject *expected_type, TypeSchema *ts) {
   }
 }
 
+/**
+ * @brief Build the structural key of an annotation and its arguments.
+ *
+ * Each level holds the annotation's own type and the annotation; generic
+ * levels add the keys of their __args__ in order. typing compares unions as
+ * sets and Literal values with ==, so Union[int, str] and Union[str, int]
+ * (or Literal[1] and Literal[True]) compare equal as annotations even though
+ * they validate differently; the ordered, typed argument keys keep them
+ * apart. List, dict, set and tuple generics compile the same whichever way
+ * they are spelled, so they are keyed by their origin instead: List[int]
+ * and list[int] (or Dict and dict) share one schema.
+ *
+ * @param annotation The annotation.
+ * @return New reference to the key, or nullptr with an exception set.
+ */
+static PyObject *structural_key(PyObject *annotation) {
+  PyObject *type = (PyObject *)Py_TYPE(annotation);
+  if (PyType_Check(annotation)) {
+    return PyTuple_Pack(2, type, annotation);
+  }
+  PyObject *args = PyObject_GetAttrString(annotation, "__args__");
+  if (!args || !PyTuple_Check(args)) {
+    PyErr_Clear();
+    Py_XDECREF(args);
+    return PyTuple_Pack(2, type, annotation);
+  }
+  Py_ssize_t num_args = PyTuple_GET_SIZE(args);
+  PyObject *arg_keys = PyTuple_New(num_args);
+  if (!arg_keys) {
+    Py_DECREF(args);
+    return nullptr;
+  }
+  for (Py_ssize_t i = 0; i < num_args; i++) {
+    PyObject *arg_key = structural_key(PyTuple_GET_ITEM(args, i));
+    if (!arg_key) {
+      Py_DECREF(arg_keys);
+      Py_DECREF(args);
+      return nullptr;
+    }
+    PyTuple_SET_ITEM(arg_keys, i, arg_key);
+  }
+  Py_DECREF(args);
+  PyObject *key;
+  PyObject *origin = PyObject_GetAttrString(annotation, "__origin__");
+  if (origin == (PyObject *)&PyList_Type ||
+      origin == (PyObject *)&PyDict_Type || origin == (PyObject *)&PySet_Type ||
+      origin == (PyObject *)&PyTuple_Type) {
+    key = PyTuple_Pack(2, origin, arg_keys);
+  } else {
+    PyErr_Clear();
+    key = PyTuple_Pack(3, type, annotation, arg_keys);
+  }
+  Py_XDECREF(origin);
+  Py_DECREF(arg_keys);
+  return key;
+}
+
+/**
+ * @brief Build the key of a generic annotation in the generic schema cache.
+ *
+ * The annotation's own type is part of the key so equal annotations spelled
+ * differently (e.g. Optional[int] and int | None) keep their own schema, and
+ * the arguments are keyed in order (see structural_key).
+ *
+ * @param expected_type The generic annotation.
+ * @return New reference to the key, or nullptr (with no exception set) if
+ * the annotation is not hashable.
+ */
+PyObject *generic_schema_key(PyObject *expected_type) {
+  PyObject *key = structural_key(expected_type);
+  if (key && PyObject_Hash(key) == -1) {
+    Py_CLEAR(key);
+  }
+  if (!key) {
+    PyErr_Clear();
+  }
+  return key;
+}
+
+/**
+ * @brief Retrieves a cached TypeSchema for a generic annotation.
+ *
+ * Structurally identical annotations (List[int], Optional[str], ...) are
+ * shared by every model declaring them, so defining more models does not
+ * recompile them.
+ *
+ * @param expected_type The generic annotation.
+ * @return Pointer to cached TypeSchema or nullptr.
+ */
+TypeSchema *get_cached_generic_type_schema(PyObject *expected_type) {
+  if (!generic_type_schemas) {
+    return nullptr;
+  }
+  PyObject *key = generic_schema_key(expected_type);
+  if (!key) {
+    return nullptr;
+  }
+  PyObject *capsule = PyDict_GetItemWithError(generic_type_schemas, key);
+  Py_DECREF(key);
+  if (!capsule) {
+    PyErr_Clear();
+    return nullptr;
+  }
+  return static_cast<TypeSchema *>(
+      PyCapsule_GetPointer(capsule, "vldt.TypeSchema"));
+}
+
+/**
+ * @brief Caches the TypeSchema of a generic annotation.
+ *
+ * Only annotations whose arguments are all cached themselves are kept, so
+ * the cache never points into a schema that can be released. This includes
+ * generics of DataModel classes (List[Address], Dict[str, List[Address]]):
+ * a model's own schema is cached on the class and holds it for the life of
+ * the process, so sharing the generic schemas around it keeps nothing else
+ * alive and lets every model declaring them reuse one compiled schema.
+ *
+ * @param expected_type The generic annotation.
+ * @param ts The TypeSchema to cache.
+ */
+void try_cache_generic_type_schema(PyObject *expected_type, TypeSchema *ts) {
+  for (Py_ssize_t i = 0; i < ts->num_args; i++) {
+    if (!ts->args[i]->cached) {
+      return;
+    }
+  }
+  if (!generic_type_schemas) {
+    generic_type_schemas = PyDict_New();
+    if (!generic_type_schemas) {
+      PyErr_Clear();
+      return;
+    }
+  }
+  PyObject *key = generic_schema_key(expected_type);
+  if (!key) {
+    return;
+  }
+  PyObject *capsule =
+      PyCapsule_New(ts, "vldt.TypeSchema", no_op_capsule_destructor);
+  if (capsule && PyDict_SetItem(generic_type_schemas, key, capsule) == 0) {
+    ts->cached = 1;
+  } else {
+    PyErr_Clear();
+  }
+  Py_XDECREF(capsule);
+  Py_DECREF(key);
+}
+
+/**
+ * @brief Sets the "Expected type X, got " prefix of type errors for a schema.
+ *
+ * X is the type's __name__ (or __qualname__), or the name of the
+ * annotation's own type when the annotation is not a class. Building it once
+ * here spares the failing validators a __name__ lookup and formatting per
+ * error. On failure the prefix falls back to a static string.
+ *
+ * @param ts The TypeSchema.
+ * @param expected_type The expected type.
+ */
+static void set_type_error_prefix(TypeSchema *ts, PyObject *expected_type) {
+  ts->type_error = nullptr;
+  if (PyType_Check(expected_type)) {
+    PyObject *name = PyObject_GetAttrString(expected_type, "__name__");
+    if (!name) {
+      PyErr_Clear();
+      name = PyObject_GetAttrString(expected_type, "__qualname__");
+    }
+    if (name && PyUnicode_Check(name)) {
+      ts->type_error = PyUnicode_FromFormat("Expected type %U, got ", name);
+    } else {
+      ts->type_error = PyUnicode_FromFormat(
+          "Expected type %s, got ", ((PyTypeObject *)expected_type)->tp_name);
+    }
+    Py_XDECREF(name);
+  } else {
+    ts->type_error = PyUnicode_FromFormat("Expected type %s, got ",
+                                          Py_TYPE(expected_type)->tp_name);
+  }
+  ts->utf8_type_error =
+      ts->type_error ? PyUnicode_AsUTF8(ts->type_error) : nullptr;
+  if (!ts->utf8_type_error) {
+    PyErr_Clear();
+    ts->utf8_type_error = "Expected type <unknown>, got ";
+  }
+}
+
 /**
  * @brief Handles the case when no origin attribute is available.
  * @param ts The TypeSchema.
@@ -104,14 +295,10 @@ TypeSchema *handle_no_origin(TypeSchema *ts, PyObject *expected_type) {
   Py_INCREF(Py_None);
   ts->num_args = 0;
   ts->args = nullptr;
-  ts->repr = PyObject_Repr(expected_type);
-  if (!ts->repr) {
-    ts->repr = Py_None;
-    Py_INCREF(Py_None);
-  }
-  ts->utf8_repr = PyUnicode_AsUTF8(ts->repr);
-  try_cache_type_schema(expected_type, ts);
+  set_type_error_prefix(ts, expected_type);
   ts->is_optional = 0;
+  assign_type_validator(ts);
+  try_cache_type_schema(expected_type, ts);
   return ts;
 }
 
@@ -150,14 +337,10 @@ void normalize_origin(TypeSchema *ts) {
 TypeSchema *handle_no_args(TypeSchema *ts, PyObject *expected_type) {
   ts->num_args = 0;
   ts->args = nullptr;
-  ts->repr = PyObject_Repr(expected_type);
-  if (!ts->repr) {
-    ts->repr = Py_None;
-    Py_INCREF(Py_None);
-  }
-  ts->utf8_repr = PyUnicode_AsUTF8(ts->repr);
-  try_cache_type_schema(expected_type, ts);
+  set_type_error_prefix(ts, expected_type);
   ts->is_optional = 0;
+  assign_type_validator(ts);
+  try_cache_type_schema(expected_type, ts);
   return ts;
 }
 
@@ -201,7 +384,16 @@ void handle_container_kind(TypeSchema *ts) {
     if (PyObject_RichCompareBool(ts->origin, UnionType, Py_EQ) == 1) {
       ts->container_kind = CK_UNION;
       ts->is_optional = 0;
+      ts->num_union_types = 0;
       for (Py_ssize_t i = 0; i < ts->num_args; i++) {
+        PyObject *check_type = (ts->args[i]->origin != Py_None)
+                                   ? ts->args[i]->origin
+                                   : ts->args[i]->expected_type;
+        if (PyType_Check(check_type) &&
+            ts->num_union_types < VLDT_UNION_TABLE_SIZE) {
+          ts->union_types[ts->num_union_types++] =
+              reinterpret_cast<PyTypeObject *>(check_type);
+        }
         if (ts->args[i]->expected_type == (PyObject *)Py_TYPE(Py_None)) {
           ts->is_optional = 1;
         } else if (PyType_Check(ts->args[i]->expected_type) &&
@@ -276,6 +468,11 @@ TypeSchema *compile_type_schema(PyObject *expected_type) {
   if (auto cached = get_cached_type_schema(expected_type)) {
     return cached;
   }
+  if (!PyType_Check(expected_type)) {
+    if (auto cached = get_cached_generic_type_schema(expected_type)) {
+      return cached;
+    }
+  }
   auto ts = new (std::nothrow) TypeSchema{};
   if (!ts) {
     PyErr_NoMemory();
@@ -315,14 +512,13 @@ TypeSchema *compile_type_schema(PyObject *expected_type) {
     return nullptr;
   }
   Py_DECREF(args);
-  ts->repr = PyObject_Repr(expected_type);
-  if (!ts->repr) {
-    ts->repr = Py_None;
-    Py_INCREF(Py_None);
-  }
-  ts->utf8_repr = PyUnicode_AsUTF8(ts->repr);
+  set_type_error_prefix(ts, expected_type);
   handle_container_kind(ts);
+  assign_type_validator(ts);
   try_cache_type_schema(expected_type, ts);
+  if (!ts->cached) {
+    try_cache_generic_type_schema(expected_type, ts);
+  }
   return ts;
 }
 
@@ -339,7 +535,7 @@ void free_type_schema(TypeSchema *ts) {
   }
   Py_DECREF(ts->expected_type);
   Py_DECREF(ts->origin);
-  Py_DECREF(ts->repr);
+  Py_XDECREF(ts->type_error);
   if (ts->inner_model_type) {
     Py_DECREF(ts->inner_model_type);
   }
@@ -380,6 +576,168 @@ Py_ssize_t count_non_class_vars(PyObject *annotations) {
   return count;
 }
 
+/**
+ * @brief Checks whether a non-empty tuple holds only interned exact strings.
+ * @param aliases The tuple.
+ * @return true if the tuple can be used as frozen aliases as it is.
+ */
+static bool aliases_are_interned(PyObject *aliases) {
+  Py_ssize_t n = PyTuple_GET_SIZE(aliases);
+  for (Py_ssize_t i = 0; i < n; i++) {
+    PyObject *alias = PyTuple_GET_ITEM(aliases, i);
+    if (!PyUnicode_CheckExact(alias) || !PyUnicode_CHECK_INTERNED(alias)) {
+      return false;
+    }
+  }
+  return n > 0;
+}
+
+/**
+ * @brief Freezes the alias setting of a Field into a tuple of interned keys.
+ *
+ * Interned aliases hash once and match interned input keys (keyword names,
+ * literals) by identity. A tuple that is already interned, as Field builds
+ * it, is shared; a single string becomes a one-item tuple, and any other
+ * list or tuple is copied, so the Field's own sequence stays untouched.
+ *
+ * @param alias_obj The alias attribute of a Field.
+ * @return New reference to the alias tuple, or nullptr when the field has
+ * no aliases (or on error).
+ */
+PyObject *freeze_aliases(PyObject *alias_obj) {
+  if (PyTuple_CheckExact(alias_obj) && aliases_are_interned(alias_obj)) {
+    return Py_NewRef(alias_obj);
+  }
+  PyObject *items;
+  if (PyUnicode_Check(alias_obj)) {
+    items = PyTuple_Pack(1, alias_obj);
+  } else if (PyList_Check(alias_obj) || PyTuple_Check(alias_obj)) {
+    items = PySequence_Tuple(alias_obj);
+  } else {
+    return nullptr;
+  }
+  Py_ssize_t n = items ? PyTuple_GET_SIZE(items) : 0;
+  PyObject *frozen = n ? PyTuple_New(n) : nullptr;
+  if (!frozen) {
+    Py_XDECREF(items);
+    PyErr_Clear();
+    return nullptr;
+  }
+  for (Py_ssize_t i = 0; i < n; i++) {
+    PyObject *alias = Py_NewRef(PyTuple_GET_ITEM(items, i));
+    if (PyUnicode_CheckExact(alias)) {
+      PyUnicode_InternInPlace(&alias);
+    }
+    PyTuple_SET_ITEM(frozen, i, alias);
+  }
+  Py_DECREF(items);
+  return frozen;
+}
+
+/**
+ * @brief Returns true for the immutable scalars a shallow copy may share.
+ */
+static inline bool is_immutable_scalar(PyObject *value) {
+  return value == Py_None || PyBool_Check(value) || PyLong_CheckExact(value) ||
+         PyFloat_CheckExact(value) || PyUnicode_CheckExact(value) ||
+         PyBytes_CheckExact(value);
+}
+
+/**
+ * @brief Returns true if a list, dict or set holds only immutable scalars,
+ * so its shallow copy is already independent of the default.
+ */
+static bool holds_only_scalars(PyObject *value) {
+  if (PyDict_Check(value)) {
+    PyObject *key, *item;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(value, &pos, &key, &item)) {
+      if (!is_immutable_scalar(item)) {
+        return false;
+      }
+    }
+    return true;
+  }
+  if (PyList_Check(value)) {
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(value); i++) {
+      if (!is_immutable_scalar(PyList_GET_ITEM(value, i))) {
+        return false;
+      }
+    }
+    return true;
+  }
+  // Set items are hashable, but tuples among them may hold mutable objects.
+  PyObject *item;
+  Py_hash_t hash;
+  Py_ssize_t pos = 0;
+  while (_PySet_NextEntry(value, &pos, &item, &hash)) {
+    if (!is_immutable_scalar(item)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * @brief Returns a factory calling copy.deepcopy on a default value.
+ *
+ * @param value The declared default value.
+ * @return New reference to functools.partial(copy.deepcopy, value), or
+ * nullptr with an exception set.
+ */
+static PyObject *deepcopy_factory(PyObject *value) {
+  static PyObject *deepcopy = nullptr;
+  static PyObject *partial = nullptr;
+  if (!partial) {
+    PyObject *copy_module = PyImport_ImportModule("copy");
+    PyObject *functools =
+        copy_module ? PyImport_ImportModule("functools") : nullptr;
+    if (functools) {
+      deepcopy = PyObject_GetAttrString(copy_module, "deepcopy");
+      partial =
+          deepcopy ? PyObject_GetAttrString(functools, "partial") : nullptr;
+      if (!partial) {
+        Py_CLEAR(deepcopy);
+      }
+    }
+    Py_XDECREF(copy_module);
+    Py_XDECREF(functools);
+    if (!partial) {
+      return nullptr;
+    }
+  }
+  return PyObject_CallFunctionObjArgs(partial, deepcopy, value, nullptr);
+}
+
+/**
+ * @brief Returns the factory that replaces a mutable default value.
+ *
+ * Empty list, dict and set defaults become the matching constructor. Others
+ * holding only immutable scalars become their copy method, and the rest a
+ * copy.deepcopy call, so every instance gets its own containers, nested
+ * ones included, instead of sharing the class attribute.
+ *
+ * @param value The declared default value.
+ * @return New reference to the factory, or nullptr if value is kept as is.
+ */
+static PyObject *mutable_default_factory(PyObject *value) {
+  PyTypeObject *type = Py_TYPE(value);
+  if (type != &PyList_Type && type != &PyDict_Type && type != &PySet_Type) {
+    return nullptr;
+  }
+  if (PyObject_Size(value) == 0) {
+    Py_INCREF(type);
+    return (PyObject *)type;
+  }
+  PyObject *factory = holds_only_scalars(value)
+                          ? PyObject_GetAttrString(value, "copy")
+                          : deepcopy_factory(value);
+  if (!factory) {
+    PyErr_Clear();
+  }
+  return factory;
+}
+
 /**
  * @brief Compiles the field schema for a given field.
  * @param cls The class object.
@@ -390,14 +748,20 @@ Py_ssize_t count_non_class_vars(PyObject *annotations) {
  */
 int compile_field_schema(PyObject *cls, PyObject *key, PyObject *expected_type,
                          FieldSchema *fs) {
-  fs->field_name = key;
   Py_INCREF(key);
-  fs->field_name_c = PyUnicode_AsUTF8(key);
+  PyUnicode_InternInPlace(&key);
+  fs->field_name = key;
+  fs->field_hash = PyObject_Hash(key);
+  if (fs->field_hash == -1) {
+    PyErr_Clear();
+  }
+  fs->field_name_c = PyUnicode_AsUTF8AndSize(key, &fs->field_name_len);
   fs->alias = nullptr;
   fs->default_value = VLDTUndefined;
   Py_INCREF(VLDTUndefined);
   fs->default_factory = Py_None;
   Py_INCREF(Py_None);
+  fs->list_sample = 0;
   const char *key_str = PyUnicode_AsUTF8(key);
   PyObject *field_obj = nullptr;
   if (PyObject_HasAttrString(cls, key_str)) {
@@ -412,20 +776,10 @@ int compile_field_schema(PyObject *cls, PyObject *key, PyObject *expected_type,
     if (has_descriptor_attrs) {
       PyObject *alias_obj = PyObject_GetAttrString(field_obj, "alias");
       if (alias_obj) {
-        if (!PyList_Check(alias_obj)) {
-          if (PyUnicode_Check(alias_obj)) {
-            PyObject *tmp = PyList_New(1);
-            if (!tmp) {
-              Py_DECREF(alias_obj);
-              alias_obj = nullptr;
-            } else {
-              PyList_SET_ITEM(tmp, 0, alias_obj);
-              alias_obj = tmp;
-            }
-          }
-        }
-        fs->alias = alias_obj;
+        fs->alias = freeze_aliases(alias_obj);
+        Py_DECREF(alias_obj);
       } else {
+        PyErr_Clear();
         fs->alias = nullptr;
       }
       PyObject *factory = PyObject_GetAttrString(field_obj, "default_factory");
@@ -445,11 +799,306 @@ int compile_field_schema(PyObject *cls, PyObject *key, PyObject *expected_type,
       Py_INCREF(fs->default_value);
     }
     Py_DECREF(field_obj);
+    if (PyObject *factory = mutable_default_factory(fs->default_value)) {
+      Py_SETREF(fs->default_factory, factory);
+      Py_SETREF(fs->default_value, Py_NewRef(VLDTUndefined));
+    }
   }
   fs->type_schema = compile_type_schema(expected_type);
   return 0;
 }
 
+/**
+ * @brief Adds one accepted key to the schema's key map.
+ * @param key_map The key map.
+ * @param key The alias or canonical field name.
+ * @param slot The field slot.
+ * @param rank The priority of the key within its field (lower wins).
+ * @return 1 if added, 0 if the key is already claimed, -1 on error.
+ */
+int add_key_map_entry(PyObject *key_map, PyObject *key, Py_ssize_t slot,
+                      Py_ssize_t rank) {
+  int present = PyDict_Contains(key_map, key);
+  if (present != 0) {
+    return present < 0 ? -1 : 0;
+  }
+  PyObject *entry = PyLong_FromSsize_t((slot << VLDT_KEY_RANK_BITS) | rank);
+  if (!entry) {
+    return -1;
+  }
+  int rc = PyDict_SetItem(key_map, key, entry);
+  Py_DECREF(entry);
+  return rc < 0 ? -1 : 1;
+}
+
+/**
+ * @brief Builds the merged alias/name key map for models with aliases.
+ *
+ * Leaves key_map unset when no field has aliases, or when a key is accepted
+ * by more than one field (then every field is looked up on its own).
+ *
+ * @param schema Pointer to the SchemaCache.
+ * @return 0 on success, -1 on failure.
+ */
+int build_key_map(SchemaCache *schema) {
+  bool has_alias = false;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    if (schema->table.flags[i] & FIELD_HAS_ALIAS) {
+      if (PyTuple_GET_SIZE(schema->fields[i].alias) >=
+          (1 << VLDT_KEY_RANK_BITS)) {
+        return 0;
+      }
+      has_alias = true;
+    }
+  }
+  if (!has_alias) {
+    return 0;
+  }
+  PyObject *key_map = PyDict_New();
+  if (!key_map) {
+    return -1;
+  }
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    FieldSchema *fs = &schema->fields[i];
+    Py_ssize_t n_alias = 0;
+    if (schema->table.flags[i] & FIELD_HAS_ALIAS) {
+      n_alias = PyTuple_GET_SIZE(fs->alias);
+    }
+    for (Py_ssize_t j = 0; j <= n_alias; j++) {
+      PyObject *key =
+          j < n_alias ? PyTuple_GET_ITEM(fs->alias, j) : fs->field_name;
+      int rc = add_key_map_entry(key_map, key, i, j);
+      if (rc <= 0) {
+        Py_DECREF(key_map);
+        return rc;
+      }
+    }
+  }
+  auto native_key_map = new (std::nothrow) NativeKeyMap();
+  if (!native_key_map) {
+    Py_DECREF(key_map);
+    PyErr_NoMemory();
+    return -1;
+  }
+  native_key_map->reserve(PyDict_GET_SIZE(key_map));
+  PyObject *key, *entry;
+  Py_ssize_t pos = 0;
+  while (PyDict_Next(key_map, &pos, &key, &entry)) {
+    if (!PyUnicode_Check(key)) {
+      continue;
+    }
+    Py_ssize_t len = 0;
+    const char *utf8 = PyUnicode_AsUTF8AndSize(key, &len);
+    if (!utf8) {
+      // Not encodable, so no parsed JSON member can carry this name.
+      PyErr_Clear();
+      continue;
+    }
+    native_key_map->emplace(std::string_view(utf8, len),
+                            PyLong_AsSsize_t(entry));
+  }
+  schema->key_map = key_map;
+  schema->native_key_map = native_key_map;
+  return 0;
+}
+
+/**
+ * @brief Returns true if the value a missing field resolves to can be stored
+ * without validation.
+ *
+ * A default (or None for an Optional field) qualifies when it is an
+ * immutable int, str, float, bool, bytes or None that the field's validator
+ * accepts by exact type. A factory qualifies when it is list, dict or set
+ * and the field is declared as that container: the fresh empty container it
+ * returns is valid for any item type.
+ *
+ * @param fs The compiled field schema.
+ * @param flags The field's flag bits computed so far.
+ * @return true if the field can be marked FIELD_MISSING_READY.
+ */
+static bool missing_value_is_ready(FieldSchema *fs, uint8_t flags) {
+  TypeSchema *ts = fs->type_schema;
+  if (!ts) {
+    return false;
+  }
+  if (flags & FIELD_HAS_FACTORY) {
+    PyObject *factory = fs->default_factory;
+    PyTypeObject *exact = ts->exact_type;
+    return (factory == (PyObject *)&PyList_Type &&
+            (ts->container_kind == CK_LIST || exact == &PyList_Type)) ||
+           (factory == (PyObject *)&PyDict_Type &&
+            (ts->container_kind == CK_DICT || exact == &PyDict_Type)) ||
+           (factory == (PyObject *)&PySet_Type &&
+            (ts->container_kind == CK_SET || exact == &PySet_Type));
+  }
+  PyObject *value;
+  if (flags & FIELD_HAS_DEFAULT) {
+    value = fs->default_value;
+  } else if (flags & FIELD_OPTIONAL) {
+    value = Py_None;
+  } else {
+    return false;
+  }
+  if (value == Py_None) {
+    return ts->container_kind == CK_UNION && ts->is_optional;
+  }
+  PyTypeObject *type = Py_TYPE(value);
+  if (type != &PyLong_Type && type != &PyUnicode_Type &&
+      type != &PyFloat_Type && type != &PyBool_Type && type != &PyBytes_Type) {
+    return false;
+  }
+  if (type == ts->exact_type) {
+    return true;
+  }
+  if (ts->container_kind == CK_UNION) {
+    for (int i = 0; i < ts->num_union_types; i++) {
+      if (ts->union_types[i] == type) {
+        return true;
+      }
+    }
+  }
+  return false;
+}
+
+/**
+ * @brief Builds the parallel field arrays and the name-to-index map from the
+ * compiled FieldSchemas.
+ * @param schema Pointer to the SchemaCache.
+ * @return 0 on success, -1 on failure.
+ */
+int build_field_table(SchemaCache *schema) {
+  Py_ssize_t n = schema->num_fields;
+  FieldTable *table = &schema->table;
+  table->keys = new (std::nothrow) PyObject *[n];
+  table->hashes = new (std::nothrow) Py_hash_t[n];
+  table->flags = new (std::nothrow) uint8_t[n];
+  table->types = new (std::nothrow) TypeSchema *[n];
+  table->dumps = new (std::nothrow) FieldDump[n]();
+  table->json_dumps = new (std::nothrow) FieldJsonDump[n]();
+  if (!table->keys || !table->hashes || !table->flags || !table->types ||
+      !table->dumps || !table->json_dumps) {
+    PyErr_NoMemory();
+    return -1;
+  }
+  schema->field_index = PyDict_New();
+  schema->kwargs_template = new_presized_dict(n);
+  if (!schema->field_index || !schema->kwargs_template) {
+    return -1;
+  }
+  for (Py_ssize_t i = 0; i < n; i++) {
+    FieldSchema *fs = &schema->fields[i];
+    uint8_t flags = 0;
+    if (fs->alias) {
+      flags |= FIELD_HAS_ALIAS;
+    }
+    if (fs->default_value != VLDTUndefined) {
+      flags |= FIELD_HAS_DEFAULT;
+    }
+    if (fs->default_factory != Py_None) {
+      flags |= FIELD_HAS_FACTORY;
+    }
+    if (fs->type_schema && fs->type_schema->is_optional) {
+      flags |= FIELD_OPTIONAL;
+    }
+    if (missing_value_is_ready(fs, flags)) {
+      flags |= FIELD_MISSING_READY;
+    }
+    json_key_cache_seed(fs->field_name);
+    for (Py_ssize_t j = 0; fs->alias && j < PyTuple_GET_SIZE(fs->alias); j++) {
+      json_key_cache_seed(PyTuple_GET_ITEM(fs->alias, j));
+    }
+    table->keys[i] = fs->field_name;
+    table->hashes[i] = fs->field_hash;
+    table->flags[i] = flags;
+    table->types[i] = fs->type_schema;
+    PyObject *index = PyLong_FromSsize_t(i);
+    if (!index || PyDict_SetItem(schema->field_index, fs->field_name, index)) {
+      Py_XDECREF(index);
+      return -1;
+    }
+    Py_DECREF(index);
+    if (PyDict_SetItem(schema->kwargs_template, fs->field_name, Py_None)) {
+      return -1;
+    }
+  }
+  return build_key_map(schema);
+}
+
+/**
+ * @brief Frees the parallel field arrays.
+ * @param schema Pointer to the SchemaCache.
+ */
+void free_field_table(SchemaCache *schema) {
+  delete[] schema->table.keys;
+  delete[] schema->table.hashes;
+  delete[] schema->table.flags;
+  delete[] schema->table.types;
+  delete[] schema->table.dumps;
+  delete[] schema->table.json_dumps;
+  Py_XDECREF(schema->field_index);
+  Py_XDECREF(schema->kwargs_template);
+  Py_XDECREF(schema->key_map);
+  delete schema->native_key_map;
+}
+
+/**
+ * @brief Freezes a serializer mapping from the model config.
+ *
+ * Non-empty dicts are copied, so later changes to the config do not affect
+ * the compiled schema; anything else (missing, empty, not a dict) becomes
+ * Py_None, letting the conversion paths test for serializers by identity.
+ *
+ * @param serializer New reference to the configured mapping, or nullptr.
+ * @return New reference to the frozen mapping or Py_None.
+ */
+PyObject *freeze_serializer(PyObject *serializer) {
+  PyObject *frozen = nullptr;
+  if (serializer && PyDict_Check(serializer) &&
+      PyDict_GET_SIZE(serializer) > 0) {
+    frozen = PyDict_Copy(serializer);
+  }
+  Py_XDECREF(serializer);
+  if (!frozen) {
+    PyErr_Clear();
+    frozen = Py_NewRef(Py_None);
+  }
+  return frozen;
+}
+
+/**
+ * @brief Applies the fast_list setting of a config to the schema's fields.
+ *
+ * True samples one item and a positive int samples that many; anything else
+ * keeps full validation. Only List[int], List[str], List[float] and
+ * List[bool] fields, and lists of them (List[List[int]], ...), are sampled;
+ * for the latter, each row is sampled.
+ *
+ * @param schema Pointer to the SchemaCache.
+ * @param fast_list New reference to the configured value, or nullptr.
+ */
+static void assign_list_samples(SchemaCache *schema, PyObject *fast_list) {
+  Py_ssize_t sample = 0;
+  if (fast_list == Py_True) {
+    sample = 1;
+  } else if (fast_list && PyLong_CheckExact(fast_list)) {
+    sample = PyLong_AsSsize_t(fast_list);
+    if (sample < 0) {
+      PyErr_Clear();
+      sample = 0;
+    }
+  }
+  Py_XDECREF(fast_list);
+  PyErr_Clear();
+  for (Py_ssize_t i = 0; sample && i < schema->num_fields; i++) {
+    TypeSchema *ts = schema->fields[i].type_schema;
+    if (is_primitive_list_schema(ts) ||
+        (ts && ts->validator == validate_list &&
+         is_primitive_list_schema(ts->args[0]))) {
+      schema->fields[i].list_sample = sample;
+    }
+  }
+}
+
 /**
  * @brief Compiles the configuration for the schema.
  * @param cls The class object.
@@ -467,12 +1116,7 @@ void compile_config(PyObject *cls, SchemaCache *schema) {
     } else {
       dict_enc = PyObject_GetAttrString(config, "dict_serializer");
     }
-    if (dict_enc) {
-      schema->dict_serializer = dict_enc;
-    } else {
-      schema->dict_serializer = Py_None;
-      Py_INCREF(Py_None);
-    }
+    schema->dict_serializer = freeze_serializer(dict_enc);
     PyObject *json_enc = nullptr;
     if (PyDict_Check(config)) {
       json_enc = PyDict_GetItemString(config, "json_serializer");
@@ -482,12 +1126,7 @@ void compile_config(PyObject *cls, SchemaCache *schema) {
     } else {
       json_enc = PyObject_GetAttrString(config, "json_serializer");
     }
-    if (json_enc) {
-      schema->json_serializer = json_enc;
-    } else {
-      schema->json_serializer = Py_None;
-      Py_INCREF(Py_None);
-    }
+    schema->json_serializer = freeze_serializer(json_enc);
     PyObject *deserializer_obj = nullptr;
     if (PyDict_Check(config)) {
       deserializer_obj = PyDict_GetItemString(config, "deserializer");
@@ -497,16 +1136,23 @@ void compile_config(PyObject *cls, SchemaCache *schema) {
     } else {
       deserializer_obj = PyObject_GetAttrString(config, "deserializer");
     }
-    if (deserializer_obj && PyDict_Check(deserializer_obj)) {
+    if (deserializer_obj && is_deserializer_mapping(deserializer_obj)) {
       schema->deserializers = create_deserializers(deserializer_obj);
       if (!schema->deserializers) {
-        Py_DECREF(deserializer_obj);
         schema->deserializers = nullptr;
       }
     } else {
       schema->deserializers = nullptr;
     }
     Py_XDECREF(deserializer_obj);
+    PyObject *fast_list = nullptr;
+    if (PyDict_Check(config)) {
+      fast_list = PyDict_GetItemString(config, "fast_list");
+      Py_XINCREF(fast_list);
+    } else {
+      fast_list = PyObject_GetAttrString(config, "fast_list");
+    }
+    assign_list_samples(schema, fast_list);
     schema->config = config;
   } else {
     schema->config = Py_None;
@@ -519,36 +1165,184 @@ void compile_config(PyObject *cls, SchemaCache *schema) {
   }
 }
 
+/**
+ * @brief Returns the type a value must have exactly for a to_dict fast path.
+ *
+ * Plain int/str/float/bool types and DataModel subclasses qualify, unless the
+ * model's dict_serializer has an entry for them. Optional[X] resolves to X:
+ * None values do not have the exact type and take the generic conversion.
+ *
+ * @param ts The compiled type schema.
+ * @param serializer The schema's frozen dict_serializer (or Py_None).
+ * @param is_model Set to whether the type is a DataModel subclass.
+ * @return The type, or nullptr if values of ts need the generic conversion.
+ */
+PyTypeObject *direct_dump_type(TypeSchema *ts, PyObject *serializer,
+                               bool *is_model) {
+  if (ts && ts->container_kind == CK_UNION && ts->is_optional &&
+      ts->num_args == 2) {
+    ts = ts->args[ts->args[0]->expected_type == (PyObject *)Py_TYPE(Py_None)];
+  }
+  if (!ts || ts->origin != Py_None || !PyType_Check(ts->expected_type)) {
+    return nullptr;
+  }
+  PyObject *type = ts->expected_type;
+  if (serializer != Py_None && PyDict_GetItem(serializer, type)) {
+    return nullptr;
+  }
+  *is_model = ts->is_data_model;
+  if (ts->is_data_model || type == IntType || type == StrType ||
+      type == FloatType || type == BoolType) {
+    return reinterpret_cast<PyTypeObject *>(type);
+  }
+  return nullptr;
+}
+
+/**
+ * @brief Selects the to_dict dispatch entry of every field.
+ *
+ * A field whose declared type has an entry in the model's dict_serializer
+ * calls that entry directly (DUMP_SERIALIZER). Plain types and models are
+ * DUMP_PLAIN and DUMP_MODEL, and lists or dicts of them get the matching
+ * container kind. Everything else stays DUMP_GENERIC. A model whose fields
+ * are all DUMP_PLAIN is marked as a leaf.
+ *
+ * @param schema Pointer to the SchemaCache; its config must be compiled.
+ */
+void assign_dump_kinds(SchemaCache *schema) {
+  PyObject *serializer = schema->dict_serializer;
+  schema->is_leaf = schema->num_fields > 0;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    TypeSchema *ts = schema->table.types[i];
+    FieldDump *dump = &schema->table.dumps[i];
+    if (ts && serializer != Py_None && PyType_Check(ts->expected_type)) {
+      PyObject *func = PyDict_GetItem(serializer, ts->expected_type);
+      if (func && PyCallable_Check(func)) {
+        dump->kind = DUMP_SERIALIZER;
+        dump->type = reinterpret_cast<PyTypeObject *>(ts->expected_type);
+        dump->serializer = func;
+      }
+    }
+    bool is_model = false;
+    PyTypeObject *type = nullptr;
+    if (dump->kind != DUMP_GENERIC) {
+      // Resolved to the serializer above.
+    } else if ((type = direct_dump_type(ts, serializer, &is_model))) {
+      dump->kind = is_model ? DUMP_MODEL : DUMP_PLAIN;
+      dump->type = type;
+    } else if (ts &&
+               (ts->container_kind == CK_LIST ||
+                ts->container_kind == CK_DICT) &&
+               ts->num_args == (ts->container_kind == CK_LIST ? 1 : 2) &&
+               (serializer == Py_None ||
+                !PyDict_GetItem(serializer, ts->origin)) &&
+               (type = direct_dump_type(ts->args[ts->num_args - 1], serializer,
+                                        &is_model))) {
+      if (ts->container_kind == CK_LIST) {
+        dump->kind = is_model ? DUMP_LIST_MODEL : DUMP_LIST_PLAIN;
+        dump->type = &PyList_Type;
+      } else {
+        dump->kind = is_model ? DUMP_DICT_MODEL : DUMP_DICT_PLAIN;
+        dump->type = &PyDict_Type;
+      }
+      dump->item_type = type;
+    }
+    if (dump->kind != DUMP_PLAIN) {
+      schema->is_leaf = 0;
+    }
+  }
+}
+
+/**
+ * @brief Selects the to_json dispatch entry of every field.
+ *
+ * A field declared as a plain type (or Optional of one) with an entry in
+ * the model's json_serializer binds that entry, so writing the field calls
+ * it without a per-value dict lookup. int, str, float and bool fields
+ * without an entry are written directly.
+ *
+ * @param schema Pointer to the SchemaCache; its config must be compiled.
+ */
+void assign_json_dumps(SchemaCache *schema) {
+  PyObject *serializer = schema->json_serializer;
+  for (Py_ssize_t i = 0; i < schema->num_fields; i++) {
+    TypeSchema *ts = schema->table.types[i];
+    if (ts && ts->container_kind == CK_UNION && ts->is_optional &&
+        ts->num_args == 2) {
+      ts = ts->args[ts->args[0]->expected_type == (PyObject *)Py_TYPE(Py_None)];
+    }
+    if (!ts || ts->origin != Py_None || !PyType_Check(ts->expected_type)) {
+      continue;
+    }
+    PyObject *type = ts->expected_type;
+    FieldJsonDump *dump = &schema->table.json_dumps[i];
+    PyObject *func =
+        serializer != Py_None ? PyDict_GetItem(serializer, type) : nullptr;
+    if (func && PyCallable_Check(func)) {
+      dump->type = reinterpret_cast<PyTypeObject *>(type);
+      dump->serializer = func;
+    } else if (!func && (type == IntType || type == StrType ||
+                         type == FloatType || type == BoolType)) {
+      dump->type = reinterpret_cast<PyTypeObject *>(type);
+    }
+  }
+}
+
 /**
  * @brief Compiles validators for the schema.
+ *
+ * Validators are unwrapped and grouped per field once here, so construction
+ * only walks the compiled arrays.
+ *
  * @param cls The class object.
  * @param schema Pointer to the SchemaCache.
+ * @return 0 on success, -1 on error.
  */
-void compile_validators(PyObject *cls, SchemaCache *schema) {
+int compile_validators(PyObject *cls, SchemaCache *schema) {
   PyObject *validators = PyObject_GetAttrString(cls, "__vldt_validators__");
-  if (validators && PyDict_Check(validators)) {
-    schema->validators = validators;
-    PyObject *tmp =
-        PyObject_GetAttrString(cls, "__vldt_has_field_before_validators__");
-    schema->has_field_before = tmp ? PyObject_IsTrue(tmp) : 0;
-    Py_XDECREF(tmp);
-    tmp = PyObject_GetAttrString(cls, "__vldt_has_field_after_validators__");
-    schema->has_field_after = tmp ? PyObject_IsTrue(tmp) : 0;
-    Py_XDECREF(tmp);
-    tmp = PyObject_GetAttrString(cls, "__vldt_has_model_before_validators__");
-    schema->has_model_before = tmp ? PyObject_IsTrue(tmp) : 0;
-    Py_XDECREF(tmp);
-    tmp = PyObject_GetAttrString(cls, "__vldt_has_model_after_validators__");
-    schema->has_model_after = tmp ? PyObject_IsTrue(tmp) : 0;
-    Py_XDECREF(tmp);
-  } else {
-    schema->validators = Py_None;
-    Py_INCREF(Py_None);
-    schema->has_field_before = 0;
-    schema->has_field_after = 0;
-    schema->has_model_before = 0;
-    schema->has_model_after = 0;
+  if (!validators) {
+    PyErr_Clear();
+  }
+  int rc = compile_validator_set(validators, schema, &schema->validators);
+  Py_XDECREF(validators);
+  if (rc != 0) {
+    return -1;
+  }
+  const ValidatorSet &sync = schema->validators;
+  unsigned flags = 0;
+  if (sync.num_field_before > 0) {
+    flags |= VALIDATORS_FIELD_BEFORE;
+  }
+  if (sync.num_field_after > 0) {
+    flags |= VALIDATORS_FIELD_AFTER;
+  }
+  if (PyTuple_GET_SIZE(sync.model_before) > 0) {
+    flags |= VALIDATORS_MODEL_BEFORE;
+  }
+  if (PyTuple_GET_SIZE(sync.model_after) > 0) {
+    flags |= VALIDATORS_MODEL_AFTER;
+  }
+
+  PyObject *async_validators =
+      PyObject_GetAttrString(cls, "__vldt_await_free_validators__");
+  if (!async_validators) {
+    PyErr_Clear();
+  }
+  rc = compile_validator_set(async_validators, schema,
+                             &schema->async_validators);
+  Py_XDECREF(async_validators);
+  if (rc != 0) {
+    return -1;
+  }
+  const ValidatorSet &async = schema->async_validators;
+  if (async.num_field_before > 0 || PyTuple_GET_SIZE(async.model_before) > 0) {
+    flags |= VALIDATORS_ASYNC_BEFORE;
+  }
+  if (async.num_field_after > 0 || PyTuple_GET_SIZE(async.model_after) > 0) {
+    flags |= VALIDATORS_ASYNC_AFTER;
   }
+  schema->validator_flags = flags;
+  return 0;
 }
 } // anonymous namespace
 
@@ -599,7 +1393,12 @@ PyObject *compile_schema(PyObject *cls) {
     idx++;
   }
   Py_DECREF(annotations);
+  if (build_field_table(schema) != 0) {
+    return nullptr;
+  }
   compile_config(cls, schema);
+  assign_dump_kinds(schema);
+  assign_json_dumps(schema);
 
   // Directly retrieve __vldt_instance_annotations__; the Python metaclass is
   // expected to have set this correctly.
@@ -614,7 +1413,9 @@ PyObject *compile_schema(PyObject *cls) {
     Py_INCREF(Py_None);
   }
 
-  compile_validators(cls, schema);
+  if (compile_validators(cls, schema) != 0) {
+    return nullptr;
+  }
   schema->cached_to_dict = PyObject_GetAttrString(cls, "to_dict");
   PyObject *capsule = PyCapsule_New(
       static_cast<void *>(schema), "vldt.SchemaCache", [](PyObject *capsule) {
@@ -633,12 +1434,15 @@ PyObject *compile_schema(PyObject *cls) {
               free_type_schema(fs->type_schema);
             }
           }
+          DataModel_clear_instance_freelist(schema);
+          free_field_table(schema);
           delete[] schema->fields;
           Py_DECREF(schema->config);
           Py_DECREF(schema->dict_serializer);
           Py_DECREF(schema->json_serializer);
           Py_DECREF(schema->instance_annotations);
-          Py_DECREF(schema->validators);
+          free_validator_set(&schema->validators);
+          free_validator_set(&schema->async_validators);
           Py_DECREF(schema->cached_to_dict);
           if (schema->deserializers) {
             free_deserializers(schema->deserializers);
@@ -646,6 +1450,9 @@ PyObject *compile_schema(PyObject *cls) {
           delete schema;
         }
       });
+  if (capsule) {
+    schema->capsule = capsule;
+  }
   return capsule;
 }
 
@@ -678,3 +1485,34 @@ PyObject *get_schema_cached(PyObject *cls) {
   }
   return capsule;
 }
+
+/**
+ * @brief Retrieves the compiled schema for the class as a borrowed pointer.
+ * @param cls The class object.
+ * @return A borrowed pointer to the SchemaCache, or nullptr on error.
+ */
+SchemaCache *get_schema(PyObject *cls) {
+  PyObject *type_dict = reinterpret_cast<PyTypeObject *>(cls)->tp_dict;
+  if (unified_schema_key && type_dict) {
+    PyObject *capsule = PyDict_GetItem(type_dict, unified_schema_key);
+    if (capsule && PyCapsule_CheckExact(capsule)) {
+      auto schema = static_cast<SchemaCache *>(
+          PyCapsule_GetPointer(capsule, "vldt.SchemaCache"));
+      if (schema) {
+        return schema;
+      }
+      PyErr_Clear();
+    }
+  }
+  PyObject *capsule = get_schema_cached(cls);
+  if (!capsule) {
+    if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError, "Could not compile model schema");
+    }
+    return nullptr;
+  }
+  auto schema = static_cast<SchemaCache *>(
+      PyCapsule_GetPointer(capsule, "vldt.SchemaCache"));
+  Py_DECREF(capsule);
+  return schema;
+}
@@ -2,11 +2,56 @@
 
 #include "schema/deserializer.hpp" // Include the deserializers header
 #include <Python.h>
+#include <stdint.h>
 
 #ifdef __cplusplus
+#include <string_view>
+#include <unordered_map>
+
+class ErrorCollector;
+
+/**
+ * @brief UTF-8 view of every key accepted by a model with aliases, mapped to
+ * the packed slot and rank stored in SchemaCache::key_map.
+ *
+ * The views point into the key strings held by key_map, so JSON object
+ * members are matched without creating Python strings for their names.
+ */
+using NativeKeyMap = std::unordered_map<std::string_view, Py_ssize_t>;
+
 extern "C" {
 #endif
 
+struct TypeSchema;
+struct InstanceData;
+
+/**
+ * @brief Maximum number of exact union member types checked by pointer.
+ */
+#define VLDT_UNION_TABLE_SIZE 8
+
+/**
+ * @brief Maximum number of released instance storages kept per model class.
+ */
+#define VLDT_INSTANCE_FREELIST_SIZE 64
+
+/**
+ * @brief Maximum number of fields for which attribute names are matched by
+ * scanning the interned field keys instead of looking them up in a dict.
+ */
+#define VLDT_FIELD_SCAN_LIMIT 16
+
+/**
+ * @brief Signature of a compiled type validator.
+ *
+ * Each TypeSchema carries the validator selected for it when the schema is
+ * compiled, so validation does not re-inspect the schema flags per value.
+ */
+typedef PyObject *(*TypeValidator)(PyObject *value, struct TypeSchema *ts,
+                                   ErrorCollector *collector,
+                                   const char *error_path,
+                                   Deserializers *deserializers);
+
 /**
  * @brief Container kind definitions.
  *
@@ -34,63 +79,242 @@ enum ContainerKind {
  *  - The cached __origin__ attribute (or Py_None if not generic).
  *  - The number of type arguments (from __args__).
  *  - An array of pointers to the TypeSchema for each type argument.
- *  - A cached representation of the type (for error messages).
- *  - The cached UTF-8 representation of the type’s repr.
+ *  - The "Expected type X, got " prefix of type errors, as a str and as
+ *    UTF-8.
  *  - Flags for model and optional types.
  *  - Container information: container_kind and, if applicable,
  *    inner_model_type.
+ *  - The validator selected for this type at compile time.
+ *  - The type whose exact instances the validator would return unchanged
+ *    (plain types and models), or nullptr, so callers can skip the call.
+ *  - For unions, a small table of member type objects so exact-type values
+ *    are accepted with pointer compares before any isinstance call.
  */
 struct TypeSchema {
   PyObject *expected_type;
   PyObject *origin;
   Py_ssize_t num_args;
   struct TypeSchema **args;
-  PyObject *repr;
-  const char *utf8_repr;
+  PyObject *type_error;
+  const char *utf8_type_error;
   int is_data_model;
   int is_optional;
   int cached;
   int container_kind;
   PyObject *inner_model_type;
+  TypeValidator validator;
+  PyTypeObject *exact_type;
+  PyTypeObject *union_types[VLDT_UNION_TABLE_SIZE];
+  int num_union_types;
 };
 
 /**
  * @brief Structure for field metadata.
  *
  * Contains per-field information and a pointer to the unified TypeSchema.
+ * The field name is interned and its hash is cached for kwargs lookups; its
+ * UTF-8 form and length are cached for writing JSON keys.
  *
  * Note: Fields no longer carry type details; these now reside solely in
  * TypeSchema.
  */
 struct FieldSchema {
   PyObject *field_name;
+  Py_hash_t field_hash;
   const char *field_name_c;
+  Py_ssize_t field_name_len;
   PyObject *alias;
   PyObject *default_value;
   PyObject *default_factory;
   TypeSchema *type_schema;
+  Py_ssize_t list_sample; // Items checked in a List[primitive] (0: all).
+};
+
+/**
+ * @brief Per-field flag bits stored in FieldTable::flags.
+ *
+ * FIELD_MISSING_READY marks fields whose value when missing (the default,
+ * None for Optional fields, or a fresh empty container from a list, dict or
+ * set factory) is known at compile time to pass validation unchanged, so it
+ * is stored without running the validator.
+ */
+enum FieldFlags {
+  FIELD_HAS_ALIAS = 1 << 0,
+  FIELD_HAS_DEFAULT = 1 << 1,
+  FIELD_HAS_FACTORY = 1 << 2,
+  FIELD_OPTIONAL = 1 << 3,
+  FIELD_MISSING_READY = 1 << 4
+};
+
+/**
+ * @brief How to_dict converts a field, chosen when the schema is compiled.
+ *
+ * Every kind except DUMP_GENERIC applies only when the value has exactly
+ * FieldDump::type; other values take the generic conversion. Items of the
+ * list and dict kinds are handled directly when they have exactly
+ * FieldDump::item_type.
+ */
+enum DumpKind {
+  DUMP_GENERIC = 0,    // dispatch on the value's type
+  DUMP_PLAIN = 1,      // int, str, float or bool: copied as is
+  DUMP_MODEL = 2,      // DataModel subclass: converted directly
+  DUMP_SERIALIZER = 3, // dict_serializer entry in FieldDump::serializer
+  DUMP_LIST_PLAIN = 4, // List of int, str, float or bool
+  DUMP_LIST_MODEL = 5, // List of a DataModel subclass
+  DUMP_DICT_PLAIN = 6, // Dict with int, str, float or bool values
+  DUMP_DICT_MODEL = 7  // Dict with DataModel values
+};
+
+/**
+ * @brief Per-field to_dict dispatch entry.
+ *
+ * The pointers are borrowed from the field's TypeSchema and the schema's
+ * dict_serializer.
+ */
+struct FieldDump {
+  uint8_t kind;
+  PyTypeObject *type;
+  PyTypeObject *item_type;
+  PyObject *serializer;
 };
 
+/**
+ * @brief Per-field to_json dispatch entry.
+ *
+ * Applies only to values of exactly type, and only while the model is
+ * written with its own json_serializer. A non-null serializer is that
+ * mapping's entry for type and is called directly; without one, type is
+ * int, str, float or bool and the value is written as is. A null type
+ * leaves the field to the generic writer. The pointers are borrowed from
+ * the field's TypeSchema and the schema's json_serializer.
+ */
+struct FieldJsonDump {
+  PyTypeObject *type;
+  PyObject *serializer;
+};
+
+/**
+ * @brief Hot per-field data laid out as parallel arrays.
+ *
+ * The instance construction loop only needs the key, its hash, a few flags
+ * and the type schema for each field. Keeping these in separate arrays lets
+ * the loop stream through them instead of striding over whole FieldSchema
+ * entries. Entry i of every array describes schema->fields[i]; the pointers
+ * are borrowed from the corresponding FieldSchema. dumps and json_dumps hold
+ * the to_dict and to_json dispatch entries of each field.
+ */
+struct FieldTable {
+  PyObject **keys;
+  Py_hash_t *hashes;
+  uint8_t *flags;
+  struct TypeSchema **types;
+  struct FieldDump *dumps;
+  struct FieldJsonDump *json_dumps;
+};
+
+/**
+ * @brief Validators of one field, resolved when the schema is compiled.
+ *
+ * callables is a tuple of plain callables (classmethod wrappers already
+ * unwrapped). slot is the field's position in the instance value array, or
+ * -1 when the key does not name a declared field.
+ */
+struct FieldValidators {
+  PyObject *key;
+  Py_ssize_t slot;
+  PyObject *callables;
+};
+
+/**
+ * @brief Compiled validators of one kind (sync or await-free async).
+ *
+ * model_before and model_after are tuples of plain callables;
+ * model_after_self_only[i] is 1 when model_after[i] takes only the instance.
+ */
+struct ValidatorSet {
+  FieldValidators *field_before;
+  Py_ssize_t num_field_before;
+  FieldValidators *field_after;
+  Py_ssize_t num_field_after;
+  PyObject *model_before;
+  PyObject *model_after;
+  uint8_t *model_after_self_only;
+};
+
+/**
+ * @brief Validator kinds present on a model, stored in
+ * SchemaCache::validator_flags.
+ */
+enum ValidatorFlags {
+  VALIDATORS_FIELD_BEFORE = 1 << 0,
+  VALIDATORS_FIELD_AFTER = 1 << 1,
+  VALIDATORS_MODEL_BEFORE = 1 << 2,
+  VALIDATORS_MODEL_AFTER = 1 << 3,
+  VALIDATORS_ASYNC_BEFORE = 1 << 4,
+  VALIDATORS_ASYNC_AFTER = 1 << 5,
+  // Any validator that runs on the keyword arguments before field lookup.
+  VALIDATORS_BEFORE = VALIDATORS_FIELD_BEFORE | VALIDATORS_MODEL_BEFORE |
+                      VALIDATORS_ASYNC_BEFORE,
+  // Any validator that runs on the instance once the fields are stored.
+  VALIDATORS_AFTER =
+      VALIDATORS_FIELD_AFTER | VALIDATORS_MODEL_AFTER | VALIDATORS_ASYNC_AFTER
+};
+
+/**
+ * @brief Bits of a key_map entry holding the rank of the key.
+ *
+ * key_map values are (slot << VLDT_KEY_RANK_BITS) | rank, where rank is the
+ * position of an alias in the field's alias list and the canonical name ranks
+ * after every alias.
+ */
+#define VLDT_KEY_RANK_BITS 16
+
 /**
  * @brief Structure aggregating model-level schema information.
  *
  * Contains an array of FieldSchema entries plus any configuration/validator
- * settings.
+ * settings. field_index maps each field name to its position in fields, which
+ * is also the slot of the field in an instance's value array. kwargs_template
+ * holds every field name (mapped to None) and is copied to get a dict already
+ * sized for the fields when keyword arguments are built from parsed JSON.
+ * key_map is set when some field has aliases: it maps every accepted key
+ * (aliases and canonical names) to its field slot and rank, so keyword
+ * arguments are matched in one pass over the input; it is nullptr otherwise.
+ * native_key_map holds the same entries keyed by UTF-8 views for matching
+ * parsed JSON members, and is set exactly when key_map is.
+ * free_instances keeps the native storage of deallocated instances for reuse
+ * by new instances of the same class. validators holds the compiled
+ * validators; async_validators holds the async validators of an
+ * AsyncDataModel when none of them awaits, so they can run inside __init__,
+ * and is empty otherwise. is_leaf is set when every field is DUMP_PLAIN,
+ * i.e. the model holds no nested models or containers.
+ * validator_flags records which ValidatorFlags kinds
+ * are non-empty, so models without validators skip the validator pipeline
+ * with a single test. capsule is the (borrowed) capsule owning the schema;
+ * every live instance holds a reference to it, so the schema outlives the
+ * class dict when a class and its instances are collected together.
  */
 struct SchemaCache {
   FieldSchema *fields;
   Py_ssize_t num_fields;
+  FieldTable table;
+  PyObject *field_index;
+  PyObject *kwargs_template;
+  PyObject *key_map;
+  NativeKeyMap *native_key_map;
   PyObject *config;
   PyObject *dict_serializer;
   PyObject *json_serializer;
   PyObject *instance_annotations;
-  PyObject *validators;
+  ValidatorSet validators;
   PyObject *cached_to_dict;
-  int has_field_before;
-  int has_field_after;
-  int has_model_before;
-  int has_model_after;
+  int is_leaf;
+  unsigned validator_flags;
+  ValidatorSet async_validators;
   Deserializers *deserializers;
+  InstanceData *free_instances[VLDT_INSTANCE_FREELIST_SIZE];
+  int num_free_instances;
+  PyObject *capsule;
 };
 
 /**
@@ -118,6 +342,19 @@ void free_type_schema(TypeSchema *ts);
  */
 PyObject *get_schema_cached(PyObject *cls);
 
+/**
+ * @brief Retrieves the compiled SchemaCache for the given model class.
+ *
+ * The schema is owned by the capsule stored on the class, so the returned
+ * pointer is borrowed and stays valid for the lifetime of the class. This is
+ * the lookup used on hot paths; it avoids creating a new reference to the
+ * capsule for every call.
+ *
+ * @param cls The model class (a Python type).
+ * @return A borrowed pointer to the schema, or nullptr with an exception set.
+ */
+SchemaCache *get_schema(PyObject *cls);
+
 #ifdef __cplusplus
 }
 #endif
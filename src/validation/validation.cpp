@@ -3,6 +3,7 @@
 #include <stdio.h>
 #include <string>
 
+#include "data_model.hpp"
 #include "error_handling.hpp"
 #include "init_globals.hpp"
 #include "schema/deserializer.hpp"
@@ -51,8 +52,10 @@ static const char *safe_type_name(PyObject *obj) {
  * @brief Validates and converts a DataModel from a Python dictionary.
  *
  * This function attempts to construct a new object of the expected type by
- * calling its constructor with the provided value. If an exception occurs,
- * the error is captured and reported via the ErrorCollector.
+ * calling its constructor with the provided value. Classes that keep the
+ * default construction path are built with DataModel_new and DataModel_init
+ * directly, as from_dict does. If an exception occurs, the error is captured
+ * and reported via the ErrorCollector.
  *
  * @param value The Python object to validate.
  * @param ts Pointer to the TypeSchema describing the expected type.
@@ -65,7 +68,16 @@ static PyObject *validate_data_model(PyObject *value, TypeSchema *ts,
                                      ErrorCollector *collector,
                                      const char *error_path,
                                      Deserializers *deserializers) {
-  PyObject *converted = PyObject_Call(ts->expected_type, empty_tuple, value);
+  PyObject *converted;
+  if (DataModel_can_init_from_native(ts->expected_type)) {
+    PyTypeObject *type = reinterpret_cast<PyTypeObject *>(ts->expected_type);
+    converted = type->tp_new(type, empty_tuple, value);
+    if (converted && DataModel_init(converted, empty_tuple, value) != 0) {
+      Py_CLEAR(converted);
+    }
+  } else {
+    converted = PyObject_Call(ts->expected_type, empty_tuple, value);
+  }
   if (converted) {
     return converted;
   } else {
@@ -101,18 +113,14 @@ static PyObject *validate_plain(PyObject *value, TypeSchema *ts,
                                 ErrorCollector *collector,
                                 const char *error_path,
                                 Deserializers *deserializers) {
-  if (PyObject_IsInstance(value, ts->expected_type)) {
+  if (is_instance_of(value, ts->expected_type)) {
     Py_INCREF(value);
     return value;
   } else {
-    PyObject *deserializer_func = nullptr;
-    if (deserializers) {
-      deserializer_func = get_deserializer(deserializers, ts->expected_type,
-                                           (PyObject *)Py_TYPE(value));
-    }
-    if (deserializer_func && deserializer_func != Py_None) {
-      PyObject *deserialized =
-          PyObject_CallFunctionObjArgs(deserializer_func, value, nullptr);
+    PyObject *deserializer_func = get_deserializer(
+        deserializers, ts->expected_type, (PyObject *)Py_TYPE(value));
+    if (deserializer_func) {
+      PyObject *deserialized = PyObject_CallOneArg(deserializer_func, value);
       if (deserialized &&
           PyObject_IsInstance(deserialized, ts->expected_type)) {
         return deserialized;
@@ -142,9 +150,8 @@ static PyObject *validate_plain(PyObject *value, TypeSchema *ts,
     Py_XDECREF(conv);
     PyErr_Clear();
     if (collector) {
-      collector->add_error(error_path, std::string("Expected type ") +
-                                           safe_type_name(ts->expected_type) +
-                                           ", got " + safe_type_name(value));
+      collector->add_error(error_path, ts->utf8_type_error,
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -176,67 +183,125 @@ static PyObject *convert_using_constructor(PyObject *value, TypeSchema *ts,
   Py_XDECREF(conv);
   PyErr_Clear();
   if (collector) {
-    collector->add_error(error_path, std::string("Expected type ") +
-                                         safe_type_name(ts->expected_type) +
-                                         ", got " + safe_type_name(value));
+    collector->add_error(error_path, ts->utf8_type_error,
+                         safe_type_name(value));
   }
   return nullptr;
 }
 
 /**
- * @brief Validates and converts a Python object to the expected type.
- *
- * This function handles conversion for optional types, data models, containers,
- * unions, and plain types by dispatching to appropriate helper functions.
- *
- * @param value The Python object to validate.
- * @param ts Pointer to the TypeSchema describing the expected type.
- * @param collector Pointer to an ErrorCollector for reporting errors.
- * @param error_path A string representing the path for error messages.
- * @param deserializers Pointer to registered deserializers.
- * @return A new PyObject on success, or nullptr on error.
+ * @brief Passes any value through unchanged (typing.Any).
  */
-PyObject *validate_and_convert(PyObject *value, TypeSchema *ts,
-                               ErrorCollector *collector,
-                               const char *error_path,
-                               Deserializers *deserializers) {
-  if (value == Py_None) {
-    if (ts->is_optional) {
-      Py_INCREF(Py_None);
-      return Py_None;
-    }
-  }
+static PyObject *validate_any(PyObject *value, TypeSchema *ts,
+                              ErrorCollector *collector, const char *error_path,
+                              Deserializers *deserializers) {
+  Py_INCREF(value);
+  return value;
+}
 
-  if (ts->expected_type == AnyType) {
+/**
+ * @brief Validates a field typed as a DataModel subclass.
+ *
+ * An instance of the model class or of one of its subclasses was validated
+ * when it was built, so it is passed through as it is without walking its
+ * fields. Dictionaries are used as constructor keyword arguments; any other
+ * value goes through the plain type validation.
+ */
+static PyObject *validate_model(PyObject *value, TypeSchema *ts,
+                                ErrorCollector *collector,
+                                const char *error_path,
+                                Deserializers *deserializers) {
+  if (PyObject_TypeCheck(value, (PyTypeObject *)ts->expected_type)) {
     Py_INCREF(value);
     return value;
   }
-
-  if (ts->is_data_model && PyDict_Check(value)) {
+  if (PyDict_Check(value)) {
     return validate_data_model(value, ts, collector, error_path, deserializers);
   }
+  return validate_plain(value, ts, collector, error_path, deserializers);
+}
 
-  switch (ts->container_kind) {
-  case CK_LIST:
-    return validate_list(value, ts, collector, error_path, deserializers);
-  case CK_DICT:
-    return validate_dict(value, ts, collector, error_path, deserializers);
-  case CK_TUPLE:
-    return validate_tuple(value, ts, collector, error_path, deserializers);
-  case CK_SET:
-    return validate_set(value, ts, collector, error_path, deserializers);
+/**
+ * @brief Validates a union, accepting None right away for Optional types.
+ */
+static PyObject *validate_union_or_none(PyObject *value, TypeSchema *ts,
+                                        ErrorCollector *collector,
+                                        const char *error_path,
+                                        Deserializers *deserializers) {
+  if (value == Py_None && ts->is_optional) {
+    Py_INCREF(Py_None);
+    return Py_None;
   }
+  return validate_union(value, ts, collector, error_path, deserializers);
+}
 
-  if (ts->origin == Py_None) {
-    return validate_plain(value, ts, collector, error_path, deserializers);
+/**
+ * @brief Returns true if the type schema is a bare int, str, float or bool.
+ */
+static bool is_primitive_type_schema(TypeSchema *ts) {
+  if (!ts || ts->origin != Py_None) {
+    return false;
   }
+  PyObject *type = ts->expected_type;
+  return type == IntType || type == StrType || type == FloatType ||
+         type == BoolType;
+}
 
-  if (ts->container_kind == CK_UNION) {
-    return validate_union(value, ts, collector, error_path, deserializers);
-  }
+/**
+ * @brief Returns true if the type schema is a list of int, str, float or
+ * bool.
+ *
+ * @param ts Pointer to a compiled type schema.
+ */
+bool is_primitive_list_schema(TypeSchema *ts) {
+  return ts && ts->validator == validate_list &&
+         is_primitive_type_schema(ts->args[0]);
+}
 
-  return convert_using_constructor(value, ts, collector, error_path,
-                                   deserializers);
+/**
+ * @brief Selects the validator for a compiled type schema.
+ *
+ * The selection mirrors the dispatch order previously done per value:
+ * Any, DataModel, containers, plain types, unions, and finally a constructor
+ * call for any other generic. Plain and model types, and unions with a plain
+ * or model candidate, also get the exact type whose values need no
+ * validator call.
+ *
+ * @param ts Pointer to the compiled type schema.
+ */
+void assign_type_validator(TypeSchema *ts) {
+  ts->exact_type = nullptr;
+  if (ts->expected_type == AnyType) {
+    ts->validator = validate_any;
+  } else if (ts->is_data_model) {
+    ts->validator = validate_model;
+  } else if (ts->container_kind == CK_LIST) {
+    ts->validator = validate_list;
+  } else if (ts->container_kind == CK_DICT) {
+    ts->validator = validate_dict;
+  } else if (ts->container_kind == CK_TUPLE) {
+    ts->validator = validate_tuple;
+  } else if (ts->container_kind == CK_SET) {
+    ts->validator = validate_set;
+  } else if (ts->origin == Py_None) {
+    ts->validator = validate_plain;
+  } else if (ts->container_kind == CK_UNION) {
+    ts->validator = validate_union_or_none;
+  } else {
+    ts->validator = convert_using_constructor;
+  }
+  if ((ts->validator == validate_model || ts->validator == validate_plain) &&
+      PyType_Check(ts->expected_type)) {
+    ts->exact_type = reinterpret_cast<PyTypeObject *>(ts->expected_type);
+  } else if (ts->validator == validate_union_or_none) {
+    // A union keeps values of any candidate's exact type as they are, so the
+    // first plain or model candidate can take the exact-type pass-through.
+    for (Py_ssize_t i = 0; i < ts->num_args && !ts->exact_type; i++) {
+      if (ts->args[i]->exact_type != Py_TYPE(Py_None)) {
+        ts->exact_type = ts->args[i]->exact_type;
+      }
+    }
+  }
 }
 
 /**
@@ -12,6 +12,9 @@
  * Any errors encountered during validation are recorded into the provided
  * ErrorCollector.
  *
+ * Values of exactly the schema's exact_type are returned as they are without
+ * calling the compiled validator; everything else is dispatched to it.
+ *
  * @param value The input Python value to validate/convert.
  * @param ts Pointer to the compiled type schema against which to validate.
  * @param collector Pointer to an ErrorCollector for recording any validation
@@ -23,10 +26,33 @@
  * @return A new reference to the validated/converted value on success, or
  * nullptr if validation fails.
  */
-PyObject *validate_and_convert(PyObject *value, TypeSchema *ts,
-                               ErrorCollector *collector,
-                               const char *error_path,
-                               Deserializers *deserializers);
+static inline PyObject *validate_and_convert(PyObject *value, TypeSchema *ts,
+                                             ErrorCollector *collector,
+                                             const char *error_path,
+                                             Deserializers *deserializers) {
+  if (Py_IS_TYPE(value, ts->exact_type)) {
+    return Py_NewRef(value);
+  }
+  return ts->validator(value, ts, collector, error_path, deserializers);
+}
+
+/**
+ * @brief Select the validator for a compiled type schema.
+ *
+ * Must be called once all other TypeSchema fields are populated.
+ *
+ * @param ts Pointer to the compiled type schema.
+ */
+void assign_type_validator(TypeSchema *ts);
+
+/**
+ * @brief Check whether a compiled type schema is List[int], List[str],
+ * List[float] or List[bool].
+ *
+ * @param ts Pointer to the compiled type schema (may be nullptr).
+ * @return true for a list of a primitive item type.
+ */
+bool is_primitive_list_schema(TypeSchema *ts);
 
 /**
  * @brief Initialize validation globals.
@@ -0,0 +1,314 @@
+#include "validation_builtins.hpp"
+#include <Python.h>
+#include <cstddef>
+#include <cstring>
+
+/**
+ * @brief Kinds of checks available in the builtin validator registry.
+ */
+enum BuiltinKind {
+  BUILTIN_MIN_VALUE,
+  BUILTIN_MAX_VALUE,
+  BUILTIN_NONNEG,
+  BUILTIN_ISDIGIT,
+  BUILTIN_CAPITALIZE,
+};
+
+/**
+ * @brief Registry entry mapping a builtin validator name to its check.
+ */
+struct BuiltinEntry {
+  const char *name;
+  BuiltinKind kind;
+  Py_ssize_t num_args;
+};
+
+static const BuiltinEntry builtin_registry[] = {
+    {"min_value", BUILTIN_MIN_VALUE, 1},   {"max_value", BUILTIN_MAX_VALUE, 1},
+    {"nonneg", BUILTIN_NONNEG, 0},         {"isdigit", BUILTIN_ISDIGIT, 0},
+    {"capitalize", BUILTIN_CAPITALIZE, 0},
+};
+
+typedef struct {
+  PyObject_HEAD const BuiltinEntry *entry;
+  PyObject *field;
+  PyObject *arg;
+  PyObject *dict;
+  vectorcallfunc vectorcall;
+} BuiltinValidatorObject;
+
+static PyObject *zero_int = nullptr;
+
+/**
+ * @brief Compares two numbers, with a direct path for small exact ints.
+ *
+ * @param value Left operand.
+ * @param bound Right operand.
+ * @param op Rich comparison operator.
+ * @return 1 if the comparison holds, 0 if not, -1 on error.
+ */
+static int compare_number(PyObject *value, PyObject *bound, int op) {
+  if (PyLong_CheckExact(value) && PyLong_CheckExact(bound)) {
+    int overflow_a = 0;
+    int overflow_b = 0;
+    long long a = PyLong_AsLongLongAndOverflow(value, &overflow_a);
+    long long b = PyLong_AsLongLongAndOverflow(bound, &overflow_b);
+    if (!overflow_a && !overflow_b) {
+      return op == Py_GE ? a >= b : a <= b;
+    }
+  } else if (PyFloat_CheckExact(value) && PyFloat_CheckExact(bound)) {
+    double a = PyFloat_AS_DOUBLE(value);
+    double b = PyFloat_AS_DOUBLE(bound);
+    return op == Py_GE ? a >= b : a <= b;
+  }
+  return PyObject_RichCompareBool(value, bound, op);
+}
+
+/**
+ * @brief Returns 1 if value is a non-empty string of decimal digits.
+ *
+ * @param value A str object.
+ * @return 1 if all characters are digits, 0 if not, -1 on error.
+ */
+static int string_is_digits(PyObject *value) {
+  if (PyUnicode_IS_ASCII(value)) {
+    Py_ssize_t len = PyUnicode_GET_LENGTH(value);
+    const char *data = (const char *)PyUnicode_DATA(value);
+    if (len == 0) {
+      return 0;
+    }
+    for (Py_ssize_t i = 0; i < len; i++) {
+      if (data[i] < '0' || data[i] > '9') {
+        return 0;
+      }
+    }
+    return 1;
+  }
+  PyObject *result = PyObject_CallMethod(value, "isdigit", nullptr);
+  if (!result) {
+    return -1;
+  }
+  int truth = PyObject_IsTrue(result);
+  Py_DECREF(result);
+  return truth;
+}
+
+/**
+ * @brief Runs the check of a builtin validator on a single value.
+ *
+ * @param self The builtin validator.
+ * @param value The field value.
+ * @return New reference to the (possibly transformed) value, or nullptr with
+ * ValueError set.
+ */
+static PyObject *run_builtin_check(BuiltinValidatorObject *self,
+                                   PyObject *value) {
+  int ok;
+  switch (self->entry->kind) {
+  case BUILTIN_MIN_VALUE:
+    ok = compare_number(value, self->arg, Py_GE);
+    if (ok == 0) {
+      PyErr_Format(PyExc_ValueError, "%U must be greater than or equal to %R",
+                   self->field, self->arg);
+    }
+    break;
+  case BUILTIN_MAX_VALUE:
+    ok = compare_number(value, self->arg, Py_LE);
+    if (ok == 0) {
+      PyErr_Format(PyExc_ValueError, "%U must be less than or equal to %R",
+                   self->field, self->arg);
+    }
+    break;
+  case BUILTIN_NONNEG:
+    ok = compare_number(value, zero_int, Py_GE);
+    if (ok == 0) {
+      PyErr_Format(PyExc_ValueError, "%U must be non-negative", self->field);
+    }
+    break;
+  case BUILTIN_ISDIGIT:
+    ok = PyUnicode_Check(value) ? string_is_digits(value) : 0;
+    if (ok == 0) {
+      PyErr_Format(PyExc_ValueError, "%U must be a number", self->field);
+    }
+    break;
+  case BUILTIN_CAPITALIZE:
+    if (!PyUnicode_Check(value)) {
+      PyErr_Format(PyExc_ValueError, "%U must be a string", self->field);
+      return nullptr;
+    }
+    return PyObject_CallMethod(value, "capitalize", nullptr);
+  default:
+    PyErr_SetString(PyExc_SystemError, "unknown builtin validator");
+    return nullptr;
+  }
+  if (ok <= 0) {
+    if (ok < 0 && PyErr_ExceptionMatches(PyExc_TypeError)) {
+      PyErr_Clear();
+      PyErr_Format(PyExc_ValueError, "%U must be a number", self->field);
+    }
+    return nullptr;
+  }
+  Py_INCREF(value);
+  return value;
+}
+
+/**
+ * @brief Vectorcall entry point: validator(cls, value).
+ */
+static PyObject *BuiltinValidator_vectorcall(PyObject *callable,
+                                             PyObject *const *args,
+                                             size_t nargsf, PyObject *kwnames) {
+  Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+  if (nargs != 2 || (kwnames && PyTuple_GET_SIZE(kwnames) != 0)) {
+    PyErr_SetString(PyExc_TypeError,
+                    "builtin validator expects (cls, value) arguments");
+    return nullptr;
+  }
+  return run_builtin_check((BuiltinValidatorObject *)callable, args[1]);
+}
+
+/**
+ * @brief Creates a builtin validator: BuiltinValidator(field, name, *args).
+ */
+static PyObject *BuiltinValidator_new(PyTypeObject *type, PyObject *args,
+                                      PyObject *kwds) {
+  if (kwds && PyDict_Size(kwds) != 0) {
+    PyErr_SetString(PyExc_TypeError,
+                    "BuiltinValidator() takes no keyword arguments");
+    return nullptr;
+  }
+  Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+  if (nargs < 2 || !PyUnicode_Check(PyTuple_GET_ITEM(args, 0)) ||
+      !PyUnicode_Check(PyTuple_GET_ITEM(args, 1))) {
+    PyErr_SetString(PyExc_TypeError,
+                    "BuiltinValidator() expects a field name and a validator "
+                    "name");
+    return nullptr;
+  }
+  const char *name = PyUnicode_AsUTF8(PyTuple_GET_ITEM(args, 1));
+  if (!name) {
+    return nullptr;
+  }
+  const BuiltinEntry *entry = nullptr;
+  for (const BuiltinEntry &candidate : builtin_registry) {
+    if (strcmp(candidate.name, name) == 0) {
+      entry = &candidate;
+      break;
+    }
+  }
+  if (!entry) {
+    PyErr_Format(PyExc_ValueError, "Unknown builtin validator: %s", name);
+    return nullptr;
+  }
+  if (nargs - 2 != entry->num_args) {
+    PyErr_Format(PyExc_TypeError,
+                 "Builtin validator '%s' takes %zd argument(s), got %zd", name,
+                 entry->num_args, nargs - 2);
+    return nullptr;
+  }
+  BuiltinValidatorObject *self =
+      (BuiltinValidatorObject *)type->tp_alloc(type, 0);
+  if (!self) {
+    return nullptr;
+  }
+  self->entry = entry;
+  self->field = Py_NewRef(PyTuple_GET_ITEM(args, 0));
+  self->arg = entry->num_args ? Py_NewRef(PyTuple_GET_ITEM(args, 2)) : nullptr;
+  self->dict = nullptr;
+  self->vectorcall = BuiltinValidator_vectorcall;
+  return (PyObject *)self;
+}
+
+static int BuiltinValidator_traverse(BuiltinValidatorObject *self,
+                                     visitproc visit, void *arg) {
+  Py_VISIT(self->arg);
+  Py_VISIT(self->dict);
+  return 0;
+}
+
+static int BuiltinValidator_clear(BuiltinValidatorObject *self) {
+  Py_CLEAR(self->arg);
+  Py_CLEAR(self->dict);
+  return 0;
+}
+
+static void BuiltinValidator_dealloc(BuiltinValidatorObject *self) {
+  PyObject_GC_UnTrack(self);
+  BuiltinValidator_clear(self);
+  Py_CLEAR(self->field);
+  Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *BuiltinValidator_repr(BuiltinValidatorObject *self) {
+  if (self->arg) {
+    return PyUnicode_FromFormat("BuiltinValidator(%R, '%s', %R)", self->field,
+                                self->entry->name, self->arg);
+  }
+  return PyUnicode_FromFormat("BuiltinValidator(%R, '%s')", self->field,
+                              self->entry->name);
+}
+
+static PyGetSetDef BuiltinValidator_getset[] = {
+    {"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict, nullptr,
+     nullptr},
+    {nullptr, nullptr, nullptr, nullptr, nullptr}};
+
+PyTypeObject BuiltinValidatorType = {
+    .ob_base = {.ob_base = {.ob_refcnt = 1, .ob_type = &PyType_Type},
+                .ob_size = 0},
+    .tp_name = "vldt._vldt.BuiltinValidator",
+    .tp_basicsize = sizeof(BuiltinValidatorObject),
+    .tp_itemsize = 0,
+    .tp_dealloc = (destructor)BuiltinValidator_dealloc,
+    .tp_vectorcall_offset = offsetof(BuiltinValidatorObject, vectorcall),
+    .tp_getattr = nullptr,
+    .tp_setattr = nullptr,
+    .tp_as_async = nullptr,
+    .tp_repr = (reprfunc)BuiltinValidator_repr,
+    .tp_as_number = nullptr,
+    .tp_as_sequence = nullptr,
+    .tp_as_mapping = nullptr,
+    .tp_hash = nullptr,
+    .tp_call = PyVectorcall_Call,
+    .tp_str = nullptr,
+    .tp_getattro = PyObject_GenericGetAttr,
+    .tp_setattro = PyObject_GenericSetAttr,
+    .tp_as_buffer = nullptr,
+    .tp_flags =
+        Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_doc = "Field validator running a builtin check in C",
+    .tp_traverse = (traverseproc)BuiltinValidator_traverse,
+    .tp_clear = (inquiry)BuiltinValidator_clear,
+    .tp_richcompare = nullptr,
+    .tp_weaklistoffset = 0,
+    .tp_iter = nullptr,
+    .tp_iternext = nullptr,
+    .tp_methods = nullptr,
+    .tp_members = nullptr,
+    .tp_getset = BuiltinValidator_getset,
+    .tp_base = nullptr,
+    .tp_dict = nullptr,
+    .tp_descr_get = nullptr,
+    .tp_descr_set = nullptr,
+    .tp_dictoffset = offsetof(BuiltinValidatorObject, dict),
+    .tp_init = nullptr,
+    .tp_alloc = nullptr,
+    .tp_new = BuiltinValidator_new,
+    .tp_free = nullptr,
+    .tp_is_gc = nullptr,
+    .tp_bases = nullptr,
+    .tp_mro = nullptr,
+    .tp_cache = nullptr,
+    .tp_subclasses = nullptr,
+    .tp_weaklist = nullptr,
+    .tp_del = nullptr,
+    .tp_version_tag = 0,
+    .tp_finalize = nullptr};
+
+int init_builtin_validators(void) {
+  zero_int = PyLong_FromLong(0);
+  if (!zero_int) {
+    return -1;
+  }
+  return PyType_Ready(&BuiltinValidatorType);
+}
@@ -0,0 +1,31 @@
+#ifndef VALIDATION_BUILTINS_HPP
+#define VALIDATION_BUILTINS_HPP
+
+#include <Python.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Type object for vldt._vldt.BuiltinValidator.
+ *
+ * A BuiltinValidator is a callable object with the field validator calling
+ * convention (cls, value). It performs one of the common checks from the
+ * builtin registry (min_value, max_value, nonneg, isdigit, capitalize) in C,
+ * so no Python frame is created when the validator runs.
+ */
+extern PyTypeObject BuiltinValidatorType;
+
+/**
+ * @brief Readies the BuiltinValidator type.
+ *
+ * @return 0 on success, -1 on failure.
+ */
+int init_builtin_validators(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // VALIDATION_BUILTINS_HPP
@@ -1,4 +1,5 @@
 #include "validation_containers.hpp"
+#include "data_model.hpp"
 #include "error_handling.hpp"
 #include "init_globals.hpp"
 #include "schema/deserializer.hpp"
@@ -7,6 +8,7 @@
 #include "validation_primitives.hpp"
 #include <Python.h>
 #include <array>
+#include <charconv>
 #include <stdio.h>
 #include <string>
 
@@ -49,7 +51,9 @@ static const char *safe_type_name(PyObject *obj) {
  * @brief Validates and converts a Python list.
  *
  * Checks if the given value is a list and converts each element using
- * validate_and_convert.
+ * validate_and_convert. Items whose type is exactly the plain or model type
+ * they are declared as are taken as they are, without formatting their
+ * error path.
  *
  * @param value The Python object to validate.
  * @param ts The type schema for the list elements.
@@ -63,16 +67,18 @@ PyObject *validate_list(PyObject *value, TypeSchema *ts,
                         Deserializers *deserializers) {
   if (!PyList_Check(value)) {
     if (collector) {
-      collector->add_error(error_path, std::string("Expected a list, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected a list, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
-  Py_ssize_t size = PyList_Size(value);
+  Py_ssize_t size = PyList_GET_SIZE(value);
   PyObject *new_list = PyList_New(size);
   if (!new_list) {
     return nullptr;
   }
+  TypeSchema *item_ts = ts->args[0];
+  PyTypeObject *item_type = item_ts->exact_type;
 
   size_t base_len = strlen(error_path);
   std::array<char, 256> new_path;
@@ -84,10 +90,16 @@ PyObject *validate_list(PyObject *value, TypeSchema *ts,
   new_path[base_len + 1] = '\0';
 
   for (Py_ssize_t i = 0; i < size; i++) {
-    PyObject *item = PyList_GetItem(value, i);
-    snprintf(new_path.data() + base_len + 1, new_path.size() - base_len - 1,
-             "%zd", i);
-    PyObject *conv_item = validate_and_convert(item, ts->args[0], collector,
+    PyObject *item = PyList_GET_ITEM(value, i);
+    if (Py_IS_TYPE(item, item_type)) {
+      PyList_SET_ITEM(new_list, i, Py_NewRef(item));
+      continue;
+    }
+    char *index_end = std::to_chars(new_path.data() + base_len + 1,
+                                    new_path.data() + new_path.size() - 1, i)
+                          .ptr;
+    *index_end = '\0';
+    PyObject *conv_item = validate_and_convert(item, item_ts, collector,
                                                new_path.data(), deserializers);
     if (!conv_item) {
       Py_DECREF(new_list);
@@ -98,11 +110,36 @@ PyObject *validate_list(PyObject *value, TypeSchema *ts,
   return new_list;
 }
 
+/**
+ * @brief Check whether every key and value of a dict has exactly the given
+ * types.
+ *
+ * @param value The dictionary.
+ * @param key_type The exact key type.
+ * @param val_type The exact value type.
+ * @return true if no pair needs a validator.
+ */
+static bool dict_items_are_exact(PyObject *value, PyTypeObject *key_type,
+                                 PyTypeObject *val_type) {
+  PyObject *key, *val;
+  Py_ssize_t pos = 0;
+  while (PyDict_Next(value, &pos, &key, &val)) {
+    if (!Py_IS_TYPE(key, key_type) || !Py_IS_TYPE(val, val_type)) {
+      return false;
+    }
+  }
+  return true;
+}
+
 /**
  * @brief Validates and converts a Python dictionary.
  *
  * Checks if the given value is a dict and converts each key-value pair using
- * validate_and_convert.
+ * validate_and_convert. Keys and values whose type is exactly the plain or
+ * model type they are declared as are taken as they are, and the error path
+ * for a pair is only formatted when one of its items needs the validator.
+ * When no pair needs it, the dictionary is copied in one PyDict_Copy call
+ * instead of being rebuilt entry by entry.
  *
  * @param value The Python object to validate.
  * @param ts The type schema for the dictionary keys and values.
@@ -117,19 +154,24 @@ PyObject *validate_dict(PyObject *value, TypeSchema *ts,
                         Deserializers *deserializers) {
   if (!PyDict_Check(value)) {
     if (collector) {
-      collector->add_error(error_path, std::string("Expected a dict, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected a dict, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
-  PyObject *new_dict = PyDict_New();
+  TypeSchema *key_schema = ts->args[0];
+  TypeSchema *val_schema = ts->args[1];
+  PyTypeObject *key_type = key_schema->exact_type;
+  PyTypeObject *val_type = val_schema->exact_type;
+  if (key_type && val_type && dict_items_are_exact(value, key_type, val_type)) {
+    return PyDict_Copy(value);
+  }
+
+  PyObject *new_dict = new_presized_dict(PyDict_GET_SIZE(value));
   if (!new_dict) {
     return nullptr;
   }
 
-  TypeSchema *key_schema = ts->args[0];
-  TypeSchema *val_schema = ts->args[1];
-
   size_t base_len = strlen(error_path);
   std::array<char, 256> new_path;
   if (base_len >= new_path.size() - 2) {
@@ -142,22 +184,38 @@ PyObject *validate_dict(PyObject *value, TypeSchema *ts,
   PyObject *key, *val;
   Py_ssize_t pos = 0;
   while (PyDict_Next(value, &pos, &key, &val)) {
-    const char *key_str =
-        PyUnicode_Check(key) ? PyUnicode_AsUTF8(key) : safe_type_name(key);
-    snprintf(new_path.data() + base_len + 1, new_path.size() - base_len - 1,
-             "%s", key_str);
-    PyObject *conv_key = validate_and_convert(key, key_schema, collector,
-                                              new_path.data(), deserializers);
-    if (!conv_key) {
-      Py_DECREF(new_dict);
-      return nullptr;
+    bool key_as_is = Py_IS_TYPE(key, key_type);
+    bool val_as_is = Py_IS_TYPE(val, val_type);
+    if (!key_as_is || !val_as_is) {
+      const char *key_str =
+          PyUnicode_Check(key) ? PyUnicode_AsUTF8(key) : safe_type_name(key);
+      snprintf(new_path.data() + base_len + 1, new_path.size() - base_len - 1,
+               "%s", key_str);
     }
-    PyObject *conv_val = validate_and_convert(val, val_schema, collector,
-                                              new_path.data(), deserializers);
-    if (!conv_val) {
-      Py_DECREF(conv_key);
-      Py_DECREF(new_dict);
-      return nullptr;
+    PyObject *conv_key;
+    if (key_as_is) {
+      Py_INCREF(key);
+      conv_key = key;
+    } else {
+      conv_key = validate_and_convert(key, key_schema, collector,
+                                      new_path.data(), deserializers);
+      if (!conv_key) {
+        Py_DECREF(new_dict);
+        return nullptr;
+      }
+    }
+    PyObject *conv_val;
+    if (val_as_is) {
+      Py_INCREF(val);
+      conv_val = val;
+    } else {
+      conv_val = validate_and_convert(val, val_schema, collector,
+                                      new_path.data(), deserializers);
+      if (!conv_val) {
+        Py_DECREF(conv_key);
+        Py_DECREF(new_dict);
+        return nullptr;
+      }
     }
     if (PyDict_SetItem(new_dict, conv_key, conv_val) < 0) {
       Py_DECREF(conv_key);
@@ -175,7 +233,9 @@ PyObject *validate_dict(PyObject *value, TypeSchema *ts,
  * @brief Validates and converts a Python tuple.
  *
  * Checks if the given value is a tuple with the expected length and converts
- * each element using validate_and_convert.
+ * each element using validate_and_convert. Elements whose type is exactly
+ * their position's type are taken as they are, before any error path is
+ * formatted.
  *
  * @param value The Python object to validate.
  * @param ts The type schema for the tuple elements.
@@ -189,8 +249,8 @@ PyObject *validate_tuple(PyObject *value, TypeSchema *ts,
                          Deserializers *deserializers) {
   if (!PyTuple_Check(value)) {
     if (collector) {
-      collector->add_error(error_path, std::string("Expected a tuple, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected a tuple, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -209,7 +269,11 @@ PyObject *validate_tuple(PyObject *value, TypeSchema *ts,
     return nullptr;
   }
   for (Py_ssize_t i = 0; i < size; i++) {
-    PyObject *item = PyTuple_GetItem(value, i);
+    PyObject *item = PyTuple_GET_ITEM(value, i);
+    if (Py_IS_TYPE(item, ts->args[i]->exact_type)) {
+      PyTuple_SET_ITEM(new_tuple, i, Py_NewRef(item));
+      continue;
+    }
     std::array<char, 256> new_path;
     snprintf(new_path.data(), new_path.size(), "%s.%zd", error_path, i);
     PyObject *conv_item = validate_and_convert(item, ts->args[i], collector,
@@ -227,7 +291,8 @@ PyObject *validate_tuple(PyObject *value, TypeSchema *ts,
  * @brief Validates and converts a Python set.
  *
  * Checks if the given value is a set and converts each element using
- * validate_and_convert.
+ * validate_and_convert. Elements whose type is exactly the item type are
+ * taken as they are, before any error path is formatted.
  *
  * @param value The Python object to validate.
  * @param ts The type schema for the set elements.
@@ -241,8 +306,8 @@ PyObject *validate_set(PyObject *value, TypeSchema *ts,
                        Deserializers *deserializers) {
   if (!PySet_Check(value)) {
     if (collector) {
-      collector->add_error(error_path, std::string("Expected a set, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected a set, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -255,14 +320,21 @@ PyObject *validate_set(PyObject *value, TypeSchema *ts,
     Py_DECREF(new_set);
     return nullptr;
   }
+  PyTypeObject *item_type = ts->args[0]->exact_type;
   PyObject *item;
   Py_ssize_t idx = 0;
   while ((item = PyIter_Next(iterator)) != nullptr) {
-    std::array<char, 256> new_path;
-    snprintf(new_path.data(), new_path.size(), "%s.%zd", error_path, idx++);
-    PyObject *conv_item = validate_and_convert(item, ts->args[0], collector,
-                                               new_path.data(), deserializers);
-    Py_DECREF(item);
+    PyObject *conv_item;
+    if (Py_IS_TYPE(item, item_type)) {
+      conv_item = item;
+      idx++;
+    } else {
+      std::array<char, 256> new_path;
+      snprintf(new_path.data(), new_path.size(), "%s.%zd", error_path, idx++);
+      conv_item = validate_and_convert(item, ts->args[0], collector,
+                                       new_path.data(), deserializers);
+      Py_DECREF(item);
+    }
     if (!conv_item) {
       Py_DECREF(iterator);
       Py_DECREF(new_set);
@@ -283,9 +355,12 @@ PyObject *validate_set(PyObject *value, TypeSchema *ts,
 /**
  * @brief Validates and converts a Python object for a Union type.
  *
- * First checks if the value is already an instance of any candidate type.
- * If not, attempts conversion for each candidate. Returns the converted value
- * if successful, or logs an error if all candidates fail.
+ * First checks if the value's exact type is one of the candidate types (a
+ * pointer compare against the table built at compile time), then if it is an
+ * instance of any candidate type. If not, attempts conversion for each
+ * candidate, skipping model candidates for which a dict value lacks a
+ * required key (so no instance is built and discarded with an error). Returns
+ * the converted value if successful, or logs an error if all candidates fail.
  *
  * @param value The Python object to validate.
  * @param ts The type schema for the union.
@@ -297,19 +372,32 @@ PyObject *validate_set(PyObject *value, TypeSchema *ts,
 PyObject *validate_union(PyObject *value, TypeSchema *ts,
                          ErrorCollector *collector, const char *error_path,
                          Deserializers *deserializers) {
+  PyTypeObject *value_type = Py_TYPE(value);
+  for (int i = 0; i < ts->num_union_types; i++) {
+    if (ts->union_types[i] == value_type) {
+      Py_INCREF(value);
+      return value;
+    }
+  }
   for (Py_ssize_t i = 0; i < ts->num_args; i++) {
     TypeSchema *candidate = ts->args[i];
     PyObject *check_type = (candidate->origin != Py_None)
                                ? candidate->origin
                                : candidate->expected_type;
-    if (PyObject_IsInstance(value, check_type)) {
+    if (is_instance_of(value, check_type)) {
       Py_INCREF(value);
       return value;
     }
   }
   ErrorCollector temp_collector;
+  bool is_dict = PyDict_Check(value);
   for (Py_ssize_t i = 0; i < ts->num_args; i++) {
-    PyObject *conv = validate_and_convert(value, ts->args[i], &temp_collector,
+    TypeSchema *candidate = ts->args[i];
+    if (is_dict && candidate->is_data_model &&
+        DataModel_dict_lacks_required(candidate->expected_type, value)) {
+      continue;
+    }
+    PyObject *conv = validate_and_convert(value, candidate, &temp_collector,
                                           error_path, deserializers);
     if (conv) {
       return conv;
@@ -317,10 +405,9 @@ PyObject *validate_union(PyObject *value, TypeSchema *ts,
     PyErr_Clear();
   }
   if (collector) {
-    collector->add_error(
-        error_path,
-        std::string("Value did not match any candidate in Union: got ") +
-            safe_type_name(value));
+    collector->add_error(error_path,
+                         "Value did not match any candidate in Union: got ",
+                         safe_type_name(value));
   }
   return nullptr;
 }
@@ -4,6 +4,9 @@
 
 #include <Python.h>
 #include <array>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
 #include <stdio.h>
 #include <string>
 
@@ -48,11 +51,79 @@ static const char *safe_type_name(PyObject *obj) {
   return type->tp_name;
 }
 
+/**
+ * @brief Checks whether eight packed bytes are all ASCII digits.
+ *
+ * Every byte must have a high nibble of 3, and adding 6 must not carry into
+ * the high nibble (which would mean the low nibble was above 9).
+ *
+ * @param chunk Eight bytes loaded in little-endian order.
+ * @return true if all eight bytes are '0'..'9'.
+ */
+static inline bool is_eight_ascii_digits(uint64_t chunk) {
+  return ((chunk & 0xF0F0F0F0F0F0F0F0ULL) |
+          (((chunk + 0x0606060606060606ULL) & 0xF0F0F0F0F0F0F0F0ULL) >> 4)) ==
+         0x3333333333333333ULL;
+}
+
+/**
+ * @brief Folds eight packed ASCII digits into their integer value.
+ *
+ * @param chunk Eight ASCII digits loaded in little-endian order.
+ * @return The decimal value of the eight digits.
+ */
+static inline uint64_t parse_eight_ascii_digits(uint64_t chunk) {
+  chunk = (chunk & 0x0F0F0F0F0F0F0F0FULL) * 2561 >> 8;
+  chunk = (chunk & 0x00FF00FF00FF00FFULL) * 6553601 >> 16;
+  return (chunk & 0x0000FFFF0000FFFFULL) * 42949672960001ULL >> 32;
+}
+
+/**
+ * @brief Parses a short string made only of ASCII digits.
+ *
+ * Eight-byte blocks are checked and folded with SWAR arithmetic, and the
+ * remaining bytes are handled one at a time. Anything else (signs,
+ * whitespace, underscores, non-ASCII digits, more than 19 digits) is
+ * rejected so the caller can fall back to int().
+ *
+ * @param s The UTF-8 buffer.
+ * @param len The buffer length.
+ * @param out The parsed value.
+ * @return true if the whole buffer was parsed.
+ */
+static bool parse_ascii_uint(const char *s, Py_ssize_t len, uint64_t *out) {
+  if (len <= 0 || len > 19) {
+    return false;
+  }
+  uint64_t result = 0;
+  Py_ssize_t i = 0;
+#if !defined(__BYTE_ORDER__) || __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+  for (; i + 8 <= len; i += 8) {
+    uint64_t chunk;
+    memcpy(&chunk, s + i, sizeof(chunk));
+    if (!is_eight_ascii_digits(chunk)) {
+      return false;
+    }
+    result = result * 100000000ULL + parse_eight_ascii_digits(chunk);
+  }
+#endif
+  for (; i < len; i++) {
+    unsigned digit = static_cast<unsigned char>(s[i]) - '0';
+    if (digit > 9) {
+      return false;
+    }
+    result = result * 10 + digit;
+  }
+  *out = result;
+  return true;
+}
+
 /**
  * @brief Validates and converts a Python object to an integer.
  *
  * If the object is already an integer, it returns the object with an
- * incremented reference. Otherwise, it attempts to convert the object to an
+ * incremented reference. Strings made only of ASCII digits are parsed
+ * directly. Otherwise, it attempts to convert the object to an
  * integer using IntType. On failure, it adds an error to the collector.
  *
  * @param value The Python object to validate.
@@ -66,15 +137,25 @@ PyObject *validate_int(PyObject *value, ErrorCollector *collector,
     Py_INCREF(value);
     return value;
   } else {
-    PyObject *conv = PyObject_CallFunctionObjArgs(IntType, value, nullptr);
+    if (PyUnicode_Check(value)) {
+      Py_ssize_t len = 0;
+      const char *s = PyUnicode_AsUTF8AndSize(value, &len);
+      uint64_t parsed = 0;
+      if (!s) {
+        PyErr_Clear();
+      } else if (parse_ascii_uint(s, len, &parsed)) {
+        return PyLong_FromUnsignedLongLong(parsed);
+      }
+    }
+    PyObject *conv = PyObject_CallOneArg(IntType, value);
     if (conv && PyLong_Check(conv)) {
       return conv;
     }
     Py_XDECREF(conv);
     PyErr_Clear();
     if (collector) {
-      collector->add_error(error_path, std::string("Expected type int, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected type int, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -98,15 +179,15 @@ PyObject *validate_str(PyObject *value, ErrorCollector *collector,
     Py_INCREF(value);
     return value;
   } else {
-    PyObject *conv = PyObject_CallFunctionObjArgs(StrType, value, nullptr);
+    PyObject *conv = PyObject_CallOneArg(StrType, value);
     if (conv && PyUnicode_Check(conv)) {
       return conv;
     }
     Py_XDECREF(conv);
     PyErr_Clear();
     if (collector) {
-      collector->add_error(error_path, std::string("Expected type str, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected type str, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -116,8 +197,10 @@ PyObject *validate_str(PyObject *value, ErrorCollector *collector,
  * @brief Validates and converts a Python object to a float.
  *
  * If the object is already a float, it returns the object with an incremented
- * reference. Otherwise, it attempts to convert the object to a float using
- * FloatType. On failure, it adds an error to the collector.
+ * reference. Integers (bool included) are converted with PyLong_AsDouble,
+ * which is what float() does for them. Otherwise, it attempts to convert the
+ * object to a float using FloatType. On failure, it adds an error to the
+ * collector.
  *
  * @param value The Python object to validate.
  * @param collector The error collector.
@@ -130,16 +213,22 @@ PyObject *validate_float(PyObject *value, ErrorCollector *collector,
     Py_INCREF(value);
     return value;
   } else {
-    PyObject *conv = PyObject_CallFunctionObjArgs(FloatType, value, nullptr);
+    if (PyLong_Check(value)) {
+      double converted = PyLong_AsDouble(value);
+      if (converted != -1.0 || !PyErr_Occurred()) {
+        return PyFloat_FromDouble(converted);
+      }
+      PyErr_Clear();
+    }
+    PyObject *conv = PyObject_CallOneArg(FloatType, value);
     if (conv && PyFloat_Check(conv)) {
       return conv;
     }
     Py_XDECREF(conv);
     PyErr_Clear();
     if (collector) {
-      collector->add_error(error_path,
-                           std::string("Expected type float, got ") +
-                               safe_type_name(value));
+      collector->add_error(error_path, "Expected type float, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
@@ -163,16 +252,43 @@ PyObject *validate_bool(PyObject *value, ErrorCollector *collector,
     Py_INCREF(value);
     return value;
   } else {
-    PyObject *conv = PyObject_CallFunctionObjArgs(BoolType, value, nullptr);
+    PyObject *conv = PyObject_CallOneArg(BoolType, value);
     if (conv && PyBool_Check(conv)) {
       return conv;
     }
     Py_XDECREF(conv);
     PyErr_Clear();
     if (collector) {
-      collector->add_error(error_path, std::string("Expected type bool, got ") +
-                                           safe_type_name(value));
+      collector->add_error(error_path, "Expected type bool, got ",
+                           safe_type_name(value));
     }
     return nullptr;
   }
 }
+
+/**
+ * @brief Rounds a number to two decimal places, matching round(value, 2).
+ *
+ * For floats the value is scaled by 100 and rounded half-to-even in one
+ * step. Dividing the exact integer result by 100 yields the same double as
+ * Python's correctly rounded round(value, 2), as long as the scaled product
+ * is not close enough to a .5 tie for the multiplication error to matter.
+ * Those rare inputs, large magnitudes, and non-float values go through
+ * __round__.
+ *
+ * @param module The extension module.
+ * @param value The number to round.
+ * @return A new reference to the rounded number, or nullptr on error.
+ */
+PyObject *primitives_round2(PyObject *module, PyObject *value) {
+  if (PyFloat_CheckExact(value)) {
+    double scaled = PyFloat_AS_DOUBLE(value) * 100.0;
+    if (std::fabs(scaled) < 1073741824.0) {
+      double frac = std::fabs(scaled - std::trunc(scaled));
+      if (std::fabs(frac - 0.5) > 1e-6) {
+        return PyFloat_FromDouble(std::nearbyint(scaled) / 100.0);
+      }
+    }
+  }
+  return PyObject_CallMethod(value, "__round__", "i", 2);
+}
@@ -56,6 +56,18 @@ PyObject *validate_float(PyObject *value, ErrorCollector *collector,
 PyObject *validate_bool(PyObject *value, ErrorCollector *collector,
                         const char *error_path);
 
+/**
+ * @brief Round a number to two decimal places (vldt.round2).
+ *
+ * Produces the same result as round(value, 2) with a native fast path for
+ * floats.
+ *
+ * @param module The extension module.
+ * @param value The number to round.
+ * @return New reference to the rounded number; nullptr on failure.
+ */
+PyObject *primitives_round2(PyObject *module, PyObject *value);
+
 #ifdef __cplusplus
 }
 #endif
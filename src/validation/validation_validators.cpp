@@ -1,5 +1,7 @@
 #include "validation_validators.hpp"
+#include "data_model.hpp"
 #include <Python.h>
+#include <new>
 
 /**
  * @brief Returns a new reference to a callable validator.
@@ -23,47 +25,390 @@ static PyObject *get_callable_validator(PyObject *validator) {
     }
     Py_XDECREF(func);
   }
+  PyErr_Clear();
   return nullptr;
 }
 
 /**
- * @brief Runs model validators.
+ * @brief Resolves a list of validators to a tuple of callables.
  *
- * Iterates over validator_list and calls each callable validator on target,
- * optionally including cls as argument.
+ * Entries that are neither callable nor wrap a callable __func__ are dropped.
  *
- * @param cls The model class.
- * @param validator_list List of validator objects.
- * @param target The target PyObject to validate.
- * @param call_with_cls Flag indicating if cls should be passed.
+ * @param validator_list List of validator objects (may be nullptr).
+ * @return New tuple reference, or nullptr on error.
+ */
+static PyObject *compile_callables(PyObject *validator_list) {
+  if (!validator_list || !PyList_Check(validator_list)) {
+    return PyTuple_New(0);
+  }
+  Py_ssize_t len = PyList_GET_SIZE(validator_list);
+  PyObject *callables = PyList_New(0);
+  if (!callables) {
+    return nullptr;
+  }
+  for (Py_ssize_t i = 0; i < len; i++) {
+    PyObject *callable =
+        get_callable_validator(PyList_GET_ITEM(validator_list, i));
+    if (!callable) {
+      continue;
+    }
+    int rc = PyList_Append(callables, callable);
+    Py_DECREF(callable);
+    if (rc != 0) {
+      Py_DECREF(callables);
+      return nullptr;
+    }
+  }
+  PyObject *result = PyList_AsTuple(callables);
+  Py_DECREF(callables);
+  return result;
+}
+
+/**
+ * @brief Compiles a mapping of field names to validator lists.
+ *
+ * @param field_validators Dict of field name to list of validators (may be
+ * nullptr).
+ * @param schema The schema, used to resolve field slots.
+ * @param out Receives the array of compiled entries.
+ * @param count Receives the number of entries.
  * @return 0 on success, -1 on error.
  */
-int run_model_validators(PyObject *cls, PyObject *validator_list,
-                         PyObject *target, int call_with_cls) {
-  Py_ssize_t len = PyList_Size(validator_list);
-  if (len == 0) {
+static int compile_field_validators(PyObject *field_validators,
+                                    SchemaCache *schema, FieldValidators **out,
+                                    Py_ssize_t *count) {
+  *out = nullptr;
+  *count = 0;
+  if (!field_validators || !PyDict_Check(field_validators) ||
+      PyDict_GET_SIZE(field_validators) == 0) {
     return 0;
   }
-  for (Py_ssize_t i = 0; i < len; i++) {
-    PyObject *validator = PyList_GetItem(validator_list, i);
-    PyObject *callable_validator = get_callable_validator(validator);
-    if (!callable_validator) {
+  Py_ssize_t size = PyDict_GET_SIZE(field_validators);
+  FieldValidators *entries = new (std::nothrow) FieldValidators[size]();
+  if (!entries) {
+    PyErr_NoMemory();
+    return -1;
+  }
+  *out = entries;
+  PyObject *key;
+  PyObject *val;
+  Py_ssize_t pos = 0;
+  while (PyDict_Next(field_validators, &pos, &key, &val)) {
+    FieldValidators *entry = &entries[*count];
+    entry->callables = compile_callables(val);
+    if (!entry->callables) {
+      return -1;
+    }
+    entry->key = Py_NewRef(key);
+    PyObject *index = PyDict_GetItem(schema->field_index, key);
+    entry->slot = index ? PyLong_AsSsize_t(index) : -1;
+    (*count)++;
+  }
+  return 0;
+}
+
+/**
+ * @brief Compiles the model AFTER validators.
+ *
+ * Validators whose code takes a single argument are called with the instance
+ * only; the others are called with (cls, instance).
+ *
+ * @param validator_list List of validator objects (may be nullptr).
+ * @param set The validator set receiving the callables and call modes.
+ * @return 0 on success, -1 on error.
+ */
+static int compile_model_after(PyObject *validator_list, ValidatorSet *set) {
+  set->model_after = compile_callables(validator_list);
+  if (!set->model_after) {
+    return -1;
+  }
+  Py_ssize_t len = PyTuple_GET_SIZE(set->model_after);
+  set->model_after_self_only = new (std::nothrow) uint8_t[len ? len : 1]();
+  if (!set->model_after_self_only) {
+    PyErr_NoMemory();
+    return -1;
+  }
+  if (!validator_list || !PyList_Check(validator_list)) {
+    return 0;
+  }
+  Py_ssize_t slot = 0;
+  for (Py_ssize_t i = 0; i < PyList_GET_SIZE(validator_list) && slot < len;
+       i++) {
+    PyObject *validator = PyList_GET_ITEM(validator_list, i);
+    PyObject *callable = get_callable_validator(validator);
+    if (!callable) {
       continue;
     }
-    PyObject *result =
-        call_with_cls
-            ? PyObject_CallFunctionObjArgs(callable_validator, cls, target,
-                                           nullptr)
-            : PyObject_CallFunctionObjArgs(callable_validator, target, nullptr);
-    Py_DECREF(callable_validator);
+    Py_DECREF(callable);
+    int argcount = 0;
+    PyObject *code = PyObject_GetAttrString(validator, "__code__");
+    if (code) {
+      PyObject *argcount_obj = PyObject_GetAttrString(code, "co_argcount");
+      if (argcount_obj && PyLong_Check(argcount_obj)) {
+        argcount = static_cast<int>(PyLong_AsLong(argcount_obj));
+      }
+      Py_XDECREF(argcount_obj);
+      Py_DECREF(code);
+    }
+    PyErr_Clear();
+    set->model_after_self_only[slot++] = argcount == 1;
+  }
+  return 0;
+}
+
+int compile_validator_set(PyObject *validators, SchemaCache *schema,
+                          ValidatorSet *set) {
+  bool is_dict = validators && PyDict_Check(validators);
+  PyObject *field_before =
+      is_dict ? PyDict_GetItemString(validators, "field_before") : nullptr;
+  PyObject *field_after =
+      is_dict ? PyDict_GetItemString(validators, "field_after") : nullptr;
+  PyObject *model_before =
+      is_dict ? PyDict_GetItemString(validators, "model_before") : nullptr;
+  PyObject *model_after =
+      is_dict ? PyDict_GetItemString(validators, "model_after") : nullptr;
+  if (compile_field_validators(field_before, schema, &set->field_before,
+                               &set->num_field_before) != 0 ||
+      compile_field_validators(field_after, schema, &set->field_after,
+                               &set->num_field_after) != 0) {
+    return -1;
+  }
+  set->model_before = compile_callables(model_before);
+  if (!set->model_before) {
+    return -1;
+  }
+  return compile_model_after(model_after, set);
+}
+
+void free_validator_set(ValidatorSet *set) {
+  for (Py_ssize_t i = 0; i < set->num_field_before; i++) {
+    Py_XDECREF(set->field_before[i].key);
+    Py_XDECREF(set->field_before[i].callables);
+  }
+  for (Py_ssize_t i = 0; i < set->num_field_after; i++) {
+    Py_XDECREF(set->field_after[i].key);
+    Py_XDECREF(set->field_after[i].callables);
+  }
+  delete[] set->field_before;
+  delete[] set->field_after;
+  Py_XDECREF(set->model_before);
+  Py_XDECREF(set->model_after);
+  delete[] set->model_after_self_only;
+  *set = ValidatorSet{};
+}
+
+/**
+ * @brief Completes the coroutine returned by an await-free async validator.
+ *
+ * Await-free coroutines run to their return statement on the first send, so
+ * they are driven here directly instead of through an event loop. Values that
+ * are not coroutines are returned unchanged.
+ *
+ * @param result New reference returned by the validator call (stolen), or
+ * nullptr.
+ * @return New reference to the validator's return value, or nullptr on error.
+ */
+static PyObject *complete_await_free(PyObject *result) {
+  if (!result || !PyCoro_CheckExact(result)) {
+    return result;
+  }
+  PyObject *value = nullptr;
+  PySendResult status = PyIter_Send(result, Py_None, &value);
+  if (status == PYGEN_NEXT) {
+    Py_DECREF(value);
+    PyObject *closed = PyObject_CallMethod(result, "close", nullptr);
+    Py_XDECREF(closed);
+    Py_DECREF(result);
+    PyErr_SetString(PyExc_RuntimeError, "Await-free async validator suspended");
+    return nullptr;
+  }
+  Py_DECREF(result);
+  return status == PYGEN_RETURN ? value : nullptr;
+}
+
+/**
+ * @brief Passes a value through a tuple of field validators.
+ *
+ * @param callables Tuple of validator callables.
+ * @param cls The model class.
+ * @param value New reference to the value (stolen).
+ * @tparam AwaitFree Whether the validators are await-free coroutines.
+ * @return New reference to the validated value, or nullptr on error.
+ */
+template <bool AwaitFree>
+static PyObject *apply_field_callables(PyObject *callables, PyObject *cls,
+                                       PyObject *value) {
+  Py_ssize_t len = PyTuple_GET_SIZE(callables);
+  for (Py_ssize_t i = 0; i < len; i++) {
+    PyObject *args[2] = {cls, value};
+    PyObject *new_value =
+        PyObject_Vectorcall(PyTuple_GET_ITEM(callables, i), args, 2, nullptr);
+    if constexpr (AwaitFree) {
+      new_value = complete_await_free(new_value);
+    }
+    Py_DECREF(value);
+    if (!new_value) {
+      return nullptr;
+    }
+    value = new_value;
+  }
+  return value;
+}
+
+/**
+ * @brief Runs model BEFORE validators on a keyword arguments dictionary.
+ *
+ * A validator returning a dict has it merged into the keyword arguments.
+ *
+ * @param set The compiled validators.
+ * @param cls The model class.
+ * @param kwds The keyword arguments dictionary.
+ * @tparam AwaitFree Whether the validators are await-free coroutines.
+ * @return 0 on success, -1 on error.
+ */
+template <bool AwaitFree>
+static int run_model_before_set(const ValidatorSet &set, PyObject *cls,
+                                PyObject *kwds) {
+  Py_ssize_t len = PyTuple_GET_SIZE(set.model_before);
+  for (Py_ssize_t i = 0; i < len; i++) {
+    PyObject *args[2] = {cls, kwds};
+    PyObject *result = PyObject_Vectorcall(
+        PyTuple_GET_ITEM(set.model_before, i), args, 2, nullptr);
+    if constexpr (AwaitFree) {
+      result = complete_await_free(result);
+    }
     if (!result) {
       return -1;
     }
-    if (result && PyDict_Check(result) && call_with_cls) {
-      if (PyDict_Update(target, result) != 0) {
-        Py_DECREF(result);
+    if (PyDict_Check(result) && PyDict_Update(kwds, result) != 0) {
+      Py_DECREF(result);
+      return -1;
+    }
+    Py_DECREF(result);
+  }
+  return 0;
+}
+
+/**
+ * @brief Runs field BEFORE validators on a keyword arguments dictionary.
+ *
+ * @param set The compiled validators.
+ * @param cls The model class.
+ * @param kwds The keyword arguments dictionary.
+ * @tparam AwaitFree Whether the validators are await-free coroutines.
+ * @return 0 on success, -1 on error.
+ */
+template <bool AwaitFree>
+static int run_field_before_set(const ValidatorSet &set, PyObject *cls,
+                                PyObject *kwds) {
+  for (Py_ssize_t i = 0; i < set.num_field_before; i++) {
+    const FieldValidators &entry = set.field_before[i];
+    PyObject *value = PyDict_GetItemWithError(kwds, entry.key);
+    if (!value) {
+      if (PyErr_Occurred()) {
         return -1;
       }
+      continue;
+    }
+    value = apply_field_callables<AwaitFree>(entry.callables, cls,
+                                             Py_NewRef(value));
+    if (!value) {
+      return -1;
+    }
+    int rc = PyDict_SetItem(kwds, entry.key, value);
+    Py_DECREF(value);
+    if (rc < 0) {
+      return -1;
+    }
+  }
+  return 0;
+}
+
+/**
+ * @brief Runs field AFTER validators on the attributes of an instance.
+ *
+ * Declared fields are read straight from the instance's value slots; other
+ * keys go through attribute lookup. Results are validated against the field
+ * type: when the class keeps the native __setattr__, a declared field that
+ * the validators returned unchanged is left as it is and a new value is
+ * stored straight into its slot. Other results are stored with setattr.
+ *
+ * @param set The compiled validators.
+ * @param cls The model class.
+ * @param self The instance to validate.
+ * @tparam AwaitFree Whether the validators are await-free coroutines.
+ * @return 0 on success, -1 on error.
+ */
+template <bool AwaitFree>
+static int run_field_after_set(const ValidatorSet &set, PyObject *cls,
+                               PyObject *self) {
+  PyObject **values = ((DataModelObject *)self)->instance_data->values;
+  bool native_setattr = Py_TYPE(self)->tp_setattro == DataModel_setattro;
+  for (Py_ssize_t i = 0; i < set.num_field_after; i++) {
+    const FieldValidators &entry = set.field_after[i];
+    PyObject *value;
+    if (entry.slot >= 0) {
+      value = Py_XNewRef(values[entry.slot]);
+    } else if (PyObject_HasAttr(self, entry.key)) {
+      value = PyObject_GetAttr(self, entry.key);
+    } else {
+      continue;
+    }
+    if (!value) {
+      if (PyErr_Occurred()) {
+        return -1;
+      }
+      continue;
+    }
+    PyObject *original = Py_NewRef(value);
+    value = apply_field_callables<AwaitFree>(entry.callables, cls, value);
+    if (!value) {
+      Py_DECREF(original);
+      return -1;
+    }
+    int rc;
+    if (!native_setattr || entry.slot < 0) {
+      rc = PyObject_SetAttr(self, entry.key, value);
+    } else if (value == original) {
+      rc = 0;
+    } else {
+      rc = DataModel_set_field(self, entry.slot, value);
+    }
+    Py_DECREF(original);
+    Py_DECREF(value);
+    if (rc < 0) {
+      return -1;
+    }
+  }
+  return 0;
+}
+
+/**
+ * @brief Runs model AFTER validators on an instance.
+ *
+ * @param set The compiled validators.
+ * @param cls The model class.
+ * @param self The instance to validate.
+ * @tparam AwaitFree Whether the validators are await-free coroutines.
+ * @return 0 on success, -1 on error.
+ */
+template <bool AwaitFree>
+static int run_model_after_set(const ValidatorSet &set, PyObject *cls,
+                               PyObject *self) {
+  Py_ssize_t len = PyTuple_GET_SIZE(set.model_after);
+  for (Py_ssize_t i = 0; i < len; i++) {
+    PyObject *callable = PyTuple_GET_ITEM(set.model_after, i);
+    PyObject *args[2] = {cls, self};
+    PyObject *result =
+        set.model_after_self_only[i]
+            ? PyObject_Vectorcall(callable, args + 1,
+                                  1 | PY_VECTORCALL_ARGUMENTS_OFFSET, nullptr)
+            : PyObject_Vectorcall(callable, args, 2, nullptr);
+    if constexpr (AwaitFree) {
+      result = complete_await_free(result);
+    }
+    if (!result) {
+      return -1;
     }
     Py_DECREF(result);
   }
@@ -83,52 +428,10 @@ int run_model_validators(PyObject *cls, PyObject *validator_list,
  */
 int run_field_before_validators(SchemaCache *schema, PyObject *cls,
                                 PyObject **pKwds) {
-  if (!schema->has_field_before) {
-    return 0;
-  }
-  PyObject *field_before =
-      PyDict_GetItemString(schema->validators, "field_before");
-  if (field_before && PyDict_Check(field_before) &&
-      PyDict_Size(field_before) == 0) {
+  if (!(schema->validator_flags & VALIDATORS_FIELD_BEFORE) || !*pKwds) {
     return 0;
   }
-  if (field_before && PyDict_Check(field_before)) {
-    PyObject *key;
-    PyObject *val;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(field_before, &pos, &key, &val)) {
-      if (PyDict_Contains(*pKwds, key)) {
-        PyObject *current_value = PyDict_GetItem(*pKwds, key);
-        Py_INCREF(current_value);
-        if (val && PyList_Check(val)) {
-          Py_ssize_t len_val = PyList_Size(val);
-          for (Py_ssize_t i = 0; i < len_val; i++) {
-            PyObject *validator = PyList_GetItem(val, i);
-            PyObject *callable_validator = get_callable_validator(validator);
-            if (callable_validator && PyCallable_Check(callable_validator)) {
-              PyObject *new_value = PyObject_CallFunctionObjArgs(
-                  callable_validator, cls, current_value, nullptr);
-              Py_DECREF(callable_validator);
-              if (!new_value) {
-                Py_DECREF(current_value);
-                return -1;
-              }
-              Py_DECREF(current_value);
-              current_value = new_value;
-            } else if (callable_validator) {
-              Py_DECREF(callable_validator);
-            }
-          }
-        }
-        if (PyDict_SetItem(*pKwds, key, current_value) < 0) {
-          Py_DECREF(current_value);
-          return -1;
-        }
-        Py_DECREF(current_value);
-      }
-    }
-  }
-  return 0;
+  return run_field_before_set<false>(schema->validators, cls, *pKwds);
 }
 
 /**
@@ -144,18 +447,10 @@ int run_field_before_validators(SchemaCache *schema, PyObject *cls,
  */
 int run_model_before_validators(SchemaCache *schema, PyObject *cls,
                                 PyObject **pKwds) {
-  if (!schema->has_model_before) {
+  if (!(schema->validator_flags & VALIDATORS_MODEL_BEFORE) || !*pKwds) {
     return 0;
   }
-  PyObject *model_before =
-      PyDict_GetItemString(schema->validators, "model_before");
-  if (model_before && PyList_Check(model_before)) {
-    if (PyList_Size(model_before) == 0) {
-      return 0;
-    }
-    return run_model_validators(cls, model_before, *pKwds, 1);
-  }
-  return 0;
+  return run_model_before_set<false>(schema->validators, cls, *pKwds);
 }
 
 /**
@@ -171,50 +466,10 @@ int run_model_before_validators(SchemaCache *schema, PyObject *cls,
  */
 int run_field_after_validators(SchemaCache *schema, PyObject *cls,
                                PyObject *self) {
-  if (!schema->has_field_after) {
+  if (!(schema->validator_flags & VALIDATORS_FIELD_AFTER)) {
     return 0;
   }
-  PyObject *field_after =
-      PyDict_GetItemString(schema->validators, "field_after");
-  if (field_after && PyDict_Check(field_after)) {
-    if (PyDict_Size(field_after) == 0) {
-      return 0;
-    }
-    PyObject *key;
-    PyObject *val;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(field_after, &pos, &key, &val)) {
-      if (PyObject_HasAttr(self, key)) {
-        PyObject *current_value = PyObject_GetAttr(self, key);
-        if (current_value && PyList_Check(val)) {
-          Py_ssize_t len_val = PyList_Size(val);
-          for (Py_ssize_t i = 0; i < len_val; i++) {
-            PyObject *validator = PyList_GetItem(val, i);
-            PyObject *callable_validator = get_callable_validator(validator);
-            if (callable_validator && PyCallable_Check(callable_validator)) {
-              PyObject *new_value = PyObject_CallFunctionObjArgs(
-                  callable_validator, cls, current_value, nullptr);
-              Py_DECREF(callable_validator);
-              if (!new_value) {
-                Py_DECREF(current_value);
-                return -1;
-              }
-              Py_DECREF(current_value);
-              current_value = new_value;
-            } else if (callable_validator) {
-              Py_DECREF(callable_validator);
-            }
-          }
-          if (PyObject_SetAttr(self, key, current_value) < 0) {
-            Py_DECREF(current_value);
-            return -1;
-          }
-          Py_DECREF(current_value);
-        }
-      }
-    }
-  }
-  return 0;
+  return run_field_after_set<false>(schema->validators, cls, self);
 }
 
 /**
@@ -229,46 +484,253 @@ int run_field_after_validators(SchemaCache *schema, PyObject *cls,
  */
 int run_model_after_validators(SchemaCache *schema, PyObject *cls,
                                PyObject *self) {
-  if (!schema->has_model_after) {
+  if (!(schema->validator_flags & VALIDATORS_MODEL_AFTER)) {
     return 0;
   }
-  PyObject *model_after =
-      PyDict_GetItemString(schema->validators, "model_after");
-  if (model_after && PyList_Check(model_after)) {
-    if (PyList_Size(model_after) == 0) {
-      return 0;
-    }
-    Py_ssize_t len = PyList_Size(model_after);
-    for (Py_ssize_t i = 0; i < len; i++) {
-      PyObject *validator = PyList_GetItem(model_after, i);
-      PyObject *callable_validator = get_callable_validator(validator);
-      if (!callable_validator) {
-        continue;
+  return run_model_after_set<false>(schema->validators, cls, self);
+}
+
+/**
+ * @brief Runs await-free async before validators.
+ *
+ * Applies the async 'model_before' and then 'field_before' validators of an
+ * AsyncDataModel whose async validators never await.
+ *
+ * @param schema SchemaCache containing validators.
+ * @param cls The model class.
+ * @param pKwds Pointer to the keyword arguments dictionary.
+ * @return 0 on success, -1 on error.
+ */
+int run_async_before_validators(SchemaCache *schema, PyObject *cls,
+                                PyObject **pKwds) {
+  if (!(schema->validator_flags & VALIDATORS_ASYNC_BEFORE) || !*pKwds) {
+    return 0;
+  }
+  if (run_model_before_set<true>(schema->async_validators, cls, *pKwds) != 0) {
+    return -1;
+  }
+  return run_field_before_set<true>(schema->async_validators, cls, *pKwds);
+}
+
+/**
+ * @brief Runs await-free async after validators.
+ *
+ * Applies the async 'field_after' and then 'model_after' validators of an
+ * AsyncDataModel whose async validators never await.
+ *
+ * @param schema SchemaCache containing validators.
+ * @param cls The model class.
+ * @param self The instance to validate.
+ * @return 0 on success, -1 on error.
+ */
+int run_async_after_validators(SchemaCache *schema, PyObject *cls,
+                               PyObject *self) {
+  if (!(schema->validator_flags & VALIDATORS_ASYNC_AFTER)) {
+    return 0;
+  }
+  if (run_field_after_set<true>(schema->async_validators, cls, self) != 0) {
+    return -1;
+  }
+  return run_model_after_set<true>(schema->async_validators, cls, self);
+}
+
+static PyObject *func_str = nullptr;
+static PyObject *mode_str = nullptr;
+static PyObject *field_str = nullptr;
+static PyObject *await_free_str = nullptr;
+
+/**
+ * @brief Returns true for class attributes that never carry validator
+ * metadata: data values and slot descriptors.
+ */
+static inline bool is_plain_attribute(PyObject *value) {
+  return value == Py_None || PyBool_Check(value) || PyLong_CheckExact(value) ||
+         PyFloat_CheckExact(value) || PyComplex_CheckExact(value) ||
+         PyUnicode_CheckExact(value) || PyBytes_CheckExact(value) ||
+         PyTuple_CheckExact(value) || PyList_CheckExact(value) ||
+         PyDict_CheckExact(value) || PyAnySet_CheckExact(value) ||
+         Py_IS_TYPE(value, &PyGetSetDescr_Type) ||
+         Py_IS_TYPE(value, &PyMemberDescr_Type);
+}
+
+/**
+ * @brief getattr(obj, name, None) without raising a missing attribute.
+ *
+ * @return int 1 if found (new reference in *result), 0 if missing, -1 on
+ * error.
+ */
+static inline int lookup_optional_attr(PyObject *obj, PyObject *name,
+                                       PyObject **result) {
+#if PY_VERSION_HEX >= 0x030D0000
+  return PyObject_GetOptionalAttr(obj, name, result);
+#else
+  return _PyObject_LookupAttr(obj, name, result);
+#endif
+}
+
+/**
+ * @brief Files a validator under its mode when its function carries a
+ * marker.
+ *
+ * @param func The function that may carry the marker.
+ * @param value The class attribute to file.
+ * @param marker The marker attribute name.
+ * @param modes The BEFORE and AFTER modes.
+ * @param targets The BEFORE and AFTER collections: dicts of field name to
+ * list for field validators, lists for model validators.
+ * @param by_field Whether the validator is a field validator.
+ * @param await_free Cleared unless the metadata marks the validator as
+ * await-free.
+ * @return int 0 on success, -1 on error.
+ */
+static int file_validator(PyObject *func, PyObject *value, PyObject *marker,
+                          PyObject *const *modes, PyObject **targets,
+                          bool by_field, bool *await_free) {
+  PyObject *info = nullptr;
+  int rc = lookup_optional_attr(func, marker, &info);
+  if (rc <= 0) {
+    return rc;
+  }
+  int res = -1;
+  PyObject *mode = nullptr;
+  PyObject *field = nullptr;
+  PyObject *target = nullptr;
+  PyObject *flag = nullptr;
+  int matched = 0;
+  if (info == Py_None) {
+    res = 0;
+    goto done;
+  }
+  mode = PyObject_GetItem(info, mode_str);
+  if (!mode) {
+    goto done;
+  }
+  if (by_field) {
+    field = PyObject_GetItem(info, field_str);
+    if (!field) {
+      goto done;
+    }
+  }
+  if (*await_free) {
+    flag = PyDict_Check(info) ? PyDict_GetItemWithError(info, await_free_str)
+                              : nullptr;
+    if (!flag && PyErr_Occurred()) {
+      goto done;
+    }
+    int truth = flag ? PyObject_IsTrue(flag) : 0;
+    if (truth < 0) {
+      goto done;
+    }
+    *await_free = truth;
+  }
+  for (int i = 0; i < 2 && !target; i++) {
+    matched = PyObject_RichCompareBool(mode, modes[i], Py_EQ);
+    if (matched < 0) {
+      goto done;
+    }
+    if (matched) {
+      target = targets[i];
+    }
+  }
+  if (!target) {
+    res = 0;
+    goto done;
+  }
+  if (by_field) {
+    PyObject *list = PyDict_GetItemWithError(target, field);
+    if (!list) {
+      if (PyErr_Occurred()) {
+        goto done;
       }
-      int argcount = 0;
-      PyObject *code = PyObject_GetAttrString(validator, "__code__");
-      if (code) {
-        PyObject *argcount_obj = PyObject_GetAttrString(code, "co_argcount");
-        if (argcount_obj && PyLong_Check(argcount_obj)) {
-          argcount = static_cast<int>(PyLong_AsLong(argcount_obj));
-        }
-        Py_XDECREF(argcount_obj);
-        Py_DECREF(code);
+      list = PyList_New(0);
+      if (!list) {
+        goto done;
       }
-      if (argcount == 1) {
-        if (!PyObject_CallFunctionObjArgs(callable_validator, self, nullptr)) {
-          Py_DECREF(callable_validator);
-          return -1;
-        }
-      } else {
-        if (!PyObject_CallFunctionObjArgs(callable_validator, cls, self,
-                                          nullptr)) {
-          Py_DECREF(callable_validator);
-          return -1;
-        }
+      int set_rc = PyDict_SetItem(target, field, list);
+      Py_DECREF(list);
+      if (set_rc < 0) {
+        goto done;
       }
-      Py_DECREF(callable_validator);
     }
+    target = list;
   }
-  return 0;
+  res = PyList_Append(target, value);
+done:
+  Py_XDECREF(mode);
+  Py_XDECREF(field);
+  Py_DECREF(info);
+  return res;
+}
+
+PyObject *validators_collect(PyObject *Py_UNUSED(module), PyObject *const *args,
+                             Py_ssize_t nargs) {
+  if (nargs != 5) {
+    PyErr_Format(PyExc_TypeError,
+                 "collect_validators() takes exactly 5 arguments (%zd given)",
+                 nargs);
+    return nullptr;
+  }
+  PyObject *cls = args[0];
+  if (!PyType_Check(cls) || !((PyTypeObject *)cls)->tp_dict) {
+    PyErr_SetString(PyExc_TypeError,
+                    "collect_validators() expects a class as first argument");
+    return nullptr;
+  }
+  if (!func_str) {
+    func_str = PyUnicode_InternFromString("__func__");
+    mode_str = PyUnicode_InternFromString("mode");
+    field_str = PyUnicode_InternFromString("field");
+    await_free_str = PyUnicode_InternFromString("await_free");
+    if (!func_str || !mode_str || !field_str || !await_free_str) {
+      Py_CLEAR(func_str);
+      return nullptr;
+    }
+  }
+  PyObject *const *modes = args + 3;
+  PyObject *field_targets[2] = {PyDict_New(), PyDict_New()};
+  PyObject *model_targets[2] = {PyList_New(0), PyList_New(0)};
+  // Validators may run arbitrary code on lookup, so iterate a snapshot.
+  PyObject *values = PyDict_Values(((PyTypeObject *)cls)->tp_dict);
+  bool await_free = true;
+  if (!field_targets[0] || !field_targets[1] || !model_targets[0] ||
+      !model_targets[1] || !values) {
+    goto error;
+  }
+  for (Py_ssize_t i = 0; i < PyList_GET_SIZE(values); i++) {
+    PyObject *value = PyList_GET_ITEM(values, i);
+    if (is_plain_attribute(value)) {
+      continue;
+    }
+    PyObject *func;
+    if (PyObject_TypeCheck(value, &PyClassMethod_Type) ||
+        PyObject_TypeCheck(value, &PyStaticMethod_Type)) {
+      func = PyObject_GetAttr(value, func_str);
+      if (!func) {
+        goto error;
+      }
+    } else {
+      func = Py_NewRef(value);
+    }
+    int rc = file_validator(func, value, args[1], modes, field_targets, true,
+                            &await_free);
+    if (rc == 0) {
+      rc = file_validator(func, value, args[2], modes, model_targets, false,
+                          &await_free);
+    }
+    Py_DECREF(func);
+    if (rc < 0) {
+      goto error;
+    }
+  }
+  Py_DECREF(values);
+  return Py_BuildValue("(NNNNO)", field_targets[0], field_targets[1],
+                       model_targets[0], model_targets[1],
+                       await_free ? Py_True : Py_False);
+error:
+  Py_XDECREF(values);
+  Py_XDECREF(field_targets[0]);
+  Py_XDECREF(field_targets[1]);
+  Py_XDECREF(model_targets[0]);
+  Py_XDECREF(model_targets[1]);
+  return nullptr;
 }
@@ -8,18 +8,24 @@ extern "C" {
 #endif
 
 /**
- * Run a list of model-level validators.
- * If call_with_cls is true, each validator is called with (cls, target);
- * otherwise, with (target,).
+ * Compile a validators mapping ({"field_before": ..., "field_after": ...,
+ * "model_before": ..., "model_after": ...}) into a ValidatorSet. The schema's
+ * field_index must already be built.
  *
- * @param cls            The model class.
- * @param validator_list A Python list of validators.
- * @param target         The dictionary or model instance to validate.
- * @param call_with_cls  Flag to control the calling signature.
+ * @param validators The validators mapping (may be nullptr or not a dict).
+ * @param schema     The schema the validators belong to.
+ * @param set        The set to fill.
  * @return 0 on success, -1 on failure.
  */
-int run_model_validators(PyObject *cls, PyObject *validator_list,
-                         PyObject *target, int call_with_cls);
+int compile_validator_set(PyObject *validators, SchemaCache *schema,
+                          ValidatorSet *set);
+
+/**
+ * Release the references and arrays held by a ValidatorSet.
+ *
+ * @param set The set to free.
+ */
+void free_validator_set(ValidatorSet *set);
 
 /**
  * Run field BEFORE validators.
@@ -65,6 +71,48 @@ int run_field_after_validators(SchemaCache *schema, PyObject *cls,
 int run_model_after_validators(SchemaCache *schema, PyObject *cls,
                                PyObject *self);
 
+/**
+ * Run the async BEFORE validators of a model whose async validators never
+ * await, completing each coroutine without an event loop.
+ *
+ * @param schema A pointer to the compiled SchemaCache.
+ * @param cls    The model class.
+ * @param pKwds  Pointer to the dict containing field values.
+ * @return 0 on success, -1 on failure.
+ */
+int run_async_before_validators(SchemaCache *schema, PyObject *cls,
+                                PyObject **pKwds);
+
+/**
+ * Run the async AFTER validators of a model whose async validators never
+ * await, completing each coroutine without an event loop.
+ *
+ * @param schema A pointer to the compiled SchemaCache.
+ * @param cls    The model class.
+ * @param self   The model instance.
+ * @return 0 on success, -1 on failure.
+ */
+int run_async_after_validators(SchemaCache *schema, PyObject *cls,
+                               PyObject *self);
+
+/**
+ * Collect the validators declared in a class namespace (Python:
+ * collect_validators(cls, field_marker, model_marker, before, after)).
+ *
+ * Each attribute of cls.__dict__ (classmethods and staticmethods unwrapped)
+ * carrying one of the marker attributes is filed under the mode of its
+ * metadata. Attributes of plain data types are skipped without a lookup.
+ *
+ * @param module Unused.
+ * @param args   The class, the field and model marker names and the BEFORE
+ *               and AFTER modes.
+ * @param nargs  Number of arguments (5).
+ * @return New reference to a (field_before, field_after, model_before,
+ *         model_after, await_free) tuple, or nullptr on error.
+ */
+PyObject *validators_collect(PyObject *module, PyObject *const *args,
+                             Py_ssize_t nargs);
+
 #ifdef __cplusplus
 }
 #endif
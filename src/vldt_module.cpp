@@ -1,8 +1,27 @@
+#include "conversion/date_fast.hpp"
+#include "conversion/uuid_fast.hpp"
 #include "data_model.hpp"
+#include "fast_defaults.hpp"
 #include "init_globals.hpp"
 #include "validation/validation.hpp"
+#include "validation/validation_builtins.hpp"
+#include "validation/validation_primitives.hpp"
+#include "validation/validation_validators.hpp"
 #include <Python.h>
 
+static PyMethodDef vldt_methods[] = {
+    {"parse_datetime_fast", (PyCFunction)date_fast_parse_datetime, METH_O,
+     "Parse a 'YYYY-MM-DD HH:MM:SS' (or 'YYYY/MM/DD HH:MM:SS') string into a "
+     "datetime. The date and time may also be separated by 'T'."},
+    {"parse_uuid_fast", (PyCFunction)uuid_fast_parse_uuid, METH_O,
+     "Parse a UUID string into a uuid.UUID."},
+    {"round2", (PyCFunction)primitives_round2, METH_O,
+     "Round a number to two decimal places, same as round(value, 2)."},
+    {"collect_validators", (PyCFunction)(void (*)(void))validators_collect,
+     METH_FASTCALL,
+     "Collect the validators declared in a class namespace by mode."},
+    {nullptr, nullptr, 0, nullptr}};
+
 static PyModuleDef vldtmodule = {
     .m_base =
         {
@@ -13,7 +32,7 @@ static PyModuleDef vldtmodule = {
     .m_name = "vldt._vldt",
     .m_doc = "vldt C++ extension module",
     .m_size = -1,
-    .m_methods = nullptr,
+    .m_methods = vldt_methods,
     .m_slots = nullptr,
     .m_traverse = nullptr,
     .m_clear = nullptr,
@@ -32,7 +51,9 @@ PyMODINIT_FUNC PyInit__vldt(void) {
     return nullptr;
   }
 
-  if (init_data_model_globals() != 0 || init_validation_globals() != 0) {
+  if (init_data_model_globals() != 0 || init_validation_globals() != 0 ||
+      init_date_fast_globals() != 0 || init_uuid_fast_globals() != 0 ||
+      init_builtin_validators() != 0 || init_fast_defaults() != 0) {
     Py_DECREF(m);
     return nullptr;
   }
@@ -43,6 +64,22 @@ PyMODINIT_FUNC PyInit__vldt(void) {
     Py_DECREF(m);
     return nullptr;
   }
+
+  Py_INCREF(&BuiltinValidatorType);
+  if (PyModule_AddObject(m, "BuiltinValidator",
+                         (PyObject *)&BuiltinValidatorType) < 0) {
+    Py_DECREF(&BuiltinValidatorType);
+    Py_DECREF(m);
+    return nullptr;
+  }
+
+  Py_INCREF(&RandIntFactoryType);
+  if (PyModule_AddObject(m, "RandIntFactory", (PyObject *)&RandIntFactoryType) <
+      0) {
+    Py_DECREF(&RandIntFactoryType);
+    Py_DECREF(m);
+    return nullptr;
+  }
   return m;
 }
 
@@ -1,14 +1,18 @@
 """Tests for async validators and async data models."""
 
+import asyncio
 import json
 import pytest
-from typing import Any
+from typing import Any, List
 from vldt import (
     AsyncDataModel,
     async_field_validator,
     async_model_validator,
+    model_validator,
+    round2,
     ValidatorMode,
 )
+from vldt.validators import never_awaits
 
 
 class AsyncPerson(AsyncDataModel):
@@ -27,8 +31,8 @@ class AsyncPerson(AsyncDataModel):
     async def check_age(cls, age: Any):
         """Validates and converts the age field before assignment.
 
-        If age is an int, checks that it is not less than 18. If age is a string, converts it to an int after checking
-        it contains only digits and validates it is not less than 18.
+        If age is an int, checks that it is not less than 18. If age is a string, converts it to an int, reporting
+        strings that are not numbers, and validates it is not less than 18.
 
         Args:
             age (Any): The input age value.
@@ -43,9 +47,10 @@ class AsyncPerson(AsyncDataModel):
             if age < 18:
                 raise ValueError("Person must be older than 18 years old")
         elif isinstance(age, str):
-            if not age.isdigit():
-                raise ValueError("Age must be a number")
-            age = int(age)
+            try:
+                age = int(age)
+            except ValueError:
+                raise ValueError("Age must be a number") from None
             if age < 18:
                 raise ValueError("Person must be older than 18 years old")
         else:
@@ -129,7 +134,7 @@ class AsyncProduct(AsyncDataModel):
     @async_model_validator(mode=ValidatorMode.AFTER)
     async def adjust_price(self):
         """Rounds the price to two decimals after model creation."""
-        self.price = round(self.price, 2)
+        self.price = round2(self.price)
 
 
 class AsyncOrder(AsyncDataModel):
@@ -146,7 +151,7 @@ class AsyncOrder(AsyncDataModel):
     @async_model_validator(mode=ValidatorMode.AFTER)
     async def adjust_order(self):
         """Rounds the total to two decimals after model creation."""
-        self.total = round(self.total, 2)
+        self.total = round2(self.total)
 
 
 def create_invalid_async_validator_model():
@@ -187,6 +192,213 @@ class AsyncEmployee(AsyncDataModel):
         self.name = self.name.upper()
 
 
+class AsyncTrace(AsyncDataModel):
+    """Async data model recording the order in which its validators run.
+
+    Attributes:
+        value (int): A value passed through every validator.
+        trace (List[str]): Names of the validators in the order they ran.
+    """
+
+    value: int
+    trace: List[str] = []
+
+    @async_model_validator(mode=ValidatorMode.BEFORE)
+    @classmethod
+    async def async_model_before(cls, data: dict):
+        """Record the async model BEFORE validator."""
+        data["trace"] = data.get("trace", []) + ["async_model_before"]
+        return data
+
+    @async_field_validator(mode=ValidatorMode.BEFORE)
+    @classmethod
+    async def value_async_before(cls, value: Any):
+        """Increment the value in the async field BEFORE validator."""
+        return int(value) + 1
+
+    @model_validator(mode=ValidatorMode.BEFORE)
+    @classmethod
+    def sync_model_before(cls, data: dict):
+        """Record the sync model BEFORE validator."""
+        data["trace"] = data["trace"] + ["sync_model_before"]
+        return data
+
+    @model_validator(mode=ValidatorMode.AFTER)
+    def sync_model_after(self):
+        """Record the sync model AFTER validator."""
+        self.trace = self.trace + ["sync_model_after"]
+
+    @async_model_validator(mode=ValidatorMode.AFTER)
+    async def async_model_after(self):
+        """Record the async model AFTER validator."""
+        self.trace = self.trace + ["async_model_after"]
+
+
+class AsyncSleepyPerson(AsyncDataModel):
+    """Async data model whose validator awaits.
+
+    Attributes:
+        name (str): The person's name.
+    """
+
+    name: str
+
+    @async_field_validator(mode=ValidatorMode.AFTER)
+    @classmethod
+    async def slow_name(cls, name: str):
+        """Title-case the name after yielding to the event loop."""
+        await asyncio.sleep(0)
+        return name.title()
+
+
+class AsyncSleepyTrace(AsyncDataModel):
+    """Async data model whose model and field validators await.
+
+    Attributes:
+        value (int): The traced value.
+        trace (list): The validators that ran, in order.
+    """
+
+    value: int
+    trace: list
+
+    @async_model_validator(mode=ValidatorMode.BEFORE)
+    @classmethod
+    async def start(cls, data: dict):
+        """Start the trace before validation."""
+        await asyncio.sleep(0)
+        return {"trace": ["model_before"]}
+
+    @async_field_validator(mode=ValidatorMode.BEFORE)
+    @staticmethod
+    async def parse(cls, value):
+        """Convert the raw value to an int."""
+        await asyncio.sleep(0)
+        return int(value)
+
+    @async_model_validator(mode=ValidatorMode.AFTER)
+    async def finish(self):
+        """Record the after validator on the instance."""
+        await asyncio.sleep(0)
+        self.trace = self.trace + ["model_after"]
+
+
+@pytest.mark.asyncio
+class TestAwaitFreeValidators:
+    """Tests for async validators that never await."""
+
+    async def test_detection(self):
+        """Test that only coroutine functions without awaits are await-free."""
+
+        async def plain(value):
+            return value
+
+        async def awaiting(value):
+            await asyncio.sleep(0)
+            return value
+
+        def sync(value):
+            return value
+
+        assert never_awaits(plain)
+        assert not never_awaits(awaiting)
+        assert not never_awaits(sync)
+        assert AsyncTrace.__vldt_await_free_validators__ is not None
+        assert AsyncSleepyPerson.__vldt_await_free_validators__ is None
+
+    async def test_validator_order(self):
+        """Test that await-free async validators keep their place around sync ones."""
+        model = await AsyncTrace(value="1")
+        assert model.value == 2
+        assert model.trace == [
+            "async_model_before",
+            "sync_model_before",
+            "sync_model_after",
+            "async_model_after",
+        ]
+
+    async def test_awaiting_validator(self):
+        """Test that validators that await still run on the event loop."""
+        person = await AsyncSleepyPerson(name="ada lovelace")
+        assert person.name == "Ada Lovelace"
+
+    async def test_awaiting_model_validators(self):
+        """Test that awaiting validators receive the class or the instance."""
+        model = await AsyncSleepyTrace(value="3")
+        assert model.value == 3
+        assert model.trace == ["model_before", "model_after"]
+
+    async def test_missing_phases_are_skipped(self):
+        """Test that phases without awaiting validators leave the input as is."""
+        person = AsyncSleepyPerson(name="ada")
+        kwargs = {"name": "ada"}
+        assert await person._run_async_before(kwargs) is kwargs
+        assert kwargs == {"name": "ada"}
+        person = await person
+        assert person.name == "Ada"
+
+    async def test_call_tables_are_frozen(self):
+        """Test that async validators are stored as tuples bound at class creation."""
+        model_before, field_before, field_after, model_after = (
+            AsyncSleepyPerson.__vldt_async_calls__
+        )
+        assert model_before == field_before == model_after == ()
+        ((field, calls),) = field_after
+        assert field == "name"
+        assert calls == (AsyncSleepyPerson.slow_name,)
+        assert calls[0].__self__ is AsyncSleepyPerson
+
+    async def test_phases_without_validators_are_not_run(self):
+        """Test that awaiting skips the BEFORE phase when it has no validators."""
+
+        class AfterOnly(AsyncDataModel):
+            """Async data model failing if its BEFORE phase runs.
+
+            Attributes:
+                name (str): The person's name.
+            """
+
+            name: str
+
+            @async_field_validator(mode=ValidatorMode.AFTER)
+            @classmethod
+            async def slow_name(cls, name: str):
+                """Title-case the name after yielding to the event loop."""
+                await asyncio.sleep(0)
+                return name.title()
+
+            async def _run_async_before(self, kwargs):
+                raise AssertionError("BEFORE phase without validators was run")
+
+        person = await AfterOnly(name="ada lovelace")
+        assert person.name == "Ada Lovelace"
+
+    async def test_models_without_async_validators(self):
+        """Test that awaiting a model without async validators never suspends."""
+
+        class Plain(AsyncDataModel):
+            """Async data model without any async validators.
+
+            Attributes:
+                id (int): The identifier.
+            """
+
+            id: int
+
+        assert Plain.__vldt_async_flags__ == 0
+        assert AsyncTrace.__vldt_async_flags__ == 0
+        assert AsyncSleepyPerson.__vldt_async_flags__ == 2
+        assert AsyncSleepyTrace.__vldt_async_flags__ == 3
+        model = Plain(id=1)
+        with pytest.raises(StopIteration) as stop:
+            next(model.__await__())
+        assert stop.value.value is model
+        assert model.id == 1
+        assert (await Plain(id=2)).id == 2
+        with pytest.raises(TypeError):
+            await Plain(id="x")
+
+
 @pytest.mark.asyncio
 class TestAsyncPersonModel:
     """Tests for the AsyncPerson data model."""
@@ -198,6 +410,55 @@ class TestAsyncPersonModel:
         assert p.age == 25
         assert p.name == "John"
 
+    async def test_init_kwargs_are_released(self):
+        """Test that the input is dropped after initialization and not validated twice."""
+        p = await AsyncPerson(name="alice", age="30")
+        assert p._init_kwargs is None
+        assert await p is p
+        assert p.age == 30
+        trace = await AsyncSleepyTrace(value="3")
+        assert await trace is trace
+        assert trace.trace == ["model_before", "model_after"]
+
+    async def test_init_kwargs_use_a_slot(self):
+        """Test that the pending kwargs are kept in a slot next to the extras."""
+        import weakref
+
+        assert type(AsyncDataModel.__dict__["_init_kwargs"]).__name__ == (
+            "member_descriptor"
+        )
+        p = AsyncPerson(name="alice", age="30")
+        assert p._init_kwargs == {"name": "alice", "age": "30"}
+        p.note = "extra"
+        ref = weakref.ref(p)
+        assert await p is ref()
+        assert (p._init_kwargs, p.note, p.age) == (None, "extra", 30)
+
+    async def test_deepcopy_of_pending_model(self):
+        """Test that a deep copy of a pending model keeps its kwargs and awaits."""
+        import copy
+
+        class Plain(AsyncDataModel):
+            age: int
+
+        pending = AsyncPerson(name="alice", age="30")
+        copied = copy.deepcopy(pending)
+        assert copied._init_kwargs == pending._init_kwargs
+        assert copied._init_kwargs is not pending._init_kwargs
+        copied = await copied
+        assert (copied.name, copied.age) == ("Alice", 30)
+        assert pending._init_kwargs == {"name": "alice", "age": "30"}
+        plain = await copy.deepcopy(Plain(age=5))
+        assert plain.age == 5
+        assert copy.deepcopy(plain)._init_kwargs is None
+
+    async def test_caller_kwargs_are_untouched(self):
+        """Test that async BEFORE validators do not rewrite the caller's dict."""
+        data = {"name": "alice", "age": "30"}
+        p = await AsyncPerson(**data)
+        assert p.age == 30
+        assert data == {"name": "alice", "age": "30"}
+
     async def test_valid_person_with_str_age(self):
         """Test valid AsyncPerson creation when age is a string representing a valid integer."""
         p = await AsyncPerson(name="alice", age="30")
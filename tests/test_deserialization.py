@@ -1,7 +1,10 @@
+import sys
 from datetime import datetime
 from uuid import UUID
 
-from vldt import DataModel, Config
+import pytest
+
+from vldt import DataModel, Config, parse_datetime_fast
 
 
 def from_string(v: str) -> datetime:
@@ -13,7 +16,7 @@ def from_string(v: str) -> datetime:
     Returns:
         datetime: The corresponding datetime object.
     """
-    return datetime.strptime(v, "%Y/%m/%d %H:%M:%S")
+    return parse_datetime_fast(v)
 
 
 class ModelWithManyTypes(DataModel):
@@ -81,3 +84,124 @@ class TestDeserializer:
         assert obj.height == 1.75
         assert obj.is_active is True
         assert obj.created_at == datetime(2021, 1, 1, 12, 0)
+
+    def test_default_deserializers(self):
+        """Test the global str and int deserializers without leaking references."""
+
+        class Event(DataModel):
+            """Data model using the default deserializers.
+
+            Attributes:
+                id (UUID): The event identifier.
+                at (datetime): When the event happened.
+            """
+
+            id: UUID
+            at: datetime
+
+        data = {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "at": "2021-01-01T12:00:00",
+        }
+        record = {
+            "id": data["id"],
+            "name": "A",
+            "age": 1,
+            "height": 1.0,
+            "is_active": True,
+            "created_at": "2021/01/01 12:00:00",
+        }
+        before = sys.getrefcount(from_string)
+        for _ in range(100):
+            ModelWithManyTypes.from_dict(record)
+        assert sys.getrefcount(from_string) == before
+        event = Event.from_dict(data)
+        assert event.id == UUID(data["id"])
+        assert event.at == datetime(2021, 1, 1, 12, 0)
+        assert Event(id=event.id, at=0).at == datetime.fromtimestamp(0)
+
+    def test_config_deserializers_are_shared(self):
+        """Test that configs reuse the merged deserializer mapping."""
+        from vldt.deserializer import GLOBAL_DESERIALIZER
+
+        assert Config().deserializer is GLOBAL_DESERIALIZER
+        custom = {datetime: {str: from_string}}
+        merged = Config(deserializer=custom).deserializer
+        assert (
+            Config(deserializer={datetime: {str: from_string}}).deserializer is merged
+        )
+        assert merged[datetime] == {str: from_string}
+        assert merged[UUID] is GLOBAL_DESERIALIZER[UUID]
+        assert GLOBAL_DESERIALIZER[datetime][str] == datetime.fromisoformat
+        with pytest.raises(TypeError):
+            merged[datetime] = {}
+        with pytest.raises(TypeError):
+            GLOBAL_DESERIALIZER[UUID][str] = str
+
+    def test_merged_deserializers_are_bounded_and_read_only(self):
+        """Test that merged mappings are read-only and not kept without bound."""
+        import gc
+        import weakref
+        from types import MappingProxyType
+        from vldt.config import _merge_hashable_deserializer
+
+        class Parser:
+            def __call__(self, value):
+                return datetime.fromisoformat(value)
+
+        parser = Parser()
+        ref = weakref.ref(parser)
+        Config(deserializer={datetime: {str: parser}})
+        del parser
+        for i in range(_merge_hashable_deserializer.cache_info().maxsize):
+            Config(deserializer={datetime: {str: lambda v, i=i: v}})
+        gc.collect()
+        assert ref() is None
+
+        unhashable = Config(deserializer={datetime: {str: from_string}, list: []})
+        for merged in (
+            unhashable.deserializer,
+            Config({}, {}, {UUID: {}}).deserializer,
+        ):
+            assert isinstance(merged, MappingProxyType)
+            with pytest.raises(TypeError):
+                merged[datetime] = {}
+
+
+class TestParseDatetimeFast:
+    """Test cases for the fixed-width datetime parser."""
+
+    def test_formats(self):
+        """Test that both date separators and both date/time separators are accepted."""
+        expected = datetime(2021, 3, 4, 5, 6, 7)
+        assert parse_datetime_fast("2021/03/04 05:06:07") == expected
+        assert parse_datetime_fast("2021-03-04 05:06:07") == expected
+        assert parse_datetime_fast("2021-03-04T05:06:07") == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2021/03/04",
+            "2021/03-04 05:06:07",
+            "2021/03/04 05:06:07Z",
+            "2021/13/04 05:06:07",
+            "2021/02/30 05:06:07",
+            "2021/03/04 25:06:07",
+            "2021/0a/04 05:06:07",
+        ],
+    )
+    def test_invalid(self, value):
+        """Test that malformed or out-of-range strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_datetime_fast(value)
+
+    def test_error_message(self):
+        """Test that the error names the rejected string and the accepted forms."""
+        with pytest.raises(ValueError) as exc_info:
+            parse_datetime_fast("2021.03.04 05:06:07")
+        message = str(exc_info.value)
+        assert "'2021.03.04 05:06:07'" in message
+        assert "%" not in message
+        assert "'YYYY-MM-DD HH:MM:SS'" in message
+        assert "'YYYY/MM/DD'" in message
+        assert "'T'" in message
@@ -1,8 +1,10 @@
-from typing import List, Dict, Optional, Union
+import json
+import threading
+from typing import List, Dict, Optional, Set, Tuple, Union
 
 import pytest
 
-from vldt import DataModel
+from vldt import DataModel, ValidatorMode, model_validator
 from vldt.config import Config
 
 
@@ -66,6 +68,20 @@ class CollectionModel(DataModel):
     mapping: Dict[str, Address]
 
 
+class ContainerShapesModel(DataModel):
+    """Data model with tuple, set and nested list fields.
+
+    Attributes:
+        pair (Tuple[Address, int]): An address paired with a count.
+        tags (Set[str]): A set of tags.
+        grid (List[List[Address]]): Rows of addresses.
+    """
+
+    pair: Tuple[Address, int]
+    tags: Set[str]
+    grid: List[List[Address]]
+
+
 def custom_float_serializer(v: float) -> str:
     """Custom serializer that converts a float to a string rounded to 2 decimals.
 
@@ -89,6 +105,21 @@ class ConfigModel(DataModel):
     __vldt_config__ = Config(dict_serializer={float: custom_float_serializer})
 
 
+class AddressSummaryModel(DataModel):
+    """Data model serializing its nested Address field with a custom serializer.
+
+    Attributes:
+        count (int): An integer count.
+        address (Address): An address serialized as a single string.
+    """
+
+    count: int
+    address: Address
+    __vldt_config__ = Config(
+        dict_serializer={Address: lambda a: f"{a.street}, {a.city}"}
+    )
+
+
 class TestToDictFromDict:
     """Test cases for converting models to dictionaries and back."""
 
@@ -107,6 +138,30 @@ class TestToDictFromDict:
         }
         assert d == expected
 
+    def test_to_dict_into_out(self):
+        """Test that to_dict fills and returns a caller-supplied dictionary."""
+        addr = Address(street="Main St", city="Town", postal_code="12345")
+        user = User(id=1, name="Alice", age=30, active=True, address=addr, notes=None)
+        out = {"stale": 1}
+        assert user.to_dict(out=out) is out
+        assert out == user.to_dict()
+        assert list(out) == list(user.to_dict())
+
+        first_address = out["address"]
+        user.age = 31
+        assert user.to_dict(out=out) is out
+        assert out["age"] == 31
+        assert out["address"] == first_address
+        assert out["address"] is not first_address
+
+        assert addr.to_dict(out=out) is out
+        assert out == {"street": "Main St", "city": "Town", "postal_code": "12345"}
+        assert user.to_dict(out=None) == user.to_dict()
+        with pytest.raises(TypeError):
+            user.to_dict(out=[])
+        with pytest.raises(TypeError):
+            user.to_dict({})
+
     def test_from_dict_round_trip(self):
         """Test round-trip conversion from dictionary to User model and back."""
         data = {
@@ -169,6 +224,182 @@ class TestToDictFromDict:
         d = coll.to_dict()
         assert d == data
 
+    def test_tuple_set_and_nested_list_fields(self):
+        """Test that tuples, sets and nested lists keep their type in to_dict."""
+        address = {"street": "Elm St", "city": "Town", "postal_code": "3"}
+        model = ContainerShapesModel(
+            pair=(address, 2), tags={"a", "b"}, grid=[[address], [address, address]]
+        )
+        d = model.to_dict()
+        assert d == {
+            "pair": (address, 2),
+            "tags": {"a", "b"},
+            "grid": [[address], [address, address]],
+        }
+        assert type(d["pair"]) is tuple
+        assert type(d["tags"]) is set
+
+    def test_from_dict_calls_overridden_init(self):
+        """Test that from_dict still goes through a user-defined __init__."""
+
+        class CountingAddress(Address):
+            """Address subclass counting how often __init__ runs."""
+
+            calls = 0
+
+            def __init__(self, **kwargs):
+                type(self).calls += 1
+                super().__init__(**kwargs)
+
+        CountingAddress.from_dict({"street": "A", "city": "B", "postal_code": "C"})
+        assert CountingAddress.calls == 1
+
+    def test_from_dicts(self):
+        """Test that from_dicts builds one model per dictionary like from_dict."""
+        rows = [{"street": "A", "city": "B", "postal_code": str(i)} for i in range(3)]
+        addresses = Address.from_dicts(rows)
+        assert [a.to_dict() for a in addresses] == rows
+        assert Address.from_dicts(row for row in rows)[2].postal_code == "2"
+        assert Address.from_dicts(()) == []
+
+        class CountingAddress(Address):
+            """Address subclass counting how often __init__ runs."""
+
+            calls = 0
+
+            def __init__(self, **kwargs):
+                type(self).calls += 1
+                super().__init__(**kwargs)
+
+        assert len(CountingAddress.from_dicts(rows)) == 3
+        assert CountingAddress.calls == 3
+
+        with pytest.raises(TypeError, match="item 1 must be a dict"):
+            Address.from_dicts([rows[0], "row"])
+        with pytest.raises(TypeError, match="postal_code"):
+            Address.from_dicts([rows[0], {"street": "A", "city": "B"}])
+
+    def test_leaf_model_keeps_value_types(self):
+        """Test that a model of plain fields keeps subclass values such as bools in int fields."""
+        company = Company(name="Acme", industry="Tools", employees=True)
+        d = company.to_dict()
+        assert d == {"name": "Acme", "industry": "Tools", "employees": True}
+        assert d["employees"] is True
+
+    def test_optional_plain_and_model_fields(self):
+        """Test that optional fields dump values and None, honoring serializers."""
+
+        class Contact(DataModel):
+            """Data model with optional plain and nested fields.
+
+            Attributes:
+                name (Optional[str]): The contact name.
+                age (Optional[int]): The contact age.
+                address (Optional[Address]): The contact address.
+            """
+
+            name: Optional[str]
+            age: Optional[int]
+            address: Optional[Address]
+            __vldt_config__ = Config(dict_serializer={type(None): lambda v: "n/a"})
+
+        address = {"street": "Elm St", "city": "Town", "postal_code": "3"}
+        full = Contact(name="Ann", age=3, address=address)
+        assert full.to_dict() == {"name": "Ann", "age": 3, "address": address}
+        empty = Contact(name=None, age=None, address=None)
+        assert empty.to_dict() == {"name": "n/a", "age": "n/a", "address": "n/a"}
+        assert json.loads(empty.to_json()) == {
+            "name": None,
+            "age": None,
+            "address": None,
+        }
+
+    def test_deeply_nested_models(self):
+        """Test that deeply nested models convert without exhausting the C stack."""
+
+        class Node(DataModel):
+            """Data model of a chain and tree node.
+
+            Attributes:
+                value (int): The node value.
+                children (List[Node]): Child nodes.
+                named (Dict[str, Node]): Child nodes by name.
+                parent (Optional[Node]): The parent node.
+            """
+
+            value: int
+            children: List["Node"] = []
+            named: Dict[str, "Node"] = {}
+            parent: Optional["Node"] = None
+
+        root = Node(value=0)
+        node = root
+        for i in range(1, 20_000):
+            child = Node(value=i)
+            node.children = [child]
+            node = child
+        results = []
+        stack_size = threading.stack_size(1 << 18)
+        try:
+            thread = threading.Thread(target=lambda: results.append(root.to_dict()))
+            thread.start()
+            thread.join()
+        finally:
+            threading.stack_size(stack_size)
+        d = results[0]
+        depth = 0
+        while d["children"]:
+            d = d["children"][0]
+            depth += 1
+        assert depth == 19_999
+
+        leaf = Node(value=3)
+        tree = Node(
+            value=1,
+            children=[leaf, {"value": 2, "named": {"x": leaf}}],
+            named={"a": Node(value=4, parent=leaf), "b": leaf},
+            parent=leaf,
+        )
+        leaf_dict = {"value": 3, "children": [], "named": {}, "parent": None}
+        assert tree.to_dict() == {
+            "value": 1,
+            "children": [
+                leaf_dict,
+                {"value": 2, "children": [], "named": {"x": leaf_dict}, "parent": None},
+            ],
+            "named": {
+                "a": {"value": 4, "children": [], "named": {}, "parent": leaf_dict},
+                "b": leaf_dict,
+            },
+            "parent": leaf_dict,
+        }
+
+    def test_container_items_follow_serializers(self):
+        """Test that list and dict items still go through a serializer for their type."""
+
+        class Directory(DataModel):
+            """Data model with containers of addresses serialized as strings.
+
+            Attributes:
+                entries (List[Address]): Addresses in a list.
+                by_name (Dict[str, Address]): Addresses keyed by name.
+                counts (List[int]): Plain integers.
+            """
+
+            entries: List[Address]
+            by_name: Dict[str, Address]
+            counts: List[int]
+            __vldt_config__ = Config(dict_serializer={Address: lambda a: a.city})
+
+        address = {"street": "Elm St", "city": "Town", "postal_code": "3"}
+        model = Directory(entries=[address], by_name={"home": address}, counts=[1, 2])
+        model.counts.append(True)
+        assert model.to_dict() == {
+            "entries": ["Town"],
+            "by_name": {"home": "Town"},
+            "counts": [1, 2, True],
+        }
+
     def test_custom_config_serializer(self):
         """Test that the custom configuration serializer correctly serializes float values."""
         model = ConfigModel(value=3.14159)
@@ -176,6 +407,33 @@ class TestToDictFromDict:
         expected = {"value": "3.14"}
         assert d == expected
 
+    def test_custom_serializer_not_implemented(self):
+        """Test that a serializer returning NotImplemented keeps the raw value."""
+
+        class SelectiveModel(DataModel):
+            """Data model serializing only negative floats.
+
+            Attributes:
+                value (float): A float value.
+            """
+
+            value: float
+            __vldt_config__ = Config(
+                dict_serializer={float: lambda v: "neg" if v < 0 else NotImplemented}
+            )
+
+        assert SelectiveModel(value=-1.5).to_dict() == {"value": "neg"}
+        assert SelectiveModel(value=2.5).to_dict() == {"value": 2.5}
+
+    def test_custom_serializer_for_nested_model(self):
+        """Test that a serializer for a model type wins over nested conversion."""
+        model = AddressSummaryModel(
+            count=True,
+            address={"street": "Main St", "city": "Springfield", "postal_code": "1"},
+        )
+        assert model.to_dict() == {"count": True, "address": "Main St, Springfield"}
+        assert model.to_dict()["count"] is True
+
     def test_missing_fields(self):
         """Test that missing required fields in the input dictionary raise an exception."""
         data = {
@@ -281,3 +539,44 @@ class TestToDictFromDict:
         assert obj.c == 1.0
         assert obj.m.b == "test"
         assert isinstance(obj.m, B)
+
+    def test_union_candidates_with_before_validators(self):
+        """Test that union dispatch keeps candidates whose BEFORE validators fill keys."""
+
+        class Named(DataModel):
+            """Data model with a required name.
+
+            Attributes:
+                name (str): Name.
+            """
+
+            name: str
+
+        class Filled(DataModel):
+            """Data model whose required field is filled by a BEFORE validator.
+
+            Attributes:
+                size (int): Size, defaulted by the validator.
+            """
+
+            size: int
+
+            @model_validator(mode=ValidatorMode.BEFORE)
+            @classmethod
+            def fill_size(cls, values):
+                values.setdefault("size", 7)
+                return values
+
+        class Holder(DataModel):
+            """Data model holding a union of the two models.
+
+            Attributes:
+                item (Union[Named, Filled]): Either model.
+            """
+
+            item: Union[Named, Filled]
+
+        assert isinstance(Holder.from_dict({"item": {"name": "x"}}).item, Named)
+        filled = Holder.from_dict({"item": {}}).item
+        assert isinstance(filled, Filled)
+        assert filled.size == 7
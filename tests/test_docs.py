@@ -202,9 +202,10 @@ class User(DataModel):
             ValueError: If age is invalid.
         """
         if isinstance(age, str):
-            if not age.isdigit():
-                raise ValueError("Age must be a number")
-            age = int(age)
+            try:
+                age = int(age)
+            except ValueError:
+                raise ValueError("Age must be a number") from None
         if age < 18:
             raise ValueError("User must be at least 18 years old")
         return age
@@ -1,7 +1,8 @@
 from random import randint
+from typing import Dict, List, Optional, Set, Union
 
 import pytest
-from vldt import DataModel, Field
+from vldt import DataModel, Field, randint_factory
 
 
 class LiteralDefaultModel(DataModel):
@@ -101,6 +102,125 @@ class TestFieldBehavior:
         assert isinstance(r1.i, int)
         assert isinstance(r2.i, int)
 
+    def test_compiled_defaults(self):
+        """Test that defaults and container factories resolve like provided values."""
+
+        class Defaults(DataModel):
+            """Data model with defaults of several kinds.
+
+            Attributes:
+                count (int): A literal default.
+                label (Optional[str]): An optional field defaulting to None.
+                either (Union[int, str]): A union default.
+                coerced (int): A default that needs conversion.
+                tags (List[str]): A list factory.
+                scores (Dict[str, int]): A dict factory.
+                seen (Set[int]): A set factory.
+            """
+
+            count: int = 42
+            label: Optional[str] = None
+            either: Union[int, str] = "x"
+            coerced: int = "7"
+            tags: List[str] = Field(default_factory=list)
+            scores: Dict[str, int] = Field(default_factory=dict)
+            seen: Set[int] = Field(default_factory=set)
+
+        first = Defaults()
+        second = Defaults()
+        assert first.to_dict() == {
+            "count": 42,
+            "label": None,
+            "either": "x",
+            "coerced": 7,
+            "tags": [],
+            "scores": {},
+            "seen": set(),
+        }
+        first.tags.append("a")
+        first.scores["a"] = 1
+        first.seen.add(1)
+        assert (second.tags, second.scores, second.seen) == ([], {}, set())
+        assert Defaults.from_json("{}").to_dict() == second.to_dict()
+
+    def test_mutable_defaults_are_not_shared(self):
+        """Test that list, dict and set defaults give every instance its own copy."""
+
+        class Bag(DataModel):
+            """Data model with plain mutable defaults.
+
+            Attributes:
+                items (list): An empty list default.
+                counts (dict): An empty dict default.
+                seen (set): An empty set default.
+                tags (List[str]): A non-empty list default.
+                extra (dict): A non-empty dict default given through Field.
+            """
+
+            items: list = []
+            counts: dict = {}
+            seen: set = set()
+            tags: List[str] = ["a"]
+            extra: dict = Field(default={"k": 1})
+
+        first = Bag()
+        second = Bag()
+        first.items.append(1)
+        first.counts["a"] = 1
+        first.seen.add(1)
+        first.tags.append("b")
+        first.extra["k"] = 2
+        assert second.to_dict() == {
+            "items": [],
+            "counts": {},
+            "seen": set(),
+            "tags": ["a"],
+            "extra": {"k": 1},
+        }
+        assert Bag.tags == ["a"]
+
+    def test_nested_mutable_defaults_are_not_shared(self):
+        """Test that containers nested in a default are copied for every instance."""
+
+        class Nested(DataModel):
+            """Data model with defaults holding mutable containers.
+
+            Attributes:
+                rows (list): A list of lists.
+                groups (Dict[str, list]): A dict of lists.
+                flags (set): A set of tuples.
+            """
+
+            rows: list = [[1]]
+            groups: Dict[str, list] = {"a": [1]}
+            flags: set = {(1, 2)}
+
+        first = Nested()
+        second = Nested()
+        first.rows[0].append(2)
+        first.groups["a"].append(2)
+        assert second.rows == [[1]]
+        assert second.groups == {"a": [1]}
+        assert second.flags == {(1, 2)}
+        assert Nested.rows == [[1]]
+
+    def test_randint_factory(self):
+        """Test that randint_factory yields integers within its inclusive bounds."""
+
+        class SeededModel(DataModel):
+            i: int = Field(default_factory=randint_factory(0, 3, seed=42))
+
+        values = {SeededModel().i for _ in range(200)}
+        assert values == {0, 1, 2, 3}
+
+        first = randint_factory(-(2**63), 2**63 - 1, seed=7)
+        second = randint_factory(-(2**63), 2**63 - 1, seed=7)
+        assert [first() for _ in range(5)] == [second() for _ in range(5)]
+        assert randint_factory(5, 5)() == 5
+
+        with pytest.raises(ValueError):
+            randint_factory(3, 2)
+
     def test_alias(self):
         """Test that AliasModel correctly handles alias input and literal default value."""
         m = AliasModel()
@@ -133,6 +253,79 @@ class TestFieldBehavior:
         m3 = MultipleAliasModel.from_dict({"alias1": "value1", "alias2": "value2"})
         assert m3.s == "value1"
 
+        m4 = MultipleAliasModel.from_dict({"alias2": "value2", "alias1": "value1"})
+        assert m4.s == "value1"
+
+    def test_aliases_on_wide_models(self):
+        """Test alias priority on a model with more fields than the scan limit."""
+        namespace = {"__annotations__": {f"f{i}": int for i in range(20)}}
+        namespace.update({f"f{i}": Field(default=i) for i in range(20)})
+        namespace["f19"] = Field(default=0, alias=["late", "later"])
+        Wide = type(DataModel)("Wide", (DataModel,), namespace)
+
+        m = Wide(later=2, late=1, f3=30)
+        assert (m.f19, m.f3, m.f4) == (1, 30, 4)
+        assert Wide(f19=5).f19 == 5
+        assert Wide(later=2, f19=5).f19 == 2
+
+    def test_aliases_frozen_at_first_use(self):
+        """Test that the schema keeps its own copy of a field's aliases."""
+        field = Field(default="unset", alias=["first", "second"])
+
+        class FrozenAliasModel(DataModel):
+            """Data model whose alias list is changed after first use.
+
+            Attributes:
+                s (str): Field with aliases "first" and "second".
+            """
+
+            s: str = field
+
+        assert FrozenAliasModel.from_dict({"second": "x"}).s == "x"
+        assert field.alias == ("first", "second")
+        field.alias += ("third",)
+        assert FrozenAliasModel.from_dict({"third": "y"}).s == "unset"
+        assert FrozenAliasModel.from_json('{"first": "z"}').s == "z"
+
+    def test_alias_tuples_are_shared(self):
+        """Test that Field stores aliases as one shared tuple per alias set."""
+        first = Field(alias=["a", "b"])
+        second = Field(alias=("a", "b"))
+        assert first.alias == ("a", "b")
+        assert first.alias is second.alias
+        assert Field(alias="a").alias == ("a",)
+        assert Field().alias == ()
+
+    def test_alias_takes_priority_over_field_name(self):
+        """Test that an alias wins over the canonical name regardless of key order."""
+
+        class PriorityModel(DataModel):
+            """Data model with an aliased field next to a plain one.
+
+            Attributes:
+                s (str): Field with aliases "alias1" and "alias2".
+                n (int): Field without aliases.
+            """
+
+            s: str = Field(alias=["alias1", "alias2"])
+            n: int = 0
+
+        m = PriorityModel.from_dict({"s": "name", "alias2": "second", "n": 3})
+        assert m.s == "second"
+        assert m.n == 3
+
+        m2 = PriorityModel(s="name", extra="ignored")
+        assert m2.s == "name"
+        assert m2.n == 0
+
+        m3 = PriorityModel.from_json('{"s": "name", "alias2": "second", "n": 3}')
+        assert m3.s == "second"
+        assert m3.n == 3
+
+        m4 = PriorityModel.from_json('{"alias2": "second", "alias1": "first"}')
+        assert m4.s == "first"
+        assert m4.n == 0
+
     def test_missing_field(self):
         """Test that MissingFieldModel raises an error when a required field is missing."""
         with pytest.raises(Exception):
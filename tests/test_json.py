@@ -8,7 +8,7 @@ from typing import List, Dict, Optional
 import json
 import pytest
 
-from vldt import DataModel
+from vldt import DataModel, ValidatorMode, model_validator
 from vldt.config import Config
 
 
@@ -95,6 +95,53 @@ class ConfigModel(DataModel):
     __vldt_config__ = Config(json_serializer={float: custom_float_serializer})
 
 
+class TaggedModel(DataModel):
+    """Data model with a before model validator, loaded via keyword arguments.
+
+    Attributes:
+        name (str): A name.
+        tag (str): A tag with a default value.
+        seen (List[str]): Keys of the input data, recorded by the validator.
+    """
+
+    name: str
+    tag: str = "none"
+    seen: List[str] = []
+
+    @model_validator(mode=ValidatorMode.BEFORE)
+    @classmethod
+    def record_keys(cls, data: dict):
+        data["seen"] = sorted(data)
+        return data
+
+
+class Envelope(DataModel):
+    """Data model whose validator parses another JSON document.
+
+    Attributes:
+        payload (str): A JSON encoded Address.
+        city (str): Filled in from the payload by the validator.
+    """
+
+    payload: str
+    city: str = ""
+
+    @model_validator(mode=ValidatorMode.AFTER)
+    def parse_payload(self):
+        self.city = Address.from_json(self.payload).city
+
+
+class CachedCollection(CollectionModel):
+    """Collection model whose from_json results are cached.
+
+    Attributes:
+        items (List[int]): A list of integers.
+        mapping (Dict[str, Address]): A dictionary mapping strings to Address objects.
+    """
+
+    __vldt_config__ = Config(cache_from_json=2)
+
+
 class TestToJsonFromJson:
     """Pytest class for testing JSON serialization and deserialization of data models."""
 
@@ -114,6 +161,21 @@ class TestToJsonFromJson:
         }
         assert d == expected
 
+    def test_to_json_large_ints_and_strings(self):
+        """Test that ints beyond 64 bits and strings with NULs or non-ASCII survive to_json."""
+        data = {
+            "items": [2**63 - 1, 2**64 - 1, 2**70, -(2**70)],
+            "mapping": {
+                "caf\u00e9": {
+                    "street": "a\x00b",
+                    "city": "\u00fcber",
+                    "postal_code": "1",
+                }
+            },
+        }
+        coll = CollectionModel.from_dict(data)
+        assert json.loads(coll.to_json()) == data
+
     def test_from_json_round_trip(self):
         """Test that converting from JSON to a User model and back is consistent."""
         data = {
@@ -187,6 +249,47 @@ class TestToJsonFromJson:
         expected = {"value": "3.14"}
         assert d == expected
 
+    def test_custom_serializer_field_types(self):
+        """Test that json_serializer entries apply to optional, nested and extra values."""
+
+        class Reading(DataModel):
+            """Data model mixing serialized, plain and nested fields.
+
+            Attributes:
+                value (Optional[float]): A float serialized with two decimals.
+                count (int): A plain integer.
+                nested (Optional[ConfigModel]): A nested model with the same serializer.
+            """
+
+            value: Optional[float]
+            count: int
+            nested: Optional[ConfigModel] = None
+            __vldt_config__ = Config(json_serializer={float: custom_float_serializer})
+
+        reading = Reading(value=1.005, count=True, nested=ConfigModel(value=2.0))
+        reading.extra = 0.5
+        assert json.loads(reading.to_json()) == {
+            "value": "1.00",
+            "count": True,
+            "nested": {"value": "2.00"},
+            "extra": "0.50",
+        }
+        assert json.loads(Reading(value=None, count=1).to_json()) == {
+            "value": None,
+            "count": 1,
+            "nested": None,
+        }
+
+        def failing_serializer(value):
+            raise RuntimeError("cannot serialize")
+
+        class Failing(DataModel):
+            value: float
+            __vldt_config__ = Config(json_serializer={float: failing_serializer})
+
+        with pytest.raises(RuntimeError, match="cannot serialize"):
+            Failing(value=1.0).to_json()
+
     def test_missing_fields(self):
         """Test that a validation error is raised when required fields are missing."""
         data = {
@@ -229,6 +332,130 @@ class TestToJsonFromJson:
         except Exception:
             pass
 
+    def test_decoded_keys_are_shared(self):
+        """Test that short ASCII keys decode to shared str objects."""
+
+        class Counts(DataModel):
+            """Data model with a dictionary of counters.
+
+            Attributes:
+                counts (Dict[str, int]): Counters by name.
+            """
+
+            counts: Dict[str, int]
+
+        long_key = "k" * 100
+        payload = json.dumps({"counts": {"visits": 1, "caf\u00e9": 2, long_key: 3}})
+        first = Counts.from_json(payload)
+        second = Counts.from_json(payload)
+        assert first.counts == {"visits": 1, "caf\u00e9": 2, long_key: 3}
+        assert next(iter(first.counts)) is next(iter(second.counts))
+
+    def test_non_ascii_field_names(self):
+        """Test that field names outside ASCII are written and read back in full."""
+
+        class Menu(DataModel):
+            """Data model with a non-ASCII field name.
+
+            Attributes:
+                café (str): The café name.
+                size (int): The menu size.
+            """
+
+            café: str
+            size: int
+
+        menu = Menu(café="Zoë", size=2)
+        assert json.loads(menu.to_json()) == {"café": "Zoë", "size": 2}
+        assert Menu.from_json(menu.to_json()).to_dict() == {"café": "Zoë", "size": 2}
+
+    def test_from_json_bytes(self):
+        """Test that from_json accepts UTF-8 bytes and bytearray input."""
+        data = {"street": "Straße 1", "city": "Zürich", "postal_code": "8000"}
+        payload = json.dumps(data, ensure_ascii=False).encode()
+        assert Address.from_json(payload).to_dict() == data
+        assert Address.from_json(bytearray(payload)).to_dict() == data
+        with pytest.raises(TypeError):
+            Address.from_json(memoryview(payload))
+        with pytest.raises(ValueError):
+            Address.from_json(b"")
+
+    def test_from_json_cache(self):
+        """Test that cached from_json results are returned as independent copies."""
+        payload = json.dumps(
+            {
+                "items": [1, 2],
+                "mapping": {"a": {"street": "S", "city": "C", "postal_code": "P"}},
+            }
+        )
+        first = CachedCollection.from_json(payload)
+        first.items.append(3)
+        first.mapping["a"].city = "Changed"
+        second = CachedCollection.from_json(payload.encode())
+        third = CachedCollection.from_json(payload)
+        assert type(third) is CachedCollection
+        assert third.items == [1, 2]
+        assert third.mapping["a"].city == "C"
+        assert third.items is not second.items
+        assert CachedCollection.__vldt_from_json_cache__.cache_info().hits == 1
+        assert CollectionModel.from_json(payload).items == [1, 2]
+
+        class Uncached(CachedCollection):
+            __vldt_config__ = Config()
+
+        assert type(Uncached.from_json(payload)) is Uncached
+        with pytest.raises(ValueError):
+            CachedCollection.from_json(b"")
+
+    def test_from_json_key_order(self):
+        """Test that fields are found whether or not keys follow declaration order."""
+        in_order = '{"street": "A", "city": "B", "postal_code": "C"}'
+        shuffled = '{"postal_code": "C", "extra": 1, "street": "A", "city": "B"}'
+        partial = '{"street": "A", "postal_code": "C", "city": "B"}'
+        for doc in (in_order, shuffled, partial):
+            address = Address.from_json(doc)
+            assert address.to_dict() == {"street": "A", "city": "B", "postal_code": "C"}
+            assert Address.from_dict(json.loads(doc)).to_dict() == address.to_dict()
+
+    def test_from_json_repeated_keys(self):
+        """Test that the last of repeated keys wins, as with json.loads."""
+        from vldt import Field
+
+        class Aliased(DataModel):
+            """Data model whose field is read through aliases.
+
+            Attributes:
+                s (str): Field with aliases "a1" and "a2".
+            """
+
+            s: str = Field(alias=["a1", "a2"])
+
+        docs = [
+            '{"street": "A", "street": "Z", "city": "B", "postal_code": "C"}',
+            '{"street": "A", "city": "B", "postal_code": "C", "street": "Z"}',
+            '{"city": "B", "street": "A", "postal_code": "C", "street": "Z"}',
+        ]
+        for doc in docs:
+            assert Address.from_json(doc).street == "Z"
+            assert Address.from_dict(json.loads(doc)).street == "Z"
+        assert Aliased.from_json('{"a1": "x", "a1": "y"}').s == "y"
+        assert Aliased.from_json('{"a1": "x", "a2": "z", "a1": "y"}').s == "y"
+
+    def test_from_json_with_before_validator(self):
+        """Test that absent fields are not passed to before validators."""
+        model = TaggedModel.from_json('{"name": "x", "extra": 1}')
+        assert model.name == "x"
+        assert model.tag == "none"
+        assert model.seen == ["extra", "name"]
+
+    def test_from_json_inside_validator(self):
+        """Test that from_json can be called while another document is parsed."""
+        payload = json.dumps(
+            {"street": "Main", "city": "Springfield", "postal_code": "12345"}
+        )
+        models = Envelope.from_json_many(json.dumps([{"payload": payload}] * 3))
+        assert [model.city for model in models] == ["Springfield"] * 3
+
     def test_none_handling(self):
         """Test that fields with None values are preserved during JSON serialization and deserialization."""
         data = {
@@ -247,3 +474,109 @@ class TestToJsonFromJson:
         user = User.from_json(json_str)
         d = json.loads(user.to_json())
         assert d == data
+
+    def test_nested_model_errors(self):
+        """Test that errors in a nested model are reported with the nested field path."""
+        data = {
+            "id": 8,
+            "name": "Grace",
+            "age": 41,
+            "active": True,
+            "address": {
+                "street": "Eighth St",
+                "city": "Ninth City",
+                "unknown": {"deep": [1, 2, 3]},
+            },
+            "notes": None,
+        }
+        with pytest.raises(TypeError) as exc_info:
+            User.from_json(json.dumps(data))
+        errors = json.loads(str(exc_info.value))
+        assert errors == {"address.postal_code": "Missing required field"}
+
+    def test_model_lists_and_optional_models(self):
+        """Test that lists of models and optional models load like from_dict."""
+
+        class Shipment(DataModel):
+            """Data model with model list and optional model fields.
+
+            Attributes:
+                stops (List[Address]): Addresses on the route.
+                origin (Optional[Address]): Where the shipment starts.
+            """
+
+            stops: List[Address]
+            origin: Optional[Address] = None
+
+        stop = {"street": "Main St", "city": "Town", "postal_code": "1"}
+        data = {"stops": [stop, stop], "origin": stop}
+        shipment = Shipment.from_json(json.dumps(data))
+        assert shipment.to_dict() == Shipment.from_dict(data).to_dict()
+        assert all(type(item) is Address for item in shipment.stops)
+        assert type(shipment.origin) is Address
+        assert Shipment.from_json('{"stops": []}').origin is None
+
+        for bad in (
+            {"stops": [stop, {"street": "Main St"}, 3]},
+            {"stops": [stop, 3]},
+            {"stops": [stop], "origin": {"street": "Main St"}},
+        ):
+            with pytest.raises(TypeError) as from_json_info:
+                Shipment.from_json(json.dumps(bad))
+            with pytest.raises(TypeError) as from_dict_info:
+                Shipment.from_dict(bad)
+            assert json.loads(str(from_json_info.value)) == json.loads(
+                str(from_dict_info.value)
+            )
+
+    def test_from_json_many_array(self):
+        """Test that a JSON array of objects is loaded into a list of models."""
+        data = [
+            {"name": "Acme", "industry": "Tools", "employees": 10},
+            {"name": "Globex", "industry": "Energy", "employees": 250},
+        ]
+        companies = Company.from_json_many(json.dumps(data))
+        assert isinstance(companies, list)
+        assert [c.to_dict() for c in companies] == data
+
+    def test_from_json_many_ndjson(self):
+        """Test that newline-delimited JSON is loaded from str and bytes input."""
+        data = [
+            {"name": "Acme", "industry": "Tools", "employees": 10},
+            {"name": "Globex", "industry": "Energy", "employees": 250},
+        ]
+        ndjson = "\n".join(json.dumps(item) for item in data) + "\n\n"
+        assert [c.to_dict() for c in Company.from_json_many(ndjson)] == data
+        assert [c.to_dict() for c in Company.from_json_many(ndjson.encode())] == data
+        assert Company.from_json_many("") == []
+        assert Company.from_json_many("[]") == []
+
+    def test_from_json_many_errors(self):
+        """Test that malformed documents and invalid items raise errors."""
+        with pytest.raises(ValueError):
+            Company.from_json_many(
+                '{"name": "Acme", "industry": "Tools", "employees": 1}\n{"name": '
+            )
+        with pytest.raises(TypeError):
+            Company.from_json_many("[1, 2]")
+        with pytest.raises(TypeError):
+            Company.from_json_many('{"name": "Acme", "industry": "Tools"}')
+
+    def test_from_json_many_custom_init(self):
+        """Test that from_json_many calls an overridden __init__ for every item."""
+
+        class CountedCompany(Company):
+            created = 0
+
+            def __init__(self, **kwargs):
+                type(self).created += 1
+                super().__init__(**kwargs)
+
+        data = [
+            {"name": "Acme", "industry": "Tools", "employees": 10},
+            {"name": "Globex", "industry": "Energy", "employees": 250},
+        ]
+        companies = CountedCompany.from_json_many(json.dumps(data))
+        assert [c.to_dict() for c in companies] == data
+        assert CountedCompany.from_json(json.dumps(data[0])).name == "Acme"
+        assert CountedCompany.created == 3
@@ -1,7 +1,13 @@
+from collections.abc import Sized
 from datetime import datetime
-from uuid import UUID
+from enum import IntEnum
+from typing import Dict, List, Optional, Union
+from uuid import UUID, SafeUUID
 
-from vldt import DataModel
+import pytest
+
+from tests.conftest import type_error_to_dict
+from vldt import DataModel, parse_uuid_fast, round2
 
 
 class ModelWithManyTypes(DataModel):
@@ -69,3 +75,322 @@ class TestTypes:
         assert obj.height == 1.75
         assert obj.is_active is True
         assert obj.created_at == datetime(2021, 1, 1, 12, 0)
+
+    def test_int_from_digit_string(self):
+        """Test that numeric strings are coerced to int for any length and shape.
+
+        Pure ASCII digit strings are parsed directly, while other forms accepted
+        by int() (signs, whitespace, very long values) keep working.
+        """
+        base = {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "name": "Alice",
+            "height": 1.75,
+            "is_active": True,
+            "created_at": "2021-01-01T12:00:00",
+        }
+        for raw in [
+            "0",
+            "7",
+            "0042",
+            "12345678",
+            "123456789012345",
+            "9999999999999999999",
+            "123456789012345678901234567890",
+            "-15",
+            " 30 ",
+            "1_000",
+        ]:
+            obj = ModelWithManyTypes.from_dict({**base, "age": raw})
+            assert obj.age == int(raw)
+
+
+class PrimitiveLists(DataModel):
+    """Data model with lists of primitive types.
+
+    Attributes:
+        scores (List[int]): Integer scores.
+        weights (List[float]): Float weights.
+        tags (List[str]): String tags.
+    """
+
+    scores: List[int]
+    weights: List[float]
+    tags: List[str]
+
+
+class TestPrimitiveLists:
+    """Test suite for lists of primitive item types."""
+
+    def test_mixed_items(self):
+        """Test that exact-type items are kept and other items are converted."""
+        scores = [1, "2", True]
+        obj = PrimitiveLists(scores=scores, weights=[1, 2.5], tags=["a", 3])
+        assert obj.scores == [1, 2, True]
+        assert obj.scores is not scores
+        assert obj.weights == [1.0, 2.5]
+        assert all(type(w) is float for w in obj.weights)
+        assert obj.tags == ["a", "3"]
+
+    def test_invalid_item(self):
+        """Test that an invalid item reports its index in the error path."""
+        with pytest.raises(TypeError, match="scores.1"):
+            PrimitiveLists(scores=[1, "x"], weights=[], tags=[])
+
+    def test_models_defined_repeatedly(self):
+        """Test that classes sharing annotations validate independently."""
+        for _ in range(3):
+
+            class Item(DataModel):
+                scores: List[int]
+
+            class Holder(DataModel):
+                scores: List[int]
+                items: List[Item]
+
+            holder = Holder(scores=["1"], items=[{"scores": [2]}])
+            assert holder.scores == [1]
+            assert type(holder.items[0]) is Item
+            assert holder.items[0].scores == [2]
+            with pytest.raises(TypeError, match="scores.0"):
+                Item(scores=["x"])
+
+
+class TestDictItems:
+    """Test suite for dictionaries of plain and model values."""
+
+    def test_mixed_items(self):
+        """Test that exact-type items are kept and other items are converted."""
+
+        class Point(DataModel):
+            x: int
+
+        class Holder(DataModel):
+            counts: Dict[str, int]
+            points: Dict[str, Point]
+
+        point = Point(x=1)
+        holder = Holder(
+            counts={"a": 1, "b": "2", 3: 3}, points={"p": point, "q": {"x": 2}}
+        )
+        assert holder.counts == {"a": 1, "b": 2, "3": 3}
+        assert holder.points["p"] is point
+        assert type(holder.points["q"]) is Point
+        assert holder.points["q"].x == 2
+        with pytest.raises(TypeError, match="counts.b"):
+            Holder(counts={"a": 1, "b": "x"}, points={})
+        with pytest.raises(TypeError, match="points.q"):
+            Holder(counts={}, points={"p": point, "q": {"x": "x"}})
+
+
+class TestSubclassValues:
+    """Test suite for values whose type subclasses the declared field type."""
+
+    def test_subclass_values_are_kept(self):
+        """Test that subclass instances pass plain and ABC checks unchanged."""
+
+        class Label(str):
+            pass
+
+        class Level(IntEnum):
+            LOW = 1
+
+        class Tagged(DataModel):
+            label: str
+            level: int
+            size: Sized
+            either: Union[float, str]
+
+        label = Label("x")
+        model = Tagged(label=label, level=Level.LOW, size=[1], either=label)
+        assert model.label is label
+        assert model.level is Level.LOW
+        assert model.size == [1]
+        assert model.either is label
+        with pytest.raises(TypeError, match="size"):
+            Tagged(label="x", level=1, size=3, either=1.0)
+
+    def test_exact_values_are_kept(self):
+        """Test that values of exactly the declared type are stored as given."""
+
+        class Stamp(DataModel):
+            at: datetime
+
+        class Event(DataModel):
+            name: str
+            when: datetime
+            stamp: Stamp
+            tags: List[str]
+
+        name = "".join(["dep", "loy"])
+        when = datetime(2025, 1, 2, 3, 4, 5)
+        stamp = Stamp(at=when)
+        for event in (
+            Event(name=name, when=when, stamp=stamp, tags=[name]),
+            Event.from_dict({"name": name, "when": when, "stamp": stamp, "tags": []}),
+        ):
+            assert event.name is name
+            assert event.when is when
+            assert event.stamp is stamp
+        event.when = when
+        assert event.when is when
+
+    def test_union_values_are_kept(self):
+        """Test that unions keep candidate values and still convert the others."""
+
+        class Stamp(DataModel):
+            at: datetime
+
+        class Entry(DataModel):
+            key: Union[int, str]
+            stamp: Optional[Stamp] = None
+            amount: Union[float, None] = None
+
+        key = 10**20
+        stamp = Stamp(at=datetime(2025, 1, 2))
+        entry = Entry(key=key, stamp=stamp, amount=1.5)
+        assert entry.key is key
+        assert entry.stamp is stamp
+        assert Entry(key=True).key is True
+        assert Entry(key="a").key == "a"
+        assert Entry(key=1, stamp={"at": datetime(2025, 1, 2)}).stamp == stamp
+        assert Entry(key=1, amount=2).amount == 2
+        with pytest.raises(TypeError, match="did not match any candidate"):
+            Entry(key=1, amount="x")
+
+    def test_shared_generic_schemas(self):
+        """Test that models sharing generic annotations keep their own semantics."""
+
+        class Stamp(DataModel):
+            at: datetime
+
+        class IntFirst(DataModel):
+            key: Union[int, str]
+            stamps: Dict[str, List[Stamp]]
+
+        class StrFirst(DataModel):
+            key: Union[str, int]
+            stamps: Dict[str, List[Stamp]]
+
+        when = datetime(2025, 1, 2)
+        assert IntFirst(key=1.5, stamps={}).key == 1
+        assert StrFirst(key=1.5, stamps={}).key == "1.5"
+        stamps = StrFirst(key="a", stamps={"a": [{"at": when}]}).stamps
+        assert stamps == {"a": [Stamp(at=when)]}
+        with pytest.raises(TypeError) as exc:
+            IntFirst(key=1, stamps={"a": [{"at": "never"}]})
+        assert list(type_error_to_dict(exc)) == ["stamps.a.0.at"]
+
+    def test_builtin_and_typing_generics_match(self):
+        """Test that list/dict spellings from typing and builtins validate alike."""
+
+        class Typed(DataModel):
+            counts: Dict[str, List[int]]
+
+        class Builtin(DataModel):
+            counts: dict[str, list[int]]
+
+        for model in (Typed, Builtin, Typed):
+            assert model(counts={"a": [1, "2"]}).counts == {"a": [1, 2]}
+            with pytest.raises(TypeError) as exc:
+                model(counts={"a": ["x"]})
+            assert type_error_to_dict(exc) == {
+                "counts.a.0": "Expected type int, got str"
+            }
+            with pytest.raises(TypeError) as exc:
+                model(counts=[])
+            assert type_error_to_dict(exc) == {"counts": "Expected a dict, got list"}
+
+
+class TestTypeErrors:
+    """Test suite for the messages of failed plain type checks."""
+
+    def test_class_names_in_messages(self):
+        """Test that messages name the expected class and the value's type."""
+
+        class Slot:
+            pass
+
+        class Holder(DataModel):
+            slot: Slot
+            when: datetime
+
+        with pytest.raises(TypeError) as exc:
+            Holder(slot=1, when=[])
+        assert type_error_to_dict(exc) == {
+            "slot": "Expected type Slot, got int",
+            "when": "Expected type datetime, got list",
+        }
+
+
+class TestParseUuidFast:
+    """Test suite for the UUID string parser used by the default deserializer."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "123e4567-e89b-12d3-a456-426614174000",
+            "123E4567-E89B-12D3-A456-426614174000",
+            "123e4567e89b12d3a456426614174000",
+            "{123e4567-e89b-12d3-a456-426614174000}",
+            "urn:uuid:123e4567-e89b-12d3-a456-426614174000",
+        ],
+    )
+    def test_matches_uuid(self, value):
+        """Test that parsed values behave exactly like uuid.UUID(value)."""
+        parsed = parse_uuid_fast(value)
+        expected = UUID(value)
+        assert type(parsed) is UUID
+        assert parsed == expected
+        assert hash(parsed) == hash(expected)
+        assert str(parsed) == str(expected)
+        assert parsed.is_safe is SafeUUID.unknown
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "123e4567-e89b-12d3-a456-42661417400g",
+            "123e4567-e89b-12d3-a456_426614174000",
+            "123e4567",
+            "",
+        ],
+    )
+    def test_invalid(self, value):
+        """Test that malformed strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_uuid_fast(value)
+
+
+class TestRound2:
+    """Test suite for the two-decimal rounding helper."""
+
+    def test_matches_round(self):
+        """Test that round2 agrees with round(value, 2), including ties and signs."""
+        values = [
+            0.0,
+            -0.0,
+            1.005,
+            2.675,
+            0.125,
+            0.135,
+            -0.125,
+            -2.675,
+            123.4567,
+            1e-9,
+            -1e-9,
+            12345678.915,
+            1e20,
+            float("inf"),
+            float("-inf"),
+        ]
+        values += [i / 1000 for i in range(-5000, 5000)]
+        for value in values:
+            expected = round(value, 2)
+            result = round2(value)
+            assert result == expected, value
+            assert str(result) == str(expected), value
+
+    def test_non_float(self):
+        """Test that non-float numbers fall back to their own __round__."""
+        assert round2(5) == 5
+        assert type(round2(5)) is int
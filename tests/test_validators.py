@@ -1,8 +1,14 @@
 """Module containing data models and pytest test cases for validating them using vldt."""
 
 import pytest
-from typing import Any
-from vldt import DataModel, field_validator, model_validator, ValidatorMode
+from typing import Any, ClassVar
+from vldt import (
+    DataModel,
+    ValidatorMode,
+    builtin_field_validator,
+    field_validator,
+    model_validator,
+)
 
 
 class Person(DataModel):
@@ -34,9 +40,10 @@ class Person(DataModel):
             if age < 18:
                 raise ValueError("Person must be older than 18 years old")
         elif isinstance(age, str):
-            if not age.isdigit():
-                raise ValueError("Age must be a number")
-            age = int(age)
+            try:
+                age = int(age)
+            except ValueError:
+                raise ValueError("Age must be a number") from None
             if age < 18:
                 raise ValueError("Person must be older than 18 years old")
         else:
@@ -212,6 +219,8 @@ class TestPersonModel:
         """Test that a non-numeric age string raises a ValueError."""
         with pytest.raises(ValueError, match="Age must be a number"):
             Person(name="bob", age="abc")
+        with pytest.raises(ValueError, match="Age must be a number"):
+            Person(name="bob", age="2\u00b2")
 
     def test_invalid_person_age_underage(self):
         """Test that an underage person raises a ValueError."""
@@ -223,6 +232,29 @@ class TestPersonModel:
         with pytest.raises(TypeError):
             Person(name="dave")  # 'age' is missing
 
+    def test_before_validators_leave_input_unchanged(self):
+        """Test that BEFORE validators do not modify the caller's dictionaries."""
+
+        class Team(DataModel):
+            """Data model nesting a Person.
+
+            Attributes:
+                lead (Person): The team lead.
+            """
+
+            lead: Person
+
+        data = {"name": "john", "age": "25"}
+        p = Person.from_dict(data)
+        assert p.name == "John"
+        assert p.age == 25
+        assert data == {"name": "john", "age": "25"}
+
+        team_data = {"lead": {"name": "ann", "age": "40"}}
+        team = Team.from_dict(team_data)
+        assert team.lead.name == "Ann"
+        assert team_data == {"lead": {"name": "ann", "age": "40"}}
+
 
 class TestProductModel:
     """Test cases for the Product model."""
@@ -252,6 +284,121 @@ class TestOrderModel:
         order = Order(id=1, total=123.4567)
         assert order.total == round(123.4567, 2)
 
+    def test_model_before_validator_without_arguments(self):
+        """Test that a BEFORE model validator also runs when no arguments are given."""
+
+        class Defaults(DataModel):
+            """Data model whose BEFORE validator supplies the values.
+
+            Attributes:
+                id (int): The identifier.
+            """
+
+            id: int
+
+            @model_validator(mode=ValidatorMode.BEFORE)
+            @classmethod
+            def fill(cls, data: dict):
+                """Provide the id when it is missing."""
+                return {"id": data.get("id", 1)}
+
+        assert Defaults().id == 1
+        assert Defaults(id=2).id == 2
+
+    def test_proxy_class_attributes_are_not_validators(self):
+        """Test that attributes answering every lookup with None are skipped."""
+
+        class Proxy:
+            def __getattr__(self, name):
+                return None
+
+        class WithProxy(DataModel):
+            """Data model holding a proxy object as a class attribute.
+
+            Attributes:
+                id (int): The identifier.
+            """
+
+            id: int
+            proxy = Proxy()
+
+            @model_validator(mode=ValidatorMode.AFTER)
+            def check(self):
+                """Reject negative identifiers."""
+                if self.id < 0:
+                    raise ValueError("negative id")
+
+        assert WithProxy(id=1).id == 1
+        with pytest.raises(ValueError):
+            WithProxy(id=-1)
+
+    def test_validators_among_plain_attributes(self):
+        """Test that validators are collected next to plain class attributes."""
+
+        def make_validator():
+            @field_validator(mode=ValidatorMode.BEFORE)
+            @classmethod
+            def double(cls, id):
+                """Double the raw identifier."""
+                return id * 2
+
+            return double
+
+        class Mixed(DataModel):
+            """Data model mixing constants and validators in its namespace.
+
+            Attributes:
+                id (int): The identifier.
+                name (str): The name.
+            """
+
+            id: int
+            name: str = "x"
+            LIMIT: ClassVar[int] = 100
+            TAGS: ClassVar[tuple] = ("a", "b")
+            double = make_validator()
+
+            @field_validator(mode=ValidatorMode.AFTER)
+            @classmethod
+            def upper(cls, name):
+                """Upper-case the name."""
+                return name.upper()
+
+            @model_validator(mode=ValidatorMode.AFTER)
+            def check(self):
+                """Reject identifiers above the limit."""
+                if self.id > self.LIMIT:
+                    raise ValueError("id too large")
+
+        model = Mixed(id=3, name="bob")
+        assert (model.id, model.name) == (6, "BOB")
+        assert list(Mixed.__vldt_validators__["field_before"]) == ["id"]
+        with pytest.raises(ValueError):
+            Mixed(id=60)
+
+    def test_collect_validators(self):
+        """Test the native collector on a model mixing validators and constants."""
+        from vldt._vldt import collect_validators
+
+        collected = collect_validators(
+            Applicant,
+            "__vldt_field_validator__",
+            "__vldt_model_validator__",
+            ValidatorMode.BEFORE,
+            ValidatorMode.AFTER,
+        )
+        field_before, field_after, model_before, model_after, await_free = collected
+        assert field_before == {"age": [Applicant.check_age_digits]}
+        assert field_after == {
+            "age": [Applicant.check_age],
+            "score": [Applicant.check_score_min, Applicant.check_score_max],
+            "name": [Applicant.check_name],
+        }
+        assert model_before == model_after == []
+        assert await_free is False
+        with pytest.raises(TypeError):
+            collect_validators(Applicant, "a", "b")
+
 
 class TestModelValidatorInstanceMethod:
     """Test cases for models with instance method validators."""
@@ -262,6 +409,51 @@ class TestModelValidatorInstanceMethod:
         assert emp.name == "JANE"
 
 
+class TestFieldAfterValidators:
+    """Test cases for how field AFTER validator results are stored."""
+
+    def test_results_are_validated(self):
+        """Test that returned values are checked and converted like assignments."""
+
+        class Reading(DataModel):
+            value: int
+            label: str
+
+            @field_validator(mode=ValidatorMode.AFTER)
+            @classmethod
+            def double_value(cls, value: int):
+                return str(value * 2) if value < 100 else "many"
+
+            @field_validator(mode=ValidatorMode.AFTER)
+            @classmethod
+            def keep_label(cls, label: str):
+                return label
+
+        reading = Reading(value=2, label="x")
+        assert reading.value == 4
+        with pytest.raises(TypeError, match="value"):
+            Reading(value=100, label="x")
+
+    def test_custom_setattr_sees_results(self):
+        """Test that a Python __setattr__ override still receives the results."""
+        seen = []
+
+        class Audited(DataModel):
+            name: str
+
+            @field_validator(mode=ValidatorMode.AFTER)
+            @classmethod
+            def keep_name(cls, name: str):
+                return name
+
+            def __setattr__(self, key, value):
+                seen.append(key)
+                super().__setattr__(key, value)
+
+        assert Audited(name="x").name == "x"
+        assert seen == ["name"]
+
+
 class TestInvalidValidatorSignature:
     """Test cases for models with invalid validator signatures."""
 
@@ -271,3 +463,82 @@ class TestInvalidValidatorSignature:
             ValueError, match="Field validator must have exactly one field parameter"
         ):
             create_invalid_validator_model()
+
+    def test_parameter_names_match_signature(self):
+        """Test that code-object parameter names agree with inspect.signature."""
+        import functools
+        import inspect
+        from vldt.validators import _parameter_names
+
+        def plain(cls, value):
+            return value
+
+        def star(cls, *values, **options):
+            return values
+
+        def keyword(cls, *, value):
+            return value
+
+        @functools.wraps(plain)
+        def wrapped(*args):
+            return plain(*args)
+
+        funcs = [plain, star, keyword, wrapped, functools.partial(plain, None)]
+        for func in funcs:
+            assert _parameter_names(func) == tuple(inspect.signature(func).parameters)
+
+
+class Applicant(DataModel):
+    """Data model validated only by builtin validators.
+
+    Attributes:
+        name (str): The applicant's name.
+        age (int): The applicant's age.
+        score (float): The applicant's score.
+    """
+
+    name: str
+    age: int
+    score: float
+
+    check_age_digits = builtin_field_validator(
+        "age", "isdigit", mode=ValidatorMode.BEFORE
+    )
+    check_age = builtin_field_validator("age", "min_value", 18)
+    check_score_min = builtin_field_validator("score", "nonneg")
+    check_score_max = builtin_field_validator("score", "max_value", 100.0)
+    check_name = builtin_field_validator("name", "capitalize")
+
+
+class TestBuiltinValidators:
+    """Test cases for validators from the builtin registry."""
+
+    def test_valid_applicant(self):
+        """Test that builtin validators pass and transform valid values."""
+        applicant = Applicant(name="alice", age="30", score=99.5)
+        assert applicant.name == "Alice"
+        assert applicant.age == 30
+        assert applicant.score == 99.5
+
+    def test_bounds(self):
+        """Test that min_value, max_value and nonneg reject out-of-range values."""
+        with pytest.raises(ValueError, match="age must be greater than or equal to 18"):
+            Applicant(name="bob", age="17", score=10)
+        with pytest.raises(ValueError, match="score must be non-negative"):
+            Applicant(name="bob", age="20", score=-1)
+        with pytest.raises(
+            ValueError, match="score must be less than or equal to 100.0"
+        ):
+            Applicant(name="bob", age="20", score=100.5)
+
+    def test_isdigit(self):
+        """Test that isdigit rejects non-digit strings."""
+        with pytest.raises(ValueError, match="age must be a number"):
+            Applicant(name="bob", age="twenty", score=1)
+
+    def test_unknown_builtin(self):
+        """Test that unknown names and wrong argument counts are rejected."""
+        with pytest.raises(ValueError, match="Unknown builtin validator"):
+            builtin_field_validator("age", "no_such_check")
+        with pytest.raises(TypeError, match="takes 1 argument"):
+            builtin_field_validator("age", "min_value")
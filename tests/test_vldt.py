@@ -1,10 +1,12 @@
 import copy
+import functools
+import weakref
 from typing import ClassVar, Union, Optional, List, Dict, Any
 
 import pytest
 
 from tests.conftest import type_error_to_dict
-from vldt import DataModel, Field
+from vldt import Config, DataModel, Field
 
 
 class Address(DataModel):
@@ -125,6 +127,34 @@ class TestDataModelValidation:
         error = type_error_to_dict(exc)
         assert error == {"count": "Expected type int, got str"}
 
+    def test_type_error_messages_per_validator(self):
+        """Test the type error message of each primitive and container check."""
+
+        class Mixed(DataModel):
+            """A model with one field per built-in check.
+
+            Attributes:
+                count (int): An integer.
+                ratio (float): A float.
+                flags (List[int]): A list of integers.
+                mapping (Dict[str, int]): A mapping of integers.
+            """
+
+            count: int
+            ratio: float
+            flags: List[int]
+            mapping: Dict[str, int]
+
+        for _ in range(3):
+            with pytest.raises(TypeError) as exc:
+                Mixed(count=object(), ratio="x", flags=5, mapping=[])
+            assert type_error_to_dict(exc) == {
+                "count": "Expected type int, got object",
+                "ratio": "Expected type float, got str",
+                "flags": "Expected a list, got int",
+                "mapping": "Expected a dict, got list",
+            }
+
     def test_optional_fields(self):
         """Test optional fields with default values.
 
@@ -192,6 +222,8 @@ class TestDataModelValidation:
         )
 
         assert obj.address.zipcode == 90210
+        assert obj.address is address
+        assert obj.products[0] is product
 
         with pytest.raises(TypeError) as exc:
             ComplexModel(
@@ -202,6 +234,28 @@ class TestDataModelValidation:
         error = type_error_to_dict(exc)
         assert error == {"products.0.id": "Expected type int, got str"}
 
+    def test_nested_subclass_instances_are_kept(self):
+        """Test that instances of a nested model's subclass are not rebuilt."""
+
+        class LocalAddress(Address):
+            """An address subclass with an extra field.
+
+            Attributes:
+                floor (int): The floor number.
+            """
+
+            floor: int = 0
+
+        address = LocalAddress(street="1 Side St", zipcode=1, floor=3)
+        obj = ComplexModel(id="x", metadata={}, products=[], address=address)
+        assert obj.address is address
+        assert obj.address.floor == 3
+
+        obj = ComplexModel(
+            id="y", metadata={}, products=[], address={"street": "2", "zipcode": 2}
+        )
+        assert type(obj.address) is Address
+
     def test_list_type_validation(self):
         """Test list type parameter validation.
 
@@ -283,6 +337,15 @@ class TestDataModelValidation:
 
         assert "Class attribute MAX_SIZE must be <class 'int'>" in str(exc.value)
 
+        with pytest.raises(TypeError, match="Missing required class attribute: LIMIT"):
+
+            class MissingClassVar(DataModel):
+                LIMIT: ClassVar[int]
+                name: str
+
+        assert ValidClassVars.__vldt_class_annotations__["MAX_SIZE"] is int
+        assert ValidClassVars.__vldt_instance_annotations__ == {"name": str}
+
     def test_deeply_nested_structures(self):
         """Test multi-level nested structures.
 
@@ -337,6 +400,35 @@ class TestDataModelValidation:
         with pytest.raises(TypeError):
             obj.value = "invalid"
 
+    def test_post_init_validation_of_field_types(self):
+        """Test assignment validation for subclass, container and optional values.
+
+        Raises:
+            AssertionError: If assigned values are not validated like init values.
+        """
+
+        class Flag(int):
+            pass
+
+        obj = ComplexModel(id=1, metadata={}, products=[])
+        flag = Flag(3)
+        obj.id = flag
+        assert obj.id is flag
+        obj.products = [{"id": "1", "name": "Widget", "price": 1}]
+        assert type(obj.products[0]) is Product
+        assert obj.products[0].id == 1
+        obj.address = None
+        assert obj.address is None
+
+        with pytest.raises(TypeError) as exc:
+            obj.products = [{"id": "wrong", "name": "Widget", "price": 1}]
+        assert type_error_to_dict(exc) == {
+            "products.0.id": "Expected type int, got str"
+        }
+        with pytest.raises(AttributeError):
+            del obj.id
+        assert obj.id is flag
+
     def test_missing_required_fields(self):
         """Test missing required fields.
 
@@ -526,6 +618,69 @@ class TestDataModelValidation:
         assert len(root.children) == 2
         assert root.children[0].value == 1
 
+    def test_subclass_type_hints(self):
+        """Test that subclasses combine resolved base hints with their own.
+
+        Raises:
+            AssertionError: If inherited, forward-referenced or mixin
+                annotations are not resolved like get_type_hints does.
+        """
+
+        class Base(DataModel):
+            """A base model.
+
+            Attributes:
+                items (List[int]): Some integers.
+            """
+
+            items: List[int]
+            LIMIT: ClassVar[int] = 3
+
+        class Child(Base):
+            """A subclass with a forward reference to itself.
+
+            Attributes:
+                parent (Optional[Child]): The parent node.
+                note (str): A note.
+            """
+
+            parent: Optional["Child"] = None
+            note: "str" = ""
+
+        class Mixin:
+            extra: "int"
+
+        class Mixed(Child, Mixin):
+            """A subclass that also inherits annotations from a plain mixin."""
+
+            label: str = ""
+
+        child = Child(items=["1"], parent={"items": []})
+        assert child.items == [1]
+        assert type(child.parent) is Child
+        assert Child.__annotations__["parent"] == Optional[Child]
+        assert Child.__vldt_class_annotations__["LIMIT"] is int
+        assert Mixed.__vldt_instance_annotations__ == {
+            "extra": int,
+            "items": List[int],
+            "parent": Optional[Child],
+            "note": str,
+            "label": str,
+        }
+        assert Mixed(items=[], extra="2").extra == 2
+
+        class PlainMixin:
+            size: Optional[int]
+
+        class Sized(Base, PlainMixin):
+            """A subclass inheriting concrete annotations from a plain mixin."""
+
+        assert Sized.__vldt_instance_annotations__ == {
+            "size": Optional[int],
+            "items": List[int],
+        }
+        assert Sized(items=[], size="3").size == 3
+
     def test_generic_containers(self):
         """Test various generic container types.
 
@@ -550,6 +705,37 @@ class TestDataModelValidation:
         with pytest.raises(TypeError):
             ContainerModel(tuple_data=("answer", 42), set_data={1, 2, 3})
 
+    def test_tuple_and_set_items(self):
+        """Test that well-typed tuple and set items are kept and others converted.
+
+        Raises:
+            AssertionError: If items are rebuilt, not converted or reported
+                under the wrong path.
+        """
+        from typing import Tuple, Set
+
+        class Pairs(DataModel):
+            """A model with a tuple and a set.
+
+            Attributes:
+                pair (Tuple[int, float]): An integer and a float.
+                values (Set[float]): A set of floats.
+            """
+
+            pair: Tuple[int, float]
+            values: Set[float]
+
+        big = 10**20
+        ratio = 2.5
+        obj = Pairs(pair=(big, ratio), values={ratio, 1})
+        assert obj.pair[0] is big
+        assert obj.pair[1] is ratio
+        assert obj.values == {2.5, 1.0}
+        assert all(type(value) is float for value in obj.values)
+        with pytest.raises(TypeError) as exc:
+            Pairs(pair=(1, "x"), values=set())
+        assert type_error_to_dict(exc) == {"pair.1": "Expected type float, got str"}
+
     def test_validation_performance(self, capsys):
         """Test performance with large datasets.
 
@@ -593,6 +779,13 @@ class TestDataModelValidation:
 
         obj = Test(value=1)
         assert obj.value == 1.0
+        assert type(obj.value) is float
+        assert Test(value=True).value == 1.0
+        assert Test(value=2**53 + 1).value == float(2**53 + 1)
+        assert Test(value="2.5").value == 2.5
+        with pytest.raises(TypeError) as exc:
+            Test(value=10**400)
+        assert type_error_to_dict(exc) == {"value": "Expected type float, got int"}
 
     def test_default_values(self):
         """Test default values for fields.
@@ -671,6 +864,69 @@ class TestDataModelValidation:
         obj2 = EqualityModel(id=1, name="Test")
         assert obj1 == obj2
 
+    def test_model_equality_compares_fields(self):
+        """Test equality across field values, nested models and other objects.
+
+        Raises:
+            AssertionError: If equality does not follow the field values.
+        """
+        first = ComplexModel(
+            id=1, metadata={}, products=[], address=Address(street="a", zipcode=1)
+        )
+        second = ComplexModel(
+            id=1, metadata={}, products=[], address=Address(street="a", zipcode=1)
+        )
+        assert first == second
+        assert not first != second
+        second.address.zipcode = 2
+        assert first != second
+        assert first != first.to_dict()
+        assert first != 1
+        second.address.zipcode = 1
+        second.note = "extra attributes are not compared"
+        assert first == second
+        with pytest.raises(TypeError):
+            hash(first)
+
+    def test_model_equality_uses_dict_serializer(self):
+        """Test that models with a dict_serializer compare serialized values.
+
+        Raises:
+            AssertionError: If equality ignores the dict_serializer.
+        """
+
+        class Rounded(DataModel):
+            x: float
+
+            __vldt_config__ = Config(dict_serializer={float: lambda v: round(v, 1)})
+
+        assert Rounded(x=1.01) == Rounded(x=1.04)
+        assert Rounded(x=1.01) != Rounded(x=1.26)
+
+        class Plain(DataModel):
+            x: float
+
+        nan = float("nan")
+        assert Plain(x=1.01) != Plain(x=1.04)
+        assert Plain(x=nan) == Plain(x=nan)
+
+    def test_model_equality_defers_to_other_objects(self):
+        """Test that objects without to_dict() decide equality themselves.
+
+        Raises:
+            AssertionError: If the other object's __eq__ is not consulted.
+        """
+
+        class Anything:
+            def __eq__(self, other):
+                return True
+
+        model = Address(street="a", zipcode=1)
+        assert model == Anything()
+        assert Anything() == model
+        assert model != object()
+        assert (model == None) is False  # noqa: E711
+
     def test_model_copy(self):
         """Test model copying via deepcopy.
 
@@ -694,6 +950,59 @@ class TestDataModelValidation:
         assert obj1 == obj2
         assert obj1 is not obj2
 
+    def test_model_deepcopy_containers(self):
+        """Test that deepcopy copies container fields and nested models.
+
+        Raises:
+            AssertionError: If the copy shares mutable state with the original.
+        """
+        products = [Product(id=1, name="Test", price=1.0)]
+        obj1 = ComplexModel(
+            id=1, metadata={"tags": ["a"]}, products=products, history=[1, {"x": 1.0}]
+        )
+        obj1.same = obj1.products
+        obj2 = copy.deepcopy(obj1)
+        assert obj2 == obj1
+        assert obj2.products is not obj1.products
+        assert obj2.products[0] is not products[0]
+        assert obj2.metadata["tags"] is not obj1.metadata["tags"]
+        assert obj2.same is obj2.products
+        obj2.products[0].name = "Changed"
+        obj2.history[1]["x"] = 2.0
+        assert products[0].name == "Test"
+        assert obj1.history[1] == {"x": 1.0}
+
+    def test_model_deepcopy_scalar_containers(self):
+        """Test that lists and dicts of scalars are copied and keep shared references.
+
+        Raises:
+            AssertionError: If a copied container is shared with the original
+                or loses its identity within the copy.
+        """
+
+        class Scores(DataModel):
+            """A model with containers of scalars.
+
+            Attributes:
+                values (List[int]): Integer scores.
+                weights (Dict[str, float]): Weights by name.
+            """
+
+            values: List[int]
+            weights: Dict[str, float]
+
+        obj1 = Scores(values=[1, 2, 3], weights={"a": 0.5})
+        obj1.alias = obj1.values
+        obj2 = copy.deepcopy(obj1)
+        assert obj2 == obj1
+        assert obj2.values is not obj1.values
+        assert obj2.weights is not obj1.weights
+        assert obj2.alias is obj2.values
+        obj2.values.append(4)
+        obj2.weights["b"] = 1.0
+        assert obj1.values == [1, 2, 3]
+        assert obj1.weights == {"a": 0.5}
+
     def test_model_update(self):
         """Test updating a model's attributes.
 
@@ -745,6 +1054,97 @@ class TestDataModelValidation:
         assert obj.id == 1
         assert obj.name == "Test"
 
+    def test_instances_without_dict(self):
+        """Test that model instances keep no per-instance __dict__.
+
+        Raises:
+            AssertionError: If instances carry a __dict__ or lose weakref support.
+        """
+
+        class DiscountedProduct(Product):
+            """A subclass of Product with an extra field.
+
+            Attributes:
+                discount (float): The discount rate.
+            """
+
+            discount: float
+
+        for obj in (
+            Product(id=1, name="Widget", price=9.99),
+            DiscountedProduct(id=1, name="Widget", price=9.99, discount=0.1),
+        ):
+            assert not hasattr(obj, "__dict__")
+            assert weakref.ref(obj)() is obj
+            obj.id = 2
+            assert obj.id == 2
+            obj.note = "extra"
+            assert obj.note == "extra"
+            with pytest.raises(TypeError):
+                obj.id = "wrong"
+
+    def test_cached_property_keeps_dict(self):
+        """Test that models defining a cached_property keep a __dict__.
+
+        Raises:
+            AssertionError: If the cached value is not stored or reused.
+        """
+
+        class Measured(DataModel):
+            """A model with a cached derived value.
+
+            Attributes:
+                x (int): The measured value.
+            """
+
+            x: int
+
+            @functools.cached_property
+            def double(self):
+                calls.append(self.x)
+                return self.x * 2
+
+        class WithDict(DataModel):
+            __slots__ = ("__dict__",)
+
+            x: int
+
+        calls = []
+        obj = Measured(x=2)
+        assert obj.double == 4
+        assert obj.double == 4
+        assert calls == [2]
+        assert vars(obj) == {"double": 4}
+        assert weakref.ref(obj)() is obj
+        assert WithDict(x=1).__dict__ == {}
+
+    def test_reinit_binds_instance_schema(self):
+        """Test that calling __init__ again binds the fields of the instance's storage.
+
+        Raises:
+            AssertionError: If re-initialization skips validation or reads past
+                the instance storage.
+        """
+
+        class Point(DataModel):
+            x: int
+
+        class Point3D(DataModel):
+            x: int
+            y: int
+            z: int
+
+        obj = Point(x=1)
+        obj.__init__(x=2)
+        assert obj.x == 2
+        with pytest.raises(TypeError):
+            obj.__init__(x="wrong")
+
+        obj = Point(x=1)
+        obj.__class__ = Point3D
+        obj.__init__(x=3, y=4, z=5)
+        assert obj.x == 3
+
     def test_model_with_model_as_dict_value(self):
         """Test a model with another model as a dictionary value.
 
@@ -816,3 +1216,140 @@ class TestDataModelValidation:
         )
         assert m.data["address1"].zipcode == 90210
         assert m.data["product1"].id == "wrong"
+
+    def test_nested_models_from_dicts(self):
+        """Test that nested dictionaries build models through their own construction path.
+
+        Raises:
+            AssertionError: If nested models are built differently from a
+                direct call or bypass an overridden __init__.
+        """
+
+        class Tagged(DataModel):
+            name: str
+
+            def __init__(self, **kwargs):
+                kwargs.setdefault("name", "default")
+                super().__init__(**kwargs)
+
+        class Holder(DataModel):
+            home: Address
+            others: List[Address]
+            tagged: Tagged
+
+        holder = Holder(
+            home={"street": "Main", "zipcode": 1},
+            others=[{"street": "Side", "zipcode": 2}],
+            tagged={},
+        )
+        assert holder.home == Address(street="Main", zipcode=1)
+        assert holder.others[0].zipcode == 2
+        assert holder.tagged.name == "default"
+        with pytest.raises(TypeError) as exc_info:
+            Holder(home={"street": "Main"}, others=[], tagged={})
+        assert "home" in str(exc_info.value)
+
+    def test_well_typed_dict_is_copied(self):
+        """Test that a dict needing no conversion is still copied and validated.
+
+        Raises:
+            AssertionError: If the stored dict is shared with the input or an
+                invalid pair is accepted.
+        """
+
+        class Counts(DataModel):
+            counts: Dict[str, int]
+
+        source = {str(i): i for i in range(100)}
+        obj = Counts(counts=source)
+        assert obj.counts == source
+        assert obj.counts is not source
+        source["extra"] = 1
+        assert "extra" not in obj.counts
+
+        assert Counts(counts={"a": 1, "b": "2"}).counts == {"a": 1, "b": 2}
+        with pytest.raises(TypeError) as exc:
+            Counts(counts={"a": 1, "b": "two"})
+        assert type_error_to_dict(exc) == {"counts.b": "Expected type int, got str"}
+
+    def test_list_items_keep_identity_and_paths(self):
+        """Test that well-typed list items are kept and bad items report their index.
+
+        Raises:
+            AssertionError: If model items are copied or an error path is wrong.
+        """
+
+        class Route(DataModel):
+            stops: List[Address]
+            grid: List[List[int]]
+
+        stops = [Address(street=f"Street {i}", zipcode=i) for i in range(12)]
+        route = Route(stops=stops, grid=[[1, 2], [3]])
+        assert all(a is b for a, b in zip(route.stops, stops))
+        assert route.stops is not stops
+
+        with pytest.raises(TypeError) as exc:
+            Route(stops=stops + [{"street": "Last"}], grid=[])
+        assert type_error_to_dict(exc) == {"stops.12.zipcode": "Missing required field"}
+        with pytest.raises(TypeError) as exc:
+            Route(stops=[], grid=[[1]] * 11 + [[2, "x"]])
+        assert type_error_to_dict(exc) == {"grid.11.1": "Expected type int, got str"}
+
+    def test_fast_list_samples_items(self):
+        """Test that Config.fast_list checks only sampled items of primitive lists.
+
+        Raises:
+            AssertionError: If sampled lists or rows are not copied, or a
+                sampled bad item is accepted.
+        """
+
+        class Sampled(DataModel):
+            __vldt_config__ = Config(fast_list=3)
+
+            values: List[int]
+            rows: List[List[int]] = []
+
+        values = [1, "unchecked", 2, 3, 4]
+        obj = Sampled(values=values)
+        assert obj.values == values
+        assert obj.values is not values
+        assert Sampled(values=["1", 2, "3"]).values == [1, 2, 3]
+        with pytest.raises(TypeError) as exc:
+            Sampled(values=[1, 2, "x"])
+        assert type_error_to_dict(exc) == {"values.2": "Expected type int, got str"}
+        with pytest.raises(TypeError):
+            Sampled(values=[], rows=[[1, 2, "x"]])
+        rows = [[1, 2, 3], values]
+        sampled_rows = Sampled(values=[], rows=rows).rows
+        assert sampled_rows == rows
+        assert sampled_rows[1] is not values
+        assert Sampled(values=[], rows=[[1], ["2"]]).rows == [[1], [2]]
+        obj.values = [5, "unchecked", 6, 7, 8]
+        assert obj.values[1] == "unchecked"
+
+        class FirstOnly(DataModel):
+            __vldt_config__ = Config(fast_list=True)
+
+            values: List[int]
+
+        assert FirstOnly(values=[1, "x"]).values == [1, "x"]
+        with pytest.raises(TypeError):
+            FirstOnly(values=["x", 1])
+
+    def test_attribute_names_built_at_runtime(self):
+        """Test that fields resolve for attribute names that are not interned.
+
+        Raises:
+            AssertionError: If a runtime-built name misses its field or a
+                non-field name resolves to one.
+        """
+        obj = Product(id=1, name="Widget", price=9.99)
+        name = "".join(["pri", "ce"])
+        assert getattr(obj, name) == 9.99
+        setattr(obj, name, 5)
+        assert obj.price == 5.0
+        with pytest.raises(TypeError):
+            setattr(obj, "".join(["i", "d"]), "wrong")
+        setattr(obj, "".join(["no", "te"]), "extra")
+        assert obj.note == "extra"
+        assert not hasattr(obj, "".join(["pri", "ces"]))
@@ -1,8 +1,11 @@
 from vldt.config import Config
+from vldt.fastdefaults import randint_factory
 from vldt.fields import Field
 from vldt.models import DataModel, AsyncDataModel
+from vldt._vldt import parse_datetime_fast, parse_uuid_fast, round2
 from vldt.validators import (
     ValidatorMode,
+    builtin_field_validator,
     field_validator,
     model_validator,
     async_field_validator,
@@ -15,8 +18,13 @@ __all__ = [
     "ValidatorMode",
     "async_field_validator",
     "async_model_validator",
+    "builtin_field_validator",
     "field_validator",
     "model_validator",
     "Field",
     "Config",
+    "parse_datetime_fast",
+    "parse_uuid_fast",
+    "randint_factory",
+    "round2",
 ]
@@ -1,24 +1,110 @@
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from vldt.deserializer import GLOBAL_DESERIALIZER
 
 
+def _freeze_deserializer(deserializer):
+    """Merge a deserializer mapping over the global one as a read-only view.
+
+    Args:
+        deserializer (Mapping): Target type to {source type: callable}.
+
+    Returns:
+        MappingProxyType: The merged mapping, with read-only inner mappings.
+    """
+    return MappingProxyType(
+        GLOBAL_DESERIALIZER
+        | {
+            target: MappingProxyType(dict(sources))
+            if isinstance(sources, Mapping)
+            else sources
+            for target, sources in deserializer.items()
+        }
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _merge_hashable_deserializer(key):
+    """Merge a deserializer given as hashable (target, sources) pairs.
+
+    The cache is bounded, so configs built over and over (for example with
+    inline lambdas) do not keep their callables alive forever.
+
+    Args:
+        key (tuple): Pairs of a target type and its (source, callable) pairs.
+
+    Returns:
+        MappingProxyType: The merged mapping.
+    """
+    return _freeze_deserializer({target: dict(sources) for target, sources in key})
+
+
+def _merge_deserializer(deserializer):
+    """Merge a deserializer mapping over the global one, sharing equal results.
+
+    Configs without their own deserializers share GLOBAL_DESERIALIZER, and
+    configs with equal mappings share one merged view from a bounded cache.
+    Mappings that cannot be hashed are merged each time. The result is always
+    read-only.
+
+    Args:
+        deserializer (dict | None): Target type to {source type: callable}.
+
+    Returns:
+        MappingProxyType: The merged deserializer mapping.
+    """
+    if not deserializer:
+        return GLOBAL_DESERIALIZER
+    try:
+        key = tuple(
+            (target, tuple(sources.items())) for target, sources in deserializer.items()
+        )
+        return _merge_hashable_deserializer(key)
+    except (AttributeError, TypeError):
+        return _freeze_deserializer(deserializer)
+
+
 class Config:
     """Configuration class for vldt models.
 
     Attributes:
         dict_serializer (dict): Encoder for dictionaries.
         json_serializer (dict): Encoder for JSON.
-        deserializer (dict): Deserializer.
+        deserializer (Mapping): Deserializer, merged over the global one.
+            Read-only.
+        cache_from_json (bool | int): Size of the from_json result cache.
+        fast_list (bool | int): Sampled validation of List[int], List[str],
+            List[float] and List[bool] fields, and of lists of them.
     """
 
-    def __init__(self, dict_serializer=None, json_serializer=None, deserializer=None):
+    def __init__(
+        self,
+        dict_serializer=None,
+        json_serializer=None,
+        deserializer=None,
+        cache_from_json=False,
+        fast_list=False,
+    ):
         """Initialize the Config instance.
 
         Args:
             dict_serializer (dict, optional): Encoder for dictionaries. Defaults to {}.
             json_serializer (dict, optional): Encoder for JSON. Defaults to {}.
             deserializer (dict, optional): Deserializer.
+            cache_from_json (bool | int, optional): Cache from_json results by
+                payload; True keeps up to 1024 payloads, an int sets the size.
+                Defaults to False.
+            fast_list (bool | int, optional): Check only some items of lists
+                of int, str, float or bool: True checks the first item, an int
+                checks that many evenly spaced items including the first and
+                the last. Lists of such lists sample each row. Unchecked
+                items are stored as given. When a checked item needs
+                conversion the whole list is validated. Defaults to False.
         """
         self.dict_serializer = dict_serializer if dict_serializer is not None else {}
         self.json_serializer = json_serializer if json_serializer is not None else {}
-        deserializer = deserializer if deserializer is not None else {}
-        self.deserializer = GLOBAL_DESERIALIZER | deserializer
+        self.deserializer = _merge_deserializer(deserializer)
+        self.cache_from_json = cache_from_json
+        self.fast_list = fast_list
@@ -1,8 +1,22 @@
 from datetime import datetime
+from types import MappingProxyType
+from uuid import UUID
 
-GLOBAL_DESERIALIZER = {
-    datetime: {
-        str: lambda v: datetime.fromisoformat(v),
-        int: lambda v: datetime.fromtimestamp(v),
-    },
-}
+from vldt._vldt import parse_uuid_fast
+
+# Read-only, since configs without deserializers of their own share it.
+GLOBAL_DESERIALIZER = MappingProxyType(
+    {
+        datetime: MappingProxyType(
+            {
+                str: datetime.fromisoformat,
+                int: datetime.fromtimestamp,
+            }
+        ),
+        UUID: MappingProxyType(
+            {
+                str: parse_uuid_fast,
+            }
+        ),
+    }
+)
@@ -0,0 +1,27 @@
+from vldt._vldt import RandIntFactory
+
+
+def randint_factory(lo, hi, seed=None):
+    """Build a default factory returning random integers in [lo, hi].
+
+    The factory is a drop-in replacement for ``lambda: randint(lo, hi)``:
+    both bounds are inclusive, but each value comes from a SplitMix64
+    generator in C instead of ``random.Random``. It is not suitable for
+    anything security sensitive.
+
+    Args:
+        lo (int): The lowest value to return.
+        hi (int): The highest value to return.
+        seed (int, optional): Seed for a reproducible sequence. Defaults to
+            a seed from the operating system.
+
+    Returns:
+        RandIntFactory: A callable taking no arguments.
+
+    Raises:
+        ValueError: If ``hi`` is lower than ``lo``.
+    """
+    return RandIntFactory(lo, hi, seed)
+
+
+__all__ = ["randint_factory"]
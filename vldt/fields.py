@@ -1,10 +1,29 @@
+import functools
+import sys
+
+
+@functools.lru_cache(maxsize=1024)
+def _freeze_aliases(aliases):
+    """Intern the names of an alias tuple, sharing the tuple between equal ones.
+
+    The cache is bounded so classes built at runtime cannot grow it forever.
+
+    Args:
+        aliases (tuple): The alias names.
+
+    Returns:
+        tuple: The aliases with every str interned.
+    """
+    return tuple(sys.intern(a) if type(a) is str else a for a in aliases)
+
+
 class Field:
     """A class representing a model field with default values and aliases.
 
     Attributes:
         default (Any): The default value of the field.
         default_factory (Callable, optional): A callable to generate the default value.
-        alias (list): A list of alternative names for the field.
+        alias (tuple): The alternative names for the field.
     """
 
     def __init__(self, *, default=None, alias=None, default_factory=None):
@@ -13,7 +32,8 @@ class Field:
         Args:
             default (Any, optional): The default value. Defaults to None.
             alias (Union[list, tuple, Any], optional): An alias or a list/tuple of aliases
-                for the field. If not provided, defaults to an empty list.
+                for the field, stored as a tuple. If not provided, defaults to an
+                empty tuple.
             default_factory (Callable, optional): A callable that returns a default value.
                 Cannot be used together with `default`.
 
@@ -25,11 +45,13 @@ class Field:
         self.default = default
         self.default_factory = default_factory
         if alias is None:
-            self.alias = []
-        elif isinstance(alias, (list, tuple)):
-            self.alias = list(alias)
+            self.alias = ()
         else:
-            self.alias = [alias]
+            aliases = tuple(alias) if isinstance(alias, (list, tuple)) else (alias,)
+            try:
+                self.alias = _freeze_aliases(aliases)
+            except TypeError:
+                self.alias = aliases
 
     def get_default(self):
         """Get the default value for the field.
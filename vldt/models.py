@@ -1,16 +1,149 @@
-import inspect
+import functools
 import sys
-from typing import ClassVar, get_type_hints, get_origin, get_args
+import types
+from typing import ClassVar, ForwardRef, get_type_hints, get_origin, get_args
 
-from vldt._vldt import DataModel as _DataModel
+from vldt._vldt import DataModel as _DataModel, collect_validators
 from vldt.config import Config
 from vldt.validators import ValidatorMode
 
+# Marks a field without a value when reading it with getattr.
+_MISSING = object()
+
+# Bits of __vldt_async_flags__: the awaited BEFORE and AFTER phases. A class
+# without flags initializes without the event loop.
+_ASYNC_BEFORE = 1
+_ASYNC_AFTER = 2
+
+
+def _install_from_json_cache(cls):
+    """Wrap from_json in an LRU cache when the model config asks for one.
+
+    Cached instances are never handed out; each call returns a deep copy, so
+    mutating a result does not affect later calls with the same payload.
+    Unhashable payloads (bytearray) are parsed without the cache.
+
+    Args:
+        cls: The model class being initialized.
+    """
+    config = getattr(cls, "__vldt_config__", None)
+    maxsize = getattr(config, "cache_from_json", False)
+    if not maxsize:
+        if hasattr(cls, "__vldt_from_json_cache__"):
+            cls.from_json = _DataModel.__dict__["from_json"]
+            cls.__vldt_from_json_cache__ = None
+        return
+    if maxsize is True:
+        maxsize = 1024
+
+    parse = _DataModel.__dict__["from_json"].__get__(None, cls)
+    cached_parse = functools.lru_cache(maxsize=maxsize)(parse)
+
+    def from_json(json_data):
+        if isinstance(json_data, bytearray):
+            return parse(json_data)
+        return cached_parse(json_data).__deepcopy__({})
+
+    from_json.__doc__ = parse.__doc__
+    cls.from_json = staticmethod(from_json)
+    cls.__vldt_from_json_cache__ = cached_parse
+
+
+def _needs_evaluation(annotation):
+    """Tell whether get_type_hints would rewrite an annotation.
+
+    Args:
+        annotation: An annotation as written in a class body.
+
+    Returns:
+        bool: True for strings, None and forward references, also when nested
+        in the arguments of a generic.
+    """
+    if annotation is None or isinstance(annotation, (str, ForwardRef)):
+        return True
+    args = getattr(annotation, "__args__", None)
+    return isinstance(args, tuple) and any(_needs_evaluation(arg) for arg in args)
+
+
+def _evaluation_namespaces(cls):
+    """Build the namespaces annotations of a model class are evaluated in.
+
+    Args:
+        cls: The model class being initialized.
+
+    Returns:
+        tuple: Globals of the class's module and the names visible from the
+        class body, including the class itself.
+    """
+    globalns = sys.modules[cls.__module__].__dict__
+    localns = dict(cls.__dict__)
+    localns[cls.__name__] = cls
+    return globalns, localns
+
+
+def _resolve_type_hints(cls):
+    """Resolve the type hints of a model class, reusing its bases' results.
+
+    get_type_hints evaluates the annotations of every class in the MRO, so
+    each subclass would resolve its bases' annotations again. Bases that are
+    models reuse the hints recorded when they were defined, and annotations
+    made only of concrete types (no strings, None or forward references) are
+    taken as they are; only the rest is evaluated. If a base other than a
+    model has annotations that need evaluation, the whole class goes through
+    get_type_hints. The evaluation namespaces are only built when something
+    is evaluated.
+
+    Args:
+        cls: The model class being initialized.
+
+    Returns:
+        dict: The resolved type hints.
+    """
+    hints = {}
+    for base in reversed(cls.__mro__[1:]):
+        resolved = base.__dict__.get("__vldt_resolved_hints__")
+        if resolved is None:
+            resolved = base.__dict__.get("__annotations__")
+            if not resolved:
+                continue
+            if any(_needs_evaluation(value) for value in resolved.values()):
+                globalns, localns = _evaluation_namespaces(cls)
+                return get_type_hints(
+                    cls, globalns=globalns, localns=localns, include_extras=True
+                )
+        hints.update(resolved)
+    own = cls.__dict__.get("__annotations__")
+    if own and not any(_needs_evaluation(value) for value in own.values()):
+        hints.update(own)
+    elif own:
+        # Evaluate with class semantics (ClassVar allowed) and without the
+        # bases, on a bare class holding only this class's annotations.
+        holder = type(cls.__name__, (), {"__annotations__": own})
+        globalns, localns = _evaluation_namespaces(cls)
+        hints.update(
+            get_type_hints(
+                holder, globalns=globalns, localns=localns, include_extras=True
+            )
+        )
+    return hints
+
 
 class DataModelMeta(type):
     def __new__(mcls, name, bases, namespace):
-        cls = super().__new__(mcls, name, bases, namespace)
-        return cls
+        # Field values and extra attributes live in the native instance
+        # storage, so a per-instance __dict__ would only ever stay empty.
+        # functools.cached_property stores its value in __dict__, so classes
+        # using it keep one; declaring __slots__ explicitly opts out.
+        if "__slots__" not in namespace and not any(
+            isinstance(value, functools.cached_property) for value in namespace.values()
+        ):
+            slots = ("__weakref__",)
+            for base in bases:
+                if base.__weakrefoffset__:
+                    slots = ()
+                    break
+            namespace["__slots__"] = slots
+        return super().__new__(mcls, name, bases, namespace)
 
     def __init__(cls, name, bases, namespace):
         """Initialize the class by resolving type annotations and collecting validators.
@@ -24,28 +157,21 @@ class DataModelMeta(type):
             bases (tuple): Base classes.
             namespace (dict): The class namespace.
         """
-        globalns = sys.modules[cls.__module__].__dict__
-        localns = dict(cls.__dict__)
-        localns[cls.__name__] = cls
         try:
-            resolved = get_type_hints(
-                cls, globalns=globalns, localns=localns, include_extras=True
-            )
+            resolved = _resolve_type_hints(cls)
         except Exception:
             resolved = cls.__annotations__
+        else:
+            cls.__vldt_resolved_hints__ = resolved
         cls.__annotations__ = resolved
 
         class_annotations = {}
         instance_annotations = {}
         for attr_name, attr_type in resolved.items():
-            if get_origin(attr_type) is ClassVar:
-                class_annotations[attr_name] = get_args(attr_type)[0]
-            else:
+            if get_origin(attr_type) is not ClassVar:
                 instance_annotations[attr_name] = attr_type
-        cls.__vldt_class_annotations__ = class_annotations or {}
-        cls.__vldt_instance_annotations__ = instance_annotations or {}
-
-        for attr_name, ann_type in class_annotations.items():
+                continue
+            ann_type = get_args(attr_type)[0]
             value = getattr(cls, attr_name, None)
             if value is None:
                 raise TypeError(f"Missing required class attribute: {attr_name}")
@@ -53,33 +179,23 @@ class DataModelMeta(type):
                 raise TypeError(
                     f"Class attribute {attr_name} must be {ann_type}, got {type(value)}"
                 )
-
-        field_validators_before = {}
-        field_validators_after = {}
-        model_validators_before = []
-        model_validators_after = []
-        for attr_name, attr_value in cls.__dict__.items():
-            candidate_funcs = []
-            if isinstance(attr_value, (classmethod, staticmethod)):
-                candidate_funcs.append(attr_value.__func__)
-            else:
-                candidate_funcs.append(attr_value)
-            for func in candidate_funcs:
-                if hasattr(func, "__vldt_field_validator__"):
-                    info = getattr(func, "__vldt_field_validator__")
-                    mode = info["mode"]
-                    field = info["field"]
-                    if mode == ValidatorMode.BEFORE:
-                        field_validators_before.setdefault(field, []).append(attr_value)
-                    elif mode == ValidatorMode.AFTER:
-                        field_validators_after.setdefault(field, []).append(attr_value)
-                if hasattr(func, "__vldt_model_validator__"):
-                    info = getattr(func, "__vldt_model_validator__")
-                    mode = info["mode"]
-                    if mode == ValidatorMode.BEFORE:
-                        model_validators_before.append(attr_value)
-                    elif mode == ValidatorMode.AFTER:
-                        model_validators_after.append(attr_value)
+            class_annotations[attr_name] = ann_type
+        cls.__vldt_class_annotations__ = class_annotations
+        cls.__vldt_instance_annotations__ = instance_annotations
+
+        (
+            field_validators_before,
+            field_validators_after,
+            model_validators_before,
+            model_validators_after,
+            _,
+        ) = collect_validators(
+            cls,
+            "__vldt_field_validator__",
+            "__vldt_model_validator__",
+            ValidatorMode.BEFORE,
+            ValidatorMode.AFTER,
+        )
         cls.__vldt_validators__ = {
             "field_before": field_validators_before,
             "field_after": field_validators_after,
@@ -90,6 +206,8 @@ class DataModelMeta(type):
         cls.__vldt_has_field_after_validators__ = bool(field_validators_after)
         cls.__vldt_has_model_before_validators__ = bool(model_validators_before)
         cls.__vldt_has_model_after_validators__ = bool(model_validators_after)
+        if "from_json" not in namespace:
+            _install_from_json_cache(cls)
         super().__init__(name, bases, namespace)
 
 
@@ -103,10 +221,40 @@ class DataModel(_DataModel, metaclass=DataModelMeta):
             cls, "__vldt_instance_annotations__", {}
         )
 
-    def __eq__(self, other):
-        if hasattr(self, "to_dict") and hasattr(other, "to_dict"):
-            return self.to_dict() == other.to_dict()
-        return False
+
+def _bind_async_validator(validator, cls):
+    """Resolve an async validator into the callable to await.
+
+    Classmethods and staticmethods are bound to the class once, so the
+    validator is later called with the value (or the instance) only.
+
+    Args:
+        validator: The collected validator (a classmethod, a staticmethod or a
+            plain coroutine function).
+        cls: The model class owning the validator.
+
+    Returns:
+        Callable: The callable returning the validator coroutine.
+    """
+    if isinstance(validator, (classmethod, staticmethod)):
+        return types.MethodType(validator.__func__, cls)
+    return validator
+
+
+def _freeze_field_calls(validators, cls):
+    """Freeze collected async field validators into a call table.
+
+    Args:
+        validators (dict): Mapping of field names to lists of validators.
+        cls: The model class owning the validators.
+
+    Returns:
+        tuple: Pairs of a field name and a tuple of bound validators.
+    """
+    return tuple(
+        (field, tuple(_bind_async_validator(v, cls) for v in field_validators))
+        for field, field_validators in validators.items()
+    )
 
 
 class AsyncDataModelMeta(DataModelMeta):
@@ -122,42 +270,57 @@ class AsyncDataModelMeta(DataModelMeta):
             namespace (dict): The class namespace.
         """
         super().__init__(name, bases, namespace)
-        async_field_before = {}
-        async_field_after = {}
-        async_model_before = []
-        async_model_after = []
-        for attr_name, attr_value in cls.__dict__.items():
-            candidate_funcs = []
-            if isinstance(attr_value, (classmethod, staticmethod)):
-                candidate_funcs.append(attr_value.__func__)
-            else:
-                candidate_funcs.append(attr_value)
-            for func in candidate_funcs:
-                if hasattr(func, "__vldt_async_field_validator__"):
-                    info = getattr(func, "__vldt_async_field_validator__")
-                    mode = info["mode"]
-                    field = info["field"]
-                    if mode == ValidatorMode.BEFORE:
-                        async_field_before.setdefault(field, []).append(attr_value)
-                    elif mode == ValidatorMode.AFTER:
-                        async_field_after.setdefault(field, []).append(attr_value)
-                if hasattr(func, "__vldt_async_model_validator__"):
-                    info = getattr(func, "__vldt_async_model_validator__")
-                    mode = info["mode"]
-                    if mode == ValidatorMode.BEFORE:
-                        async_model_before.append(attr_value)
-                    elif mode == ValidatorMode.AFTER:
-                        async_model_after.append(attr_value)
+        (
+            async_field_before,
+            async_field_after,
+            async_model_before,
+            async_model_after,
+            await_free,
+        ) = collect_validators(
+            cls,
+            "__vldt_async_field_validator__",
+            "__vldt_async_model_validator__",
+            ValidatorMode.BEFORE,
+            ValidatorMode.AFTER,
+        )
         cls.__async_validators__ = {
             "field_before": async_field_before,
             "field_after": async_field_after,
             "model_before": async_model_before,
             "model_after": async_model_after,
         }
+        # Frozen call tables for the awaiting path, in the order the phases
+        # run: model before, field before, field after, model after.
+        cls.__vldt_async_calls__ = (
+            tuple(_bind_async_validator(v, cls) for v in async_model_before),
+            _freeze_field_calls(async_field_before, cls),
+            _freeze_field_calls(async_field_after, cls),
+            tuple(_bind_async_validator(v, cls) for v in async_model_after),
+        )
         cls.__vldt_has_async_field_before_validators__ = bool(async_field_before)
         cls.__vldt_has_async_field_after_validators__ = bool(async_field_after)
         cls.__vldt_has_async_model_before_validators__ = bool(async_model_before)
         cls.__vldt_has_async_model_after_validators__ = bool(async_model_after)
+        # When no async validator awaits, the C++ initialization runs them in
+        # order around the synchronous validators instead of the event loop.
+        has_async = bool(
+            async_field_before
+            or async_field_after
+            or async_model_before
+            or async_model_after
+        )
+        cls.__vldt_await_free_validators__ = (
+            cls.__async_validators__ if has_async and await_free else None
+        )
+        # Awaiting the instance only needs the event loop when a validator
+        # actually awaits; the flags then tell which phases have validators.
+        flags = 0
+        if has_async and not await_free:
+            if async_model_before or async_field_before:
+                flags |= _ASYNC_BEFORE
+            if async_field_after or async_model_after:
+                flags |= _ASYNC_AFTER
+        cls.__vldt_async_flags__ = flags
 
 
 class AsyncDataModel(DataModel, metaclass=AsyncDataModelMeta):
@@ -171,13 +334,18 @@ class AsyncDataModel(DataModel, metaclass=AsyncDataModelMeta):
         person = await AsyncDataModel(name="john", age="20")
     """
 
+    # The pending keyword arguments live in a slot rather than in the
+    # native extras mapping.
+    __slots__ = ("_init_kwargs",)
+
     def __new__(cls, *args, **kwargs):
         # Allocate an instance without calling the C++ initialization (tp_init).
         return DataModel.__new__(cls)
 
     def __init__(self, *args, **kwargs):
-        # Instead of running validations immediately, store the kwargs.
-        self._init_kwargs = kwargs.copy()
+        # Instead of running validations immediately, store the kwargs. The
+        # ** dict is built for this call, so it is not shared with the caller.
+        self._init_kwargs = kwargs
 
     def _sync_init(self, kwargs):
         """Call the synchronous DataModel initialization code on this instance.
@@ -199,27 +367,18 @@ class AsyncDataModel(DataModel, metaclass=AsyncDataModelMeta):
         Returns:
             dict: The updated keyword arguments.
         """
-        if getattr(self.__class__, "__vldt_has_async_model_before_validators__", False):
-            for validator in self.__class__.__async_validators__.get(
-                "model_before", []
-            ):
-                if isinstance(validator, (classmethod, staticmethod)):
-                    result = await validator.__func__(self.__class__, kwargs)
-                else:
-                    result = await validator(kwargs)
+        model_before, field_before, _, _ = type(self).__vldt_async_calls__
+        if model_before:
+            for func in model_before:
+                result = await func(kwargs)
                 if isinstance(result, dict):
                     kwargs.update(result)
-        if getattr(self.__class__, "__vldt_has_async_field_before_validators__", False):
-            for field, validators in self.__class__.__async_validators__.get(
-                "field_before", {}
-            ).items():
+        if field_before:
+            for field, validators in field_before:
                 if field in kwargs:
                     value = kwargs[field]
-                    for validator in validators:
-                        if isinstance(validator, (classmethod, staticmethod)):
-                            value = await validator.__func__(self.__class__, value)
-                        else:
-                            value = await validator(value)
+                    for func in validators:
+                        value = await func(value)
                     kwargs[field] = value
         return kwargs
 
@@ -228,24 +387,17 @@ class AsyncDataModel(DataModel, metaclass=AsyncDataModelMeta):
 
         This method awaits async field and model validators that modify the instance.
         """
-        if getattr(self.__class__, "__vldt_has_async_field_after_validators__", False):
-            for field, validators in self.__class__.__async_validators__.get(
-                "field_after", {}
-            ).items():
-                if hasattr(self, field):
-                    value = getattr(self, field)
-                    for validator in validators:
-                        if isinstance(validator, (classmethod, staticmethod)):
-                            value = await validator.__func__(self.__class__, value)
-                        else:
-                            value = await validator(value)
+        _, _, field_after, model_after = type(self).__vldt_async_calls__
+        if field_after:
+            for field, validators in field_after:
+                value = getattr(self, field, _MISSING)
+                if value is not _MISSING:
+                    for func in validators:
+                        value = await func(value)
                     setattr(self, field, value)
-        if getattr(self.__class__, "__vldt_has_async_model_after_validators__", False):
-            for validator in self.__class__.__async_validators__.get("model_after", []):
-                if inspect.iscoroutinefunction(validator):
-                    await validator(self)
-                else:
-                    await validator.__func__(self.__class__, self)
+        if model_after:
+            for func in model_after:
+                await func(self)
 
     async def _async_init(self):
         """Perform asynchronous initialization.
@@ -256,14 +408,34 @@ class AsyncDataModel(DataModel, metaclass=AsyncDataModelMeta):
           3. Runs async AFTER validators.
           4. Returns the fully initialized instance.
 
+        When none of the async validators awaits, step 2 runs them as well, so
+        no coroutine is awaited here. Steps 1 and 3 are skipped when the model
+        has no validators for them. The stored kwargs are released once the
+        initialization succeeds, and awaiting the instance again returns it
+        unchanged.
+
         Returns:
             AsyncDataModel: The initialized instance.
         """
-        updated_kwargs = await self._run_async_before(self._init_kwargs)
-        self._init_kwargs = updated_kwargs
-        self._sync_init(updated_kwargs)
-        await self._run_async_after()
+        kwargs = self._init_kwargs
+        if kwargs is None:
+            return self
+        flags = type(self).__vldt_async_flags__
+        if flags & _ASYNC_BEFORE:
+            kwargs = await self._run_async_before(kwargs)
+        self._sync_init(kwargs)
+        if flags & _ASYNC_AFTER:
+            await self._run_async_after()
+        self._init_kwargs = None
         return self
 
     def __await__(self):
-        return self._async_init().__await__()
+        if not type(self).__vldt_async_flags__:
+            # Nothing to await: initialize in place and finish the generator
+            # without creating the _async_init coroutine.
+            kwargs = self._init_kwargs
+            if kwargs is not None:
+                self._sync_init(kwargs)
+                self._init_kwargs = None
+            return self
+        return (yield from self._async_init().__await__())
@@ -1,5 +1,9 @@
+import dis
 import inspect
 from enum import Enum
+from types import FunctionType
+
+from vldt._vldt import BuiltinValidator
 
 
 class ValidatorMode(Enum):
@@ -7,6 +11,67 @@ class ValidatorMode(Enum):
     AFTER = "after"
 
 
+# Opcodes through which a coroutine can suspend (await, async for, async with).
+_SUSPENDING_OPNAMES = frozenset(
+    {
+        "GET_AWAITABLE",
+        "GET_AITER",
+        "GET_ANEXT",
+        "BEFORE_ASYNC_WITH",
+        "END_ASYNC_FOR",
+        "SEND",
+        "YIELD_FROM",
+    }
+)
+
+
+def never_awaits(fn) -> bool:
+    """Check whether a coroutine function can complete without suspending.
+
+    The bytecode of the function is scanned for await, async for and async with.
+    A coroutine function without them runs to its return statement on the first
+    send, so it does not need an event loop.
+
+    Args:
+        fn (Callable): The function to inspect.
+
+    Returns:
+        bool: True if fn is a coroutine function that never suspends.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None or not code.co_flags & inspect.CO_COROUTINE:
+        return False
+    return not any(
+        instruction.opname in _SUSPENDING_OPNAMES
+        for instruction in dis.get_instructions(code)
+    )
+
+
+def _parameter_names(fn) -> tuple:
+    """Return the parameter names of a validator function.
+
+    Plain functions are read from their code object, which is much cheaper than
+    building a signature. Wrapped functions, partials and other callables go
+    through inspect.signature.
+
+    Args:
+        fn (Callable): The validator function.
+
+    Returns:
+        tuple: The parameter names.
+    """
+    if type(fn) is FunctionType:
+        attrs = fn.__dict__
+        if "__wrapped__" not in attrs and "__signature__" not in attrs:
+            code = fn.__code__
+            flags = code.co_flags
+            count = code.co_argcount + code.co_kwonlyargcount
+            count += bool(flags & inspect.CO_VARARGS)
+            count += bool(flags & inspect.CO_VARKEYWORDS)
+            return code.co_varnames[:count]
+    return tuple(inspect.signature(fn).parameters)
+
+
 def field_validator(*, mode: ValidatorMode):
     """Decorator for field validators.
 
@@ -24,8 +89,7 @@ def field_validator(*, mode: ValidatorMode):
     def decorator(fn):
         # Get the underlying function if wrapped as a classmethod/staticmethod.
         actual_func = fn.__func__ if isinstance(fn, (classmethod, staticmethod)) else fn
-        sig = inspect.signature(actual_func)
-        params = list(sig.parameters.keys())
+        params = _parameter_names(actual_func)
         # Expect exactly one parameter for the field value aside from the first parameter.
         if len(params) != 2:
             raise ValueError(
@@ -40,6 +104,31 @@ def field_validator(*, mode: ValidatorMode):
     return decorator
 
 
+def builtin_field_validator(
+    field: str, name: str, *args, mode: ValidatorMode = ValidatorMode.AFTER
+):
+    """Create a field validator from the builtin registry.
+
+    Builtin validators run entirely in the C extension. Available names are
+    ``min_value`` and ``max_value`` (taking a bound), ``nonneg``, ``isdigit``
+    and ``capitalize``. Assign the result to a class attribute of the model:
+
+        check_age = builtin_field_validator("age", "min_value", 18)
+
+    Args:
+        field (str): The name of the field to validate.
+        name (str): The name of the builtin validator.
+        *args: Arguments of the builtin validator (e.g. the bound).
+        mode (ValidatorMode): The validator mode.
+
+    Returns:
+        BuiltinValidator: The validator with attached metadata.
+    """
+    validator = BuiltinValidator(field, name, *args)
+    validator.__vldt_field_validator__ = {"mode": mode, "field": field}
+    return validator
+
+
 def model_validator(*, mode: ValidatorMode):
     """Decorator for model validators.
 
@@ -58,8 +147,7 @@ def model_validator(*, mode: ValidatorMode):
 
     def decorator(fn):
         actual_func = fn.__func__ if isinstance(fn, (classmethod, staticmethod)) else fn
-        sig = inspect.signature(actual_func)
-        params = list(sig.parameters.keys())
+        params = _parameter_names(actual_func)
         if isinstance(fn, (classmethod, staticmethod)):
             if len(params) != 2:
                 raise ValueError(
@@ -94,14 +182,18 @@ def async_field_validator(*, mode: ValidatorMode):
 
     def decorator(fn):
         actual_func = fn.__func__ if isinstance(fn, (classmethod, staticmethod)) else fn
-        sig = inspect.signature(actual_func)
-        params = list(sig.parameters.keys())
+        params = _parameter_names(actual_func)
         if len(params) != 2:
             raise ValueError(
                 "Async field validator must have exactly one field parameter (aside from 'cls' or 'self')"
             )
         field_name = params[1]
-        meta = {"mode": mode, "field": field_name, "async": True}
+        meta = {
+            "mode": mode,
+            "field": field_name,
+            "async": True,
+            "await_free": never_awaits(actual_func),
+        }
         setattr(actual_func, "__vldt_async_field_validator__", meta)
         setattr(fn, "__vldt_async_field_validator__", meta)
         return fn
@@ -126,8 +218,7 @@ def async_model_validator(*, mode: ValidatorMode):
 
     def decorator(fn):
         actual_func = fn.__func__ if isinstance(fn, (classmethod, staticmethod)) else fn
-        sig = inspect.signature(actual_func)
-        params = list(sig.parameters.keys())
+        params = _parameter_names(actual_func)
         if isinstance(fn, (classmethod, staticmethod)):
             if len(params) != 2:
                 raise ValueError(
@@ -138,7 +229,7 @@ def async_model_validator(*, mode: ValidatorMode):
                 raise ValueError(
                     "Async model validator (as an instance method) must have no parameter aside from 'self'"
                 )
-        meta = {"mode": mode, "async": True}
+        meta = {"mode": mode, "async": True, "await_free": never_awaits(actual_func)}
         setattr(actual_func, "__vldt_async_model_validator__", meta)
         setattr(fn, "__vldt_async_model_validator__", meta)
         return fn